@@ -119,18 +119,19 @@ def get_schedules_for_pipeline(graphene_info: ResolveInfo, pipeline_selector):
     repository = location.get_repository(pipeline_selector.repository_name)
     external_schedules = repository.get_external_schedules()
 
-    results = []
-    for external_schedule in external_schedules:
-        if external_schedule.pipeline_name != pipeline_selector.pipeline_name:
-            continue
-
-        schedule_state = graphene_info.context.instance.get_instigator_state(
-            external_schedule.get_external_origin_id(),
-            external_schedule.selector_id,
-        )
-        results.append(GrapheneSchedule(external_schedule, schedule_state))
+    external_schedules = [
+        external_schedule
+        for external_schedule in external_schedules
+        if external_schedule.pipeline_name == pipeline_selector.pipeline_name
+    ]
+    schedule_states = graphene_info.context.instance.get_instigator_states(
+        [external_schedule.selector_id for external_schedule in external_schedules]
+    )
 
-    return results
+    return [
+        GrapheneSchedule(external_schedule, schedule_states.get(external_schedule.selector_id))
+        for external_schedule in external_schedules
+    ]
 
 
 @capture_error
@@ -158,20 +158,20 @@ def get_sensors_for_pipeline(graphene_info: ResolveInfo, pipeline_selector):
     repository = location.get_repository(pipeline_selector.repository_name)
     external_sensors = repository.get_external_sensors()
 
-    results = []
-    for external_sensor in external_sensors:
-        if pipeline_selector.pipeline_name not in [
-            target.pipeline_name for target in external_sensor.get_external_targets()
-        ]:
-            continue
-
-        sensor_state = graphene_info.context.instance.get_instigator_state(
-            external_sensor.get_external_origin_id(),
-            external_sensor.selector_id,
-        )
-        results.append(GrapheneSensor(external_sensor, sensor_state))
+    external_sensors = [
+        external_sensor
+        for external_sensor in external_sensors
+        if pipeline_selector.pipeline_name
+        in [target.pipeline_name for target in external_sensor.get_external_targets()]
+    ]
+    sensor_states = graphene_info.context.instance.get_instigator_states(
+        [external_sensor.selector_id for external_sensor in external_sensors]
+    )
 
-    return results
+    return [
+        GrapheneSensor(external_sensor, sensor_states.get(external_sensor.selector_id))
+        for external_sensor in external_sensors
+    ]
 
 
 def get_sensor_next_tick(graphene_info: ResolveInfo, sensor_state):
@@ -368,6 +368,7 @@
 )
 from dagster._core.event_api import (
     EventLogRecord as EventLogRecord,
+    EventLogRecordProjection as EventLogRecordProjection,
     EventRecordsFilter as EventRecordsFilter,
     RunShardedEventsCursor as RunShardedEventsCursor,
 )
@@ -67,3 +67,37 @@ def sync_get_external_schedule_execution_data_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+async def async_get_external_schedule_execution_data_grpc(
+    api_client: "DagsterGrpcClient",
+    instance: DagsterInstance,
+    repository_handle: RepositoryHandle,
+    schedule_name: str,
+    scheduled_execution_time: Any,
+) -> ScheduleExecutionData:
+    check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+    check.str_param(schedule_name, "schedule_name")
+    check.opt_inst_param(scheduled_execution_time, "scheduled_execution_time", PendulumDateTime)
+
+    origin = repository_handle.get_external_origin()
+    result = deserialize_as(
+        await api_client.external_schedule_execution_async(
+            external_schedule_execution_args=ExternalScheduleExecutionArgs(
+                repository_origin=origin,
+                instance_ref=instance.get_ref(),
+                schedule_name=schedule_name,
+                scheduled_execution_timestamp=scheduled_execution_time.timestamp()
+                if scheduled_execution_time
+                else None,
+                scheduled_execution_timezone=scheduled_execution_time.timezone.name
+                if scheduled_execution_time
+                else None,
+            ),
+        ),
+        (ScheduleExecutionData, ExternalScheduleExecutionErrorData),
+    )
+    if isinstance(result, ExternalScheduleExecutionErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+    return result
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Optional
 
 import dagster._check as check
+from dagster._core.definitions.run_status_feed import RunStatusFeedSlice
 from dagster._core.definitions.sensor_definition import SensorExecutionData
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.host_representation.external_data import ExternalSensorExecutionErrorData
@@ -22,6 +23,7 @@ def sync_get_external_sensor_execution_data_ephemeral_grpc(
     last_run_key: Optional[str],
     cursor: Optional[str],
     timeout: Optional[int] = DEFAULT_GRPC_TIMEOUT,
+    run_status_feed: Optional[RunStatusFeedSlice] = None,
 ) -> SensorExecutionData:
     from dagster._grpc.client import ephemeral_grpc_api_client
 
@@ -38,6 +40,7 @@ def sync_get_external_sensor_execution_data_ephemeral_grpc(
             last_run_key,
             cursor,
             timeout=timeout,
+            run_status_feed=run_status_feed,
         )
 
 
@@ -50,12 +53,14 @@ def sync_get_external_sensor_execution_data_grpc(
     last_run_key: Optional[str],
     cursor: Optional[str],
     timeout: Optional[int] = DEFAULT_GRPC_TIMEOUT,
+    run_status_feed: Optional[RunStatusFeedSlice] = None,
 ) -> SensorExecutionData:
     check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
     check.str_param(sensor_name, "sensor_name")
     check.opt_float_param(last_completion_time, "last_completion_time")
     check.opt_str_param(last_run_key, "last_run_key")
     check.opt_str_param(cursor, "cursor")
+    check.opt_inst_param(run_status_feed, "run_status_feed", RunStatusFeedSlice)
 
     origin = repository_handle.get_external_origin()
 
@@ -68,6 +73,49 @@ def sync_get_external_sensor_execution_data_grpc(
                 last_completion_time=last_completion_time,
                 last_run_key=last_run_key,
                 cursor=cursor,
+                run_status_feed=run_status_feed,
+            ),
+            timeout=timeout,
+        ),
+        (SensorExecutionData, ExternalSensorExecutionErrorData),
+    )
+
+    if isinstance(result, ExternalSensorExecutionErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+    return result
+
+
+async def async_get_external_sensor_execution_data_grpc(
+    api_client: "DagsterGrpcClient",
+    instance: "DagsterInstance",
+    repository_handle: RepositoryHandle,
+    sensor_name: str,
+    last_completion_time: Optional[float],
+    last_run_key: Optional[str],
+    cursor: Optional[str],
+    timeout: Optional[int] = DEFAULT_GRPC_TIMEOUT,
+    run_status_feed: Optional[RunStatusFeedSlice] = None,
+) -> SensorExecutionData:
+    check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+    check.str_param(sensor_name, "sensor_name")
+    check.opt_float_param(last_completion_time, "last_completion_time")
+    check.opt_str_param(last_run_key, "last_run_key")
+    check.opt_str_param(cursor, "cursor")
+    check.opt_inst_param(run_status_feed, "run_status_feed", RunStatusFeedSlice)
+
+    origin = repository_handle.get_external_origin()
+
+    result = deserialize_as(
+        await api_client.external_sensor_execution_async(
+            sensor_execution_args=SensorExecutionArgs(
+                repository_origin=origin,
+                instance_ref=instance.get_ref(),
+                sensor_name=sensor_name,
+                last_completion_time=last_completion_time,
+                last_run_key=last_run_key,
+                cursor=cursor,
+                run_status_feed=run_status_feed,
             ),
             timeout=timeout,
         ),
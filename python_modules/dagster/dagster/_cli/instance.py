@@ -1,9 +1,20 @@
 import os
 
 import click
+import pendulum
 
 import dagster._check as check
 from dagster._core.instance import DagsterInstance
+from dagster._core.storage.migration.batched import (
+    DEFAULT_DATA_MIGRATION_BATCH_SIZE,
+    DEFAULT_DATA_MIGRATION_THROTTLE_SECONDS,
+    execute_batched_data_migrations,
+)
+from dagster._core.storage.migration.bulk_transfer import (
+    DEFAULT_BULK_TRANSFER_CHUNK_SIZE,
+    export_instance_history,
+    import_instance_history,
+)
 
 
 @click.group(name="instance")
@@ -54,7 +65,36 @@ def migrate_command():
 
 
 @instance_cli.command(name="reindex", help="Rebuild index over historical runs for performance.")
-def reindex_command():
+@click.option(
+    "--batched",
+    is_flag=True,
+    default=False,
+    help=(
+        "Run the run and event log data migrations in bounded batches, saving progress after each "
+        "batch, so that the instance stays usable and an interrupted reindex resumes where it "
+        "left off."
+    ),
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_DATA_MIGRATION_BATCH_SIZE,
+    show_default=True,
+    help="With --batched, the maximum number of rows processed per batch.",
+)
+@click.option(
+    "--throttle-seconds",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_DATA_MIGRATION_THROTTLE_SECONDS,
+    show_default=True,
+    help="With --batched, how long to pause between batches.",
+)
+@click.option(
+    "--time-limit-seconds",
+    type=click.FloatRange(min=0),
+    help="With --batched, stop after this many seconds. Run the command again to resume.",
+)
+def reindex_command(batched, batch_size, throttle_seconds, time_limit_seconds):
     with DagsterInstance.get() as instance:
         home = os.environ.get("DAGSTER_HOME")
 
@@ -68,4 +108,103 @@ def reindex_command():
 
         click.echo("$DAGSTER_HOME: {}\n".format(home))
 
-        instance.reindex(click.echo)
+        if batched:
+            for _ in execute_batched_data_migrations(
+                instance,
+                batch_size=batch_size,
+                throttle_seconds=throttle_seconds,
+                time_limit_seconds=time_limit_seconds,
+                print_fn=click.echo,
+            ):
+                pass
+        else:
+            instance.reindex(click.echo)
+
+
+@instance_cli.command(
+    name="compact",
+    help=(
+        "Archive the event logs of runs that finished more than the given number of days ago. "
+        "Requires the run stats tables built by `dagster instance reindex`."
+    ),
+)
+@click.option(
+    "--days",
+    type=click.IntRange(min=0),
+    default=30,
+    show_default=True,
+    help="Only compact the event logs of runs that finished more than this many days ago.",
+)
+def compact_command(days):
+    with DagsterInstance.get() as instance:
+        home = os.environ.get("DAGSTER_HOME")
+
+        if instance.is_ephemeral:
+            click.echo(
+                "$DAGSTER_HOME is not set; ephemeral instances cannot be compacted.  If you "
+                "intended to compact a persistent instance, please ensure that $DAGSTER_HOME is "
+                "set accordingly."
+            )
+            return
+
+        click.echo("$DAGSTER_HOME: {}\n".format(home))
+
+        finished_before = pendulum.now("UTC").subtract(days=days)
+        instance.compact_event_logs(finished_before, click.echo)
+
+
+@instance_cli.command(
+    name="export",
+    help=(
+        "Export the runs, run tags, snapshots, asset keys, and event logs of the current instance "
+        "to a bulk transfer file, which can be imported into another instance with "
+        "`dagster instance import`."
+    ),
+)
+@click.argument("output_file", type=click.Path())
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_BULK_TRANSFER_CHUNK_SIZE,
+    show_default=True,
+    help="The maximum number of rows read from the instance at a time.",
+)
+def export_command(output_file, chunk_size):
+    with DagsterInstance.get() as instance:
+        if instance.is_ephemeral:
+            click.echo(
+                "$DAGSTER_HOME is not set; ephemeral instances cannot be exported.  If you "
+                "intended to export a persistent instance, please ensure that $DAGSTER_HOME is "
+                "set accordingly."
+            )
+            return
+
+        click.echo("$DAGSTER_HOME: {}\n".format(os.environ.get("DAGSTER_HOME")))
+
+        export_instance_history(instance, output_file, chunk_size, click.echo)
+        click.echo(f"Exported instance history to {output_file}.")
+
+
+@instance_cli.command(
+    name="import",
+    help=(
+        "Import a bulk transfer file written by `dagster instance export` into the current "
+        "instance. Runs that already exist in the instance are skipped. Both instances must be "
+        "migrated to the current schema with `dagster instance migrate`."
+    ),
+)
+@click.argument("input_file", type=click.Path(exists=True))
+def import_command(input_file):
+    with DagsterInstance.get() as instance:
+        if instance.is_ephemeral:
+            click.echo(
+                "$DAGSTER_HOME is not set; ephemeral instances cannot be imported into.  If you "
+                "intended to import into a persistent instance, please ensure that $DAGSTER_HOME "
+                "is set accordingly."
+            )
+            return
+
+        click.echo("$DAGSTER_HOME: {}\n".format(os.environ.get("DAGSTER_HOME")))
+
+        import_instance_history(instance, input_file, click.echo)
+        click.echo("Done.")
@@ -3,12 +3,14 @@
 import datetime
 import itertools
 import json
-from collections import defaultdict
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Dict,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -28,6 +30,9 @@
     TimeWindow,
     TimeWindowPartitionsDefinition,
 )
+from dagster._core.event_api import EventRecordsFilter
+from dagster._core.events import DagsterEventType
+from dagster._utils.timing import format_duration, time_execution_scope
 
 from .asset_selection import AssetGraph, AssetSelection
 from .decorators.sensor_decorator import sensor
@@ -41,6 +46,25 @@
     from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer  # expensive import
 
+# The maximum number of dirty asset partitions whose children are evaluated in a single tick. Any
+# beyond this are kept in the cursor and evaluated on subsequent ticks.
+DEFAULT_MAX_DIRTY_ASSET_PARTITIONS_PER_TICK = 10000
+
+
+class DirtyAssetPartition(NamedTuple):
+    """An asset partition that has been materialized since the cursor, but whose children have not
+    been evaluated yet.
+
+    Attributes:
+        asset_partition: The materialized asset partition.
+        storage_id: The storage ID of its latest materialization.
+        run_id: The ID of the run of its latest materialization.
+    """
+
+    asset_partition: AssetKeyPartitionKey
+    storage_id: int
+    run_id: str
+
 
 class AssetReconciliationCursor(NamedTuple):
     """
@@ -53,11 +77,14 @@ class AssetReconciliationCursor(NamedTuple):
         materialized_or_requested_root_partitions_by_asset_key: Every key is a partitioned root
             asset. Every value is the set of that asset's partitoins that have been requested by
             this sensor or have been materialized (even if not by this sensor).
+        dirty_asset_partitions: Asset partitions materialized up to latest_storage_id whose
+            children have not been evaluated yet, in storage ID order.
     """
 
     latest_storage_id: Optional[int]
     materialized_or_requested_root_asset_keys: AbstractSet[AssetKey]
     materialized_or_requested_root_partitions_by_asset_key: Mapping[AssetKey, PartitionsSubset]
+    dirty_asset_partitions: Sequence[DirtyAssetPartition] = ()
 
     def was_previously_materialized_or_requested(self, asset_key: AssetKey) -> bool:
         return asset_key in self.materialized_or_requested_root_asset_keys
@@ -97,10 +124,12 @@ def with_updates(
         newly_materialized_root_asset_keys: AbstractSet[AssetKey],
         newly_materialized_root_partitions_by_asset_key: Mapping[AssetKey, AbstractSet[str]],
         asset_graph: AssetGraph,
+        dirty_asset_partitions: Sequence[DirtyAssetPartition] = (),
     ) -> "AssetReconciliationCursor":
         """
         Returns a cursor that represents this cursor plus the updates that have happened within the
-        tick.
+        tick. dirty_asset_partitions replaces the dirty asset partitions of this cursor, as the
+        ones evaluated within the tick are no longer dirty.
         """
         requested_root_partitions_by_asset_key: Dict[AssetKey, Set[str]] = defaultdict(set)
         requested_non_partitioned_root_assets: Set[AssetKey] = set()
@@ -154,6 +183,7 @@ def with_updates(
             latest_storage_id=latest_storage_id or self.latest_storage_id,
             materialized_or_requested_root_asset_keys=result_materialized_or_requested_root_asset_keys,
             materialized_or_requested_root_partitions_by_asset_key=result_materialized_or_requested_root_partitions_by_asset_key,
+            dirty_asset_partitions=list(dirty_asset_partitions),
         )
 
     @classmethod
@@ -170,6 +200,8 @@ def from_serialized(cls, cursor: str, asset_graph: AssetGraph) -> "AssetReconcil
             latest_storage_id,
             serialized_materialized_or_requested_root_asset_keys,
             serialized_materialized_or_requested_root_partitions_by_asset_key,
+            # cursors without dirty asset partitions are serialized without this element
+            *serialized_dirty_asset_partitions,
         ) = json.loads(cursor)
         materialized_or_requested_root_partitions_by_asset_key = {}
         for (
@@ -187,6 +219,18 @@ def from_serialized(cls, cursor: str, asset_graph: AssetGraph) -> "AssetReconcil
                 for key_str in serialized_materialized_or_requested_root_asset_keys
             },
             materialized_or_requested_root_partitions_by_asset_key=materialized_or_requested_root_partitions_by_asset_key,
+            dirty_asset_partitions=[
+                DirtyAssetPartition(
+                    asset_partition=AssetKeyPartitionKey(
+                        AssetKey.from_user_string(key_str), partition_key
+                    ),
+                    storage_id=storage_id,
+                    run_id=run_id,
+                )
+                for key_str, partition_key, storage_id, run_id in next(
+                    iter(serialized_dirty_asset_partitions), []
+                )
+            ],
         )
 
     def serialize(self) -> str:
@@ -194,16 +238,54 @@ def serialize(self) -> str:
             key.to_user_string(): subset.serialize()
             for key, subset in self.materialized_or_requested_root_partitions_by_asset_key.items()
         }
+        serializable_dirty_asset_partitions = [
+            (
+                dirty.asset_partition.asset_key.to_user_string(),
+                dirty.asset_partition.partition_key,
+                dirty.storage_id,
+                dirty.run_id,
+            )
+            for dirty in self.dirty_asset_partitions
+        ]
         serialized = json.dumps(
             (
                 self.latest_storage_id,
                 [key.to_user_string() for key in self.materialized_or_requested_root_asset_keys],
                 serializable_materialized_or_requested_root_partitions_by_asset_key,
+                # only written when non-empty, so that cursors remain readable by prior versions
+                *(
+                    [serializable_dirty_asset_partitions]
+                    if serializable_dirty_asset_partitions
+                    else []
+                ),
             )
         )
         return serialized
 
 
+class ReconciliationPhaseTimer:
+    """Records how long each phase of a reconciliation tick takes."""
+
+    def __init__(self):
+        self._timings: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        with time_execution_scope() as timer_result:
+            yield
+        self._timings[name] = self._timings.get(name, 0.0) + timer_result.millis
+
+    @property
+    def timings(self) -> Mapping[str, float]:
+        """The total duration of each phase, in milliseconds."""
+        return dict(self._timings)
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{name}: {format_duration(millis)}" for name, millis in self._timings.items()
+        )
+
+
 def find_parent_materialized_asset_partitions(
     instance_queryer: "CachingInstanceQueryer",
     latest_storage_id: Optional[int],
@@ -265,6 +347,133 @@ def find_parent_materialized_asset_partitions(
     return (result_asset_partitions, result_latest_storage_id)
 
 
+class DirtyAssetPartitions(NamedTuple):
+    """
+    Attributes:
+        to_evaluate: The dirty asset partitions whose children are evaluated in this tick.
+        deferred: The dirty asset partitions left for subsequent ticks.
+        latest_storage_id: The storage ID of the latest materialization read.
+    """
+
+    to_evaluate: Sequence[DirtyAssetPartition]
+    deferred: Sequence[DirtyAssetPartition]
+    latest_storage_id: Optional[int]
+
+
+def find_dirty_asset_partitions(
+    instance_queryer: "CachingInstanceQueryer",
+    cursor: AssetReconciliationCursor,
+    target_parent_asset_keys: AbstractSet[AssetKey],
+    asset_graph: AssetGraph,
+    max_dirty_asset_partitions: Optional[int] = DEFAULT_MAX_DIRTY_ASSET_PARTITIONS_PER_TICK,
+) -> DirtyAssetPartitions:
+    """
+    Reads the materializations since the cursor to find the asset partitions among the parents of
+    the target assets that have been materialized since the cursor, adding them to the dirty asset
+    partitions of the cursor.
+
+    Unlike find_parent_materialized_asset_partitions, which checks each parent of the target assets
+    for new materializations, this only reads the materializations that have happened since the
+    cursor, so its cost does not grow with the size of the asset graph.
+    """
+    check.invariant(
+        cursor.latest_storage_id is not None,
+        "Dirty asset partitions can only be found for a cursor with a latest storage ID",
+    )
+
+    dirty_by_asset_partition: Dict[AssetKeyPartitionKey, DirtyAssetPartition] = {
+        dirty.asset_partition: dirty for dirty in cursor.dirty_asset_partitions
+    }
+    latest_storage_id = cursor.latest_storage_id
+    for record in instance_queryer.instance.iterate_event_records(
+        EventRecordsFilter(
+            event_type=DagsterEventType.ASSET_MATERIALIZATION,
+            after_cursor=cursor.latest_storage_id,
+        ),
+        include_event=False,
+    ):
+        latest_storage_id = record.storage_id
+        asset_key = record.asset_key
+        if (
+            asset_key is None
+            or asset_key not in target_parent_asset_keys
+            or asset_graph.is_source(asset_key)
+        ):
+            continue
+
+        asset_partition = AssetKeyPartitionKey(asset_key, record.partition_key)
+        # a later materialization of the same asset partition replaces the earlier one
+        dirty_by_asset_partition[asset_partition] = DirtyAssetPartition(
+            asset_partition=asset_partition, storage_id=record.storage_id, run_id=record.run_id
+        )
+
+    dirty_asset_partitions = sorted(
+        dirty_by_asset_partition.values(), key=lambda dirty: dirty.storage_id
+    )
+    if max_dirty_asset_partitions is None:
+        max_dirty_asset_partitions = len(dirty_asset_partitions)
+
+    return DirtyAssetPartitions(
+        to_evaluate=dirty_asset_partitions[:max_dirty_asset_partitions],
+        deferred=dirty_asset_partitions[max_dirty_asset_partitions:],
+        latest_storage_id=latest_storage_id,
+    )
+
+
+def get_dirty_asset_partition_children(
+    instance_queryer: "CachingInstanceQueryer",
+    dirty_asset_partitions: Iterable[DirtyAssetPartition],
+    target_asset_keys: AbstractSet[AssetKey],
+    asset_graph: AssetGraph,
+) -> AbstractSet[AssetKeyPartitionKey]:
+    """
+    Returns the children of the given dirty asset partitions, choosing the same children as
+    find_parent_materialized_asset_partitions would for the same materializations.
+    """
+    result_asset_partitions: Set[AssetKeyPartitionKey] = set()
+    for dirty in dirty_asset_partitions:
+        asset_key = dirty.asset_partition.asset_key
+        for child in asset_graph.get_children_partitions(
+            instance_queryer, asset_key, dirty.asset_partition.partition_key
+        ):
+            if asset_graph.is_partitioned(asset_key) or (
+                child.asset_key in target_asset_keys
+                and not instance_queryer.is_asset_in_run(dirty.run_id, child)
+            ):
+                result_asset_partitions.add(child)
+
+    return result_asset_partitions
+
+
+def get_dirty_asset_partition_neighborhood(
+    dirty_asset_partitions: Iterable[DirtyAssetPartition],
+    target_asset_keys: AbstractSet[AssetKey],
+    asset_graph: AssetGraph,
+) -> AbstractSet[AssetKey]:
+    """
+    Returns the assets whose materializations are queried to evaluate the children of the given
+    dirty asset partitions: the targeted children of the dirty asset partitions, and every asset
+    upstream of those children, which determine whether the children are reconciled.
+    """
+    neighborhood = {
+        child_key
+        for dirty in dirty_asset_partitions
+        for child_key in asset_graph.get_children(dirty.asset_partition.asset_key)
+        if child_key in target_asset_keys
+    }
+    queue = deque(neighborhood)
+    while queue:
+        asset_key = queue.popleft()
+        if asset_graph.is_source(asset_key):
+            continue
+        for parent_key in asset_graph.get_parents(asset_key):
+            if parent_key not in neighborhood:
+                neighborhood.add(parent_key)
+                queue.append(parent_key)
+
+    return neighborhood
+
+
 def find_never_materialized_or_requested_root_asset_partitions(
     instance_queryer: "CachingInstanceQueryer",
     cursor: AssetReconciliationCursor,
@@ -289,10 +498,15 @@ def find_never_materialized_or_requested_root_asset_partitions(
 
     for asset_key in (target_asset_selection & AssetSelection.all().sources()).resolve(asset_graph):
         if asset_graph.is_partitioned(asset_key):
-            for partition_key in cursor.get_never_requested_never_materialized_partitions(
-                asset_key, asset_graph, instance_queryer
-            ):
-                asset_partition = AssetKeyPartitionKey(asset_key, partition_key)
+            asset_partitions = [
+                AssetKeyPartitionKey(asset_key, partition_key)
+                for partition_key in cursor.get_never_requested_never_materialized_partitions(
+                    asset_key, asset_graph, instance_queryer
+                )
+            ]
+            instance_queryer.prefetch_latest_materialization_records(asset_partitions)
+            for asset_partition in asset_partitions:
+                partition_key = cast(str, asset_partition.partition_key)
                 if instance_queryer.get_latest_materialization_record(asset_partition, None):
                     newly_materialized_root_partitions_by_asset_key[asset_key].add(partition_key)
                 else:
@@ -373,31 +587,50 @@ def determine_asset_partitions_to_reconcile(
     target_asset_selection: AssetSelection,
     asset_graph: AssetGraph,
     eventual_asset_partitions_to_reconcile_for_freshness: AbstractSet[AssetKeyPartitionKey],
+    dirty_asset_partitions: Optional[DirtyAssetPartitions] = None,
+    phase_timer: Optional[ReconciliationPhaseTimer] = None,
 ) -> Tuple[
     AbstractSet[AssetKeyPartitionKey],
     AbstractSet[AssetKey],
     Mapping[AssetKey, AbstractSet[str]],
     Optional[int],
 ]:
-    (
-        never_materialized_or_requested_roots,
-        newly_materialized_root_asset_keys,
-        newly_materialized_root_partitions_by_asset_key,
-    ) = find_never_materialized_or_requested_root_asset_partitions(
-        instance_queryer=instance_queryer,
-        cursor=cursor,
-        target_asset_selection=target_asset_selection,
-        asset_graph=asset_graph,
-    )
+    """
+    If dirty_asset_partitions is provided, only the children of the dirty asset partitions to
+    evaluate are considered as stale candidates, rather than the children of every parent of the
+    target assets that has been materialized since the cursor.
+    """
+    phase_timer = phase_timer or ReconciliationPhaseTimer()
+    target_asset_keys = target_asset_selection.resolve(asset_graph)
 
-    stale_candidates, latest_storage_id = find_parent_materialized_asset_partitions(
-        instance_queryer=instance_queryer,
-        latest_storage_id=cursor.latest_storage_id,
-        target_asset_selection=target_asset_selection,
-        asset_graph=asset_graph,
-    )
+    with phase_timer.phase("find_roots"):
+        (
+            never_materialized_or_requested_roots,
+            newly_materialized_root_asset_keys,
+            newly_materialized_root_partitions_by_asset_key,
+        ) = find_never_materialized_or_requested_root_asset_partitions(
+            instance_queryer=instance_queryer,
+            cursor=cursor,
+            target_asset_selection=target_asset_selection,
+            asset_graph=asset_graph,
+        )
 
-    target_asset_keys = target_asset_selection.resolve(asset_graph)
+    with phase_timer.phase("find_stale_candidates"):
+        if dirty_asset_partitions is not None:
+            stale_candidates = get_dirty_asset_partition_children(
+                instance_queryer=instance_queryer,
+                dirty_asset_partitions=dirty_asset_partitions.to_evaluate,
+                target_asset_keys=target_asset_keys,
+                asset_graph=asset_graph,
+            )
+            latest_storage_id = dirty_asset_partitions.latest_storage_id
+        else:
+            stale_candidates, latest_storage_id = find_parent_materialized_asset_partitions(
+                instance_queryer=instance_queryer,
+                latest_storage_id=cursor.latest_storage_id,
+                target_asset_selection=target_asset_selection,
+                asset_graph=asset_graph,
+            )
 
     def parents_will_be_reconciled(
         candidate: AssetKeyPartitionKey,
@@ -443,11 +676,12 @@ def should_reconcile(
             for candidate in candidates_unit
         )
 
-    to_reconcile = asset_graph.bfs_filter_asset_partitions(
-        instance_queryer,
-        should_reconcile,
-        set(itertools.chain(never_materialized_or_requested_roots, stale_candidates)),
-    )
+    with phase_timer.phase("filter_candidates"):
+        to_reconcile = asset_graph.bfs_filter_asset_partitions(
+            instance_queryer,
+            should_reconcile,
+            set(itertools.chain(never_materialized_or_requested_roots, stale_candidates)),
+        )
 
     return (
         to_reconcile,
@@ -740,26 +974,69 @@ def reconcile(
     instance: "DagsterInstance",
     cursor: AssetReconciliationCursor,
     run_tags: Optional[Mapping[str, str]],
+    max_dirty_asset_partitions: Optional[int] = DEFAULT_MAX_DIRTY_ASSET_PARTITIONS_PER_TICK,
+    phase_timer: Optional[ReconciliationPhaseTimer] = None,
 ):
+    """
+    Once the cursor has a latest storage ID, reconciliation is incremental: only the
+    materializations since the cursor are read, and only the descendants of the asset partitions
+    they touched are evaluated. At most max_dirty_asset_partitions of those asset partitions are
+    evaluated per tick, and the rest are kept in the cursor for subsequent ticks.
+    """
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer  # expensive import
 
     instance_queryer = CachingInstanceQueryer(instance=instance)
     asset_graph = repository_def.asset_graph
+    phase_timer = phase_timer or ReconciliationPhaseTimer()
+
+    with phase_timer.phase("find_dirty_asset_partitions"):
+        target_parent_asset_keys = asset_selection.upstream(depth=1).resolve(asset_graph)
+        if cursor.latest_storage_id is not None:
+            dirty_asset_partitions: Optional[DirtyAssetPartitions] = find_dirty_asset_partitions(
+                instance_queryer=instance_queryer,
+                cursor=cursor,
+                target_parent_asset_keys=target_parent_asset_keys,
+                asset_graph=asset_graph,
+                max_dirty_asset_partitions=max_dirty_asset_partitions,
+            )
+        else:
+            dirty_asset_partitions = None
+
+    with phase_timer.phase("prefetch"):
+        # fetch some data in advance to batch together some queries
+        if dirty_asset_partitions is not None:
+            target_asset_keys = asset_selection.resolve(asset_graph)
+            keys_to_prefetch = {
+                *get_dirty_asset_partition_neighborhood(
+                    dirty_asset_partitions.to_evaluate, target_asset_keys, asset_graph
+                ),
+                *(key for key in target_asset_keys if not asset_graph.has_non_source_parents(key)),
+                # the freshness policies are evaluated over all of their upstream assets
+                *itertools.chain.from_iterable(
+                    [key, *asset_graph.upstream_key_iterator(key)]
+                    for key, freshness_policy in asset_graph.freshness_policies_by_key.items()
+                    if freshness_policy is not None
+                ),
+            }
+            instance_queryer.prefetch_for_keys(
+                [key for key in keys_to_prefetch if key in target_parent_asset_keys],
+                after_cursor=cursor.latest_storage_id,
+            )
+        else:
+            instance_queryer.prefetch_for_keys(
+                list(target_parent_asset_keys),
+                after_cursor=cursor.latest_storage_id,
+            )
 
-    # fetch some data in advance to batch together some queries
-    instance_queryer.prefetch_for_keys(
-        list(asset_selection.upstream(depth=1).resolve(asset_graph)),
-        after_cursor=cursor.latest_storage_id,
-    )
-
-    (
-        asset_partitions_to_reconcile_for_freshness,
-        eventual_asset_partitions_to_reconcile_for_freshness,
-    ) = determine_asset_partitions_to_reconcile_for_freshness(
-        instance_queryer=instance_queryer,
-        asset_graph=asset_graph,
-        target_asset_selection=asset_selection,
-    )
+    with phase_timer.phase("freshness"):
+        (
+            asset_partitions_to_reconcile_for_freshness,
+            eventual_asset_partitions_to_reconcile_for_freshness,
+        ) = determine_asset_partitions_to_reconcile_for_freshness(
+            instance_queryer=instance_queryer,
+            asset_graph=asset_graph,
+            target_asset_selection=asset_selection,
+        )
 
     (
         asset_partitions_to_reconcile,
@@ -772,13 +1049,16 @@ def reconcile(
         cursor=cursor,
         target_asset_selection=asset_selection,
         eventual_asset_partitions_to_reconcile_for_freshness=eventual_asset_partitions_to_reconcile_for_freshness,
+        dirty_asset_partitions=dirty_asset_partitions,
+        phase_timer=phase_timer,
     )
 
-    run_requests = build_run_requests(
-        asset_partitions_to_reconcile | asset_partitions_to_reconcile_for_freshness,
-        asset_graph,
-        run_tags,
-    )
+    with phase_timer.phase("build_run_requests"):
+        run_requests = build_run_requests(
+            asset_partitions_to_reconcile | asset_partitions_to_reconcile_for_freshness,
+            asset_graph,
+            run_tags,
+        )
 
     return run_requests, cursor.with_updates(
         latest_storage_id=latest_storage_id,
@@ -786,6 +1066,7 @@ def reconcile(
         asset_graph=repository_def.asset_graph,
         newly_materialized_root_asset_keys=newly_materialized_root_asset_keys,
         newly_materialized_root_partitions_by_asset_key=newly_materialized_root_partitions_by_asset_key,
+        dirty_asset_partitions=dirty_asset_partitions.deferred if dirty_asset_partitions else (),
     )
 
 
@@ -951,13 +1232,21 @@ def _sensor(context):
             if context.cursor
             else AssetReconciliationCursor.empty()
         )
+        phase_timer = ReconciliationPhaseTimer()
         run_requests, updated_cursor = reconcile(
             repository_def=context.repository_def,
             asset_selection=asset_selection,
             instance=context.instance,
             cursor=cursor,
             run_tags=run_tags,
+            phase_timer=phase_timer,
         )
+        context.log.debug(f"Asset reconciliation phase timings: {phase_timer}")
+        if updated_cursor.dirty_asset_partitions:
+            context.log.info(
+                f"Deferred {len(updated_cursor.dirty_asset_partitions)} materialized asset"
+                " partitions to the next tick"
+            )
 
         context.update_cursor(updated_cursor.serialize())
         return run_requests
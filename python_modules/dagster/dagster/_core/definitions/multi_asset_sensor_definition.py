@@ -31,7 +31,7 @@
 from dagster._core.instance.ref import InstanceRef
 
 from ..decorator_utils import get_function_params
-from .events import AssetKey
+from .events import AssetKey, AssetKeyPartitionKey
 from .run_request import RunRequest, SkipReason
 from .sensor_definition import (
     DefaultSensorStatus,
@@ -481,8 +481,7 @@ def my_sensor(context):
                 # returns {"2022-07-05": EventLogRecord(...)}
 
         """
-        from dagster._core.events import DagsterEventType
-        from dagster._core.storage.event_log.base import EventLogRecord, EventRecordsFilter
+        from dagster._core.storage.event_log.base import EventLogRecord
 
         asset_key = check.inst_param(asset_key, "asset_key", AssetKey)
 
@@ -522,14 +521,20 @@ def my_sensor(context):
                 # Add partition and materialization to the end of the OrderedDict
                 materialization_by_partition[partition] = unconsumed_event
 
-        partition_materializations = self.instance.get_event_records(
-            EventRecordsFilter(
-                event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                asset_key=asset_key,
-                asset_partitions=partitions_to_fetch,
-                after_cursor=self._get_cursor(asset_key).latest_consumed_event_id,
+        # the latest materialization of each partition, in the order that they occurred
+        latest_consumed_event_id = self._get_cursor(asset_key).latest_consumed_event_id
+        partition_materializations = sorted(
+            (
+                record
+                for record in self.instance.get_latest_asset_partition_materialization_records(
+                    [
+                        AssetKeyPartitionKey(asset_key, partition)
+                        for partition in partitions_to_fetch
+                    ]
+                ).values()
+                if latest_consumed_event_id is None or record.storage_id > latest_consumed_event_id
             ),
-            ascending=True,
+            key=lambda record: record.storage_id,
         )
         for materialization in partition_materializations:
             partition = materialization.partition_key
@@ -0,0 +1,111 @@
+"""The run lifecycle events handed to run status sensors.
+
+Rather than each run status sensor querying the event log for the events after its own cursor, and
+then loading the run of each event one at a time, the sensor daemon reads the new events of each
+run lifecycle event type once per iteration, loads their runs in a single batch, and passes each
+run status sensor the slice of events after its cursor along with its evaluation arguments.
+"""
+from typing import TYPE_CHECKING, NamedTuple, Optional, Sequence
+
+import dagster._check as check
+from dagster._core.event_api import EventLogRecord
+from dagster._core.storage.pipeline_run import DagsterRun, RunsFilter
+from dagster._serdes import whitelist_for_serdes
+from dagster._utils import utc_datetime_from_timestamp
+
+if TYPE_CHECKING:
+    from dagster._core.instance import DagsterInstance
+
+# The default maximum number of run lifecycle events read in a single event log query
+DEFAULT_RUN_STATUS_EVENT_BATCH_SIZE = 5
+
+
+@whitelist_for_serdes
+class RunStatusFeedEntry(
+    NamedTuple(
+        "_RunStatusFeedEntry",
+        [
+            ("event_record", EventLogRecord),
+            ("dagster_run", Optional[DagsterRun]),
+            ("update_timestamp", str),
+        ],
+    )
+):
+    """A run lifecycle event, along with the run it belongs to (None if the run could not be
+    found) and the ISO formatted time the run was last updated.
+    """
+
+    def __new__(
+        cls,
+        event_record: EventLogRecord,
+        dagster_run: Optional[DagsterRun],
+        update_timestamp: str,
+    ):
+        return super(RunStatusFeedEntry, cls).__new__(
+            cls,
+            event_record=check.inst_param(event_record, "event_record", EventLogRecord),
+            dagster_run=check.opt_inst_param(dagster_run, "dagster_run", DagsterRun),
+            update_timestamp=check.str_param(update_timestamp, "update_timestamp"),
+        )
+
+
+@whitelist_for_serdes
+class RunStatusFeedSlice(
+    NamedTuple(
+        "_RunStatusFeedSlice",
+        [
+            ("after_storage_id", int),
+            ("entries", Sequence[RunStatusFeedEntry]),
+        ],
+    )
+):
+    """The run lifecycle events of a single event type with a storage id greater than
+    `after_storage_id`, in ascending storage id order.
+    """
+
+    def __new__(cls, after_storage_id: int, entries: Sequence[RunStatusFeedEntry]):
+        return super(RunStatusFeedSlice, cls).__new__(
+            cls,
+            after_storage_id=check.int_param(after_storage_id, "after_storage_id"),
+            entries=check.sequence_param(entries, "entries", of_type=RunStatusFeedEntry),
+        )
+
+
+def get_run_status_feed_entries(
+    instance: "DagsterInstance", event_records: Sequence[EventLogRecord]
+) -> Sequence[RunStatusFeedEntry]:
+    """Loads the runs of the given run lifecycle event records in a single run storage query."""
+    run_ids = list({event_record.run_id for event_record in event_records})
+    run_records_by_id = (
+        {
+            run_record.dagster_run.run_id: run_record
+            for run_record in instance.get_run_records(filters=RunsFilter(run_ids=run_ids))
+        }
+        if run_ids
+        else {}
+    )
+
+    entries = []
+    for event_record in event_records:
+        run_record = run_records_by_id.get(event_record.run_id)
+        if run_record:
+            entries.append(
+                RunStatusFeedEntry(
+                    event_record=event_record,
+                    dagster_run=run_record.dagster_run,
+                    update_timestamp=run_record.update_timestamp.isoformat(),
+                )
+            )
+        else:
+            # bc we couldn't find the run, we use the event timestamp as the approximate run update
+            # timestamp
+            entries.append(
+                RunStatusFeedEntry(
+                    event_record=event_record,
+                    dagster_run=None,
+                    update_timestamp=utc_datetime_from_timestamp(
+                        event_record.timestamp
+                    ).isoformat(),
+                )
+            )
+    return entries
@@ -27,7 +27,7 @@
 )
 from dagster._core.events import PIPELINE_RUN_STATUS_TO_EVENT_TYPE, DagsterEvent
 from dagster._core.instance import DagsterInstance
-from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, RunsFilter
+from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus
 from dagster._serdes import (
     deserialize_json_to_dagster_namedtuple,
     serialize_dagster_namedtuple,
@@ -36,13 +36,13 @@
 from dagster._serdes.errors import DeserializationError
 from dagster._serdes.serdes import register_serdes_tuple_fallbacks
 from dagster._seven import JSONDecodeError
-from dagster._utils import utc_datetime_from_timestamp
 from dagster._utils.backcompat import deprecation_warning
 from dagster._utils.error import serializable_error_info_from_exc_info
 
 from ..decorator_utils import get_function_params
 from .graph_definition import GraphDefinition
 from .pipeline_definition import PipelineDefinition
+from .run_status_feed import DEFAULT_RUN_STATUS_EVENT_BATCH_SIZE, get_run_status_feed_entries
 from .sensor_definition import (
     DefaultSensorStatus,
     PipelineRunReaction,
@@ -469,6 +469,7 @@ def __init__(
         self._run_status_sensor_fn = check.callable_param(
             run_status_sensor_fn, "run_status_sensor_fn"
         )
+        self._run_status = run_status
         event_type = PIPELINE_RUN_STATUS_TO_EVENT_TYPE[run_status]
 
         # split monitored_jobs into external repos, external jobs, and jobs in the current repo
@@ -497,7 +498,10 @@ def _wrapped_fn(
             if context.cursor is None or not RunStatusSensorCursor.is_valid(context.cursor):
                 most_recent_event_records = list(
                     context.instance.get_event_records(
-                        EventRecordsFilter(event_type=event_type), ascending=False, limit=1
+                        EventRecordsFilter(event_type=event_type),
+                        ascending=False,
+                        limit=1,
+                        include_event=False,
                     )
                 )
                 most_recent_event_id = (
@@ -516,49 +520,49 @@ def _wrapped_fn(
 
             record_id, update_timestamp = RunStatusSensorCursor.from_json(context.cursor)
 
-            # Fetch events after the cursor id
-            # * we move the cursor forward to the latest visited event's id to avoid revisits
-            # * when the daemon is down, bc we persist the cursor info, we can go back to where we
-            #   left and backfill alerts for the qualified events (up to 5 at a time) during the downtime
-            # Note: this is a cross-run query which requires extra handling in sqlite, see details in SqliteEventLogStorage.
-            event_records = context.instance.get_event_records(
-                EventRecordsFilter(
-                    after_cursor=RunShardedEventsCursor(
-                        id=record_id,
-                        run_updated_after=cast(datetime, pendulum.parse(update_timestamp)),
+            run_status_feed = context.run_status_feed
+            if run_status_feed is not None and run_status_feed.after_storage_id == record_id:
+                # the sensor daemon has already read the events after the cursor, along with their
+                # runs, once for all of the run status sensors of this event type
+                feed_entries = run_status_feed.entries
+            else:
+                # Fetch events after the cursor id
+                # * we move the cursor forward to the latest visited event's id to avoid revisits
+                # * when the daemon is down, bc we persist the cursor info, we can go back to where
+                #   we left and backfill alerts for the qualified events (up to the configured batch
+                #   size at a time) during the downtime
+                # Note: this is a cross-run query which requires extra handling in sqlite, see
+                # details in SqliteEventLogStorage.
+                event_records = context.instance.get_event_records(
+                    EventRecordsFilter(
+                        after_cursor=RunShardedEventsCursor(
+                            id=record_id,
+                            run_updated_after=cast(datetime, pendulum.parse(update_timestamp)),
+                        ),
+                        event_type=event_type,
                     ),
-                    event_type=event_type,
-                ),
-                ascending=True,
-                limit=5,
-            )
+                    ascending=True,
+                    limit=context.instance.get_settings("sensors").get(
+                        "run_status_batch_size", DEFAULT_RUN_STATUS_EVENT_BATCH_SIZE
+                    ),
+                )
+                feed_entries = get_run_status_feed_entries(context.instance, event_records)
 
-            for event_record in event_records:
-                event_log_entry = event_record.event_log_entry
+            for feed_entry in feed_entries:
+                event_record = feed_entry.event_record
                 storage_id = event_record.storage_id
-
-                # get run info
-                run_records = context.instance.get_run_records(
-                    filters=RunsFilter(run_ids=[event_log_entry.run_id])
-                )
+                update_timestamp = feed_entry.update_timestamp
 
                 # skip if we couldn't find the right run
-                if len(run_records) != 1:
-                    # bc we couldn't find the run, we use the event timestamp as the approximate
-                    # run update timestamp
-                    approximate_update_timestamp = utc_datetime_from_timestamp(
-                        event_log_entry.timestamp
-                    )
+                if feed_entry.dagster_run is None:
                     context.update_cursor(
                         RunStatusSensorCursor(
-                            record_id=storage_id,
-                            update_timestamp=approximate_update_timestamp.isoformat(),
+                            record_id=storage_id, update_timestamp=update_timestamp
                         ).to_json()
                     )
                     continue
 
-                pipeline_run = run_records[0].dagster_run
-                update_timestamp = run_records[0].update_timestamp
+                pipeline_run = feed_entry.dagster_run
 
                 job_match = False
 
@@ -609,7 +613,7 @@ def _wrapped_fn(
                     # the run in question doesn't match any of the criteria for we advance the cursor and move on
                     context.update_cursor(
                         RunStatusSensorCursor(
-                            record_id=storage_id, update_timestamp=update_timestamp.isoformat()
+                            record_id=storage_id, update_timestamp=update_timestamp
                         ).to_json()
                     )
                     continue
@@ -626,7 +630,7 @@ def _wrapped_fn(
                             RunStatusSensorContext(  # type: ignore
                                 sensor_name=name,
                                 dagster_run=pipeline_run,
-                                dagster_event=event_log_entry.dagster_event,
+                                dagster_event=event_record.event_log_entry.dagster_event,
                                 instance=context.instance,
                                 context=context,
                             )
@@ -635,7 +639,7 @@ def _wrapped_fn(
                             context.update_cursor(
                                 RunStatusSensorCursor(
                                     record_id=storage_id,
-                                    update_timestamp=update_timestamp.isoformat(),
+                                    update_timestamp=update_timestamp,
                                 ).to_json()
                             )
 
@@ -654,7 +658,7 @@ def _wrapped_fn(
 
                 context.update_cursor(
                     RunStatusSensorCursor(
-                        record_id=storage_id, update_timestamp=update_timestamp.isoformat()
+                        record_id=storage_id, update_timestamp=update_timestamp
                     ).to_json()
                 )
 
@@ -720,6 +724,10 @@ def __call__(self, *args, **kwargs):
 
             return self._run_status_sensor_fn()
 
+    @property
+    def run_status(self) -> DagsterRunStatus:
+        return self._run_status
+
     @property
     def sensor_type(self) -> SensorType:
         return SensorType.RUN_STATUS
@@ -41,6 +41,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.definitions.repository_definition import RepositoryDefinition
+    from dagster._core.definitions.run_status_feed import RunStatusFeedSlice
 
 
 @whitelist_for_serdes
@@ -102,6 +103,7 @@ def __init__(
         repository_def: Optional["RepositoryDefinition"] = None,
         instance: Optional[DagsterInstance] = None,
         sensor_name: Optional[str] = None,
+        run_status_feed: Optional["RunStatusFeedSlice"] = None,
     ):
         self._exit_stack = ExitStack()
         self._instance_ref = check.opt_inst_param(instance_ref, "instance_ref", InstanceRef)
@@ -114,6 +116,7 @@ def __init__(
         self._repository_def = repository_def
         self._instance = check.opt_inst_param(instance, "instance", DagsterInstance)
         self._sensor_name = sensor_name
+        self._run_status_feed = run_status_feed
         self._log_key = (
             [
                 repository_name,
@@ -191,6 +194,11 @@ def repository_name(self) -> Optional[str]:
     def repository_def(self) -> Optional["RepositoryDefinition"]:
         return self._repository_def
 
+    @property
+    def run_status_feed(self) -> Optional["RunStatusFeedSlice"]:
+        # the run lifecycle events read by the sensor daemon on behalf of a run status sensor
+        return self._run_status_feed
+
     @property
     def log(self) -> logging.Logger:
         if self._logger:
@@ -64,6 +64,21 @@ def asset_materialization(self) -> Optional[AssetMaterialization]:
         return self.event_log_entry.asset_materialization
 
 
+@whitelist_for_serdes
+class EventLogRecordProjection(NamedTuple):
+    """The indexed fields of an event record, as returned by the event log storage reads that are
+    called with `include_event=False`, which skip fetching and deserializing the event itself.
+
+    Users should not instantiate this class directly.
+    """
+
+    storage_id: PublicAttr[int]
+    run_id: PublicAttr[str]
+    timestamp: PublicAttr[float]
+    asset_key: PublicAttr[Optional[AssetKey]]
+    partition_key: PublicAttr[Optional[str]]
+
+
 @whitelist_for_serdes
 class EventRecordsFilter(
     NamedTuple(
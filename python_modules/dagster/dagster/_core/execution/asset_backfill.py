@@ -2,12 +2,17 @@
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
+    Any,
+    Dict,
     Iterable,
+    Iterator,
     List,
+    Mapping,
     NamedTuple,
     Optional,
     Sequence,
     Set,
+    Tuple,
     cast,
 )
 
@@ -27,6 +32,11 @@
 from dagster._core.definitions.selector import PipelineSelector
 from dagster._core.errors import DagsterBackfillFailedError
 from dagster._core.events import DagsterEventType
+from dagster._core.execution.backfill_submission import (
+    BackfillSubmissionSettings,
+    submit_backfill_runs_in_order,
+)
+from dagster._core.host_representation import ExternalExecutionPlan, ExternalPipeline
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.pipeline_run import DagsterRunStatus, RunsFilter
 from dagster._core.storage.tags import BACKFILL_ID_TAG, PARTITION_NAME_TAG
@@ -244,13 +254,18 @@ def execute_asset_backfill_iteration(
     if result.backfill_data.is_complete():
         updated_backfill = updated_backfill.with_status(BulkActionStatus.COMPLETED)
 
-    for run_request in result.run_requests:
+    yield None
+    for _run_id in submit_run_requests(
+        run_requests=result.run_requests,
+        asset_graph=asset_graph,
+        workspace=workspace,
+        instance=instance,
+    ):
         yield None
-        submit_run_request(
-            run_request=run_request, asset_graph=asset_graph, workspace=workspace, instance=instance
-        )
 
-    instance.update_backfill(updated_backfill)
+    # skip the write when an iteration neither requested nor observed anything new
+    if updated_backfill != backfill:
+        instance.update_backfill(updated_backfill)
 
 
 def submit_run_request(
@@ -262,6 +277,109 @@ def submit_run_request(
     """
     Creates and submits a run for the given run request
     """
+    for _run_id in submit_run_requests(
+        asset_graph=asset_graph, run_requests=[run_request], instance=instance, workspace=workspace
+    ):
+        pass
+
+
+def submit_run_requests(
+    asset_graph: ExternalAssetGraph,
+    run_requests: Sequence[RunRequest],
+    instance: DagsterInstance,
+    workspace: BaseWorkspaceRequestContext,
+) -> Iterator[str]:
+    """
+    Creates and submits runs for the given run requests, yielding the id of each run once it has
+    been submitted.
+
+    The external job and execution plan for each distinct asset selection are fetched once, rather
+    than once per run request.
+    """
+    settings = BackfillSubmissionSettings.from_instance(instance)
+    external_jobs_by_asset_selection: Dict[
+        AbstractSet[AssetKey], Tuple[ExternalPipeline, ExternalExecutionPlan]
+    ] = {}
+
+    if settings.batch_run_creation:
+        run_ids: Iterable[str] = [
+            run.run_id
+            for run in instance.create_runs(
+                [
+                    _get_run_request_params(
+                        asset_graph,
+                        run_request,
+                        instance,
+                        workspace,
+                        external_jobs_by_asset_selection,
+                    )
+                    for run_request in run_requests
+                ]
+            )
+        ]
+    else:
+        run_ids = (
+            instance.create_run(
+                **_get_run_request_params(
+                    asset_graph,
+                    run_request,
+                    instance,
+                    workspace,
+                    external_jobs_by_asset_selection,
+                )
+            ).run_id
+            for run_request in run_requests
+        )
+
+    yield from submit_backfill_runs_in_order(instance, workspace, run_ids, settings)
+
+
+def _get_run_request_params(
+    asset_graph: ExternalAssetGraph,
+    run_request: RunRequest,
+    instance: DagsterInstance,
+    workspace: BaseWorkspaceRequestContext,
+    external_jobs_by_asset_selection: Dict[
+        AbstractSet[AssetKey], Tuple[ExternalPipeline, ExternalExecutionPlan]
+    ],
+) -> Mapping[str, Any]:
+    if not run_request.asset_selection:
+        check.failed("Expected RunRequest to have an asset selection")
+
+    asset_selection = frozenset(run_request.asset_selection)
+    if asset_selection not in external_jobs_by_asset_selection:
+        external_jobs_by_asset_selection[asset_selection] = _get_external_job_for_run_request(
+            asset_graph, run_request, instance, workspace
+        )
+    external_pipeline, external_execution_plan = external_jobs_by_asset_selection[asset_selection]
+
+    return dict(
+        pipeline_snapshot=external_pipeline.pipeline_snapshot,
+        execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
+        parent_pipeline_snapshot=external_pipeline.parent_pipeline_snapshot,
+        pipeline_name=external_pipeline.name,
+        run_id=None,
+        solids_to_execute=None,
+        solid_selection=None,
+        run_config={},
+        mode=DEFAULT_MODE_NAME,
+        step_keys_to_execute=None,
+        tags=run_request.tags,
+        root_run_id=None,
+        parent_run_id=None,
+        status=DagsterRunStatus.NOT_STARTED,
+        external_pipeline_origin=external_pipeline.get_external_origin(),
+        pipeline_code_origin=external_pipeline.get_python_origin(),
+        asset_selection=asset_selection,
+    )
+
+
+def _get_external_job_for_run_request(
+    asset_graph: ExternalAssetGraph,
+    run_request: RunRequest,
+    instance: DagsterInstance,
+    workspace: BaseWorkspaceRequestContext,
+) -> Tuple[ExternalPipeline, ExternalExecutionPlan]:
     repo_handle = asset_graph.get_repository_handle(
         cast(Sequence[AssetKey], run_request.asset_selection)[0]
     )
@@ -294,31 +412,7 @@ def submit_run_request(
         known_state=None,
         instance=instance,
     )
-
-    if not run_request.asset_selection:
-        check.failed("Expected RunRequest to have an asset selection")
-
-    run = instance.create_run(
-        pipeline_snapshot=external_pipeline.pipeline_snapshot,
-        execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
-        parent_pipeline_snapshot=external_pipeline.parent_pipeline_snapshot,
-        pipeline_name=external_pipeline.name,
-        run_id=None,
-        solids_to_execute=None,
-        solid_selection=None,
-        run_config={},
-        mode=DEFAULT_MODE_NAME,
-        step_keys_to_execute=None,
-        tags=run_request.tags,
-        root_run_id=None,
-        parent_run_id=None,
-        status=DagsterRunStatus.NOT_STARTED,
-        external_pipeline_origin=external_pipeline.get_external_origin(),
-        pipeline_code_origin=external_pipeline.get_python_origin(),
-        asset_selection=frozenset(run_request.asset_selection),
-    )
-
-    instance.submit_run(run.run_id, workspace)
+    return external_pipeline, external_execution_plan
 
 
 def _get_implicit_job_name_for_assets(
@@ -0,0 +1,115 @@
+"""Submission of the runs created by backfills.
+
+A backfill over many partitions creates many runs at once. The `backfills` instance settings
+control how many partitions of a job backfill are submitted between checkpoints, whether the runs
+of a chunk are created in a single run storage write, and how many threads submit them, at up to
+how many submissions per second.
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Deque, Iterable, Iterator, NamedTuple, Optional
+
+import dagster._check as check
+
+if TYPE_CHECKING:
+    from dagster._core.instance import DagsterInstance
+    from dagster._core.workspace.workspace import IWorkspace
+
+# The default number of partitions of a job backfill submitted between checkpoints
+DEFAULT_BACKFILL_CHUNK_SIZE = 25
+
+# The default number of threads submitting backfill runs when `use_threads` is set
+DEFAULT_BACKFILL_SUBMISSION_WORKERS = 4
+
+
+class BackfillSubmissionSettings(NamedTuple):
+    chunk_size: int
+    batch_run_creation: bool
+    num_workers: int
+    max_submissions_per_second: Optional[float]
+
+    @staticmethod
+    def from_instance(instance: "DagsterInstance") -> "BackfillSubmissionSettings":
+        settings = instance.get_settings("backfills")
+        return BackfillSubmissionSettings(
+            chunk_size=check.int_param(
+                settings.get("chunk_size", DEFAULT_BACKFILL_CHUNK_SIZE), "chunk_size"
+            ),
+            batch_run_creation=settings.get("batch_run_creation", False),
+            num_workers=(
+                settings.get("num_workers") or DEFAULT_BACKFILL_SUBMISSION_WORKERS
+                if settings.get("use_threads")
+                else 1
+            ),
+            max_submissions_per_second=settings.get("max_submissions_per_second"),
+        )
+
+
+class SubmissionRateLimiter:
+    """Spaces out submissions so that at most `max_per_second` start in any second."""
+
+    def __init__(self, max_per_second: Optional[float]):
+        check.invariant(
+            max_per_second is None or max_per_second > 0,
+            "max_submissions_per_second must be positive",
+        )
+        self._interval = 1.0 / max_per_second if max_per_second else 0.0
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+
+        if start > now:
+            time.sleep(start - now)
+
+
+def submit_backfill_runs_in_order(
+    instance: "DagsterInstance",
+    workspace: "IWorkspace",
+    run_ids: Iterable[str],
+    settings: BackfillSubmissionSettings,
+) -> Iterator[str]:
+    """Submits the given runs, yielding the id of each run once it has been submitted, in the order
+    they were given.
+
+    `run_ids` is consumed lazily, at most `num_workers` runs ahead of the last run yielded, so runs
+    that are created as they are iterated over are not created until a worker is ready to submit
+    them. Closing the iterator stops submitting new runs once the in-flight submissions finish.
+    """
+    rate_limiter = SubmissionRateLimiter(settings.max_submissions_per_second)
+
+    if settings.num_workers <= 1:
+        for run_id in run_ids:
+            rate_limiter.wait()
+            instance.submit_run(run_id, workspace)
+            yield run_id
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=settings.num_workers,
+        thread_name_prefix="backfill_submission_worker",
+    ) as executor:
+        in_flight: Deque["Future[str]"] = deque()
+        for run_id in run_ids:
+            if len(in_flight) >= settings.num_workers:
+                yield in_flight.popleft().result()
+
+            rate_limiter.wait()
+            in_flight.append(executor.submit(_submit_run, instance, workspace, run_id))
+
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def _submit_run(instance: "DagsterInstance", workspace: "IWorkspace", run_id: str) -> str:
+    instance.submit_run(run_id, workspace)
+    return run_id
@@ -1,7 +1,7 @@
 import logging
 import os
 import time
-from typing import Iterable, Mapping, Optional, Sequence, Tuple, cast
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, cast
 
 import dagster._check as check
 from dagster._core.definitions.selector import PipelineSelector
@@ -34,11 +34,11 @@
 from dagster._utils.merger import merge_dicts
 
 from .backfill import BulkActionStatus, PartitionBackfill
+from .backfill_submission import BackfillSubmissionSettings, submit_backfill_runs_in_order
 
 # out of abundance of caution, sleep at checkpoints in case we are pinning CPU by submitting lots
 # of jobs all at once
 CHECKPOINT_INTERVAL = 1
-CHECKPOINT_COUNT = 25
 
 
 def execute_job_backfill_iteration(
@@ -64,16 +64,29 @@ def execute_job_backfill_iteration(
 
     _check_repo_has_partition_set(repo_location, backfill)
 
+    settings = BackfillSubmissionSettings.from_instance(instance)
+
     has_more = True
     while has_more:
         if backfill.status != BulkActionStatus.REQUESTED:
             break
 
-        chunk, checkpoint, has_more = _get_partitions_chunk(
-            instance, logger, backfill, CHECKPOINT_COUNT
+        chunk, unsubmitted_run_ids, checkpoint, has_more = _get_partitions_chunk(
+            instance, logger, backfill, settings.chunk_size
         )
         _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
 
+        if unsubmitted_run_ids:
+            # runs created by a previous iteration that stopped before submitting them
+            logger.info(
+                f"Submitting {len(unsubmitted_run_ids)} runs that were created but not submitted"
+                f" for backfill {backfill.backfill_id}"
+            )
+            for _run_id in submit_backfill_runs_in_order(
+                instance, workspace, unsubmitted_run_ids, settings
+            ):
+                yield None
+
         if chunk:
             for _run_id in submit_backfill_runs(
                 instance, workspace, repo_location, backfill, chunk
@@ -127,29 +140,33 @@ def _get_partitions_chunk(
     logger: logging.Logger,
     backfill_job: PartitionBackfill,
     chunk_size: int,
-) -> Tuple[Sequence[str], str, bool]:
+) -> Tuple[Sequence[str], Sequence[str], str, bool]:
+    """Returns the partitions of the next chunk that don't have a run yet, the ids of the runs of
+    the chunk that were created but never submitted, the checkpoint after the chunk, and whether
+    there are more partitions after it.
+    """
     partition_names = cast(Sequence[str], backfill_job.partition_names)
     checkpoint = backfill_job.last_submitted_partition_name
 
-    if (
-        backfill_job.last_submitted_partition_name
-        and backfill_job.last_submitted_partition_name in partition_names
-    ):
-        index = partition_names.index(backfill_job.last_submitted_partition_name)
-        partition_names = partition_names[index + 1 :]
+    start = partition_names.index(checkpoint) + 1 if checkpoint in partition_names else 0
+    has_more = start + chunk_size < len(partition_names)
+    partitions_chunk = partition_names[start : start + chunk_size]
+    next_checkpoint = partitions_chunk[-1]
 
-    # for idempotence, fetch all runs with the current backfill id
+    # for idempotence, fetch the runs for the partitions in the chunk with the current backfill id,
+    # rather than every run of the backfill
     backfill_runs = instance.get_runs(
-        RunsFilter(tags=DagsterRun.tags_for_backfill_id(backfill_job.backfill_id))
+        RunsFilter(
+            tags={
+                **DagsterRun.tags_for_backfill_id(backfill_job.backfill_id),
+                PARTITION_NAME_TAG: list(partitions_chunk),
+            }
+        )
     )
     completed_partitions = set([run.tags.get(PARTITION_NAME_TAG) for run in backfill_runs])
-    initial_checkpoint = (
-        partition_names.index(checkpoint) + 1 if checkpoint and checkpoint in partition_names else 0
-    )
-    partition_names = partition_names[initial_checkpoint:]
-    has_more = chunk_size < len(partition_names)
-    partitions_chunk = partition_names[:chunk_size]
-    next_checkpoint = partitions_chunk[-1]
+    unsubmitted_run_ids = [
+        run.run_id for run in backfill_runs if run.status == DagsterRunStatus.NOT_STARTED
+    ]
 
     to_skip = set(partitions_chunk).intersection(completed_partitions)
     if to_skip:
@@ -161,7 +178,7 @@ def _get_partitions_chunk(
         for partition_name in partitions_chunk
         if partition_name not in completed_partitions
     ]
-    return to_submit, next_checkpoint, has_more
+    return to_submit, unsubmitted_run_ids, next_checkpoint, has_more
 
 
 def submit_backfill_runs(
@@ -209,22 +226,62 @@ def submit_backfill_runs(
         external_pipeline = external_repo.get_full_external_job(
             external_partition_set.pipeline_name
         )
-    for partition_data in result.partition_data:
+
+    settings = BackfillSubmissionSettings.from_instance(instance)
+    if settings.batch_run_creation and not backfill_job.from_failure:
+        run_ids: Iterable[str] = [
+            dagster_run.run_id
+            for dagster_run in instance.create_runs(
+                [
+                    get_backfill_run_params(
+                        instance,
+                        repo_location,
+                        external_pipeline,
+                        external_partition_set,
+                        backfill_job,
+                        partition_data,
+                    )
+                    for partition_data in result.partition_data
+                ]
+            )
+        ]
+    else:
+        run_ids = _create_backfill_runs(
+            instance,
+            repo_location,
+            external_pipeline,
+            external_partition_set,
+            backfill_job,
+            result.partition_data,
+        )
+
+    for run_id in submit_backfill_runs_in_order(instance, workspace, run_ids, settings):
+        yield run_id
+        yield None
+
+
+def _create_backfill_runs(
+    instance: DagsterInstance,
+    repo_location: RepositoryLocation,
+    external_pipeline: ExternalPipeline,
+    external_partition_set: ExternalPartitionSet,
+    backfill_job: PartitionBackfill,
+    partition_data: Sequence[ExternalPartitionExecutionParamData],
+) -> Iterator[str]:
+    for partition_datum in partition_data:
         dagster_run = create_backfill_run(
             instance,
             repo_location,
             external_pipeline,
             external_partition_set,
             backfill_job,
-            partition_data,
+            partition_datum,
         )
+        # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
+        # and the partition has had a successful run since the time the backfill was
+        # scheduled
         if dagster_run:
-            # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
-            # and the partition has had a successful run since the time the backfill was
-            # scheduled
-            instance.submit_run(dagster_run.run_id, workspace)
             yield dagster_run.run_id
-        yield None
 
 
 def create_backfill_run(
@@ -235,28 +292,55 @@ def create_backfill_run(
     backfill_job: PartitionBackfill,
     partition_data: ExternalPartitionExecutionParamData,
 ) -> Optional[DagsterRun]:
-    from dagster._daemon.daemon import get_telemetry_daemon_session_id
+    if backfill_job.from_failure:
+        _log_backfill_run_created(instance, repo_location, external_pipeline)
+        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
+        if not last_run or last_run.status != DagsterRunStatus.FAILURE:
+            return None
+        return instance.create_reexecuted_run(
+            parent_run=last_run,
+            repo_location=repo_location,
+            external_pipeline=external_pipeline,
+            strategy=ReexecutionStrategy.FROM_FAILURE,
+            extra_tags=_get_backfill_run_tags(external_pipeline, backfill_job, partition_data),
+            run_config=partition_data.run_config,
+            mode=external_partition_set.mode,
+            use_parent_run_tags=False,  # don't inherit tags from the previous run
+        )
 
-    log_action(
-        instance,
-        BACKFILL_RUN_CREATED,
-        metadata={
-            "DAEMON_SESSION_ID": get_telemetry_daemon_session_id(),
-            "repo_hash": hash_name(repo_location.name),
-            "pipeline_name_hash": hash_name(external_pipeline.name),
-        },
+    return instance.create_run(
+        **get_backfill_run_params(
+            instance,
+            repo_location,
+            external_pipeline,
+            external_partition_set,
+            backfill_job,
+            partition_data,
+        )
     )
 
-    tags = merge_dicts(
-        external_pipeline.tags,
-        partition_data.tags,
-        DagsterRun.tags_for_backfill_id(backfill_job.backfill_id),
-        backfill_job.tags,
+
+def get_backfill_run_params(
+    instance: DagsterInstance,
+    repo_location: RepositoryLocation,
+    external_pipeline: ExternalPipeline,
+    external_partition_set: ExternalPartitionSet,
+    backfill_job: PartitionBackfill,
+    partition_data: ExternalPartitionExecutionParamData,
+) -> Mapping[str, Any]:
+    """Returns the arguments to `DagsterInstance.create_run` for the run of a partition of a
+    backfill that is not a `from_failure` backfill.
+    """
+    check.invariant(
+        not backfill_job.from_failure, "from_failure backfills re-execute their previous runs"
     )
+    _log_backfill_run_created(instance, repo_location, external_pipeline)
+
+    tags = _get_backfill_run_tags(external_pipeline, backfill_job, partition_data)
 
     solids_to_execute = None
     solid_selection = None
-    if not backfill_job.from_failure and not backfill_job.reexecution_steps:
+    if not backfill_job.reexecution_steps:
         step_keys_to_execute = None
         parent_run_id = None
         root_run_id = None
@@ -265,22 +349,7 @@ def create_backfill_run(
             solids_to_execute = frozenset(external_partition_set.solid_selection)
             solid_selection = external_partition_set.solid_selection
 
-    elif backfill_job.from_failure:
-        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
-        if not last_run or last_run.status != DagsterRunStatus.FAILURE:
-            return None
-        return instance.create_reexecuted_run(
-            parent_run=last_run,
-            repo_location=repo_location,
-            external_pipeline=external_pipeline,
-            strategy=ReexecutionStrategy.FROM_FAILURE,
-            extra_tags=tags,
-            run_config=partition_data.run_config,
-            mode=external_partition_set.mode,
-            use_parent_run_tags=False,  # don't inherit tags from the previous run
-        )
-
-    else:  # backfill_job.reexecution_steps
+    else:
         last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
         parent_run_id = last_run.run_id if last_run else None
         root_run_id = (last_run.root_run_id or last_run.run_id) if last_run else None
@@ -310,7 +379,7 @@ def create_backfill_run(
         instance=instance,
     )
 
-    return instance.create_run(
+    return dict(
         pipeline_snapshot=external_pipeline.pipeline_snapshot,
         execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
         parent_pipeline_snapshot=external_pipeline.parent_pipeline_snapshot,
@@ -333,6 +402,37 @@ def create_backfill_run(
     )
 
 
+def _get_backfill_run_tags(
+    external_pipeline: ExternalPipeline,
+    backfill_job: PartitionBackfill,
+    partition_data: ExternalPartitionExecutionParamData,
+) -> Mapping[str, str]:
+    return merge_dicts(
+        external_pipeline.tags,
+        partition_data.tags,
+        DagsterRun.tags_for_backfill_id(backfill_job.backfill_id),
+        backfill_job.tags,
+    )
+
+
+def _log_backfill_run_created(
+    instance: DagsterInstance,
+    repo_location: RepositoryLocation,
+    external_pipeline: ExternalPipeline,
+) -> None:
+    from dagster._daemon.daemon import get_telemetry_daemon_session_id
+
+    log_action(
+        instance,
+        BACKFILL_RUN_CREATED,
+        metadata={
+            "DAEMON_SESSION_ID": get_telemetry_daemon_session_id(),
+            "repo_hash": hash_name(repo_location.name),
+            "pipeline_name_hash": hash_name(external_pipeline.name),
+        },
+    )
+
+
 def _fetch_last_run(instance, external_partition_set, partition_name):
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(external_partition_set, "external_partition_set", ExternalPartitionSet)
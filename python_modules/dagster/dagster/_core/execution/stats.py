@@ -1,8 +1,8 @@
-from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, cast
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, cast
 
 import dagster._check as check
+import dagster._seven as seven
 from dagster._core.definitions import ExpectationResult
 from dagster._core.events import MARKER_EVENTS, DagsterEventType, StepExpectationResultData
 from dagster._core.events.log import EventLogEntry
@@ -87,101 +87,201 @@ class StepEventStatus(Enum):
     IN_PROGRESS = "IN_PROGRESS"
 
 
+# Events that contribute to PipelineRunStatsSnapshot
+RUN_STATS_EVENTS = {
+    DagsterEventType.PIPELINE_ENQUEUED,
+    DagsterEventType.PIPELINE_STARTING,
+    DagsterEventType.PIPELINE_START,
+    DagsterEventType.PIPELINE_SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE,
+    DagsterEventType.PIPELINE_CANCELED,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+}
+
+# Step events that contribute to RunStepKeyStatsSnapshot
+STEP_STATS_EVENTS = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+} | MARKER_EVENTS
+
+# Step events that report a step in its RunStepKeyStatsSnapshot, steps are ordered by the first one
+STEP_ORDER_EVENTS = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+}
+
+
 def build_run_step_stats_from_events(
-    run_id: str, records: Iterable[EventLogEntry]
+    run_id: str,
+    records: Iterable[EventLogEntry],
+    storage_ids: Optional[Sequence[int]] = None,
 ) -> Sequence["RunStepKeyStatsSnapshot"]:
-    by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
-    markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    for event in records:
+    """Builds the step stats for a run from its events in storage order. The storage ids of the
+    events, if given, order the steps like the step stats maintained by event log storages.
+    """
+    step_stats_data: Dict[str, Dict[str, Any]] = {}
+    for i, event in enumerate(records):
         if not event.is_dagster_event:
             continue
-        dagster_event = event.get_dagster_event()
-
-        step_key = dagster_event.step_key
+        step_key = event.get_dagster_event().step_key
         if not step_key:
             continue
-
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
-            by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-            by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
-        if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
-            materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
-            by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-            expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
-            expectation_result = expectation_data.expectation_result
-            step_expectation_results = by_step_key[step_key].get("expectation_results", [])
-            step_expectation_results.append(expectation_result)
-            by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
-            DagsterEventType.STEP_UP_FOR_RETRY,
-            DagsterEventType.STEP_RESTARTED,
-        ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type in MARKER_EVENTS:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
-                else:
-                    markers[step_key][key]["start"] = event.timestamp
-
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
-                else:
-                    markers[step_key][key]["end"] = event.timestamp
-
-    for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
-        step_attempts = []
-        attempt_start = step_stats.get("start_time")
-
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-                step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
-                )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
-        if step_stats.get("end_time"):
-            step_attempts.append(
-                RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
-            )
-        else:
-            by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
-        attempts[step_key] = step_attempts
-
-    return [
-        RunStepKeyStatsSnapshot(
-            run_id=run_id,
-            step_key=step_key,
-            attempts_list=attempts[step_key],
-            markers=[
-                RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
-                for marker in markers[step_key].values()
-            ],
-            **value,
+        step_stats_data[step_key] = update_step_stats_data(
+            step_stats_data.get(step_key),
+            event,
+            sort_key=storage_ids[i] if storage_ids is not None else i,
         )
-        for step_key, value in by_step_key.items()
-    ]
+
+    return build_run_step_stats_from_data(run_id, step_stats_data)
+
+
+def update_step_stats_data(
+    step_stats_data: Optional[Dict[str, Any]], event: EventLogEntry, sort_key: Optional[int]
+) -> Dict[str, Any]:
+    """Folds a single event for a step into the accumulated stats data for that step, which is a
+    JSON-serializable dict (apart from the materialization events and expectation results, which
+    are accumulated under their own keys) from which a RunStepKeyStatsSnapshot can be built.
+
+    Folding events one at a time in storage order is equivalent to building the stats for the step
+    from all of its events, which allows event log storages to maintain step stats incrementally.
+    Steps are ordered by the `sort_key` of the first event that reports them, which must increase
+    in storage order, e.g. the storage id of the event. It is only required for STEP_ORDER_EVENTS,
+    since the timestamps of events can tie or go backwards.
+    """
+    data = step_stats_data if step_stats_data is not None else {"attempt_events": [], "markers": []}
+    dagster_event = event.get_dagster_event()
+    event_type = dagster_event.event_type
+
+    if event_type in STEP_ORDER_EVENTS:
+        # steps are only reported once one of these events has been seen, in that order
+        if "stats" not in data:
+            data["stats"] = {"order": check.not_none(sort_key)}
+        stats = data["stats"]
+    else:
+        stats = {}
+
+    if event_type == DagsterEventType.STEP_START:
+        stats["start_time"] = event.timestamp
+        stats["attempts"] = 1
+    if event_type == DagsterEventType.STEP_FAILURE:
+        stats["end_time"] = event.timestamp
+        stats["status"] = StepEventStatus.FAILURE.value
+    if event_type == DagsterEventType.STEP_RESTARTED:
+        stats["attempts"] = int(stats.get("attempts") or 0) + 1
+    if event_type == DagsterEventType.STEP_SUCCESS:
+        stats["end_time"] = event.timestamp
+        stats["status"] = StepEventStatus.SUCCESS.value
+    if event_type == DagsterEventType.STEP_SKIPPED:
+        stats["end_time"] = event.timestamp
+        stats["status"] = StepEventStatus.SKIPPED.value
+    if event_type == DagsterEventType.ASSET_MATERIALIZATION:
+        data.setdefault("materialization_events", []).append(event)
+    if event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+        expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
+        data.setdefault("expectation_results", []).append(expectation_data.expectation_result)
+    if event_type in (
+        DagsterEventType.STEP_UP_FOR_RETRY,
+        DagsterEventType.STEP_RESTARTED,
+    ):
+        data["attempt_events"].append([event_type.value, event.timestamp])
+    if event_type in MARKER_EVENTS:
+        if dagster_event.engine_event_data.marker_start:
+            key = dagster_event.engine_event_data.marker_start
+            _get_marker(data, key)["start"] = event.timestamp
+
+        if dagster_event.engine_event_data.marker_end:
+            key = dagster_event.engine_event_data.marker_end
+            _get_marker(data, key)["end"] = event.timestamp
+
+    return data
+
+
+def _get_marker(step_stats_data: Dict[str, Any], key: str) -> Dict[str, Any]:
+    # markers are kept in a list rather than keyed by marker key, so that they stay in the order
+    # they were first reported when serialized with sorted keys
+    for marker in step_stats_data["markers"]:
+        if marker["key"] == key:
+            return marker
+    marker = {"key": key}
+    step_stats_data["markers"].append(marker)
+    return marker
+
+
+def serialize_step_stats_data(step_stats_data: Mapping[str, Any]) -> str:
+    """Serializes the accumulated stats data for a step for storage, leaving out the
+    materialization events and expectation results, which are read back from the event log.
+    """
+    return seven.json.dumps(
+        {
+            key: value
+            for key, value in step_stats_data.items()
+            if key not in ("materialization_events", "expectation_results")
+        }
+    )
+
+
+def build_run_step_stats_from_data(
+    run_id: str, step_stats_data: Mapping[str, Mapping[str, Any]]
+) -> Sequence["RunStepKeyStatsSnapshot"]:
+    """Builds step stats snapshots from the accumulated stats data of each step, see
+    `update_step_stats_data`.
+    """
+    included = sorted(
+        [(step_key, data) for step_key, data in step_stats_data.items() if "stats" in data],
+        key=lambda item: item[1]["stats"]["order"],
+    )
+    return [_build_step_stats_snapshot(run_id, step_key, data) for step_key, data in included]
+
+
+def _build_step_stats_snapshot(
+    run_id: str, step_key: str, data: Mapping[str, Any]
+) -> "RunStepKeyStatsSnapshot":
+    stats = data["stats"]
+    start_time = stats.get("start_time")
+    end_time = stats.get("end_time")
+    status = StepEventStatus(stats["status"]) if stats.get("status") else None
+
+    step_attempts = []
+    attempt_start = start_time
+    for event_type_value, timestamp in data["attempt_events"]:
+        if event_type_value == DagsterEventType.STEP_UP_FOR_RETRY.value:
+            step_attempts.append(RunStepMarker(start_time=attempt_start, end_time=timestamp))
+        elif event_type_value == DagsterEventType.STEP_RESTARTED.value:
+            attempt_start = timestamp
+    if end_time:
+        step_attempts.append(RunStepMarker(start_time=attempt_start, end_time=end_time))
+    else:
+        status = StepEventStatus.IN_PROGRESS
+
+    return RunStepKeyStatsSnapshot(
+        run_id=run_id,
+        step_key=step_key,
+        status=status,
+        start_time=start_time,
+        end_time=end_time,
+        materialization_events=data.get("materialization_events"),
+        expectation_results=data.get("expectation_results"),
+        attempts=stats.get("attempts"),
+        attempts_list=step_attempts,
+        markers=[
+            RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
+            for marker in data["markers"]
+        ],
+    )
 
 
 @whitelist_for_serdes
@@ -43,6 +43,7 @@
 from dagster._core.origin import PipelinePythonOrigin, RepositoryPythonOrigin
 from dagster._core.snap import ExecutionPlanSnapshot
 from dagster._core.snap.execution_plan_snapshot import ExecutionStepSnap
+from dagster._core.storage.pipeline_run import DagsterRunStatus
 from dagster._core.utils import toposort
 from dagster._serdes import create_snapshot_id
 from dagster._utils import iter_to_list
@@ -787,6 +788,12 @@ def selector_id(self) -> str:
     def sensor_type(self) -> SensorType:
         return self._external_sensor_data.sensor_type or SensorType.UNKNOWN
 
+    @property
+    def run_status(self) -> Optional[DagsterRunStatus]:
+        # only set for run status sensors loaded from code locations that report it
+        metadata = self._external_sensor_data.metadata
+        return metadata.run_status if metadata else None
+
     def get_current_instigator_state(
         self, stored_state: Optional["InstigatorState"]
     ) -> InstigatorState:
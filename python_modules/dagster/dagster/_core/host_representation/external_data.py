@@ -50,6 +50,7 @@
     get_builtin_partition_mapping_types,
 )
 from dagster._core.definitions.resource_definition import ResourceDefinition
+from dagster._core.definitions.run_status_sensor_definition import RunStatusSensorDefinition
 from dagster._core.definitions.schedule_definition import DefaultScheduleStatus
 from dagster._core.definitions.sensor_definition import (
     DefaultSensorStatus,
@@ -61,6 +62,7 @@
 from dagster._core.errors import DagsterInvalidDefinitionError
 from dagster._core.snap import PipelineSnapshot
 from dagster._core.snap.mode import ResourceDefSnap, build_resource_def_snap
+from dagster._core.storage.pipeline_run import DagsterRunStatus
 from dagster._serdes import DefaultNamedTupleSerializer, whitelist_for_serdes
 from dagster._utils.error import SerializableErrorInfo
 
@@ -405,18 +407,35 @@ def __new__(cls, pipeline_name: str, mode: str, solid_selection: Optional[Sequen
         )
 
 
-@whitelist_for_serdes
+class ExternalSensorMetadataSerializer(DefaultNamedTupleSerializer):
+    @classmethod
+    def skip_when_empty(cls) -> Set[str]:
+        return {"run_status"}  # Maintain stable snapshot ID for back-compat purposes
+
+
+@whitelist_for_serdes(serializer=ExternalSensorMetadataSerializer)
 class ExternalSensorMetadata(
-    NamedTuple("_ExternalSensorMetadata", [("asset_keys", Optional[Sequence[AssetKey]])])
+    NamedTuple(
+        "_ExternalSensorMetadata",
+        [
+            ("asset_keys", Optional[Sequence[AssetKey]]),
+            ("run_status", Optional[DagsterRunStatus]),
+        ],
+    )
 ):
     """Stores additional sensor metadata which is available on the Dagit frontend."""
 
-    def __new__(cls, asset_keys: Optional[Sequence[AssetKey]] = None):
+    def __new__(
+        cls,
+        asset_keys: Optional[Sequence[AssetKey]] = None,
+        run_status: Optional[DagsterRunStatus] = None,
+    ):
         return super(ExternalSensorMetadata, cls).__new__(
             cls,
             asset_keys=check.opt_nullable_sequence_param(
                 asset_keys, "asset_keys", of_type=AssetKey
             ),
+            run_status=check.opt_inst_param(run_status, "run_status", DagsterRunStatus),
         )
 
 
@@ -1463,6 +1482,10 @@ def external_sensor_data_from_def(
     if isinstance(sensor_def, AssetSensorDefinition):
         asset_keys = [sensor_def.asset_key]
 
+    run_status = None
+    if isinstance(sensor_def, RunStatusSensorDefinition):
+        run_status = sensor_def.run_status
+
     if sensor_def.asset_selection is not None:
         target_dict = {
             base_asset_job_name: ExternalTargetData(
@@ -1488,7 +1511,7 @@ def external_sensor_data_from_def(
         target_dict=target_dict,
         min_interval=sensor_def.minimum_interval_seconds,
         description=sensor_def.description,
-        metadata=ExternalSensorMetadata(asset_keys=asset_keys),
+        metadata=ExternalSensorMetadata(asset_keys=asset_keys, run_status=run_status),
         default_status=sensor_def.default_status,
         sensor_type=sensor_def.sensor_type,
     )
@@ -1,4 +1,6 @@
+import asyncio
 import datetime
+import functools
 import sys
 import threading
 from abc import abstractmethod
@@ -64,6 +66,7 @@
 from dagster._utils.merger import merge_dicts
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.run_status_feed import RunStatusFeedSlice
     from dagster._core.definitions.schedule_definition import ScheduleExecutionData
     from dagster._core.definitions.sensor_definition import SensorExecutionData
     from dagster._core.host_representation import (
@@ -212,9 +215,54 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        run_status_feed: Optional["RunStatusFeedSlice"] = None,
     ) -> "SensorExecutionData":
         pass
 
+    async def get_external_schedule_execution_data_async(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        schedule_name: str,
+        scheduled_execution_time,
+    ) -> "ScheduleExecutionData":
+        # locations without an async transport evaluate on a worker thread of the event loop
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.get_external_schedule_execution_data,
+                instance,
+                repository_handle,
+                schedule_name,
+                scheduled_execution_time,
+            ),
+        )
+
+    async def get_external_sensor_execution_data_async(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        name: str,
+        last_completion_time: Optional[float],
+        last_run_key: Optional[str],
+        cursor: Optional[str],
+        run_status_feed: Optional["RunStatusFeedSlice"] = None,
+    ) -> "SensorExecutionData":
+        # locations without an async transport evaluate on a worker thread of the event loop
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.get_external_sensor_execution_data,
+                instance,
+                repository_handle,
+                name,
+                last_completion_time,
+                last_run_key,
+                cursor,
+                run_status_feed=run_status_feed,
+            ),
+        )
+
     @abstractmethod
     def get_external_notebook_data(self, notebook_path: str) -> bytes:
         pass
@@ -505,6 +553,7 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        run_status_feed: Optional["RunStatusFeedSlice"] = None,
     ) -> "SensorExecutionData":
         result = get_external_sensor_execution(
             self._get_repo_def(repository_handle.repository_name),
@@ -513,6 +562,7 @@ def get_external_sensor_execution_data(
             last_completion_time,
             last_run_key,
             cursor,
+            run_status_feed,
         )
         if isinstance(result, ExternalSensorExecutionErrorData):
             raise DagsterUserCodeProcessError.from_error_info(result.error)
@@ -855,6 +905,7 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        run_status_feed: Optional["RunStatusFeedSlice"] = None,
     ) -> "SensorExecutionData":
         from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
 
@@ -866,6 +917,52 @@ def get_external_sensor_execution_data(
             last_completion_time,
             last_run_key,
             cursor,
+            run_status_feed=run_status_feed,
+        )
+
+    async def get_external_schedule_execution_data_async(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        schedule_name: str,
+        scheduled_execution_time: Optional[datetime.datetime],
+    ) -> "ScheduleExecutionData":
+        from dagster._api.snapshot_schedule import async_get_external_schedule_execution_data_grpc
+
+        check.inst_param(instance, "instance", DagsterInstance)
+        check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+        check.str_param(schedule_name, "schedule_name")
+        check.opt_inst_param(scheduled_execution_time, "scheduled_execution_time", PendulumDateTime)
+
+        return await async_get_external_schedule_execution_data_grpc(
+            self.client,
+            instance,
+            repository_handle,
+            schedule_name,
+            scheduled_execution_time,
+        )
+
+    async def get_external_sensor_execution_data_async(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        name: str,
+        last_completion_time: Optional[float],
+        last_run_key: Optional[str],
+        cursor: Optional[str],
+        run_status_feed: Optional["RunStatusFeedSlice"] = None,
+    ) -> "SensorExecutionData":
+        from dagster._api.snapshot_sensor import async_get_external_sensor_execution_data_grpc
+
+        return await async_get_external_sensor_execution_data_grpc(
+            self.client,
+            instance,
+            repository_handle,
+            name,
+            last_completion_time,
+            last_run_key,
+            cursor,
+            run_status_feed=run_status_feed,
         )
 
     def get_external_partition_set_execution_param_data(
@@ -4,11 +4,13 @@
 import logging.config
 import os
 import sys
+import threading
 import time
 import warnings
 import weakref
 from collections import defaultdict
 from contextlib import ExitStack
+from datetime import datetime
 from enum import Enum
 from tempfile import TemporaryDirectory
 from typing import (
@@ -20,6 +22,7 @@
     FrozenSet,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -29,14 +32,15 @@
     TypeVar,
     Union,
     cast,
+    overload,
 )
 
 import yaml
-from typing_extensions import Protocol, runtime_checkable
+from typing_extensions import Literal, Protocol, runtime_checkable
 
 import dagster._check as check
 from dagster._annotations import public
-from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.definitions.pipeline_base import InMemoryPipeline
 from dagster._core.definitions.pipeline_definition import (
     PipelineDefinition,
@@ -51,6 +55,7 @@
 )
 from dagster._core.origin import PipelinePythonOrigin
 from dagster._core.storage.pipeline_run import (
+    FINISHED_STATUSES,
     IN_PROGRESS_RUN_STATUSES,
     DagsterRun,
     DagsterRunStatus,
@@ -59,11 +64,12 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunStatusRecord,
     TagBucket,
 )
 from dagster._core.storage.tags import PARENT_RUN_ID_TAG, RESUME_RETRY_TAG, ROOT_RUN_ID_TAG
 from dagster._core.utils import str_format_list
-from dagster._serdes import ConfigurableClass
+from dagster._serdes import ConfigurableClass, SerdesFormat
 from dagster._seven import get_current_datetime_in_utc
 from dagster._utils import traced
 from dagster._utils.backcompat import deprecation_warning, experimental_functionality_warning
@@ -86,9 +92,13 @@
 AIRFLOW_EXECUTION_DATE_STR = "airflow_execution_date"
 IS_AIRFLOW_INGEST_PIPELINE_STR = "is_airflow_ingest_pipeline"
 
+# number of runs fetched per page when compacting the event log
+COMPACT_EVENT_LOGS_BATCH_SIZE = 100
+
 if TYPE_CHECKING:
     from dagster._core.debug import DebugRunPayload
     from dagster._core.definitions.run_request import InstigatorType
+    from dagster._core.event_api import EventLogRecordProjection
     from dagster._core.events import DagsterEvent, DagsterEventType
     from dagster._core.events.log import EventLogEntry
     from dagster._core.execution.backfill import PartitionBackfill
@@ -102,6 +112,7 @@
         HistoricalPipeline,
         RepositoryLocation,
     )
+    from dagster._core.instance.event_buffer import EventBuffer, EventBufferStats
     from dagster._core.launcher import RunLauncher
     from dagster._core.run_coordinator import RunCoordinator
     from dagster._core.scheduler import Scheduler
@@ -120,6 +131,7 @@
     from dagster._core.storage.root import LocalArtifactStorage
     from dagster._core.storage.runs import RunStorage
     from dagster._core.storage.runs.base import RunGroupInfo
+    from dagster._core.storage.runs.wakeup import RunWakeupChannel
     from dagster._core.storage.schedules import ScheduleStorage
     from dagster._core.workspace.workspace import IWorkspace
     from dagster._daemon.types import DaemonHeartbeat, DaemonStatus
@@ -243,6 +255,30 @@ def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         return self.get_dynamic_partitions(partitions_def_name=partitions_def_name)
 
 
+class SnapshotIdCache:
+    """The ids of the snapshots persisted while creating a batch of runs, so that a snapshot shared
+    by many runs is only hashed and checked against run storage once.
+
+    Snapshot objects are keyed by identity, and held onto for the life of the cache so that their
+    identities can't be reused.
+    """
+
+    def __init__(self):
+        self._snapshots_and_ids_by_object_id: Dict[int, Tuple[Any, str]] = {}
+        self._persisted_ids: Set[str] = set()
+
+    def get_persisted_id(self, snapshot: Any) -> Optional[str]:
+        snapshot_and_id = self._snapshots_and_ids_by_object_id.get(id(snapshot))
+        return snapshot_and_id[1] if snapshot_and_id else None
+
+    def set_persisted_id(self, snapshot: Any, snapshot_id: str) -> None:
+        self._snapshots_and_ids_by_object_id[id(snapshot)] = (snapshot, snapshot_id)
+        self._persisted_ids.add(snapshot_id)
+
+    def is_persisted(self, snapshot_id: str) -> bool:
+        return snapshot_id in self._persisted_ids
+
+
 class DagsterInstance(DynamicPartitionsStore):
     """Core abstraction for managing Dagster's access to storage and other resources.
 
@@ -372,6 +408,12 @@ def __init__(
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
+        # lazily started when buffered event handling is enabled
+        self._event_buffer: Optional["EventBuffer"] = None
+        self._event_buffer_lock = threading.Lock()
+        # the buffered events of each thread that have not been handled since it last flushed
+        self._unhandled_buffered_events = threading.local()
+
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         if run_monitoring_enabled and not self.run_launcher.supports_check_run_worker_health:
             run_monitoring_enabled = False
@@ -765,6 +807,90 @@ def run_retries_enabled(self) -> bool:
     def run_retries_max_retries(self) -> int:
         return self.get_settings("run_retries").get("max_retries")
 
+    # data migrations
+
+    @property
+    def data_migrations_settings(self) -> Mapping[str, Any]:
+        return self.get_settings("data_migrations")
+
+    @property
+    def data_migrations_enabled(self) -> bool:
+        return self.data_migrations_settings.get("enabled", False)
+
+    # event log buffer
+
+    @property
+    def event_log_buffer_settings(self) -> Mapping[str, Any]:
+        return self.get_settings("event_log_buffer")
+
+    @property
+    def event_log_buffer_enabled(self) -> bool:
+        return self.event_log_buffer_settings.get("enabled", False)
+
+    def get_event_buffer_stats(self) -> Optional["EventBufferStats"]:
+        """Returns queue depth and flush latency metrics for the event log buffer, or None if
+        buffered event handling is not enabled or no events have been handled yet.
+        """
+        if not self._event_buffer:
+            return None
+        return self._event_buffer.get_stats()
+
+    def _get_event_buffer(self) -> "EventBuffer":
+        from dagster._core.instance.event_buffer import (
+            DEFAULT_FLUSH_BATCH_SIZE,
+            DEFAULT_FLUSH_INTERVAL_SECONDS,
+            DEFAULT_MAX_BUFFERED_EVENTS,
+            EventBuffer,
+        )
+
+        with self._event_buffer_lock:
+            if not self._event_buffer:
+                settings = self.event_log_buffer_settings
+                self._event_buffer = EventBuffer(
+                    self._event_storage.store_events,
+                    max_buffered_events=settings.get(
+                        "max_buffered_events", DEFAULT_MAX_BUFFERED_EVENTS
+                    ),
+                    flush_batch_size=settings.get("flush_batch_size", DEFAULT_FLUSH_BATCH_SIZE),
+                    flush_interval_seconds=settings.get(
+                        "flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS
+                    ),
+                )
+            return self._event_buffer
+
+    def flush_event_buffer(self) -> None:
+        """Block until every event handled so far has been written to storage, then update run
+        status and notify subscribers for the events handled by the calling thread since it last
+        flushed. This is a no-op unless buffered event handling is enabled.
+        """
+        if self._event_buffer:
+            self._flush_event_buffer(self._event_buffer)
+
+    def _flush_event_buffer(self, event_buffer: "EventBuffer") -> None:
+        unhandled_events = self._get_unhandled_buffered_events()
+        events = list(unhandled_events)
+        unhandled_events.clear()
+
+        event_buffer.flush()
+        for event in events:
+            self._handle_stored_event(event)
+
+    def _get_unhandled_buffered_events(self) -> List["EventLogEntry"]:
+        unhandled_events = getattr(self._unhandled_buffered_events, "events", None)
+        if unhandled_events is None:
+            unhandled_events = self._unhandled_buffered_events.events = []
+        return unhandled_events
+
+    # serialization
+
+    def get_serdes_format(self, storage_key: str) -> SerdesFormat:
+        """The format used to serialize payloads written by the given storage, one of
+        `event_log_storage`, `run_storage`, or `schedule_storage`.
+        """
+        check.str_param(storage_key, "storage_key")
+        serdes_format = self.get_settings("serialization").get(storage_key)
+        return SerdesFormat(serdes_format) if serdes_format else SerdesFormat.JSON
+
     # python logs
 
     @property
@@ -816,7 +942,46 @@ def reindex(self, print_fn=lambda _: None):
         self._schedule_storage.optimize(print_fn)
         print_fn("Done.")
 
+    def compact_event_logs(self, finished_before: datetime, print_fn=lambda _: None) -> int:
+        """Archive the events of the runs that finished before the given time, keeping the events
+        that back the run, asset, and stats indexes in the event log. Returns the number of events
+        archived.
+        """
+        check.inst_param(finished_before, "finished_before", datetime)
+
+        start_time = time.time()
+        run_count = 0
+        event_count = 0
+        cursor = None
+        print_fn(f"Archiving events of runs finished before {finished_before.isoformat()}...")
+        while True:
+            run_records = self.get_run_records(
+                filters=RunsFilter(statuses=FINISHED_STATUSES, updated_before=finished_before),
+                limit=COMPACT_EVENT_LOGS_BATCH_SIZE,
+                cursor=cursor,
+            )
+            if not run_records:
+                break
+
+            for run_record in run_records:
+                archived = self._event_storage.archive_events(run_record.dagster_run.run_id)
+                if archived:
+                    run_count += 1
+                    event_count += archived
+
+            cursor = run_records[-1].dagster_run.run_id
+            elapsed = time.time() - start_time
+            print_fn(
+                f"Archived {event_count} events from {run_count} runs in {elapsed:.1f}s "
+                f"({event_count / elapsed if elapsed else 0:.0f} events/s)."
+            )
+
+        print_fn("Done.")
+        return event_count
+
     def dispose(self):
+        if self._event_buffer:
+            self._event_buffer.dispose()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
         if self._run_launcher:
@@ -1015,6 +1180,7 @@ def _construct_run_with_snapshots(
         solid_selection=None,
         external_pipeline_origin=None,
         pipeline_code_origin=None,
+        snapshot_id_cache=None,
     ) -> DagsterRun:
         # https://github.com/dagster-io/dagster/issues/2403
         if tags and IS_AIRFLOW_INGEST_PIPELINE_STR in tags:
@@ -1031,14 +1197,19 @@ def _construct_run_with_snapshots(
         )
 
         pipeline_snapshot_id = (
-            self._ensure_persisted_pipeline_snapshot(pipeline_snapshot, parent_pipeline_snapshot)
+            self._ensure_persisted_pipeline_snapshot(
+                pipeline_snapshot, parent_pipeline_snapshot, snapshot_id_cache
+            )
             if pipeline_snapshot
             else None
         )
 
         execution_plan_snapshot_id = (
             self._ensure_persisted_execution_plan_snapshot(
-                execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
+                execution_plan_snapshot,
+                pipeline_snapshot_id,
+                step_keys_to_execute,
+                snapshot_id_cache,
             )
             if execution_plan_snapshot and pipeline_snapshot_id
             else None
@@ -1065,12 +1236,19 @@ def _construct_run_with_snapshots(
             and execution_plan_snapshot.repository_load_data is not None,
         )
 
-    def _ensure_persisted_pipeline_snapshot(self, pipeline_snapshot, parent_pipeline_snapshot):
+    def _ensure_persisted_pipeline_snapshot(
+        self, pipeline_snapshot, parent_pipeline_snapshot, snapshot_id_cache=None
+    ):
         from dagster._core.snap import PipelineSnapshot, create_pipeline_snapshot_id
 
         check.inst_param(pipeline_snapshot, "pipeline_snapshot", PipelineSnapshot)
         check.opt_inst_param(parent_pipeline_snapshot, "parent_pipeline_snapshot", PipelineSnapshot)
 
+        if snapshot_id_cache is not None:
+            cached_snapshot_id = snapshot_id_cache.get_persisted_id(pipeline_snapshot)
+            if cached_snapshot_id:
+                return cached_snapshot_id
+
         if pipeline_snapshot.lineage_snapshot:
             if not self._run_storage.has_pipeline_snapshot(
                 pipeline_snapshot.lineage_snapshot.parent_snapshot_id
@@ -1096,10 +1274,17 @@ def _ensure_persisted_pipeline_snapshot(self, pipeline_snapshot, parent_pipeline
             )
             check.invariant(pipeline_snapshot_id == returned_pipeline_snapshot_id)
 
+        if snapshot_id_cache is not None:
+            snapshot_id_cache.set_persisted_id(pipeline_snapshot, pipeline_snapshot_id)
+
         return pipeline_snapshot_id
 
     def _ensure_persisted_execution_plan_snapshot(
-        self, execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
+        self,
+        execution_plan_snapshot,
+        pipeline_snapshot_id,
+        step_keys_to_execute,
+        snapshot_id_cache=None,
     ):
         from dagster._core.snap.execution_plan_snapshot import (
             ExecutionPlanSnapshot,
@@ -1122,15 +1307,26 @@ def _ensure_persisted_execution_plan_snapshot(
             ),
         )
 
+        if snapshot_id_cache is not None:
+            cached_snapshot_id = snapshot_id_cache.get_persisted_id(execution_plan_snapshot)
+            if cached_snapshot_id:
+                return cached_snapshot_id
+
         execution_plan_snapshot_id = create_execution_plan_snapshot_id(execution_plan_snapshot)
 
-        if not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
+        if not (
+            snapshot_id_cache is not None
+            and snapshot_id_cache.is_persisted(execution_plan_snapshot_id)
+        ) and not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
             returned_execution_plan_snapshot_id = self._run_storage.add_execution_plan_snapshot(
                 execution_plan_snapshot
             )
 
             check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
 
+        if snapshot_id_cache is not None:
+            snapshot_id_cache.set_persisted_id(execution_plan_snapshot, execution_plan_snapshot_id)
+
         return execution_plan_snapshot_id
 
     def _log_asset_materialization_planned_events(self, pipeline_run, execution_plan_snapshot):
@@ -1159,7 +1355,7 @@ def _log_asset_materialization_planned_events(self, pipeline_run, execution_plan
                         )
                         self.report_dagster_event(event, pipeline_run.run_id, logging.DEBUG)
 
-    def create_run(
+    def _construct_run(
         self,
         *,
         pipeline_name: str,
@@ -1179,6 +1375,7 @@ def create_run(
         solid_selection: Optional[Sequence[str]],
         external_pipeline_origin: Optional["ExternalPipelineOrigin"],
         pipeline_code_origin: Optional[PipelinePythonOrigin],
+        snapshot_id_cache: Optional[SnapshotIdCache] = None,
     ) -> DagsterRun:
         from dagster._core.definitions.utils import validate_tags
         from dagster._core.host_representation.origin import ExternalPipelineOrigin
@@ -1297,6 +1494,50 @@ def create_run(
             parent_pipeline_snapshot=parent_pipeline_snapshot,
             external_pipeline_origin=external_pipeline_origin,
             pipeline_code_origin=pipeline_code_origin,
+            snapshot_id_cache=snapshot_id_cache,
+        )
+
+        return pipeline_run
+
+    def create_run(
+        self,
+        *,
+        pipeline_name: str,
+        run_id: Optional[str],
+        run_config: Optional[Mapping[str, object]],
+        mode: Optional[str],
+        status: Optional[DagsterRunStatus],
+        tags: Optional[Mapping[str, Any]],
+        root_run_id: Optional[str],
+        parent_run_id: Optional[str],
+        step_keys_to_execute: Optional[Sequence[str]],
+        execution_plan_snapshot: Optional[ExecutionPlanSnapshot],
+        pipeline_snapshot: Optional[PipelineSnapshot],
+        parent_pipeline_snapshot: Optional[PipelineSnapshot],
+        asset_selection: Optional[AbstractSet[AssetKey]],
+        solids_to_execute: Optional[AbstractSet[str]],
+        solid_selection: Optional[Sequence[str]],
+        external_pipeline_origin: Optional["ExternalPipelineOrigin"],
+        pipeline_code_origin: Optional[PipelinePythonOrigin],
+    ) -> DagsterRun:
+        pipeline_run = self._construct_run(
+            pipeline_name=pipeline_name,
+            run_id=run_id,
+            run_config=run_config,
+            mode=mode,
+            status=status,
+            tags=tags,
+            root_run_id=root_run_id,
+            parent_run_id=parent_run_id,
+            step_keys_to_execute=step_keys_to_execute,
+            execution_plan_snapshot=execution_plan_snapshot,
+            pipeline_snapshot=pipeline_snapshot,
+            parent_pipeline_snapshot=parent_pipeline_snapshot,
+            asset_selection=asset_selection,
+            solids_to_execute=solids_to_execute,
+            solid_selection=solid_selection,
+            external_pipeline_origin=external_pipeline_origin,
+            pipeline_code_origin=pipeline_code_origin,
         )
 
         pipeline_run = self._run_storage.add_run(pipeline_run)
@@ -1306,6 +1547,31 @@ def create_run(
 
         return pipeline_run
 
+    def create_runs(self, runs_to_create: Sequence[Mapping[str, Any]]) -> Sequence[DagsterRun]:
+        """Creates a batch of runs, each described by the keyword arguments of `create_run`, and
+        adds them to run storage in a single write.
+
+        Snapshots shared between the runs are hashed and persisted once for the whole batch.
+        """
+        check.sequence_param(runs_to_create, "runs_to_create", of_type=Mapping)
+
+        snapshot_id_cache = SnapshotIdCache()
+        pipeline_runs = self._run_storage.add_runs(
+            [
+                self._construct_run(**run_to_create, snapshot_id_cache=snapshot_id_cache)
+                for run_to_create in runs_to_create
+            ]
+        )
+
+        for pipeline_run, run_to_create in zip(pipeline_runs, runs_to_create):
+            execution_plan_snapshot = run_to_create.get("execution_plan_snapshot")
+            if execution_plan_snapshot:
+                self._log_asset_materialization_planned_events(
+                    pipeline_run, execution_plan_snapshot
+                )
+
+        return pipeline_runs
+
     def create_reexecuted_run(
         self,
         *,
@@ -1473,6 +1739,10 @@ def get_run():
     def add_run(self, pipeline_run: DagsterRun) -> DagsterRun:
         return self._run_storage.add_run(pipeline_run)
 
+    @traced
+    def add_runs(self, pipeline_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        return self._run_storage.add_runs(pipeline_runs)
+
     @traced
     def add_snapshot(self, snapshot, snapshot_id=None):
         return self._run_storage.add_snapshot(snapshot, snapshot_id)
@@ -1539,6 +1809,31 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    @traced
+    def get_run_status_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunStatusRecord]:
+        """Return a list of run status records, holding the id, status, tags, code location name and
+        creation time of the runs stored in the run storage, without deserializing the runs.
+
+        Args:
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            order_by (Optional[str]): Name of the column to sort by. Defaults to id.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+            cursor (Optional[str]): Only return the runs stored before the run with this run id.
+
+        Returns:
+            List[RunStatusRecord]: List of run status records stored in the run storage.
+        """
+        return self._run_storage.get_run_status_records(filters, limit, order_by, ascending, cursor)
+
     @property
     def supports_bucket_queries(self):
         return self._run_storage.supports_bucket_queries
@@ -1587,8 +1882,11 @@ def get_records_for_run(
         cursor: Optional[str] = None,
         of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
         limit: Optional[int] = None,
+        include_event: bool = True,
     ):
-        return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit)
+        return self._event_storage.get_records_for_run(
+            run_id, cursor, of_type, limit, include_event
+        )
 
     def watch_event_logs(self, run_id, cursor, cb):
         return self._event_storage.watch(run_id, cursor, cb)
@@ -1633,6 +1931,27 @@ def get_latest_materialization_events(
     def get_latest_materialization_event(self, asset_key: AssetKey) -> Optional["EventLogEntry"]:
         return self._event_storage.get_latest_materialization_events([asset_key]).get(asset_key)
 
+    @overload
+    def get_event_records(
+        self,
+        event_records_filter: "EventRecordsFilter",
+        limit: Optional[int] = ...,
+        ascending: bool = ...,
+        include_event: Literal[True] = ...,
+    ) -> Iterable["EventLogRecord"]:
+        ...
+
+    @overload
+    def get_event_records(
+        self,
+        event_records_filter: "EventRecordsFilter",
+        limit: Optional[int] = ...,
+        ascending: bool = ...,
+        *,
+        include_event: Literal[False],
+    ) -> Iterable["EventLogRecordProjection"]:
+        ...
+
     @public
     @traced
     def get_event_records(
@@ -1640,7 +1959,8 @@ def get_event_records(
         event_records_filter: "EventRecordsFilter",
         limit: Optional[int] = None,
         ascending: bool = False,
-    ) -> Iterable["EventLogRecord"]:
+        include_event: bool = True,
+    ) -> Iterable[Union["EventLogRecord", "EventLogRecordProjection"]]:
         """Return a list of event records stored in the event log storage.
 
         Args:
@@ -1649,11 +1969,65 @@ def get_event_records(
             limit (Optional[int]): Number of results to get. Defaults to infinite.
             ascending (Optional[bool]): Sort the result in ascending order if True, descending
                 otherwise. Defaults to descending.
+            include_event (bool): Whether to fetch the event log entry of each record. If False,
+                the records are returned as EventLogRecordProjections, which only hold the storage
+                id, run id, timestamp, asset key and partition of each record. Defaults to True.
 
         Returns:
             List[EventLogRecord]: List of event log records stored in the event log storage.
         """
-        return self._event_storage.get_event_records(event_records_filter, limit, ascending)
+        return self._event_storage.get_event_records(
+            event_records_filter, limit, ascending, include_event
+        )
+
+    @overload
+    def iterate_event_records(
+        self,
+        event_records_filter: "EventRecordsFilter",
+        batch_size: int = ...,
+        include_event: Literal[True] = ...,
+    ) -> Iterator["EventLogRecord"]:
+        ...
+
+    @overload
+    def iterate_event_records(
+        self,
+        event_records_filter: "EventRecordsFilter",
+        batch_size: int = ...,
+        *,
+        include_event: Literal[False],
+    ) -> Iterator["EventLogRecordProjection"]:
+        ...
+
+    @public
+    @traced
+    def iterate_event_records(
+        self,
+        event_records_filter: "EventRecordsFilter",
+        batch_size: int = 1000,
+        include_event: bool = True,
+    ) -> Iterator[Union["EventLogRecord", "EventLogRecordProjection"]]:
+        """Yield the event records stored in the event log storage that match the filter, in
+        ascending order.
+
+        Unlike `get_event_records`, which returns a single list, the records are fetched lazily in
+        pages of `batch_size` records, so that catching up over a large number of events only
+        holds a single page in memory.
+
+        Args:
+            event_records_filter (EventRecordsFilter): the filter by which to filter event records.
+            batch_size (int): Number of records to fetch per page. Defaults to 1000.
+            include_event (bool): Whether to fetch the event log entry of each record. If False,
+                the records are yielded as EventLogRecordProjections, which only hold the storage
+                id, run id, timestamp, asset key and partition of each record. Defaults to True.
+
+        Returns:
+            Iterator[EventLogRecord]: Iterator over the event records stored in the event log
+                storage.
+        """
+        return self._event_storage.iterate_event_records(
+            event_records_filter, batch_size, include_event
+        )
 
     @public
     @traced
@@ -1702,6 +2076,14 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         return self._event_storage.get_materialization_count_by_partition(asset_keys, after_cursor)
 
+    @traced
+    def get_latest_asset_partition_materialization_records(
+        self, asset_partitions: Sequence[AssetKeyPartitionKey]
+    ) -> Mapping[AssetKeyPartitionKey, "EventLogRecord"]:
+        return self._event_storage.get_latest_asset_partition_materialization_records(
+            asset_partitions
+        )
+
     @traced
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         check.str_param(partitions_def_name, "partitions_def_name")
@@ -1778,9 +2160,40 @@ def store_event(self, event):
         self._event_storage.store_event(event)
 
     def handle_new_event(self, event):
-        run_id = event.run_id
+        if self.event_log_buffer_enabled:
+            from dagster._core.instance.event_buffer import is_flush_boundary_event
+
+            event_buffer = self._get_event_buffer()
+            event_buffer.put(event)
+
+            # the events are handled by the thread that put them once they have been written, so
+            # that run status updates and subscriber callbacks never run on the writer thread
+            unhandled_events = self._get_unhandled_buffered_events()
+            unhandled_events.append(event)
+            if (
+                is_flush_boundary_event(event)
+                or len(unhandled_events) >= event_buffer.max_buffered_events
+            ):
+                self._flush_event_buffer(event_buffer)
+            return
 
         self._event_storage.store_event(event)
+        self._handle_stored_event(event)
+
+    def handle_new_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events in a single event log storage write, then update run status and
+        notify subscribers for each event in order.
+        """
+        events = check.sequence_param(events, "events")
+        if not events:
+            return
+
+        self._event_storage.store_events(events)
+        for event in events:
+            self._handle_stored_event(event)
+
+    def _handle_stored_event(self, event):
+        run_id = event.run_id
 
         if event.is_dagster_event and event.dagster_event.is_pipeline_event:
             self._run_storage.handle_run_event(run_id, event.dagster_event)
@@ -2218,6 +2631,12 @@ def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional["In
             check.failed("Schedule storage not available")
         return self._schedule_storage.get_instigator_state(origin_id, selector_id)
 
+    @traced
+    def get_instigator_states(self, selector_ids: Sequence[str]) -> Mapping[str, "InstigatorState"]:
+        if not self._schedule_storage:
+            check.failed("Schedule storage not available")
+        return self._schedule_storage.get_instigator_states(selector_ids)
+
     def add_instigator_state(self, state: "InstigatorState") -> "InstigatorState":
         if not self._schedule_storage:
             check.failed("Schedule storage not available")
@@ -2228,6 +2647,13 @@ def update_instigator_state(self, state: "InstigatorState") -> "InstigatorState"
             check.failed("Schedule storage not available")
         return self._schedule_storage.update_instigator_state(state)
 
+    def update_instigator_states(
+        self, states: Sequence["InstigatorState"]
+    ) -> Sequence["InstigatorState"]:
+        if not self._schedule_storage:
+            check.failed("Schedule storage not available")
+        return self._schedule_storage.update_instigator_states(states)
+
     def delete_instigator_state(self, origin_id, selector_id):
         return self._schedule_storage.delete_instigator_state(origin_id, selector_id)
 
@@ -2262,9 +2688,15 @@ def get_ticks(self, origin_id, selector_id, before=None, after=None, limit=None,
     def create_tick(self, tick_data: "TickData") -> "InstigatorTick":
         return check.not_none(self._schedule_storage).create_tick(tick_data)
 
+    def create_ticks(self, tick_datas: Sequence["TickData"]) -> Sequence["InstigatorTick"]:
+        return check.not_none(self._schedule_storage).create_ticks(tick_datas)
+
     def update_tick(self, tick: "InstigatorTick"):
         return check.not_none(self._schedule_storage).update_tick(tick)
 
+    def update_ticks(self, ticks: Sequence["InstigatorTick"]) -> Sequence["InstigatorTick"]:
+        return check.not_none(self._schedule_storage).update_ticks(ticks)
+
     def purge_ticks(self, origin_id, selector_id, before, tick_statuses=None):
         self._schedule_storage.purge_ticks(origin_id, selector_id, before, tick_statuses)
 
@@ -2297,12 +2729,24 @@ def get_daemon_heartbeats(self) -> Mapping[str, "DaemonHeartbeat"]:
     def wipe_daemon_heartbeats(self):
         self._run_storage.wipe_daemon_heartbeats()
 
+    def add_run_wakeup_listener(
+        self, channels: Sequence["RunWakeupChannel"], wakeup_event: threading.Event
+    ) -> None:
+        """Sets the given event when runs are queued, change status or backfills are created,
+        if the run storage supports wakeup notifications.
+        """
+        self._run_storage.add_wakeup_listener(channels, wakeup_event)
+
+    def remove_run_wakeup_listener(self, wakeup_event: threading.Event) -> None:
+        self._run_storage.remove_wakeup_listener(wakeup_event)
+
     def get_required_daemon_types(self):
         from dagster._core.run_coordinator import QueuedRunCoordinator
         from dagster._core.scheduler import DagsterDaemonScheduler
         from dagster._daemon.auto_run_reexecution.event_log_consumer import EventLogConsumerDaemon
         from dagster._daemon.daemon import (
             BackfillDaemon,
+            DataMigrationDaemon,
             MonitoringDaemon,
             SchedulerDaemon,
             SensorDaemon,
@@ -2323,6 +2767,8 @@ def get_required_daemon_types(self):
             daemons.append(MonitoringDaemon.daemon_type())
         if self.run_retries_enabled:
             daemons.append(EventLogConsumerDaemon.daemon_type())
+        if self.data_migrations_enabled:
+            daemons.append(DataMigrationDaemon.daemon_type())
         return daemons
 
     def get_daemon_statuses(
@@ -7,10 +7,20 @@
     Bool,
     _check as check,
 )
-from dagster._config import Field, Permissive, ScalarUnion, Selector, StringSource, validate_config
+from dagster._config import (
+    Enum,
+    EnumValue,
+    Field,
+    Map,
+    Permissive,
+    ScalarUnion,
+    Selector,
+    StringSource,
+    validate_config,
+)
 from dagster._core.errors import DagsterInvalidConfigError
 from dagster._core.storage.config import mysql_config, pg_config
-from dagster._serdes import class_from_code_pointer
+from dagster._serdes import SerdesFormat, class_from_code_pointer
 from dagster._utils.merger import merge_dicts
 from dagster._utils.yaml_utils import load_yaml_from_globs
 
@@ -124,7 +134,9 @@ def storage_config_schema() -> Field:
             {
                 "postgres": Field(pg_config()),
                 "mysql": Field(mysql_config()),
-                "sqlite": Field({"base_dir": StringSource}),
+                "sqlite": Field(
+                    {"base_dir": StringSource, "single_writer": Field(bool, is_required=False)}
+                ),
                 "custom": Field(configurable_class_schema()),
             }
         ),
@@ -227,11 +239,47 @@ def get_tick_retention_settings(
         return default_retention_settings
 
 
+def async_evaluation_config() -> Field:
+    evaluation_limits = {
+        "max_concurrent_evaluations": Field(
+            int,
+            is_required=False,
+            description="The maximum number of evaluations in flight against a code location.",
+        ),
+        "timeout_seconds": Field(
+            float,
+            is_required=False,
+            description="How long an evaluation may take before it fails.",
+        ),
+    }
+    return Field(
+        {
+            "enabled": Field(Bool, is_required=False, default_value=False),
+            **evaluation_limits,
+            "locations": Field(
+                Map(str, evaluation_limits),
+                is_required=False,
+                description="Overrides of the evaluation limits for individual code locations.",
+            ),
+        },
+        is_required=False,
+    )
+
+
 def sensors_daemon_config() -> Field:
     return Field(
         {
             "use_threads": Field(Bool, is_required=False, default_value=False),
             "num_workers": Field(int, is_required=False),
+            "async_evaluation": async_evaluation_config(),
+            "run_status_batch_size": Field(
+                int,
+                is_required=False,
+                description=(
+                    "The maximum number of run lifecycle events read for run status sensors in a "
+                    "single event log query. Raise it to catch up faster after an outage."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -242,6 +290,78 @@ def schedules_daemon_config() -> Field:
         {
             "use_threads": Field(Bool, is_required=False, default_value=False),
             "num_workers": Field(int, is_required=False),
+            "async_evaluation": async_evaluation_config(),
+        },
+        is_required=False,
+    )
+
+
+def backfills_daemon_config() -> Field:
+    return Field(
+        {
+            "chunk_size": Field(
+                int,
+                is_required=False,
+                description=(
+                    "The number of partitions of a job backfill submitted between checkpoints."
+                ),
+            ),
+            "batch_run_creation": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Whether the runs of a chunk are created together, in a single run storage"
+                    " write that persists their shared snapshots once, before any of them is"
+                    " submitted."
+                ),
+            ),
+            "use_threads": Field(Bool, is_required=False, default_value=False),
+            "num_workers": Field(int, is_required=False),
+            "max_submissions_per_second": Field(
+                float,
+                is_required=False,
+                description="The maximum rate at which backfill runs are submitted.",
+            ),
+        },
+        is_required=False,
+    )
+
+
+def data_migrations_config_schema() -> Field:
+    return Field(
+        {
+            "enabled": Field(Bool, is_required=False, default_value=False),
+            "batch_size": Field(int, is_required=False),
+            "throttle_seconds": Field(float, is_required=False),
+            "interval_seconds": Field(int, is_required=False),
+            "time_limit_seconds": Field(float, is_required=False),
+        },
+        is_required=False,
+    )
+
+
+def event_log_buffer_config_schema() -> Field:
+    return Field(
+        {
+            "enabled": Field(Bool, is_required=False, default_value=False),
+            "max_buffered_events": Field(int, is_required=False),
+            "flush_batch_size": Field(int, is_required=False),
+            "flush_interval_seconds": Field(float, is_required=False),
+        },
+        is_required=False,
+    )
+
+
+def serialization_config_schema() -> Field:
+    serdes_format = Enum(
+        "SerdesFormat", [EnumValue(serdes_format.value) for serdes_format in SerdesFormat]
+    )
+    return Field(
+        {
+            "event_log_storage": Field(serdes_format, is_required=False),
+            "run_storage": Field(serdes_format, is_required=False),
+            "schedule_storage": Field(serdes_format, is_required=False),
         },
         is_required=False,
     )
@@ -301,4 +421,8 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
         "retention": retention_config_schema(),
         "sensors": sensors_daemon_config(),
         "schedules": schedules_daemon_config(),
+        "backfills": backfills_daemon_config(),
+        "event_log_buffer": event_log_buffer_config_schema(),
+        "data_migrations": data_migrations_config_schema(),
+        "serialization": serialization_config_schema(),
     }
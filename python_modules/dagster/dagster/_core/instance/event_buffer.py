@@ -0,0 +1,227 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import dagster._check as check
+from dagster._core.events import DagsterEventType
+
+if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
+
+DEFAULT_MAX_BUFFERED_EVENTS = 1000
+DEFAULT_FLUSH_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Events after which the buffer is flushed synchronously, so that step and run status are durable
+# by the time the event has been handled, exactly as in the unbuffered mode.
+STEP_BOUNDARY_EVENTS = {
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+}
+
+
+def is_flush_boundary_event(event: "EventLogEntry") -> bool:
+    if not event.is_dagster_event:
+        return False
+    dagster_event = event.get_dagster_event()
+    return dagster_event.is_pipeline_event or dagster_event.event_type in STEP_BOUNDARY_EVENTS
+
+
+class EventBufferStats(
+    NamedTuple(
+        "_EventBufferStats",
+        [
+            ("queue_depth", int),
+            ("flushed_batches", int),
+            ("flushed_events", int),
+            ("last_flush_latency", Optional[float]),
+            ("max_flush_latency", Optional[float]),
+        ],
+    )
+):
+    """Point-in-time metrics for an :py:class:`EventBuffer`.
+
+    Args:
+        queue_depth (int): The number of events currently waiting to be written.
+        flushed_batches (int): The number of batches written so far.
+        flushed_events (int): The number of events written so far.
+        last_flush_latency (Optional[float]): Seconds spent writing the most recent batch.
+        max_flush_latency (Optional[float]): Seconds spent writing the slowest batch.
+    """
+
+
+class _FlushRequest:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_BufferedEvent = Tuple["EventLogEntry", threading.Thread]
+
+
+class EventBuffer:
+    """Bounded write-behind buffer for events handled by a DagsterInstance.
+
+    Events are put on a bounded in-process queue and written by a background thread, in batches of
+    up to ``flush_batch_size`` events or after ``flush_interval_seconds``, whichever comes first.
+    When the queue is full, ``put`` blocks until the writer catches up.
+
+    ``flush`` blocks until every event put before it has been written. If writing a batch fails,
+    its events are dropped and the error is raised to each thread that put one of them, on the next
+    ``put`` or ``flush`` of that thread. Events put on the writer thread itself, e.g. from within
+    ``write_fn``, are written synchronously, since the writer can't wait on its own queue.
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Sequence["EventLogEntry"]], None],
+        max_buffered_events: int = DEFAULT_MAX_BUFFERED_EVENTS,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ):
+        self._write_fn = check.callable_param(write_fn, "write_fn")
+        self._flush_batch_size = check.int_param(flush_batch_size, "flush_batch_size")
+        self._flush_interval_seconds = check.numeric_param(
+            flush_interval_seconds, "flush_interval_seconds"
+        )
+        check.invariant(self._flush_batch_size > 0, "flush_batch_size must be positive")
+        check.invariant(max_buffered_events > 0, "max_buffered_events must be positive")
+        self._max_buffered_events = max_buffered_events
+
+        # events are queued along with the thread that put them, which any write error is raised to
+        self._queue: "queue.Queue[Union[_BufferedEvent, _FlushRequest, None]]" = queue.Queue(
+            maxsize=max_buffered_events
+        )
+
+        self._stats_lock = threading.Lock()
+        self._flushed_batches = 0
+        self._flushed_events = 0
+        self._last_flush_latency: Optional[float] = None
+        self._max_flush_latency: Optional[float] = None
+        self._errors: "weakref.WeakKeyDictionary[threading.Thread, BaseException]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        self._disposed = False
+        self._thread = threading.Thread(
+            target=self._run, name="dagster-event-buffer-writer", daemon=True
+        )
+        self._thread.start()
+
+        # the writer is a daemon thread, so make sure that buffered events are written before the
+        # interpreter exits even if the instance is never disposed
+        atexit.register(_dispose_at_exit, weakref.ref(self))
+
+    @property
+    def max_buffered_events(self) -> int:
+        return self._max_buffered_events
+
+    def put(self, event: "EventLogEntry") -> None:
+        check.invariant(not self._disposed, "Cannot put events on a disposed EventBuffer")
+        self._raise_write_error()
+
+        if threading.current_thread() is self._thread:
+            self._write_fn([event])
+            return
+
+        self._queue.put((event, threading.current_thread()))
+
+    def flush(self) -> None:
+        if self._disposed or threading.current_thread() is self._thread:
+            return
+
+        request = _FlushRequest()
+        self._queue.put(request)
+        request.done.wait()
+        self._raise_write_error()
+
+    def _raise_write_error(self) -> None:
+        with self._stats_lock:
+            error = self._errors.pop(threading.current_thread(), None)
+        if error:
+            raise error
+
+    def get_stats(self) -> EventBufferStats:
+        with self._stats_lock:
+            return EventBufferStats(
+                queue_depth=self._queue.qsize(),
+                flushed_batches=self._flushed_batches,
+                flushed_events=self._flushed_events,
+                last_flush_latency=self._last_flush_latency,
+                max_flush_latency=self._max_flush_latency,
+            )
+
+    def dispose(self) -> None:
+        if self._disposed:
+            return
+
+        try:
+            self.flush()
+        finally:
+            self._disposed = True
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        batch: List[_BufferedEvent] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                # the flush interval elapsed for the pending batch
+                item = _FlushRequest()
+
+            if item is None:
+                self._write_batch(batch)
+                return
+
+            if isinstance(item, _FlushRequest):
+                self._write_batch(batch)
+                batch = []
+                deadline = None
+                item.done.set()
+                continue
+
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self._flush_interval_seconds
+
+            if len(batch) >= self._flush_batch_size or time.monotonic() >= deadline:
+                self._write_batch(batch)
+                batch = []
+                deadline = None
+
+    def _write_batch(self, batch: Sequence[_BufferedEvent]) -> None:
+        if not batch:
+            return
+
+        start = time.monotonic()
+        try:
+            self._write_fn([event for event, _producer in batch])
+        except Exception as e:
+            logging.exception("Failed to write %s buffered events.", len(batch))
+            with self._stats_lock:
+                for _event, producer in batch:
+                    self._errors[producer] = e
+            return
+
+        latency = time.monotonic() - start
+        with self._stats_lock:
+            self._flushed_batches += 1
+            self._flushed_events += len(batch)
+            self._last_flush_latency = latency
+            self._max_flush_latency = max(latency, self._max_flush_latency or 0)
+
+
+def _dispose_at_exit(event_buffer_ref: "weakref.ref[EventBuffer]") -> None:
+    event_buffer = event_buffer_ref()
+    if event_buffer:
+        try:
+            event_buffer.dispose()
+        except Exception:
+            logging.exception("Failed to write buffered events at exit.")
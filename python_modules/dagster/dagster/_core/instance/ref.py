@@ -120,7 +120,10 @@ def configurable_storage_data(
         storage_data = ConfigurableClassData(
             "dagster._core.storage.sqlite_storage",
             "DagsterSqliteStorage",
-            yaml.dump({"base_dir": base_dir}, default_flow_style=False),
+            yaml.dump(config_field["sqlite"], default_flow_style=False),
+        )
+        single_writer_config = (
+            {"single_writer": True} if config_field["sqlite"].get("single_writer") else {}
         )
 
         # Back-compat fo the legacy storage field only works if the base_dir is a string
@@ -129,13 +132,19 @@ def configurable_storage_data(
             run_storage_data = ConfigurableClassData(
                 "dagster._core.storage.runs",
                 "SqliteRunStorage",
-                yaml.dump({"base_dir": _runs_directory(base_dir)}, default_flow_style=False),
+                yaml.dump(
+                    {"base_dir": _runs_directory(base_dir), **single_writer_config},
+                    default_flow_style=False,
+                ),
             )
 
             event_storage_data = ConfigurableClassData(
                 "dagster._core.storage.event_log",
                 "SqliteEventLogStorage",
-                yaml.dump({"base_dir": _event_logs_directory(base_dir)}, default_flow_style=False),
+                yaml.dump(
+                    {"base_dir": _event_logs_directory(base_dir), **single_writer_config},
+                    default_flow_style=False,
+                ),
             )
 
             schedule_storage_data = ConfigurableClassData(
@@ -424,7 +433,11 @@ def from_dir(
             "retention",
             "sensors",
             "schedules",
+            "backfills",
             "nux",
+            "event_log_buffer",
+            "serialization",
+            "data_migrations",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
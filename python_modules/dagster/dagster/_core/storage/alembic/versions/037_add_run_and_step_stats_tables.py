@@ -0,0 +1,75 @@
+"""add run and step stats tables
+
+Revision ID: 7b8304b4429e
+Revises: e62c379ac8f4
+Create Date: 2023-02-14 10:12:03.417865
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import get_current_timestamp
+
+# revision identifiers, used by Alembic.
+revision = "7b8304b4429e"
+down_revision = "e62c379ac8f4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # only the event log storage has an event_logs table
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("run_stats"):
+        op.create_table(
+            "run_stats",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("dagster_event_type", db.Text, nullable=False),
+            db.Column("event_count", db.Integer, nullable=False),
+            db.Column("last_event_timestamp", db.types.TIMESTAMP),
+        )
+
+    if not has_index("run_stats", "idx_run_stats"):
+        op.create_index(
+            "idx_run_stats",
+            "run_stats",
+            ["run_id", "dagster_event_type"],
+            mysql_length={"dagster_event_type": 64},
+            unique=True,
+        )
+
+    if not has_table("step_stats"):
+        op.create_table(
+            "step_stats",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("stats_data", db.Text, nullable=False),
+            db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+    if not has_index("step_stats", "idx_step_stats"):
+        op.create_index(
+            "idx_step_stats",
+            "step_stats",
+            ["run_id", "step_key"],
+            mysql_length={"step_key": 64},
+            unique=True,
+        )
+
+
+def downgrade():
+    if has_index("step_stats", "idx_step_stats"):
+        op.drop_index("idx_step_stats", "step_stats")
+
+    if has_table("step_stats"):
+        op.drop_table("step_stats")
+
+    if has_index("run_stats", "idx_run_stats"):
+        op.drop_index("idx_run_stats", "run_stats")
+
+    if has_table("run_stats"):
+        op.drop_table("run_stats")
@@ -0,0 +1,54 @@
+"""add event log archives table
+
+Revision ID: 5f2a9d1c8e47
+Revises: 7b8304b4429e
+Create Date: 2023-02-21 15:32:47.519314
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import get_current_timestamp
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = "5f2a9d1c8e47"
+down_revision = "7b8304b4429e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # only the event log storage has an event_logs table
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("event_log_archives"):
+        op.create_table(
+            "event_log_archives",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("event_count", db.Integer, nullable=False),
+            db.Column(
+                "archive_body",
+                db.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql"),
+                nullable=False,
+            ),
+            db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+    if not has_index("event_log_archives", "idx_event_log_archives"):
+        op.create_index(
+            "idx_event_log_archives",
+            "event_log_archives",
+            ["run_id"],
+            unique=True,
+        )
+
+
+def downgrade():
+    if has_index("event_log_archives", "idx_event_log_archives"):
+        op.drop_index("idx_event_log_archives", "event_log_archives")
+
+    if has_table("event_log_archives"):
+        op.drop_table("event_log_archives")
@@ -0,0 +1,51 @@
+"""add asset partition latest table
+
+Revision ID: 9c5e0f7a3b21
+Revises: 5f2a9d1c8e47
+Create Date: 2023-02-24 11:08:13.284106
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import get_current_timestamp
+
+# revision identifiers, used by Alembic.
+revision = "9c5e0f7a3b21"
+down_revision = "5f2a9d1c8e47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # only the event log storage has an event_logs table
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("asset_partition_latest"):
+        op.create_table(
+            "asset_partition_latest",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("asset_key", db.Text, nullable=False),
+            db.Column("partition", db.Text, nullable=False),
+            db.Column("last_materialization_storage_id", db.Integer, nullable=False),
+            db.Column("last_materialization_timestamp", db.types.TIMESTAMP),
+            db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+    if not has_index("asset_partition_latest", "idx_asset_partition_latest"):
+        op.create_index(
+            "idx_asset_partition_latest",
+            "asset_partition_latest",
+            ["asset_key", "partition"],
+            unique=True,
+            mysql_length={"asset_key": 64, "partition": 64},
+        )
+
+
+def downgrade():
+    if has_index("asset_partition_latest", "idx_asset_partition_latest"):
+        op.drop_index("idx_asset_partition_latest", "asset_partition_latest")
+
+    if has_table("asset_partition_latest"):
+        op.drop_table("asset_partition_latest")
@@ -2,13 +2,57 @@
 
 from typing_extensions import TypedDict
 
-from dagster._config import Field, IntSource, Permissive, Selector, StringSource
+from dagster._config import Field, IntSource, Permissive, StringSource
 from dagster._config.config_schema import UserConfigSchema
 
 
+class SqlPoolConfig(TypedDict):
+    pool_size: int
+    max_overflow: int
+    pool_recycle: int
+    pool_timeout: int
+
+
+def sql_pool_config() -> Field:
+    return Field(
+        {
+            "pool_size": Field(
+                IntSource,
+                is_required=False,
+                default_value=5,
+                description="Number of connections the shared pool keeps open.",
+            ),
+            "max_overflow": Field(
+                IntSource,
+                is_required=False,
+                default_value=10,
+                description="Number of connections that may be opened beyond pool_size under load.",
+            ),
+            "pool_recycle": Field(
+                IntSource,
+                is_required=False,
+                default_value=3600,
+                description="Seconds after which an idle pooled connection is replaced.",
+            ),
+            "pool_timeout": Field(
+                IntSource,
+                is_required=False,
+                default_value=30,
+                description="Seconds to wait for a connection when the pool is exhausted.",
+            ),
+        },
+        is_required=False,
+        description=(
+            "If set, the run, event log and schedule storages in a process share a single pooled "
+            "engine for this database rather than each opening its own connections."
+        ),
+    )
+
+
 class MySqlStorageConfig(TypedDict):
     mysql_url: str
     mysql_db: "MySqlStorageConfigDb"
+    pool: SqlPoolConfig
 
 
 class MySqlStorageConfigDb(TypedDict):
@@ -20,23 +64,26 @@ class MySqlStorageConfigDb(TypedDict):
 
 
 def mysql_config() -> UserConfigSchema:
-    return Selector(
-        {
-            "mysql_url": StringSource,
-            "mysql_db": {
+    return {
+        "mysql_url": Field(StringSource, is_required=False),
+        "mysql_db": Field(
+            {
                 "username": StringSource,
                 "password": StringSource,
                 "hostname": StringSource,
                 "db_name": StringSource,
                 "port": Field(IntSource, is_required=False, default_value=3306),
             },
-        }
-    )
+            is_required=False,
+        ),
+        "pool": sql_pool_config(),
+    }
 
 
 class PostgresStorageConfig(TypedDict):
     postgres_url: str
     postgres_db: "PostgresStorageConfigDb"
+    pool: SqlPoolConfig
 
 
 class PostgresStorageConfigDb(TypedDict):
@@ -65,4 +112,5 @@ def pg_config() -> UserConfigSchema:
             is_required=False,
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
+        "pool": sql_pool_config(),
     }
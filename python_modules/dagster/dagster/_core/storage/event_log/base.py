@@ -3,19 +3,30 @@
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
+    Dict,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
     Set,
     Union,
+    cast,
+    overload,
 )
 
+from typing_extensions import Literal
+
 import dagster._check as check
 from dagster._core.assets import AssetDetails
-from dagster._core.definitions.events import AssetKey
-from dagster._core.event_api import EventHandlerFn, EventLogRecord, EventRecordsFilter
+from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
+from dagster._core.event_api import (
+    EventHandlerFn,
+    EventLogRecord,
+    EventLogRecordProjection,
+    EventRecordsFilter,
+)
 from dagster._core.events import DagsterEventType
 from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.stats import (
@@ -32,6 +43,9 @@
 if TYPE_CHECKING:
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
+# Default number of records fetched per page by iterate_event_records
+EVENT_RECORDS_BATCH_SIZE = 1000
+
 
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
@@ -39,6 +53,12 @@ class EventLogConnection(NamedTuple):
     has_more: bool
 
 
+class EventLogProjectionConnection(NamedTuple):
+    records: Sequence[EventLogRecordProjection]
+    cursor: str
+    has_more: bool
+
+
 class EventLogCursorType(Enum):
     OFFSET = "OFFSET"
     STORAGE_ID = "STORAGE_ID"
@@ -170,6 +190,29 @@ def get_logs_for_run(
         records = self.get_records_for_run(run_id, cursor, of_type, limit).records
         return [record.event_log_entry for record in records]
 
+    @overload
+    def get_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = ...,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = ...,
+        limit: Optional[int] = ...,
+        include_event: Literal[True] = ...,
+    ) -> EventLogConnection:
+        ...
+
+    @overload
+    def get_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = ...,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = ...,
+        limit: Optional[int] = ...,
+        *,
+        include_event: Literal[False],
+    ) -> EventLogProjectionConnection:
+        ...
+
     @abstractmethod
     def get_records_for_run(
         self,
@@ -177,7 +220,8 @@ def get_records_for_run(
         cursor: Optional[str] = None,
         of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
         limit: Optional[int] = None,
-    ) -> EventLogConnection:
+        include_event: bool = True,
+    ) -> Union[EventLogConnection, EventLogProjectionConnection]:
         """Get all of the event log records corresponding to a run.
 
         Args:
@@ -185,6 +229,8 @@ def get_records_for_run(
             cursor (Optional[str]): Cursor value to track paginated queries.
             of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
             limit (Optional[int]): Max number of records to return.
+            include_event (bool): Whether to fetch the event of each record. If False, the
+                records are returned as EventLogRecordProjections of their indexed fields.
         """
 
     def get_stats_for_run(self, run_id: str) -> PipelineRunStatsSnapshot:
@@ -213,10 +259,28 @@ def store_event(self, event: "EventLogEntry") -> None:
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events, in order.
+
+        Storages that can write several events in one round trip should override this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
 
+    def archive_events(self, run_id: str) -> int:
+        """Move the events of a finished run into an archive of the run's events, which continue
+        to be returned by `get_records_for_run`. Returns the number of events archived. Only
+        supported for sql storages.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema migrations necessary to bring an
@@ -255,15 +319,83 @@ def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
         """Allows for optimizing database connection / use in the context of a long lived dagit process.
         """
 
+    @overload
+    def get_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = ...,
+        ascending: bool = ...,
+        include_event: Literal[True] = ...,
+    ) -> Iterable[EventLogRecord]:
+        ...
+
+    @overload
+    def get_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = ...,
+        ascending: bool = ...,
+        *,
+        include_event: Literal[False],
+    ) -> Iterable[EventLogRecordProjection]:
+        ...
+
     @abstractmethod
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
         limit: Optional[int] = None,
         ascending: bool = False,
-    ) -> Iterable[EventLogRecord]:
+        include_event: bool = True,
+    ) -> Iterable[Union[EventLogRecord, EventLogRecordProjection]]:
         pass
 
+    @overload
+    def iterate_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        batch_size: int = ...,
+        include_event: Literal[True] = ...,
+    ) -> Iterator[EventLogRecord]:
+        ...
+
+    @overload
+    def iterate_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        batch_size: int = ...,
+        *,
+        include_event: Literal[False],
+    ) -> Iterator[EventLogRecordProjection]:
+        ...
+
+    def iterate_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        batch_size: int = EVENT_RECORDS_BATCH_SIZE,
+        include_event: bool = True,
+    ) -> Iterator[Union[EventLogRecord, EventLogRecordProjection]]:
+        """Yields the records matching the filter in ascending storage id order, fetching them in
+        pages of at most batch_size records keyed by storage id, so that only a single page is held
+        in memory at a time.
+        """
+        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+        check.bool_param(include_event, "include_event")
+
+        page_filter = event_records_filter
+        while True:
+            records = list(
+                self.get_event_records(
+                    page_filter, limit=batch_size, ascending=True, include_event=include_event
+                )
+            )
+            yield from records
+            if len(records) < batch_size:
+                return
+            page_filter = page_filter._replace(after_cursor=records[-1].storage_id)
+
     def supports_event_consumer_queries(self) -> bool:
         return False
 
@@ -368,6 +500,37 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         pass
 
+    def get_latest_asset_partition_materialization_records(
+        self, asset_partitions: Sequence[AssetKeyPartitionKey]
+    ) -> Mapping[AssetKeyPartitionKey, EventLogRecord]:
+        """Get the latest materialization record of each of a set of partitions of assets, keyed
+        by asset partition. Asset partitions that have not been materialized are omitted.
+        """
+        check.sequence_param(asset_partitions, "asset_partitions", of_type=AssetKeyPartitionKey)
+
+        partitions_by_asset_key: Dict[AssetKey, Set[str]] = {}
+        for asset_partition in asset_partitions:
+            check.invariant(
+                asset_partition.partition_key is not None,
+                "Can only fetch the latest materializations of partitioned asset partitions",
+            )
+            partitions_by_asset_key.setdefault(asset_partition.asset_key, set()).add(
+                cast(str, asset_partition.partition_key)
+            )
+
+        records: Dict[AssetKeyPartitionKey, EventLogRecord] = {}
+        for asset_key, partitions in partitions_by_asset_key.items():
+            for record in self.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                    asset_key=asset_key,
+                    asset_partitions=sorted(partitions),
+                ),
+                ascending=True,
+            ):
+                records[AssetKeyPartitionKey(asset_key, record.partition_key)] = record
+        return records
+
     @abstractmethod
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         """Get the list of partition keys for a dynamic partitions definition."""
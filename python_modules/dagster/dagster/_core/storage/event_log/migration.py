@@ -1,18 +1,39 @@
+import time
+from datetime import datetime
+
 import sqlalchemy as db
 from tqdm import tqdm
 
 from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.migration.batched import dump_migration_cursor, load_migration_cursor
 from dagster._serdes import deserialize_json_to_dagster_namedtuple
 from dagster._utils import utc_datetime_from_timestamp
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+RUN_STATS_TABLES = "run_stats_tables"  # builds the run_stats and step_stats tables
+ASSET_PARTITION_LATEST_TABLE = "asset_partition_latest_table"  # builds asset_partition_latest
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
+    RUN_STATS_TABLES: lambda: migrate_run_stats_data,
+    ASSET_PARTITION_LATEST_TABLE: lambda: migrate_asset_partition_latest_data,
 }
 ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
 
+# batched equivalents of the data migrations above, run by `execute_batched_data_migrations`
+BATCHED_EVENT_LOG_DATA_MIGRATIONS = {
+    SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data_batch,
+    RUN_STATS_TABLES: lambda: migrate_run_stats_data_batch,
+    ASSET_PARTITION_LATEST_TABLE: lambda: migrate_asset_partition_latest_data_batch,
+}
+BATCHED_ASSET_DATA_MIGRATIONS = {
+    ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns_batch
+}
+
+# Maximum number of values bound in a single IN clause by the batched data migrations
+MIGRATION_LOOKUP_BATCH_SIZE = 500
+
 
 def migrate_event_log_data(instance=None):
     """
@@ -71,12 +92,204 @@ def migrate_asset_key_data(event_log_storage, print_fn=None):
                 pass
 
 
-def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
+def _check_run_stats_tables(event_log_storage):
+    from dagster._core.errors import DagsterInvariantViolationError
+
+    from .schema import RunStatsTable, StepStatsTable
+
+    if not (
+        event_log_storage.has_table(RunStatsTable.name)
+        and event_log_storage.has_table(StepStatsTable.name)
+    ):
+        raise DagsterInvariantViolationError(
+            "The run_stats and step_stats tables do not exist. Run `dagster instance migrate` to "
+            "create them before building run stats."
+        )
+
+
+def migrate_run_stats_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the run_stats and step_stats tables from the data in existing event log
+    records, replacing any existing stats rows for each run.  Runs whose events are stored in a
+    database without the stats tables (e.g. a run shard that has not been upgraded) are skipped, and
+    their stats continue to be read from the event log.
+    """
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    from .schema import SqlEventLogStorageTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    _check_run_stats_tables(event_log_storage)
+
+    if event_log_storage.is_run_sharded:
+        run_ids = event_log_storage.get_all_run_ids()  # type: ignore
+    else:
+        with event_log_storage.index_connection() as conn:
+            run_ids = [
+                row[0]
+                for row in conn.execute(
+                    db.select([SqlEventLogStorageTable.c.run_id])
+                    .where(SqlEventLogStorageTable.c.run_id != None)  # noqa: E711
+                    .distinct()
+                ).fetchall()
+            ]
+
+    if print_fn:
+        print_fn(f"Found {len(run_ids)} runs to build stats for.")
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        _rebuild_run_stats(event_log_storage, run_id)
+
+
+def _rebuild_run_stats(event_log_storage, run_id):
+    from dagster._core.execution.stats import (
+        RUN_STATS_EVENTS,
+        STEP_STATS_EVENTS,
+        serialize_step_stats_data,
+        update_step_stats_data,
+    )
+
+    from .schema import RunStatsTable, SqlEventLogStorageTable, StepStatsTable
+
+    with event_log_storage.run_connection(run_id) as conn:
+        if not (
+            conn.dialect.has_table(conn, RunStatsTable.name)
+            and conn.dialect.has_table(conn, StepStatsTable.name)
+        ):
+            return
+
+        # only the storage ids and serialized events are read, so that this works against any event
+        # log schema
+        rows = conn.execute(
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        ).fetchall()
+
+        run_stats_data = {}
+        step_stats_data = {}
+        for storage_id, event_json in rows:
+            event = deserialize_json_to_dagster_namedtuple(event_json)
+            if not isinstance(event, EventLogEntry) or not event.is_dagster_event:
+                continue
+
+            dagster_event = event.get_dagster_event()
+            if dagster_event.event_type in RUN_STATS_EVENTS:
+                event_count, last_event_timestamp = run_stats_data.get(
+                    dagster_event.event_type_value, (0, event.timestamp)
+                )
+                run_stats_data[dagster_event.event_type_value] = (
+                    event_count + 1,
+                    max(last_event_timestamp, event.timestamp),
+                )
+            if dagster_event.event_type in STEP_STATS_EVENTS and dagster_event.step_key:
+                step_stats_data[dagster_event.step_key] = update_step_stats_data(
+                    step_stats_data.get(dagster_event.step_key),
+                    event,
+                    sort_key=storage_id,
+                )
+
+        with conn.begin():
+            conn.execute(
+                RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    RunStatsTable.c.run_id == run_id
+                )
+            )
+            conn.execute(
+                StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    StepStatsTable.c.run_id == run_id
+                )
+            )
+            if run_stats_data:
+                conn.execute(
+                    RunStatsTable.insert(),  # pylint: disable=no-value-for-parameter
+                    [
+                        dict(
+                            run_id=run_id,
+                            dagster_event_type=event_type_value,
+                            event_count=event_count,
+                            last_event_timestamp=datetime.utcfromtimestamp(last_event_timestamp),
+                        )
+                        for event_type_value, (
+                            event_count,
+                            last_event_timestamp,
+                        ) in run_stats_data.items()
+                    ],
+                )
+            if step_stats_data:
+                conn.execute(
+                    StepStatsTable.insert(),  # pylint: disable=no-value-for-parameter
+                    [
+                        dict(
+                            run_id=run_id,
+                            step_key=step_key,
+                            stats_data=serialize_step_stats_data(data),
+                        )
+                        for step_key, data in step_stats_data.items()
+                    ],
+                )
+
+
+def migrate_asset_partition_latest_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the asset_partition_latest table from the partitioned materializations
+    in existing event log records, replacing any existing rows for each asset.  Materializations
+    from before an asset was wiped are not indexed.
+    """
     from dagster._core.definitions.events import AssetKey
+    from dagster._core.errors import DagsterInvariantViolationError
+    from dagster._core.events import DagsterEventType
     from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
-    from dagster._serdes import serialize_dagster_namedtuple
 
-    from .schema import AssetKeyTable, SqlEventLogStorageTable
+    from .schema import AssetPartitionLatestTable, SqlEventLogStorageTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if not event_log_storage.has_table(AssetPartitionLatestTable.name):
+        raise DagsterInvariantViolationError(
+            "The asset_partition_latest table does not exist. Run `dagster instance migrate` to "
+            "create it before building the latest materializations of asset partitions."
+        )
+
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Querying partitioned asset materializations.")
+        rows = conn.execute(
+            db.select([SqlEventLogStorageTable.c.asset_key])
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key)
+        ).fetchall()
+
+    # legacy and current asset key strings are indexed under the current asset key string
+    asset_keys = sorted(
+        {AssetKey.from_db_string(row[0]) for row in rows}, key=lambda key: key.to_string()
+    )
+    if print_fn:
+        print_fn(f"Found {len(asset_keys)} partitioned assets to index.")
+        asset_keys = tqdm(asset_keys)
+
+    for asset_key in asset_keys:
+        with event_log_storage.index_connection() as conn:
+            event_log_storage._rebuild_asset_partition_latest(  # pylint: disable=protected-access
+                conn, asset_key
+            )
+
+
+def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    from .schema import AssetKeyTable
 
     if not isinstance(event_log_storage, SqlEventLogStorage):
         return
@@ -99,69 +312,319 @@ def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
             results = tqdm(results)
 
         for row in results:
-            asset_key_str, asset_details_str, last_materialization_str = row
-            wipe_timestamp = None
-            event = None
+            _migrate_asset_key_index_columns_row(event_log_storage, conn, row)
+
 
-            asset_key = AssetKey.from_db_string(asset_key_str)
+def _migrate_asset_key_index_columns_row(event_log_storage, conn, row):
+    from dagster._core.definitions.events import AssetKey
+    from dagster._serdes import serialize_value
+
+    from .schema import AssetKeyTable, SqlEventLogStorageTable
+
+    asset_key_str, asset_details_str, last_materialization_str = row
+    wipe_timestamp = None
+    event = None
+
+    asset_key = AssetKey.from_db_string(asset_key_str)
 
-            if asset_details_str:
-                asset_details = deserialize_json_to_dagster_namedtuple(asset_details_str)
-                wipe_timestamp = asset_details.last_wipe_timestamp if asset_details else None
+    if asset_details_str:
+        asset_details = deserialize_json_to_dagster_namedtuple(asset_details_str)
+        wipe_timestamp = asset_details.last_wipe_timestamp if asset_details else None
 
-            if last_materialization_str:
-                event_or_materialization = deserialize_json_to_dagster_namedtuple(
-                    last_materialization_str
+    if last_materialization_str:
+        event_or_materialization = deserialize_json_to_dagster_namedtuple(last_materialization_str)
+
+        if isinstance(event_or_materialization, EventLogEntry):
+            event = event_or_materialization
+
+    if not event:
+        materialization_query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(
+                db.or_(
+                    SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                    SqlEventLogStorageTable.c.asset_key == asset_key.to_string(legacy=True),
                 )
+            )
+            .order_by(SqlEventLogStorageTable.c.timestamp.desc())
+            .limit(1)
+        )
+        row = conn.execute(materialization_query).fetchone()
+        if row:
+            event = deserialize_json_to_dagster_namedtuple(row[0])
+
+    if not event:
+        # this must be a wiped asset
+        conn.execute(
+            AssetKeyTable.update()
+            .values(  # pylint: disable=no-value-for-parameter
+                last_materialization=None,
+                last_materialization_timestamp=None,
+                wipe_timestamp=utc_datetime_from_timestamp(wipe_timestamp)
+                if wipe_timestamp
+                else None,
+            )
+            .where(
+                AssetKeyTable.c.asset_key == asset_key.to_string(),
+            )
+        )
+    else:
+        conn.execute(
+            AssetKeyTable.update()
+            .values(  # pylint: disable=no-value-for-parameter
+                last_materialization=serialize_value(
+                    event, serdes_format=event_log_storage.serdes_format
+                ),
+                last_materialization_timestamp=utc_datetime_from_timestamp(event.timestamp),
+                wipe_timestamp=utc_datetime_from_timestamp(wipe_timestamp)
+                if wipe_timestamp
+                else None,
+            )
+            .where(
+                AssetKeyTable.c.asset_key == asset_key.to_string(),
+            )
+        )
+
 
-                if isinstance(event_or_materialization, EventLogEntry):
-                    event = event_or_materialization
+def _get_max_storage_id(event_log_storage):
+    from .schema import SqlEventLogStorageTable
+
+    with event_log_storage.index_connection() as conn:
+        return conn.execute(db.select([db.func.max(SqlEventLogStorageTable.c.id)])).scalar() or 0
 
-            if not event:
-                materialization_query = (
-                    db.select([SqlEventLogStorageTable.c.event])
-                    .where(
-                        db.or_(
-                            SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
-                            SqlEventLogStorageTable.c.asset_key == asset_key.to_string(legacy=True),
+
+def migrate_asset_key_data_batch(event_log_storage, cursor, batch_size):
+    """
+    Batched equivalent of `migrate_asset_key_data`. Each batch scans a fixed range of storage ids,
+    so that it does a bounded amount of work no matter how sparse the asset events are.
+    """
+    from dagster._core.definitions.events import AssetKey
+
+    from .schema import AssetKeyTable, SqlEventLogStorageTable
+
+    after_id = load_migration_cursor(cursor).get("after_id", 0)
+    if after_id >= _get_max_storage_id(event_log_storage):
+        return None
+
+    upper_id = after_id + batch_size
+    with event_log_storage.index_connection() as conn:
+        rows = conn.execute(
+            db.select([SqlEventLogStorageTable.c.asset_key])
+            .where(SqlEventLogStorageTable.c.id > after_id)
+            .where(SqlEventLogStorageTable.c.id <= upper_id)
+            .where(SqlEventLogStorageTable.c.asset_key != None)  # noqa: E711
+            .distinct()
+        ).fetchall()
+        asset_keys = sorted({AssetKey.from_db_string(row[0]).to_string() for row in rows})
+
+        existing = set()
+        for i in range(0, len(asset_keys), MIGRATION_LOOKUP_BATCH_SIZE):
+            existing.update(
+                row[0]
+                for row in conn.execute(
+                    db.select([AssetKeyTable.c.asset_key]).where(
+                        AssetKeyTable.c.asset_key.in_(
+                            asset_keys[i : i + MIGRATION_LOOKUP_BATCH_SIZE]
                         )
                     )
-                    .order_by(SqlEventLogStorageTable.c.timestamp.desc())
-                    .limit(1)
                 )
-                row = conn.execute(materialization_query).fetchone()
-                if row:
-                    event = deserialize_json_to_dagster_namedtuple(row[0])
+            )
 
-            if not event:
-                # this must be a wiped asset
+        for asset_key in asset_keys:
+            if asset_key in existing:
+                continue
+            try:
                 conn.execute(
-                    AssetKeyTable.update()
-                    .values(  # pylint: disable=no-value-for-parameter
-                        last_materialization=None,
-                        last_materialization_timestamp=None,
-                        wipe_timestamp=utc_datetime_from_timestamp(wipe_timestamp)
-                        if wipe_timestamp
-                        else None,
-                    )
-                    .where(
-                        AssetKeyTable.c.asset_key == asset_key.to_string(),
+                    AssetKeyTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        asset_key=asset_key
                     )
                 )
-            else:
-                conn.execute(
-                    AssetKeyTable.update()
-                    .values(  # pylint: disable=no-value-for-parameter
-                        last_materialization=serialize_dagster_namedtuple(event),
-                        last_materialization_timestamp=utc_datetime_from_timestamp(event.timestamp),
-                        wipe_timestamp=utc_datetime_from_timestamp(wipe_timestamp)
-                        if wipe_timestamp
-                        else None,
-                    )
-                    .where(
-                        AssetKeyTable.c.asset_key == asset_key.to_string(),
+            except db.exc.IntegrityError:
+                # asset key inserted concurrently
+                pass
+
+    return dump_migration_cursor({"after_id": upper_id})
+
+
+def _get_run_ids_after(event_log_storage, after_run_id, limit):
+    from .schema import SqlEventLogStorageTable
+
+    if event_log_storage.is_run_sharded:
+        return sorted(
+            run_id
+            for run_id in event_log_storage.get_all_run_ids()
+            if after_run_id is None or run_id > after_run_id
+        )[:limit]
+
+    query = (
+        db.select([SqlEventLogStorageTable.c.run_id])
+        .where(SqlEventLogStorageTable.c.run_id != None)  # noqa: E711
+        .distinct()
+        .order_by(SqlEventLogStorageTable.c.run_id.asc())
+        .limit(limit)
+    )
+    if after_run_id is not None:
+        query = query.where(SqlEventLogStorageTable.c.run_id > after_run_id)
+    with event_log_storage.index_connection() as conn:
+        return [row[0] for row in conn.execute(query).fetchall()]
+
+
+def _get_run_ids_with_events_since(event_log_storage, after_id, after_timestamp):
+    from .schema import SqlEventLogStorageTable
+
+    if not event_log_storage.is_run_sharded:
+        with event_log_storage.index_connection() as conn:
+            return [
+                row[0]
+                for row in conn.execute(
+                    db.select([SqlEventLogStorageTable.c.run_id])
+                    .where(SqlEventLogStorageTable.c.id > after_id)
+                    .where(SqlEventLogStorageTable.c.run_id != None)  # noqa: E711
+                    .distinct()
+                ).fetchall()
+            ]
+
+    # storage ids are not comparable across run shards, so timestamps are compared instead
+    run_ids = []
+    for run_id in event_log_storage.get_all_run_ids():
+        with event_log_storage.run_connection(run_id) as conn:
+            row = conn.execute(
+                db.select([SqlEventLogStorageTable.c.id])
+                .where(
+                    SqlEventLogStorageTable.c.timestamp
+                    >= datetime.utcfromtimestamp(after_timestamp)
+                )
+                .limit(1)
+            ).fetchone()
+        if row:
+            run_ids.append(run_id)
+    return run_ids
+
+
+def migrate_run_stats_data_batch(event_log_storage, cursor, batch_size):
+    """
+    Batched equivalent of `migrate_run_stats_data`, rebuilding the stats of a batch of runs at a
+    time, in run id order. Events are not folded into the stats tables until they are enabled, so
+    once every run has been rebuilt, the runs that stored events since the migration started are
+    rebuilt again.
+    """
+    _check_run_stats_tables(event_log_storage)
+
+    if cursor:
+        state = load_migration_cursor(cursor)
+    else:
+        state = {
+            "after_run_id": None,
+            "after_id": _get_max_storage_id(event_log_storage),
+            "after_timestamp": time.time(),
+        }
+
+    run_ids = _get_run_ids_after(event_log_storage, state["after_run_id"], batch_size)
+    if run_ids:
+        for run_id in run_ids:
+            _rebuild_run_stats(event_log_storage, run_id)
+        return dump_migration_cursor(dict(state, after_run_id=run_ids[-1]))
+
+    for run_id in _get_run_ids_with_events_since(
+        event_log_storage, state["after_id"], state["after_timestamp"]
+    ):
+        _rebuild_run_stats(event_log_storage, run_id)
+    return None
+
+
+def migrate_asset_partition_latest_data_batch(event_log_storage, cursor, batch_size):
+    """
+    Batched equivalent of `migrate_asset_partition_latest_data`, rebuilding the latest
+    materializations of the partitions of a batch of assets at a time, in asset key order. New
+    materializations are written to the asset_partition_latest table as they are stored, whether
+    or not the migration is complete.
+    """
+    from dagster._core.definitions.events import AssetKey
+    from dagster._core.errors import DagsterInvariantViolationError
+
+    from .schema import AssetKeyTable, AssetPartitionLatestTable
+
+    if not event_log_storage.has_table(AssetPartitionLatestTable.name):
+        raise DagsterInvariantViolationError(
+            "The asset_partition_latest table does not exist. Run `dagster instance migrate` to "
+            "create it before building the latest materializations of asset partitions."
+        )
+
+    after_asset_key = load_migration_cursor(cursor).get("after_asset_key")
+    query = (
+        db.select([AssetKeyTable.c.asset_key])
+        .order_by(AssetKeyTable.c.asset_key.asc())
+        .limit(batch_size)
+    )
+    if after_asset_key is not None:
+        query = query.where(AssetKeyTable.c.asset_key > after_asset_key)
+
+    with event_log_storage.index_connection() as conn:
+        asset_key_strs = [row[0] for row in conn.execute(query).fetchall()]
+        for asset_key_str in asset_key_strs:
+            event_log_storage._rebuild_asset_partition_latest(  # pylint: disable=protected-access
+                conn, AssetKey.from_db_string(asset_key_str)
+            )
+
+    if len(asset_key_strs) < batch_size:
+        return None
+    return dump_migration_cursor({"after_asset_key": asset_key_strs[-1]})
+
+
+def migrate_asset_keys_index_columns_batch(event_log_storage, cursor, batch_size):
+    """
+    Batched equivalent of `migrate_asset_keys_index_columns`, reindexing a batch of asset keys at a
+    time, in asset key order. The index columns are not written as events are stored until the
+    migration is complete, so once every asset key has been reindexed, the asset keys that stored
+    events since the migration started are reindexed again.
+    """
+    from dagster._core.definitions.events import AssetKey
+
+    from .schema import AssetKeyTable, SqlEventLogStorageTable
+
+    if cursor:
+        state = load_migration_cursor(cursor)
+    else:
+        state = {"after_asset_key": None, "after_id": _get_max_storage_id(event_log_storage)}
+
+    columns = [
+        AssetKeyTable.c.asset_key,
+        AssetKeyTable.c.asset_details,
+        AssetKeyTable.c.last_materialization,
+    ]
+    query = db.select(columns).order_by(AssetKeyTable.c.asset_key.asc()).limit(batch_size)
+    if state["after_asset_key"] is not None:
+        query = query.where(AssetKeyTable.c.asset_key > state["after_asset_key"])
+
+    with event_log_storage.index_connection() as conn:
+        rows = conn.execute(query).fetchall()
+        if rows:
+            for row in rows:
+                _migrate_asset_key_index_columns_row(event_log_storage, conn, row)
+            return dump_migration_cursor(dict(state, after_asset_key=rows[-1][0]))
+
+        updated_asset_keys = sorted(
+            {
+                AssetKey.from_db_string(row[0]).to_string()
+                for row in conn.execute(
+                    db.select([SqlEventLogStorageTable.c.asset_key])
+                    .where(SqlEventLogStorageTable.c.id > state["after_id"])
+                    .where(SqlEventLogStorageTable.c.asset_key != None)  # noqa: E711
+                    .distinct()
+                ).fetchall()
+            }
+        )
+        for i in range(0, len(updated_asset_keys), MIGRATION_LOOKUP_BATCH_SIZE):
+            for row in conn.execute(
+                db.select(columns).where(
+                    AssetKeyTable.c.asset_key.in_(
+                        updated_asset_keys[i : i + MIGRATION_LOOKUP_BATCH_SIZE]
                     )
                 )
+            ).fetchall():
+                _migrate_asset_key_index_columns_row(event_log_storage, conn, row)
+
+    return None
 
 
 def sql_asset_event_generator(conn, cursor=None, batch_size=1000):
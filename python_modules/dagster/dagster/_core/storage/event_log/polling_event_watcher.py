@@ -1,7 +1,19 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from collections import defaultdict
+from typing import (
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import dagster._check as check
+from dagster._core.event_api import EventLogRecord
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor
 
@@ -9,6 +21,12 @@
 
 POLLING_CADENCE = 0.1  # 100 ms
 
+# the polling interval doubles on every poll that finds no new events, up to this value
+MAX_POLLING_CADENCE = 1.0
+
+# the maximum number of events fetched per poll, across all watched runs
+POLLING_BATCH_SIZE = 1000
+
 
 class CallbackAfterCursor(NamedTuple):
     """Callback passed from Observer class in event polling.
@@ -22,14 +40,36 @@ class CallbackAfterCursor(NamedTuple):
     callback: Callable[[EventLogEntry, str], None]
 
 
+class _WatchedRun:
+    """The callbacks watching a run, along with the storage id of the last event of the run that
+    was dispatched to them.
+    """
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.callbacks: List[CallbackAfterCursor] = []
+        self.cursor: Optional[str] = None
+        self.last_storage_id: Optional[int] = None
+
+
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that polls the event log for the new events of all watched runs from a
+    single thread.
+
+    Every poll issues one query for the new events of all watched runs, each after the storage id
+    of the last event dispatched for that run, and dispatches the fetched events to the callbacks
+    of their runs. Since every run keeps its own cursor, an event committed after events of other
+    runs with larger storage ids is still fetched. Runs watched from an offset cursor, and all runs
+    of run-sharded storages, where storage ids are not comparable across runs, are queried
+    separately, but still from the single watcher thread.
+
+    The polling interval starts at POLLING_CADENCE and doubles on every poll that finds no new
+    events, up to MAX_POLLING_CADENCE. It is reset when new events are found, or a run is watched.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _lock protects _watched_runs. Callbacks are called after releasing _lock, so
+        that they can watch and unwatch runs, and a callback may be called for an event fetched
+        before it was unwatched.
     """
 
     def __init__(self, event_log_storage: SqlEventLogStorage):
@@ -37,16 +77,18 @@ def __init__(self, event_log_storage: SqlEventLogStorage):
             event_log_storage, "event_log_storage", SqlEventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _lock protects _watched_runs
+        self._lock: threading.Lock = threading.Lock()
+        self._watched_runs: MutableMapping[str, _WatchedRun] = {}
+        self._wakeup = threading.Event()
+        self._should_thread_exit = threading.Event()
+        self._thread: Optional[threading.Thread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
-        return _has_run_id
+        with self._lock:
+            return run_id in self._watched_runs
 
     def watch_run(
         self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
@@ -54,23 +96,34 @@ def watch_run(
         run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
+        with self._lock:
+            if run_id not in self._watched_runs:
+                watched_run = _WatchedRun(run_id)
+                watched_run.cursor = cursor
+                self._watched_runs[run_id] = watched_run
+            self._watched_runs[run_id].callbacks.append(CallbackAfterCursor(cursor, callback))
+
+            if self._thread is None and not self._disposed:
+                self._thread = threading.Thread(
+                    target=self._run, name="sql-event-watch", daemon=True
                 )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+                self._thread.start()
+        self._wakeup.set()
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._lock:
+            watched_run = self._watched_runs.get(run_id)
+            if watched_run is None:
+                return
+            watched_run.callbacks = [
+                callback_with_cursor
+                for callback_with_cursor in watched_run.callbacks
+                if callback_with_cursor.callback != handler
+            ]
+            if not watched_run.callbacks:
+                del self._watched_runs[run_id]
 
     def __del__(self):
         self.close()
@@ -78,95 +131,130 @@ def __del__(self):
     def close(self):
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                del self._run_id_to_watcher_dict
+            self._should_thread_exit.set()
+            self._wakeup.set()
+            thread = self._thread
+            if thread is not None and thread is not threading.current_thread():
+                thread.join()
+            with self._lock:
+                self._watched_runs = {}
 
+    def _run(self) -> None:
+        """Polling loop of the watcher thread. Sleeps for the current polling interval (or
+        indefinitely, if no runs are watched) unless woken up by a newly watched run, then fetches
+        and dispatches the new events of all watched runs.
+        """
+        interval = POLLING_CADENCE
+        while True:
+            with self._lock:
+                is_watching = bool(self._watched_runs)
+            self._wakeup.wait(interval if is_watching else None)
+            if self._wakeup.is_set():
+                self._wakeup.clear()
+                interval = POLLING_CADENCE
+            if self._should_thread_exit.is_set():
+                return
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+            try:
+                has_events, has_more = self._poll()
+            except Exception:
+                logging.exception("Exception while polling the event log for watched runs.")
+                has_events, has_more = False, False
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
+            if has_more:
+                self._wakeup.set()
+            elif has_events:
+                interval = POLLING_CADENCE
+            else:
+                interval = min(interval * 2, MAX_POLLING_CADENCE)
 
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
+    def _poll(self) -> Tuple[bool, bool]:
+        """Fetches and dispatches the new events of the watched runs. Returns whether any events
+        were found, and whether more events may remain to be fetched.
+        """
+        is_run_sharded = self._event_log_storage.is_run_sharded
+        with self._lock:
+            after_storage_ids: Dict[str, int] = {}
+            run_cursors: Dict[str, Optional[str]] = {}
+            for run_id, watched_run in self._watched_runs.items():
+                after_storage_id = _after_storage_id(watched_run)
+                if is_run_sharded or after_storage_id is None:
+                    run_cursors[run_id] = _run_cursor(watched_run)
+                else:
+                    after_storage_ids[run_id] = after_storage_id
 
-    """
+        has_events = False
+        has_more = False
+        for run_id, cursor in run_cursors.items():
+            connection = self._event_log_storage.get_records_for_run(
+                run_id, cursor=cursor, limit=POLLING_BATCH_SIZE
+            )
+            self._dispatch(run_id, connection.records)
+            has_events = has_events or bool(connection.records)
+            has_more = has_more or connection.has_more
 
-    def __init__(self, event_log_storage: SqlEventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", SqlEventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"mysql-event-watch-run-id-{self._run_id}"
+        if not after_storage_ids:
+            return has_events, has_more
 
-    @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
+        records = self._event_log_storage.get_records_for_runs(
+            after_storage_ids, limit=POLLING_BATCH_SIZE
+        )
+        records_by_run_id: Dict[str, List[EventLogRecord]] = defaultdict(list)
+        for record in records:
+            records_by_run_id[record.run_id].append(record)
+        for run_id, run_records in records_by_run_id.items():
+            self._dispatch(run_id, run_records)
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
+        return has_events or bool(records), has_more or len(records) == POLLING_BATCH_SIZE
 
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
+    def _dispatch(self, run_id: str, records: Sequence[EventLogRecord]) -> None:
+        """Calls the callbacks watching a run on its new events, skipping events that were already
+        dispatched and, for each callback, events before its cursor.
         """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+        calls = []
+        with self._lock:
+            watched_run = self._watched_runs.get(run_id)
+            if watched_run is None:
+                return
+            for record in records:
+                if (
+                    watched_run.last_storage_id is not None
+                    and record.storage_id <= watched_run.last_storage_id
+                ):
+                    continue
+                watched_run.last_storage_id = record.storage_id
 
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys.
+                for callback_with_cursor in watched_run.callbacks:
+                    if (
+                        callback_with_cursor.cursor is None
+                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                        < record.storage_id
+                    ):
+                        calls.append((callback_with_cursor.callback, record))
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+        for callback, record in calls:
+            try:
+                callback(
+                    record.event_log_entry,
+                    str(EventLogCursor.from_storage_id(record.storage_id)),
+                )
+            except Exception:
+                logging.exception("Exception in callback for event watch on run %s.", run_id)
 
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
-
-    def run(self):
-        """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
-        """
-        cursor = None
-        while not self._should_thread_exit.wait(POLLING_CADENCE):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor if conn.cursor else cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
+
+def _run_cursor(watched_run: _WatchedRun) -> Optional[str]:
+    if watched_run.last_storage_id is not None:
+        return EventLogCursor.from_storage_id(watched_run.last_storage_id).to_string()
+    return watched_run.cursor
+
+
+def _after_storage_id(watched_run: _WatchedRun) -> Optional[int]:
+    """The storage id after which the events of the run are fetched, or None if the run is
+    watched from an offset cursor and has no events dispatched yet.
+    """
+    if watched_run.last_storage_id is not None:
+        return watched_run.last_storage_id
+    if watched_run.cursor is None:
+        return -1
+    cursor = EventLogCursor.parse(watched_run.cursor)
+    return cursor.storage_id() if cursor.is_id_cursor() else None
@@ -1,5 +1,5 @@
 import sqlalchemy as db
-from sqlalchemy.dialects import sqlite
+from sqlalchemy.dialects import mysql, sqlite
 
 from ..sql import MySQLCompatabilityTypes, get_current_timestamp
 
@@ -80,6 +80,61 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Per-run counts and latest timestamps of the event types summarized by `get_stats_for_run`,
+# maintained incrementally as events are stored.
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("dagster_event_type", db.Text, nullable=False),
+    db.Column("event_count", db.Integer, nullable=False),
+    db.Column("last_event_timestamp", db.types.TIMESTAMP),
+)
+
+# Per-step stats data accumulated from step events, from which `get_step_stats_for_run` builds
+# step stats without reading the step events, maintained incrementally as events are stored.
+StepStatsTable = db.Table(
+    "step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("stats_data", db.Text, nullable=False),
+    db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
+# Compressed archives of the events of finished runs that have been moved out of the event_logs
+# table, one row per run. Events that back the run, asset, and stats indexes are never archived.
+EventLogArchivesTable = db.Table(
+    "event_log_archives",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("event_count", db.Integer, nullable=False),
+    db.Column(
+        "archive_body",
+        db.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql"),
+        nullable=False,
+    ),
+    db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
+
+# The storage id of the latest materialization of each asset partition, maintained as asset events
+# are stored, from which the latest materializations of many partitions are fetched without
+# scanning the materializations of each partition.
+AssetPartitionLatestTable = db.Table(
+    "asset_partition_latest",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("asset_key", db.Text, nullable=False),
+    db.Column("partition", db.Text, nullable=False),
+    db.Column("last_materialization_storage_id", db.Integer, nullable=False),
+    db.Column("last_materialization_timestamp", db.types.TIMESTAMP),
+    db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
 
 db.Index(
     "idx_step_key",
@@ -138,3 +193,29 @@
     mysql_length={"partitions_def_name": 64, "partition": 64},
     unique=True,
 )
+db.Index(
+    "idx_run_stats",
+    RunStatsTable.c.run_id,
+    RunStatsTable.c.dagster_event_type,
+    mysql_length={"dagster_event_type": 64},
+    unique=True,
+)
+db.Index(
+    "idx_step_stats",
+    StepStatsTable.c.run_id,
+    StepStatsTable.c.step_key,
+    mysql_length={"step_key": 64},
+    unique=True,
+)
+db.Index(
+    "idx_event_log_archives",
+    EventLogArchivesTable.c.run_id,
+    unique=True,
+)
+db.Index(
+    "idx_asset_partition_latest",
+    AssetPartitionLatestTable.c.asset_key,
+    AssetPartitionLatestTable.c.partition,
+    mysql_length={"asset_key": 64, "partition": 64},
+    unique=True,
+)
@@ -1,13 +1,18 @@
 import logging
+import threading
+import zlib
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import groupby
 from typing import (
     TYPE_CHECKING,
     Any,
     ContextManager,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -27,20 +32,36 @@
 import dagster._check as check
 import dagster._seven as seven
 from dagster._core.assets import AssetDetails
-from dagster._core.definitions.events import AssetKey, AssetMaterialization, Materialization
+from dagster._core.definitions.events import (
+    AssetKey,
+    AssetKeyPartitionKey,
+    AssetMaterialization,
+    Materialization,
+)
 from dagster._core.errors import (
     DagsterEventLogInvalidForRun,
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
 )
-from dagster._core.event_api import RunShardedEventsCursor
-from dagster._core.events import ASSET_EVENTS, MARKER_EVENTS, DagsterEventType
-from dagster._core.execution.stats import RunStepKeyStatsSnapshot, build_run_step_stats_from_events
-from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
+from dagster._core.event_api import EventLogRecordProjection, RunShardedEventsCursor
+from dagster._core.events import ASSET_EVENTS, MARKER_EVENTS, PIPELINE_EVENTS, DagsterEventType
+from dagster._core.execution.stats import (
+    RUN_STATS_EVENTS,
+    STEP_ORDER_EVENTS,
+    STEP_STATS_EVENTS,
+    RunStepKeyStatsSnapshot,
+    build_run_step_stats_from_data,
+    build_run_step_stats_from_events,
+    serialize_step_stats_data,
+    update_step_stats_data,
+)
+from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow, iter_table_row_chunks
 from dagster._serdes import (
+    SerdesFormat,
     deserialize_as,
     deserialize_json_to_dagster_namedtuple,
     serialize_dagster_namedtuple,
+    serialize_value,
 )
 from dagster._serdes.errors import DeserializationError
 from dagster._utils import (
@@ -52,22 +73,36 @@
 
 from ..pipeline_run import PipelineRunStatsSnapshot
 from .base import (
+    EVENT_RECORDS_BATCH_SIZE,
     AssetEntry,
     AssetRecord,
     EventLogConnection,
     EventLogCursor,
     EventLogEntry,
+    EventLogProjectionConnection,
     EventLogRecord,
     EventLogStorage,
     EventRecordsFilter,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    ASSET_PARTITION_LATEST_TABLE,
+    BATCHED_ASSET_DATA_MIGRATIONS,
+    BATCHED_EVENT_LOG_DATA_MIGRATIONS,
+    EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_TABLES,
+)
 from .schema import (
     AssetEventTagsTable,
     AssetKeyTable,
+    AssetPartitionLatestTable,
     DynamicPartitionsTable,
+    EventLogArchivesTable,
+    RunStatsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
+    StepStatsTable,
 )
 
 if TYPE_CHECKING:
@@ -75,6 +110,37 @@
 
 MIN_ASSET_ROWS = 25
 
+# Events that are never archived, since the run status, asset, and stats queries read them from the
+# event_logs table
+UNARCHIVED_EVENTS = PIPELINE_EVENTS | ASSET_EVENTS | RUN_STATS_EVENTS
+
+# Number of runs whose decompressed archived events are kept in memory, so that paging through the
+# events of an archived run does not decompress its archive for every page
+ARCHIVED_EVENT_ROWS_CACHE_SIZE = 16
+
+# Maximum number of partitions bound in a single query on the asset_partition_latest table
+ASSET_PARTITION_LATEST_BATCH_SIZE = 500
+
+# Maximum number of values bound in a single IN clause when checking imported rows for conflicts
+IMPORT_LOOKUP_BATCH_SIZE = 500
+
+# Number of imported asset events folded into the asset indexes at a time
+IMPORT_INDEX_REBUILD_BATCH_SIZE = 1000
+
+# Columns of the asset_keys table that are derived from the event log, and are rebuilt from the
+# imported events rather than copied, since they reference storage ids of the exporting instance
+DERIVED_ASSET_KEY_COLUMNS = {
+    "last_materialization",
+    "last_run_id",
+    "last_materialization_timestamp",
+    "cached_status_data",
+}
+
+# Number of attempts to make at updating the stats of a step before giving up, when other writers
+# are concurrently updating the same step. Giving up leaves the step stats stale rather than failing
+# the write of events that are already stored
+MAX_STEP_STATS_UPDATE_ATTEMPTS = 5
+
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
 # whole can be dropped.
@@ -88,6 +154,11 @@ class SqlEventLogStorage(EventLogStorage):
     sharding, while maintaining the ability to do cross-run queries
     """
 
+    _has_event_log_archives_table = False
+    _has_asset_partition_latest_table = False
+    _archived_event_rows_cache: Optional["_ArchivedEventRowsCache"] = None
+    _has_run_stats_schema = False
+
     @abstractmethod
     def run_connection(self, run_id: Optional[str]) -> ContextManager[Connection]:
         """Context manager yielding a connection to access the event logs for a specific run.
@@ -111,6 +182,12 @@ def upgrade(self) -> None:
     def has_table(self, table_name: str) -> bool:
         """This method checks if a table exists in the database."""
 
+    @property
+    def serdes_format(self) -> SerdesFormat:
+        """The format used to serialize events written to this storage."""
+        instance = self._instance
+        return instance.get_serdes_format("event_log_storage") if instance else SerdesFormat.JSON
+
     def prepare_insert_event(self, event):
         """Helper method for preparing the event log SQL insertion statement.  Abstracted away to
         have a single place for the logical table representation of the event, while having a way
@@ -118,6 +195,12 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._get_insert_event_values(event)
+        )
+
+    def _get_insert_event_values(self, event: EventLogEntry) -> Dict[str, Any]:
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -131,10 +214,9 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
-            event=serialize_dagster_namedtuple(event),
+            event=serialize_value(event, serdes_format=self.serdes_format),
             dagster_event_type=dagster_event_type,
             # Postgres requires a datetime that is in UTC but has no timezone info set
             # in order to be stored correctly
@@ -188,6 +270,8 @@ def store_asset_event(self, event: EventLogEntry, event_id: int):
             except db_exc.IntegrityError:
                 conn.execute(update_statement)
 
+        self._store_asset_partition_latest([(event, event_id)])
+
     def _get_asset_entry_values(
         self, event: EventLogEntry, event_id: int, has_asset_key_index_cols: bool
     ) -> Dict[str, Any]:
@@ -208,11 +292,12 @@ def _get_asset_entry_values(
         if dagster_event.is_step_materialization:
             entry_values.update(
                 {
-                    "last_materialization": serialize_dagster_namedtuple(
+                    "last_materialization": serialize_value(
                         EventLogRecord(
                             storage_id=event_id,
                             event_log_entry=event,
-                        )
+                        ),
+                        serdes_format=self.serdes_format,
                     ),
                     "last_run_id": event.run_id,
                 }
@@ -323,7 +408,23 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         check.int_param(event_id, "event_id")
 
-        if (
+        tag_rows = self._get_asset_event_tag_rows(event, event_id)
+        if not tag_rows:
+            return
+
+        if not self.has_table(AssetEventTagsTable.name):
+            # If tags table does not exist, silently exit. This is to support OSS
+            # users who have not yet run the migration to create the table.
+            # On read, we will throw an error if the table does not exist.
+            return
+
+        with self.index_connection() as conn:
+            conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
+    def _get_asset_event_tag_rows(
+        self, event: EventLogEntry, event_id: int
+    ) -> Sequence[Mapping[str, Any]]:
+        if not (
             event.dagster_event
             and event.dagster_event.asset_key
             and event.dagster_event.is_step_materialization
@@ -332,32 +433,111 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
             )
             and event.dagster_event.step_materialization_data.materialization.tags
         ):
-            if not self.has_table(AssetEventTagsTable.name):
-                # If tags table does not exist, silently exit. This is to support OSS
-                # users who have not yet run the migration to create the table.
-                # On read, we will throw an error if the table does not exist.
-                return
+            return []
+
+        check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
+        asset_key_str = event.dagster_event.asset_key.to_string()
+
+        tags = event.dagster_event.step_materialization_data.materialization.tags
+        return [
+            dict(
+                event_id=event_id,
+                asset_key=asset_key_str,
+                key=key,
+                value=value,
+                # Postgres requires a datetime that is in UTC but has no timezone info
+                # set in order to be stored correctly
+                event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+            )
+            for key, value in tags.items()
+        ]
+
+    def store_asset_events(self, asset_events: Sequence[Tuple[EventLogEntry, int]]) -> None:
+        """Batched equivalent of calling `store_asset_event` and `store_asset_event_tags` for each
+        (event, storage id) pair.
+
+        Asset index rows are upserted once per asset key, with the values of later events taking
+        precedence, and all asset event tags are written with a single insert.
+        """
+        if not asset_events:
+            return
+
+        for _event, event_id in asset_events:
+            if event_id is None:
+                raise DagsterInvariantViolationError(
+                    "Cannot store asset event tags for null event id."
+                )
 
-            check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
+        self._store_asset_entries(asset_events)
+        self._store_asset_partition_latest(asset_events)
+
+        tag_rows = [
+            tag_row
+            for event, event_id in asset_events
+            for tag_row in self._get_asset_event_tag_rows(event, event_id)
+        ]
+        if tag_rows and self.has_table(AssetEventTagsTable.name):
+            with self.index_connection() as conn:
+                conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
+    def _get_asset_entry_values_by_key(
+        self, asset_events: Sequence[Tuple[EventLogEntry, int]], has_asset_key_index_cols: bool
+    ) -> Mapping[str, Dict[str, Any]]:
+        # Applying the asset entry updates for a key in event order is equivalent to merging them
+        # into a single update, since each update only sets the columns relevant to its event type.
+        values_by_key: Dict[str, Dict[str, Any]] = OrderedDict()
+        for event, event_id in asset_events:
+            if not (event.dagster_event and event.dagster_event.asset_key):
+                continue
             asset_key_str = event.dagster_event.asset_key.to_string()
+            values_by_key.setdefault(asset_key_str, {}).update(
+                self._get_asset_entry_values(event, event_id, has_asset_key_index_cols)
+            )
+        return values_by_key
+
+    def _store_asset_entries(self, asset_events: Sequence[Tuple[EventLogEntry, int]]) -> None:
+        values_by_key = self._get_asset_entry_values_by_key(
+            asset_events, self.has_asset_key_index_cols()
+        )
+        if not values_by_key:
+            return
 
-            tags = event.dagster_event.step_materialization_data.materialization.tags
+        try:
             with self.index_connection() as conn:
-                conn.execute(
-                    AssetEventTagsTable.insert(),
-                    [
-                        dict(
-                            event_id=event_id,
-                            asset_key=asset_key_str,
-                            key=key,
-                            value=value,
-                            # Postgres requires a datetime that is in UTC but has no timezone info
-                            # set in order to be stored correctly
-                            event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+                with conn.begin():
+                    existing_keys = {
+                        row[0]
+                        for row in conn.execute(
+                            db.select([AssetKeyTable.c.asset_key]).where(
+                                AssetKeyTable.c.asset_key.in_(list(values_by_key.keys()))
+                            )
+                        ).fetchall()
+                    }
+                    insert_rows = [
+                        dict(asset_key=asset_key, **values)
+                        for asset_key, values in values_by_key.items()
+                        if asset_key not in existing_keys
+                    ]
+                    for rows in _group_rows_by_columns(insert_rows):
+                        conn.execute(AssetKeyTable.insert(), rows)
+
+                    update_rows = [
+                        dict(_asset_key=asset_key, **values)
+                        for asset_key, values in values_by_key.items()
+                        if asset_key in existing_keys and values
+                    ]
+                    for rows in _group_rows_by_columns(update_rows):
+                        conn.execute(
+                            AssetKeyTable.update().where(
+                                AssetKeyTable.c.asset_key == db.bindparam("_asset_key")
+                            ),
+                            rows,
                         )
-                        for key, value in tags.items()
-                    ],
-                )
+        except db_exc.IntegrityError:
+            # another writer inserted one of the asset keys concurrently, fall back to storing the
+            # asset entries one at a time
+            for event, event_id in asset_events:
+                self.store_asset_event(event, event_id)
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a pipeline run.
@@ -371,10 +551,14 @@ def store_event(self, event: EventLogEntry) -> None:
 
         event_id = None
 
+        should_update_run_stats = self.should_update_run_stats()
         with self.run_connection(run_id) as conn:
             result = conn.execute(insert_event_statement)
             event_id = result.inserted_primary_key[0]
 
+            if should_update_run_stats:
+                self._update_stats_for_events(conn, [(event, event_id)])
+
         if (
             event.is_dagster_event
             and event.dagster_event_type in ASSET_EVENTS
@@ -389,13 +573,233 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events, preserving their order.
+
+        Consecutive events for the same run are written in a single transaction, followed by one
+        batched write of the asset index rows and asset event tags for the whole batch.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        should_update_run_stats = self.should_update_run_stats()
+        asset_events: List[Tuple[EventLogEntry, int]] = []
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events)
+            with self.run_connection(run_id) as conn:
+                with conn.begin():
+                    stored_events = self._insert_events(
+                        conn, run_events, fetch_step_order_ids=should_update_run_stats
+                    )
+
+                if should_update_run_stats:
+                    self._update_stats_for_events(conn, stored_events)
+
+            asset_events.extend(
+                (event, cast(int, event_id))
+                for event, event_id in stored_events
+                if _is_asset_index_event(event)
+            )
+
+        self.store_asset_events(asset_events)
+
+    def _insert_events(
+        self, conn: Connection, events: Sequence[EventLogEntry], fetch_step_order_ids: bool = False
+    ) -> Sequence[Tuple[EventLogEntry, Optional[int]]]:
+        """Insert events into the event log table, returning each event with its storage id.
+
+        Storage ids are only fetched for asset events, which need them to write the asset index,
+        and, if `fetch_step_order_ids` is set, for the step events that order the step stats. Runs
+        of other events are inserted with a single executemany, preserving their order.
+        """
+        stored_events: List[Tuple[EventLogEntry, Optional[int]]] = []
+        pending: List[EventLogEntry] = []
+
+        def _flush_pending():
+            if pending:
+                conn.execute(
+                    SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                    [self._get_insert_event_values(event) for event in pending],
+                )
+                stored_events.extend((event, None) for event in pending)
+                pending.clear()
+
+        for event in events:
+            if _is_asset_index_event(event) or (
+                fetch_step_order_ids and _is_step_order_event(event)
+            ):
+                _flush_pending()
+                result = conn.execute(self.prepare_insert_event(event))
+                stored_events.append((event, result.inserted_primary_key[0]))
+            else:
+                pending.append(event)
+
+        _flush_pending()
+        return stored_events
+
+    def has_run_stats_tables(self) -> bool:
+        """Whether the run_stats and step_stats tables have been built, in which case they are used
+        to serve run and step stats.
+        """
+        return self.has_secondary_index(RUN_STATS_TABLES)
+
+    def should_update_run_stats(self) -> bool:
+        """Whether stored events are folded into the run_stats and step_stats tables. The tables
+        are kept up to date from when they are created rather than from when they are built, so
+        that the events stored while the migration that builds them is running are not missing
+        from the runs it has already built.
+        """
+        # the tables are never dropped once created, so only a positive check is cached
+        if not self._has_run_stats_schema:
+            self._has_run_stats_schema = self.has_table(RunStatsTable.name) and self.has_table(
+                StepStatsTable.name
+            )
+        return self._has_run_stats_schema
+
+    def _update_stats_for_events(
+        self, conn: Connection, stored_events: Sequence[Tuple[EventLogEntry, Optional[int]]]
+    ) -> None:
+        """Fold a batch of stored events into the run_stats and step_stats tables.
+
+        Each event comes with its storage id, which is required for the step events that order the
+        step stats. Each statement commits on its own, so that concurrent writers for the same run
+        can resolve conflicting inserts by retrying. Marker events without a marker are skipped,
+        since they do not change the stats of their step.
+        """
+        stats_events = [
+            (event, storage_id)
+            for event, storage_id in stored_events
+            if event.is_dagster_event and event.run_id is not None
+        ]
+
+        run_stats_events: Dict[Tuple[str, str], List[EventLogEntry]] = defaultdict(list)
+        step_stats_events: Dict[
+            Tuple[str, str], List[Tuple[EventLogEntry, Optional[int]]]
+        ] = defaultdict(list)
+        for event, storage_id in stats_events:
+            event_type = event.get_dagster_event().event_type
+            if event_type in RUN_STATS_EVENTS:
+                run_stats_events[(event.run_id, event_type.value)].append(event)
+            if (
+                event_type in STEP_STATS_EVENTS
+                and event.step_key
+                and not _is_marker_event_without_marker(event)
+            ):
+                step_stats_events[(event.run_id, event.step_key)].append((event, storage_id))
+
+        for (run_id, event_type_value), type_events in run_stats_events.items():
+            self._update_run_stats(conn, run_id, event_type_value, type_events)
+
+        for (run_id, step_key), step_events in step_stats_events.items():
+            self._update_step_stats(conn, run_id, step_key, step_events)
+
+    def _update_run_stats(
+        self,
+        conn: Connection,
+        run_id: str,
+        event_type_value: str,
+        events: Sequence[EventLogEntry],
+    ) -> None:
+        last_event_timestamp = datetime.utcfromtimestamp(max(event.timestamp for event in events))
+        update_statement = (
+            RunStatsTable.update()  # pylint: disable=no-value-for-parameter
+            .where(RunStatsTable.c.run_id == run_id)
+            .where(RunStatsTable.c.dagster_event_type == event_type_value)
+            .values(
+                event_count=RunStatsTable.c.event_count + len(events),
+                last_event_timestamp=db.case(
+                    [
+                        (
+                            RunStatsTable.c.last_event_timestamp < last_event_timestamp,
+                            last_event_timestamp,
+                        )
+                    ],
+                    else_=RunStatsTable.c.last_event_timestamp,
+                ),
+            )
+        )
+
+        if conn.execute(update_statement).rowcount:
+            return
+
+        try:
+            conn.execute(
+                RunStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    run_id=run_id,
+                    dagster_event_type=event_type_value,
+                    event_count=len(events),
+                    last_event_timestamp=last_event_timestamp,
+                )
+            )
+        except db_exc.IntegrityError:
+            # another writer inserted the row concurrently
+            conn.execute(update_statement)
+
+    def _update_step_stats(
+        self,
+        conn: Connection,
+        run_id: str,
+        step_key: str,
+        stored_events: Sequence[Tuple[EventLogEntry, Optional[int]]],
+    ) -> None:
+        # optimistic concurrency: the row is only updated if it has not changed since it was read
+        for _ in range(MAX_STEP_STATS_UPDATE_ATTEMPTS):
+            row = conn.execute(
+                db.select([StepStatsTable.c.stats_data])
+                .where(StepStatsTable.c.run_id == run_id)
+                .where(StepStatsTable.c.step_key == step_key)
+            ).fetchone()
+
+            step_stats_data = seven.json.loads(row[0]) if row else None
+            for event, storage_id in stored_events:
+                step_stats_data = update_step_stats_data(
+                    step_stats_data, event, sort_key=storage_id
+                )
+            stats_data = serialize_step_stats_data(cast(Dict[str, Any], step_stats_data))
+
+            if row is None:
+                try:
+                    conn.execute(
+                        StepStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                            run_id=run_id,
+                            step_key=step_key,
+                            stats_data=stats_data,
+                        )
+                    )
+                    return
+                except db_exc.IntegrityError:
+                    continue
+
+            result = conn.execute(
+                StepStatsTable.update()  # pylint: disable=no-value-for-parameter
+                .where(StepStatsTable.c.run_id == run_id)
+                .where(StepStatsTable.c.step_key == step_key)
+                .where(StepStatsTable.c.stats_data == row[0])
+                .values(stats_data=stats_data, update_timestamp=pendulum.now("UTC"))
+            )
+            if result.rowcount:
+                return
+
+        logging.warning(
+            (
+                "Could not update the stats for step %s of run %s after %s attempts, the stats for"
+                " the step may be stale."
+            ),
+            step_key,
+            run_id,
+            MAX_STEP_STATS_UPDATE_ATTEMPTS,
+        )
+
     def get_records_for_run(
         self,
         run_id,
         cursor: Optional[str] = None,
         of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
         limit: Optional[int] = None,
-    ) -> EventLogConnection:
+        include_event: bool = True,
+    ) -> Union[EventLogConnection, EventLogProjectionConnection]:
         """Get all of the logs corresponding to a run.
 
         Args:
@@ -404,9 +808,12 @@ def get_records_for_run(
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
             of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
             limit (Optional[int]): the maximum number of events to fetch
+            include_event (bool): Whether to fetch the event of each record. If False, the
+                records are returned as EventLogRecordProjections of their indexed fields.
         """
         check.str_param(run_id, "run_id")
         check.opt_str_param(cursor, "cursor")
+        check.bool_param(include_event, "include_event")
 
         check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
 
@@ -417,7 +824,7 @@ def get_records_for_run(
         )
 
         query = (
-            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            db.select(_event_record_columns(include_event))
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
@@ -428,36 +835,47 @@ def get_records_for_run(
                 )
             )
 
-        # adjust 0 based index cursor to SQL offset
-        if cursor is not None:
-            cursor_obj = EventLogCursor.parse(cursor)
-            if cursor_obj.is_offset_cursor():
-                query = query.offset(cursor_obj.offset())
-            elif cursor_obj.is_id_cursor():
-                query = query.where(SqlEventLogStorageTable.c.id > cursor_obj.storage_id())
-
-        if limit:
-            query = query.limit(limit)
+        cursor_obj = EventLogCursor.parse(cursor) if cursor is not None else None
 
         with self.run_connection(run_id) as conn:
+            archived_rows = (
+                self._get_archived_event_rows(conn, run_id)
+                if self.has_event_log_archives_table()
+                else None
+            )
+            if archived_rows is None:
+                # adjust 0 based index cursor to SQL offset
+                if cursor_obj and cursor_obj.is_offset_cursor():
+                    query = query.offset(cursor_obj.offset())
+                elif cursor_obj and cursor_obj.is_id_cursor():
+                    query = query.where(SqlEventLogStorageTable.c.id > cursor_obj.storage_id())
+
+                if limit:
+                    query = query.limit(limit)
+
             results = conn.execute(query).fetchall()
 
-        last_record_id = None
-        try:
-            records = []
-            for (
-                record_id,
-                json_str,
-            ) in results:
-                records.append(
-                    EventLogRecord(
-                        storage_id=record_id,
-                        event_log_entry=deserialize_as(json_str, EventLogEntry),
-                    )
-                )
-                last_record_id = record_id
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+        if archived_rows is not None:
+            # the run has archived events, which are merged with the events remaining in the
+            # event_logs table before applying the cursor and limit
+            event_type_values = {event_type.value for event_type in dagster_event_types}
+            results = sorted(
+                [
+                    _event_record_row_from_archived_row(row, run_id, include_event)
+                    for row in archived_rows
+                    if not event_type_values or row[2] in event_type_values
+                ]
+                + list(results),
+                key=lambda row: row[0],
+            )
+            if cursor_obj and cursor_obj.is_offset_cursor():
+                results = results[cursor_obj.offset() :]
+            elif cursor_obj and cursor_obj.is_id_cursor():
+                results = [row for row in results if row[0] > cursor_obj.storage_id()]
+            if limit:
+                results = results[:limit]
+
+        last_record_id = results[-1][0] if results else None
 
         if last_record_id is not None:
             next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
@@ -468,35 +886,108 @@ def get_records_for_run(
             # rely on the fact that all storage ids will be positive integers
             next_cursor = EventLogCursor.from_storage_id(-1).to_string()
 
+        has_more = bool(limit and len(results) == limit)
+        if not include_event:
+            return EventLogProjectionConnection(
+                records=[_event_record_projection_from_row(row) for row in results],
+                cursor=next_cursor,
+                has_more=has_more,
+            )
         return EventLogConnection(
-            records=records,
+            records=[_event_record_from_row(row) for row in results],
             cursor=next_cursor,
-            has_more=bool(limit and len(results) == limit),
+            has_more=has_more,
         )
 
-    def get_stats_for_run(self, run_id: str) -> PipelineRunStatsSnapshot:
-        check.str_param(run_id, "run_id")
+    def get_records_for_runs(
+        self,
+        after_storage_ids: Mapping[str, int],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the event records of a set of runs with a single query, in storage id order.
+
+        Only supported by storages that are not run-sharded, since storage ids are not comparable
+        across shards. Events of archived runs are not included.
+
+        Args:
+            after_storage_ids (Mapping[str, int]): The ids of the runs for which to fetch records,
+                each mapped to the storage id after which to fetch the records of the run.
+            limit (Optional[int]): The maximum number of records to fetch.
+        """
+        check.mapping_param(after_storage_ids, "after_storage_ids", key_type=str, value_type=int)
+        check.opt_int_param(limit, "limit")
+        check.invariant(
+            not self.is_run_sharded,
+            "Cannot fetch the records of multiple runs from a run-sharded event log storage.",
+        )
+
+        if not after_storage_ids:
+            return []
 
         query = (
-            db.select(
-                [
-                    SqlEventLogStorageTable.c.dagster_event_type,
-                    db.func.count().label("n_events_of_type"),
-                    db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
-                ]
-            )
+            db.select(_event_record_columns(include_event=True))
             .where(
-                db.and_(
-                    SqlEventLogStorageTable.c.run_id == run_id,
-                    SqlEventLogStorageTable.c.dagster_event_type != None,  # noqa: E711
+                db.or_(
+                    *[
+                        db.and_(
+                            SqlEventLogStorageTable.c.run_id == run_id,
+                            SqlEventLogStorageTable.c.id > after_storage_id,
+                        )
+                        for run_id, after_storage_id in after_storage_ids.items()
+                    ]
                 )
             )
-            .group_by("dagster_event_type")
+            .order_by(SqlEventLogStorageTable.c.id.asc())
         )
+        if limit:
+            query = query.limit(limit)
 
-        with self.run_connection(run_id) as conn:
+        with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
 
+        return list(_event_records_from_rows(results))
+
+    def get_stats_for_run(self, run_id: str) -> PipelineRunStatsSnapshot:
+        check.str_param(run_id, "run_id")
+
+        results = None
+        if self.has_run_stats_tables():
+            with self.run_connection(run_id) as conn:
+                results = conn.execute(
+                    db.select(
+                        [
+                            RunStatsTable.c.dagster_event_type,
+                            RunStatsTable.c.event_count,
+                            RunStatsTable.c.last_event_timestamp,
+                        ]
+                    ).where(RunStatsTable.c.run_id == run_id)
+                ).fetchall()
+
+        # runs without stats rows (e.g. runs whose stats could not be built) are summarized from
+        # the event log
+        if not results:
+            query = (
+                db.select(
+                    [
+                        SqlEventLogStorageTable.c.dagster_event_type,
+                        db.func.count().label("n_events_of_type"),
+                        db.func.max(SqlEventLogStorageTable.c.timestamp).label(
+                            "last_event_timestamp"
+                        ),
+                    ]
+                )
+                .where(
+                    db.and_(
+                        SqlEventLogStorageTable.c.run_id == run_id,
+                        SqlEventLogStorageTable.c.dagster_event_type != None,  # noqa: E711
+                    )
+                )
+                .group_by("dagster_event_type")
+            )
+
+            with self.run_connection(run_id) as conn:
+                results = conn.execute(query).fetchall()
+
         try:
             counts = {}
             times = {}
@@ -537,6 +1028,11 @@ def get_step_stats_for_run(
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self.has_run_stats_tables():
+            step_stats = self._get_step_stats_from_stats_table(run_id, step_keys)
+            if step_stats is not None:
+                return step_stats
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -550,7 +1046,7 @@ def get_step_stats_for_run(
         # choose to revisit this in the future, especially if we are able to do JSON-column queries
         # in SQL as a way of bypassing the serdes layer in all cases.
         raw_event_query = (
-            db.select([SqlEventLogStorageTable.c.event])
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
             .where(
@@ -584,9 +1080,72 @@ def get_step_stats_for_run(
                 check.inst_param(
                     deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
                 )
-                for (json_str,) in results
+                for (_, json_str) in results
             ]
-            return build_run_step_stats_from_events(run_id, records)  # type: ignore
+            return build_run_step_stats_from_events(
+                run_id, records, storage_ids=[storage_id for (storage_id, _) in results]
+            )
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def _get_step_stats_from_stats_table(
+        self, run_id: str, step_keys: Optional[Sequence[str]] = None
+    ) -> Optional[Sequence[RunStepKeyStatsSnapshot]]:
+        """Returns None if there are no step stats rows for the run, in which case the step stats
+        are built from the event log.
+        """
+        # the step stats are read from the step_stats table, only the materialization and
+        # expectation result events are read from the event log
+        step_stats_query = (
+            db.select([StepStatsTable.c.step_key, StepStatsTable.c.stats_data])
+            .where(StepStatsTable.c.run_id == run_id)
+            .order_by(StepStatsTable.c.id.asc())
+        )
+        raw_event_query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [
+                        DagsterEventType.ASSET_MATERIALIZATION.value,
+                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if step_keys:
+            step_stats_query = step_stats_query.where(StepStatsTable.c.step_key.in_(step_keys))
+            raw_event_query = raw_event_query.where(
+                SqlEventLogStorageTable.c.step_key.in_(step_keys)
+            )
+
+        with self.run_connection(run_id) as conn:
+            step_stats_rows = conn.execute(step_stats_query).fetchall()
+            if not step_stats_rows:
+                return None
+            event_rows = conn.execute(raw_event_query).fetchall()
+
+        try:
+            step_stats_data = {
+                step_key: seven.json.loads(stats_data) for step_key, stats_data in step_stats_rows
+            }
+            for (json_str,) in event_rows:
+                event = check.inst_param(
+                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                )
+                step_key = cast(str, event.step_key)
+                if step_key not in step_stats_data:
+                    continue
+                data = step_stats_data[step_key]
+                if event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                    data.setdefault("materialization_events", []).append(event)
+                else:
+                    data.setdefault("expectation_results", []).append(
+                        event.get_dagster_event().event_specific_data.expectation_result  # type: ignore
+                    )
+            return build_run_step_stats_from_data(run_id, step_stats_data)
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
@@ -613,6 +1172,154 @@ def reindex_assets(self, print_fn: Optional[PrintFn] = None, force: bool = False
         for migration_name, migration_fn in ASSET_DATA_MIGRATIONS.items():
             self._apply_migration(migration_name, migration_fn, print_fn, force)
 
+    def get_pending_batched_data_migrations(self) -> Sequence[str]:
+        """Returns the names of the data migrations that can be run a batch at a time with
+        `run_batched_data_migration`, and whose secondary indexes have not been built yet.
+        Migrations that build tables missing from the schema are left out until
+        `dagster instance migrate` creates them.
+        """
+        pending = []
+        for migration_name in {
+            **BATCHED_EVENT_LOG_DATA_MIGRATIONS,
+            **BATCHED_ASSET_DATA_MIGRATIONS,
+        }:
+            if self.has_secondary_index(migration_name):
+                continue
+            if migration_name == RUN_STATS_TABLES and not (
+                self.has_table(RunStatsTable.name) and self.has_table(StepStatsTable.name)
+            ):
+                continue
+            if (
+                migration_name == ASSET_PARTITION_LATEST_TABLE
+                and not self.has_asset_partition_latest_table()
+            ):
+                continue
+            pending.append(migration_name)
+        return pending
+
+    def run_batched_data_migration(
+        self, migration_name: str, cursor: Optional[str], batch_size: int
+    ) -> Optional[str]:
+        """Runs a single batch of a data migration, resuming from the cursor returned by the
+        previous batch. Returns the cursor to resume from, or None once the migration is complete,
+        at which point its secondary index is enabled and reads switch over to it.
+        """
+        migrations = {**BATCHED_EVENT_LOG_DATA_MIGRATIONS, **BATCHED_ASSET_DATA_MIGRATIONS}
+        check.invariant(
+            migration_name in migrations, f"Unknown batched data migration {migration_name}"
+        )
+        check.opt_str_param(cursor, "cursor")
+        check.int_param(batch_size, "batch_size")
+        next_cursor = migrations[migration_name]()(self, cursor, batch_size)
+        if next_cursor is None:
+            self.enable_secondary_index(migration_name)
+        return next_cursor
+
+    def iter_export_rows(
+        self, table: db.Table, chunk_size: int
+    ) -> Iterator[Sequence[Mapping[str, Any]]]:
+        """Yields the rows of the event_logs or asset_keys table in chunks, for bulk transfer to
+        another instance.
+        """
+        check.invariant(
+            table in (SqlEventLogStorageTable, AssetKeyTable),
+            f"Cannot export rows of table {table.name} from event log storage.",
+        )
+        check.int_param(chunk_size, "chunk_size")
+        with self.index_connection() as conn:
+            yield from iter_table_row_chunks(conn, table, chunk_size)
+
+    def _bulk_insert_rows(
+        self, conn: Connection, table: db.Table, rows: Sequence[Mapping[str, Any]]
+    ) -> None:
+        """Insert a chunk of exported rows into a table. Uses a single executemany, which drivers
+        that support it (e.g. mysql) send as multi-row inserts. Overridden by storages that have a
+        faster bulk loading path, like ``COPY`` on Postgres.
+        """
+        conn.execute(table.insert(), rows)  # pylint: disable=no-value-for-parameter
+
+    def import_asset_key_rows(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        """Insert a chunk of exported asset key rows, skipping assets that already exist. The
+        columns derived from the event log are left empty, to be filled in by
+        `rebuild_indexes_after_import`. Returns the number of rows inserted.
+        """
+        check.sequence_param(rows, "rows", of_type=dict)
+        asset_keys = [row["asset_key"] for row in rows]
+        existing: Set[str] = set()
+        with self.index_connection() as conn:
+            for i in range(0, len(asset_keys), IMPORT_LOOKUP_BATCH_SIZE):
+                existing.update(
+                    row[0]
+                    for row in conn.execute(
+                        db.select([AssetKeyTable.c.asset_key]).where(
+                            AssetKeyTable.c.asset_key.in_(
+                                asset_keys[i : i + IMPORT_LOOKUP_BATCH_SIZE]
+                            )
+                        )
+                    )
+                )
+
+            to_insert = [
+                {key: value for key, value in row.items() if key not in DERIVED_ASSET_KEY_COLUMNS}
+                for row in rows
+                if row["asset_key"] not in existing
+            ]
+            if to_insert:
+                with conn.begin():
+                    self._bulk_insert_rows(conn, AssetKeyTable, to_insert)
+        return len(to_insert)
+
+    def import_event_log_rows(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        """Insert a chunk of exported event log rows. The asset and stats indexes are not updated
+        per row; call `rebuild_indexes_after_import` once all rows have been imported. Returns the
+        number of rows inserted.
+        """
+        check.sequence_param(rows, "rows", of_type=dict)
+        if rows:
+            with self.index_connection() as conn:
+                with conn.begin():
+                    self._bulk_insert_rows(conn, SqlEventLogStorageTable, rows)
+        return len(rows)
+
+    def rebuild_indexes_after_import(
+        self, after_storage_id: Optional[int], print_fn: Optional[PrintFn] = None
+    ) -> None:
+        """Fold the event log rows imported after the given storage id into the asset indexes
+        (asset_keys, asset_event_tags, asset_partition_latest), and rebuild the run stats tables
+        if they are in use.
+        """
+        check.opt_int_param(after_storage_id, "after_storage_id")
+        last_id = after_storage_id or 0
+        event_count = 0
+        while True:
+            with self.index_connection() as conn:
+                rows = conn.execute(
+                    db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+                    .where(SqlEventLogStorageTable.c.id > last_id)
+                    .where(SqlEventLogStorageTable.c.asset_key != None)  # noqa: E711
+                    .order_by(SqlEventLogStorageTable.c.id.asc())
+                    .limit(IMPORT_INDEX_REBUILD_BATCH_SIZE)
+                ).fetchall()
+            if not rows:
+                break
+
+            last_id = rows[-1][0]
+            asset_events = []
+            for storage_id, event_json in rows:
+                event = deserialize_json_to_dagster_namedtuple(event_json)
+                if isinstance(event, EventLogEntry) and _is_asset_index_event(event):
+                    asset_events.append((event, storage_id))
+            self.store_asset_events(asset_events)
+            event_count += len(asset_events)
+
+        if print_fn:
+            print_fn(f"Indexed {event_count} imported asset events.")
+
+        if self.has_run_stats_tables():
+            self._apply_migration(
+                RUN_STATS_TABLES, EVENT_LOG_DATA_MIGRATIONS[RUN_STATS_TABLES], print_fn, force=True
+            )
+
     def wipe(self) -> None:
         """Clears the event log storage."""
         # Should be overridden by SqliteEventLogStorage and other storages that shard based on
@@ -631,6 +1338,22 @@ def wipe(self) -> None:
                     DynamicPartitionsTable.delete()
                 )  # pylint: disable=no-value-for-parameter
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())  # pylint: disable=no-value-for-parameter
+
+            if self.has_table("step_stats"):
+                conn.execute(StepStatsTable.delete())  # pylint: disable=no-value-for-parameter
+
+            if self.has_table("event_log_archives"):
+                conn.execute(
+                    EventLogArchivesTable.delete()
+                )  # pylint: disable=no-value-for-parameter
+
+            if self.has_table("asset_partition_latest"):
+                conn.execute(
+                    AssetPartitionLatestTable.delete()
+                )  # pylint: disable=no-value-for-parameter
+
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
@@ -643,12 +1366,337 @@ def wipe(self) -> None:
                     DynamicPartitionsTable.delete()
                 )  # pylint: disable=no-value-for-parameter
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())  # pylint: disable=no-value-for-parameter
+
+            if self.has_table("step_stats"):
+                conn.execute(StepStatsTable.delete())  # pylint: disable=no-value-for-parameter
+
+            if self.has_table("event_log_archives"):
+                conn.execute(
+                    EventLogArchivesTable.delete()
+                )  # pylint: disable=no-value-for-parameter
+
+            if self.has_table("asset_partition_latest"):
+                conn.execute(
+                    AssetPartitionLatestTable.delete()
+                )  # pylint: disable=no-value-for-parameter
+
     def delete_events(self, run_id: str) -> None:
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
 
+    def has_event_log_archives_table(self) -> bool:
+        # the table is never dropped once created, so only a positive check is cached
+        if not self._has_event_log_archives_table:
+            self._has_event_log_archives_table = self.has_table(EventLogArchivesTable.name)
+        return self._has_event_log_archives_table
+
+    def has_asset_partition_latest_table(self) -> bool:
+        # the table is never dropped once created, so only a positive check is cached
+        if not self._has_asset_partition_latest_table:
+            self._has_asset_partition_latest_table = self.has_table(AssetPartitionLatestTable.name)
+        return self._has_asset_partition_latest_table
+
+    def _store_asset_partition_latest(
+        self, asset_events: Sequence[Tuple[EventLogEntry, int]]
+    ) -> None:
+        """Record the partitioned materializations of a batch of asset events in the
+        asset_partition_latest table, keeping the row of each asset partition pointing at its
+        materialization with the largest storage id.
+        """
+        latest: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        for event, event_id in asset_events:
+            dagster_event = event.dagster_event
+            if not (
+                dagster_event
+                and dagster_event.is_step_materialization
+                and dagster_event.asset_key
+                and dagster_event.partition
+            ):
+                continue
+            key = (dagster_event.asset_key.to_string(), dagster_event.partition)
+            if key not in latest or latest[key][0] < event_id:
+                latest[key] = (event_id, event.timestamp)
+
+        if not latest or not self.has_asset_partition_latest_table():
+            return
+
+        try:
+            with self.index_connection() as conn:
+                with conn.begin():
+                    _upsert_asset_partition_latest_rows(conn, latest)
+        except db_exc.IntegrityError:
+            # another writer inserted one of the asset partitions concurrently, after which the
+            # rows are updated in place
+            with self.index_connection() as conn:
+                with conn.begin():
+                    _upsert_asset_partition_latest_rows(conn, latest)
+
+    def _rebuild_asset_partition_latest(
+        self, conn: Connection, asset_key: AssetKey, partitions: Optional[Sequence[str]] = None
+    ) -> None:
+        """Replace the asset_partition_latest rows of an asset (or of some of its partitions) with
+        the latest materializations in the event log that happened after the asset was last wiped.
+        """
+        asset_details_row = conn.execute(
+            db.select([AssetKeyTable.c.asset_details]).where(
+                AssetKeyTable.c.asset_key == asset_key.to_string()
+            )
+        ).fetchone()
+        asset_details = (
+            deserialize_as(asset_details_row[0], AssetDetails)
+            if asset_details_row and asset_details_row[0]
+            else None
+        )
+
+        partition_chunks = (
+            [None]
+            if partitions is None
+            else [
+                partitions[i : i + ASSET_PARTITION_LATEST_BATCH_SIZE]
+                for i in range(0, len(partitions), ASSET_PARTITION_LATEST_BATCH_SIZE)
+            ]
+        )
+        for partition_chunk in partition_chunks:
+            latest_ids_query = (
+                db.select([db.func.max(SqlEventLogStorageTable.c.id)])
+                .where(
+                    db.and_(
+                        db.or_(
+                            SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                            SqlEventLogStorageTable.c.asset_key == asset_key.to_string(legacy=True),
+                        ),
+                        SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                        SqlEventLogStorageTable.c.dagster_event_type
+                        == DagsterEventType.ASSET_MATERIALIZATION.value,
+                    )
+                )
+                .group_by(SqlEventLogStorageTable.c.partition)
+            )
+            delete_statement = (
+                AssetPartitionLatestTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    AssetPartitionLatestTable.c.asset_key == asset_key.to_string()
+                )
+            )
+            if partition_chunk is not None:
+                latest_ids_query = latest_ids_query.where(
+                    SqlEventLogStorageTable.c.partition.in_(partition_chunk)
+                )
+                delete_statement = delete_statement.where(
+                    AssetPartitionLatestTable.c.partition.in_(partition_chunk)
+                )
+            if asset_details and asset_details.last_wipe_timestamp:
+                latest_ids_query = latest_ids_query.where(
+                    SqlEventLogStorageTable.c.timestamp
+                    > datetime.utcfromtimestamp(asset_details.last_wipe_timestamp)
+                )
+
+            rows = conn.execute(
+                db.select(
+                    [
+                        SqlEventLogStorageTable.c.partition,
+                        SqlEventLogStorageTable.c.id,
+                        SqlEventLogStorageTable.c.timestamp,
+                    ]
+                ).where(SqlEventLogStorageTable.c.id.in_(latest_ids_query))
+            ).fetchall()
+
+            with conn.begin():
+                conn.execute(delete_statement)
+                if rows:
+                    conn.execute(
+                        AssetPartitionLatestTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [
+                            dict(
+                                asset_key=asset_key.to_string(),
+                                partition=partition,
+                                last_materialization_storage_id=storage_id,
+                                last_materialization_timestamp=timestamp,
+                            )
+                            for partition, storage_id, timestamp in rows
+                        ],
+                    )
+
+    def get_latest_asset_partition_materialization_records(
+        self, asset_partitions: Sequence[AssetKeyPartitionKey]
+    ) -> Mapping[AssetKeyPartitionKey, EventLogRecord]:
+        check.sequence_param(asset_partitions, "asset_partitions", of_type=AssetKeyPartitionKey)
+
+        if not self.has_secondary_index(ASSET_PARTITION_LATEST_TABLE):
+            return super().get_latest_asset_partition_materialization_records(asset_partitions)
+
+        partitions_by_asset_key: Dict[AssetKey, Set[str]] = defaultdict(set)
+        for asset_partition in asset_partitions:
+            check.invariant(
+                asset_partition.partition_key is not None,
+                "Can only fetch the latest materializations of partitioned asset partitions",
+            )
+            partitions_by_asset_key[asset_partition.asset_key].add(
+                cast(str, asset_partition.partition_key)
+            )
+
+        records: Dict[AssetKeyPartitionKey, EventLogRecord] = {}
+        with self.index_connection() as conn:
+            for asset_key, partition_set in partitions_by_asset_key.items():
+                partitions = sorted(partition_set)
+                for i in range(0, len(partitions), ASSET_PARTITION_LATEST_BATCH_SIZE):
+                    query = (
+                        db.select(
+                            [
+                                AssetPartitionLatestTable.c.partition,
+                                *_event_record_columns(include_event=True),
+                            ]
+                        )
+                        .select_from(
+                            AssetPartitionLatestTable.join(
+                                SqlEventLogStorageTable,
+                                AssetPartitionLatestTable.c.last_materialization_storage_id
+                                == SqlEventLogStorageTable.c.id,
+                            )
+                        )
+                        .where(
+                            db.and_(
+                                AssetPartitionLatestTable.c.asset_key == asset_key.to_string(),
+                                AssetPartitionLatestTable.c.partition.in_(
+                                    partitions[i : i + ASSET_PARTITION_LATEST_BATCH_SIZE]
+                                ),
+                            )
+                        )
+                    )
+                    for row in conn.execute(query).fetchall():
+                        partition = row[0]
+                        for event_record in _event_records_from_rows([row[1:]]):
+                            records[AssetKeyPartitionKey(asset_key, partition)] = event_record
+
+        return records
+
+    def archive_events(self, run_id: str) -> int:
+        """Moves the events of a run out of the event_logs table into a compressed archive of the
+        run's events, from which they continue to be read by `get_records_for_run`. The events
+        that back the run status, asset, and stats queries are kept in the event_logs table.
+
+        Returns the number of events archived. Runs without run stats rows are not archived, since
+        their stats are built from their events.
+        """
+        check.str_param(run_id, "run_id")
+
+        if not self.has_event_log_archives_table():
+            raise DagsterInvariantViolationError(
+                "The event_log_archives table does not exist. Run `dagster instance migrate` to "
+                "create it before archiving events."
+            )
+        if not self.has_run_stats_tables():
+            raise DagsterInvariantViolationError(
+                "Run stats have not been built. Run `dagster instance reindex` to build them "
+                "before archiving events."
+            )
+
+        archived_event_type_filter = db.or_(
+            SqlEventLogStorageTable.c.dagster_event_type == None,  # noqa: E711
+            SqlEventLogStorageTable.c.dagster_event_type.notin_(
+                [event_type.value for event_type in UNARCHIVED_EVENTS]
+            ),
+        )
+
+        with self.run_connection(run_id) as conn:
+            has_run_stats = conn.execute(
+                db.select([RunStatsTable.c.id]).where(RunStatsTable.c.run_id == run_id).limit(1)
+            ).fetchone()
+            if not has_run_stats:
+                return 0
+
+            rows = conn.execute(
+                db.select(
+                    [
+                        SqlEventLogStorageTable.c.id,
+                        SqlEventLogStorageTable.c.event,
+                        SqlEventLogStorageTable.c.dagster_event_type,
+                        SqlEventLogStorageTable.c.timestamp,
+                        SqlEventLogStorageTable.c.asset_key,
+                        SqlEventLogStorageTable.c.partition,
+                    ]
+                )
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .where(archived_event_type_filter)
+                .order_by(SqlEventLogStorageTable.c.id.asc())
+            ).fetchall()
+            if not rows:
+                return 0
+
+            archived_rows = (self._get_archived_event_rows(conn, run_id) or []) + [
+                [
+                    storage_id,
+                    event,
+                    dagster_event_type,
+                    datetime_as_float(timestamp) if timestamp else None,
+                    asset_key,
+                    partition,
+                ]
+                for storage_id, event, dagster_event_type, timestamp, asset_key, partition in rows
+            ]
+            archive_body = zlib.compress(seven.json.dumps(archived_rows).encode("utf-8"))
+
+            with conn.begin():
+                conn.execute(
+                    EventLogArchivesTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        EventLogArchivesTable.c.run_id == run_id
+                    )
+                )
+                conn.execute(
+                    EventLogArchivesTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        run_id=run_id,
+                        event_count=len(archived_rows),
+                        archive_body=archive_body,
+                    )
+                )
+                conn.execute(
+                    SqlEventLogStorageTable.delete()  # pylint: disable=no-value-for-parameter
+                    .where(SqlEventLogStorageTable.c.run_id == run_id)
+                    .where(archived_event_type_filter)
+                    .where(SqlEventLogStorageTable.c.id <= rows[-1][0])
+                )
+
+        return len(rows)
+
+    def _get_archived_event_rows(self, conn: Connection, run_id: str) -> Optional[List[List[Any]]]:
+        """Returns the archived events of a run as lists of storage id, serialized event, event
+        type, timestamp, asset key and partition, or None if the run has no archived events.
+        """
+        row = conn.execute(
+            db.select([EventLogArchivesTable.c.id, EventLogArchivesTable.c.event_count]).where(
+                EventLogArchivesTable.c.run_id == run_id
+            )
+        ).fetchone()
+        if not row:
+            return None
+
+        # the archive row is replaced with a larger one whenever more events of the run are
+        # archived, so its id and event count identify the archive contents
+        archive_id, event_count = row
+        if self._archived_event_rows_cache is None:
+            self._archived_event_rows_cache = _ArchivedEventRowsCache(
+                ARCHIVED_EVENT_ROWS_CACHE_SIZE
+            )
+        cached_rows = self._archived_event_rows_cache.get(run_id, (archive_id, event_count))
+        if cached_rows is not None:
+            return cached_rows
+
+        body_row = conn.execute(
+            db.select([EventLogArchivesTable.c.archive_body]).where(
+                EventLogArchivesTable.c.id == archive_id
+            )
+        ).fetchone()
+        if not body_row:
+            # the archive was replaced or deleted since it was looked up
+            return self._get_archived_event_rows(conn, run_id)
+
+        archived_rows = seven.json.loads(zlib.decompress(body_row[0]).decode("utf-8"))
+        self._archived_event_rows_cache.set(run_id, (archive_id, event_count), archived_rows)
+        return archived_rows
+
     def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
         check.str_param(run_id, "run_id")
 
@@ -668,7 +1716,48 @@ def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
             AssetKey.from_db_string(row[0])
             for row in conn.execute(removed_asset_key_query).fetchall()
         ]
+
+        # the asset partitions whose latest materialization is one of the deleted events
+        removed_latest_partitions: Dict[AssetKey, List[str]] = defaultdict(list)
+        if removed_asset_keys and self.has_asset_partition_latest_table():
+            for asset_key_str, partition in conn.execute(
+                db.select(
+                    [AssetPartitionLatestTable.c.asset_key, AssetPartitionLatestTable.c.partition]
+                )
+                .select_from(
+                    AssetPartitionLatestTable.join(
+                        SqlEventLogStorageTable,
+                        AssetPartitionLatestTable.c.last_materialization_storage_id
+                        == SqlEventLogStorageTable.c.id,
+                    )
+                )
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+            ).fetchall():
+                removed_latest_partitions[AssetKey.from_db_string(asset_key_str)].append(partition)
+
         conn.execute(delete_statement)
+
+        if self.has_table("run_stats"):
+            conn.execute(
+                RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    RunStatsTable.c.run_id == run_id
+                )
+            )
+
+        if self.has_table("step_stats"):
+            conn.execute(
+                StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    StepStatsTable.c.run_id == run_id
+                )
+            )
+
+        if self.has_table("event_log_archives"):
+            conn.execute(
+                EventLogArchivesTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    EventLogArchivesTable.c.run_id == run_id
+                )
+            )
+
         if len(removed_asset_keys) > 0:
             keys_to_check = []
             keys_to_check.extend([key.to_string() for key in removed_asset_keys])  # type: ignore  # (bad sig?)
@@ -692,6 +1781,9 @@ def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
                     )
                 )
 
+        for asset_key, partitions in removed_latest_partitions.items():
+            self._rebuild_asset_partition_latest(conn, asset_key, partitions)
+
     @property
     def is_persistent(self) -> bool:
         return True
@@ -713,7 +1805,7 @@ def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
                 SqlEventLogStorageTable.update()  # pylint: disable=no-value-for-parameter
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_dagster_namedtuple(event),
+                    event=serialize_value(event, serdes_format=self.serdes_format),
                     dagster_event_type=dagster_event_type,
                     timestamp=datetime.utcfromtimestamp(event.timestamp),
                     step_key=event.step_key,
@@ -738,6 +1830,9 @@ def get_event_log_table_data(self, run_id: str, record_id: int) -> Optional[SqlA
     def has_secondary_index(self, name: str) -> bool:
         """This method uses a checkpoint migration table to see if summary data has been constructed
         in a secondary index table.  Can be used to checkpoint event_log data migrations.
+
+        Storages that cache the result only cache a positive check, since an index is never unbuilt,
+        so that a long-running process starts using an index once another process has built it.
         """
         query = (
             db.select([1])
@@ -770,6 +1865,16 @@ def enable_secondary_index(self, name: str) -> None:
                     .values(migration_completed=datetime.now())
                 )
 
+    def _get_storage_id_bounds_for_timestamps(
+        self, before_timestamp: Optional[float], after_timestamp: Optional[float]
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Returns an inclusive lower and an exclusive upper bound on the storage ids of the events
+        stored within the given timestamp bounds, if the storage can derive them cheaply. Storages
+        that partition the event log by storage id use these to prune partitions from time-bounded
+        queries.
+        """
+        return None, None
+
     def _apply_filter_to_query(
         self,
         query: SqlAlchemyQuery,
@@ -834,6 +1939,16 @@ def _apply_filter_to_query(
                 > datetime.utcfromtimestamp(event_records_filter.after_timestamp)
             )
 
+        if event_records_filter.before_timestamp or event_records_filter.after_timestamp:
+            min_storage_id, max_storage_id = self._get_storage_id_bounds_for_timestamps(
+                before_timestamp=event_records_filter.before_timestamp,
+                after_timestamp=event_records_filter.after_timestamp,
+            )
+            if min_storage_id is not None:
+                query = query.where(SqlEventLogStorageTable.c.id >= min_storage_id)
+            if max_storage_id is not None:
+                query = query.where(SqlEventLogStorageTable.c.id < max_storage_id)
+
         if event_records_filter.storage_ids:
             query = query.where(SqlEventLogStorageTable.c.id.in_(event_records_filter.storage_ids))
 
@@ -887,17 +2002,13 @@ def _apply_tags_table_joins(
             )
         return table
 
-    def get_event_records(
-        self,
-        event_records_filter: EventRecordsFilter,
-        limit: Optional[int] = None,
-        ascending: bool = False,
-    ) -> Iterable[EventLogRecord]:
-        """Returns a list of (record_id, record)."""
-        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
-        check.opt_int_param(limit, "limit")
-        check.bool_param(ascending, "ascending")
-
+    def _get_event_records_query(
+        self, event_records_filter: EventRecordsFilter, include_event: bool
+    ) -> Tuple[SqlAlchemyQuery, bool]:
+        """Returns the unordered query for the records matching the filter, along with whether the
+        tags of the filter must be matched against the fetched records in memory, as there is no
+        tags table to query.
+        """
         if event_records_filter.asset_key:
             asset_details = next(iter(self._get_assets_details([event_records_filter.asset_key])))
         else:
@@ -914,8 +2025,12 @@ def get_event_records(
         else:
             table = SqlEventLogStorageTable
 
+        # the events are needed to filter on tags when there is no tags table to join against
+        filter_tags_in_memory = bool(
+            event_records_filter.tags and not self.has_table(AssetEventTagsTable.name)
+        )
         query = db.select(
-            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
+            _event_record_columns(include_event or filter_tags_in_memory)
         ).select_from(table)
 
         query = self._apply_filter_to_query(
@@ -923,6 +2038,24 @@ def get_event_records(
             event_records_filter=event_records_filter,
             asset_details=asset_details,
         )
+        return query, filter_tags_in_memory
+
+    def get_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+        include_event: bool = True,
+    ) -> Iterable[Union[EventLogRecord, EventLogRecordProjection]]:
+        """Returns a list of (record_id, record)."""
+        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+        check.opt_int_param(limit, "limit")
+        check.bool_param(ascending, "ascending")
+        check.bool_param(include_event, "include_event")
+
+        query, filter_tags_in_memory = self._get_event_records_query(
+            event_records_filter, include_event
+        )
         if limit:
             query = query.limit(limit)
 
@@ -934,37 +2067,83 @@ def get_event_records(
         with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
 
-        event_records = []
-        for row_id, json_str in results:
-            try:
-                event_record = deserialize_json_to_dagster_namedtuple(json_str)
-                if not isinstance(event_record, EventLogEntry):
-                    logging.warning(
-                        "Could not resolve event record as EventLogEntry for id `%s`.", row_id
-                    )
-                    continue
+        if not filter_tags_in_memory:
+            if not include_event:
+                return list(_event_record_projections_from_rows(results))
+            return list(_event_records_from_rows(results))
 
-                if event_records_filter.tags and not self.has_table(AssetEventTagsTable.name):
-                    # If we can't filter tags via the tags table, filter the returned records
-                    if limit is not None:
-                        raise DagsterInvalidInvocationError(
-                            "Cannot filter events on tags with a limit, without the asset event "
-                            "tags table. To fix, run `dagster instance migrate`."
-                        )
+        # If we can't filter tags via the tags table, filter the returned records
+        if limit is not None:
+            raise DagsterInvalidInvocationError(
+                "Cannot filter events on tags with a limit, without the asset event "
+                "tags table. To fix, run `dagster instance migrate`."
+            )
 
-                    event_record_tags = event_record.tags
-                    if not event_record_tags or any(
-                        event_record_tags.get(k) != v for k, v in event_records_filter.tags.items()
-                    ):
-                        continue
+        return [
+            event_record if include_event else _event_record_projection(event_record)
+            for event_record in _event_records_from_rows(results)
+            if _event_record_matches_tags(event_record, event_records_filter.tags)
+        ]
 
-                event_records.append(
-                    EventLogRecord(storage_id=row_id, event_log_entry=event_record)
-                )
-            except seven.JSONDecodeError:
-                logging.warning("Could not parse event record id `%s`.", row_id)
+    def iterate_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        batch_size: int = EVENT_RECORDS_BATCH_SIZE,
+        include_event: bool = True,
+    ) -> Iterator[Union[EventLogRecord, EventLogRecordProjection]]:
+        """Yields the records matching the filter in ascending storage id order. The records are
+        fetched over a single connection, in pages of at most batch_size records keyed by storage
+        id, each of which is streamed from the database when the driver supports it.
+        """
+        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+        check.bool_param(include_event, "include_event")
+
+        query, filter_tags_in_memory = self._get_event_records_query(
+            event_records_filter, include_event
+        )
+        query = query.order_by(SqlEventLogStorageTable.c.id.asc()).limit(batch_size)
 
-        return event_records
+        last_storage_id = None
+        with self.index_connection() as conn:
+            while True:
+                page_query = (
+                    query
+                    if last_storage_id is None
+                    else query.where(SqlEventLogStorageTable.c.id > last_storage_id)
+                )
+                num_rows = 0
+                with self._stream_query(conn, page_query) as rows:
+                    for row in rows:
+                        num_rows += 1
+                        last_storage_id = row[0]
+                        if not filter_tags_in_memory:
+                            if include_event:
+                                yield from _event_records_from_rows([row])
+                            else:
+                                yield from _event_record_projections_from_rows([row])
+                            continue
+
+                        for event_record in _event_records_from_rows([row]):
+                            if _event_record_matches_tags(event_record, event_records_filter.tags):
+                                yield (
+                                    event_record
+                                    if include_event
+                                    else _event_record_projection(event_record)
+                                )
+                if num_rows < batch_size:
+                    return
+
+    @contextmanager
+    def _stream_query(
+        self, conn: Connection, query: SqlAlchemyQuery
+    ) -> Iterator[Iterable[SqlAlchemyRow]]:
+        """Executes a query whose rows are consumed while other work happens between rows. By
+        default, the rows are fetched up front, so that no database cursor is left open. Storages
+        whose drivers support server-side cursors override this to stream the rows instead.
+        """
+        yield conn.execute(query).fetchall()
 
     def supports_event_consumer_queries(self) -> bool:
         return True
@@ -1093,13 +2272,7 @@ def _get_latest_materialization_records(
             .group_by(SqlEventLogStorageTable.c.asset_key)
             .alias("latest_materializations")
         )
-        backcompat_query = db.select(
-            [
-                SqlEventLogStorageTable.c.asset_key,
-                SqlEventLogStorageTable.c.id,
-                SqlEventLogStorageTable.c.event,
-            ]
-        ).select_from(
+        backcompat_query = db.select(_event_record_columns(include_event=True)).select_from(
             latest_event_subquery.join(
                 SqlEventLogStorageTable,
                 db.and_(
@@ -1111,15 +2284,9 @@ def _get_latest_materialization_records(
         with self.index_connection() as conn:
             event_rows = conn.execute(backcompat_query).fetchall()
 
-        for row in event_rows:
-            asset_key = AssetKey.from_db_string(row[0])
-            if asset_key:
-                results[asset_key] = EventLogRecord(
-                    storage_id=row[1],
-                    event_log_entry=cast(
-                        EventLogEntry, deserialize_json_to_dagster_namedtuple(row[2])
-                    ),
-                )
+        for record in _event_records_from_rows(event_rows):
+            if record.asset_key:
+                results[record.asset_key] = record
         return results
 
     def can_cache_asset_status_data(self) -> bool:
@@ -1655,6 +2822,13 @@ def wipe_asset(self, asset_key: AssetKey) -> None:
                 )
             )
 
+            if self.has_asset_partition_latest_table():
+                conn.execute(
+                    AssetPartitionLatestTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        AssetPartitionLatestTable.c.asset_key == asset_key.to_string()
+                    )
+                )
+
     def get_materialization_count_by_partition(
         self, asset_keys: Sequence[AssetKey], after_cursor: Optional[int] = None
     ) -> Mapping[AssetKey, Mapping[str, int]]:
@@ -1774,6 +2948,262 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
             )
 
 
+def _upsert_asset_partition_latest_rows(
+    conn: Connection, latest: Mapping[Tuple[str, str], Tuple[int, float]]
+) -> None:
+    """Point the asset_partition_latest row of each (asset key, partition) at the given storage id,
+    unless the row already points at a later materialization.
+    """
+    partitions_by_asset_key: Dict[str, List[str]] = defaultdict(list)
+    for asset_key_str, partition in latest.keys():
+        partitions_by_asset_key[asset_key_str].append(partition)
+
+    existing = set()
+    for asset_key_str, partitions in partitions_by_asset_key.items():
+        existing.update(
+            (asset_key_str, row[0])
+            for row in conn.execute(
+                db.select([AssetPartitionLatestTable.c.partition]).where(
+                    db.and_(
+                        AssetPartitionLatestTable.c.asset_key == asset_key_str,
+                        AssetPartitionLatestTable.c.partition.in_(partitions),
+                    )
+                )
+            ).fetchall()
+        )
+
+    insert_rows = [
+        dict(
+            asset_key=asset_key_str,
+            partition=partition,
+            last_materialization_storage_id=storage_id,
+            last_materialization_timestamp=datetime.utcfromtimestamp(timestamp),
+        )
+        for (asset_key_str, partition), (storage_id, timestamp) in latest.items()
+        if (asset_key_str, partition) not in existing
+    ]
+    if insert_rows:
+        conn.execute(
+            AssetPartitionLatestTable.insert(),  # pylint: disable=no-value-for-parameter
+            insert_rows,
+        )
+
+    update_rows = [
+        dict(
+            _asset_key=asset_key_str,
+            _partition=partition,
+            _storage_id=storage_id,
+            last_materialization_storage_id=storage_id,
+            last_materialization_timestamp=datetime.utcfromtimestamp(timestamp),
+        )
+        for (asset_key_str, partition), (storage_id, timestamp) in latest.items()
+        if (asset_key_str, partition) in existing
+    ]
+    if update_rows:
+        conn.execute(
+            AssetPartitionLatestTable.update().where(  # pylint: disable=no-value-for-parameter
+                db.and_(
+                    AssetPartitionLatestTable.c.asset_key == db.bindparam("_asset_key"),
+                    AssetPartitionLatestTable.c.partition == db.bindparam("_partition"),
+                    AssetPartitionLatestTable.c.last_materialization_storage_id
+                    < db.bindparam("_storage_id"),
+                )
+            ),
+            update_rows,
+        )
+
+
+def _is_asset_index_event(event: EventLogEntry) -> bool:
+    return bool(
+        event.is_dagster_event
+        and event.dagster_event_type in ASSET_EVENTS
+        and event.get_dagster_event().asset_key
+    )
+
+
+def _is_step_order_event(event: EventLogEntry) -> bool:
+    return bool(
+        event.is_dagster_event
+        and event.dagster_event_type in STEP_ORDER_EVENTS
+        and event.get_dagster_event().step_key
+    )
+
+
+def _is_marker_event_without_marker(event: EventLogEntry) -> bool:
+    dagster_event = event.get_dagster_event()
+    return dagster_event.event_type in MARKER_EVENTS and not (
+        dagster_event.engine_event_data.marker_start or dagster_event.engine_event_data.marker_end
+    )
+
+
+def _group_rows_by_columns(
+    rows: Sequence[Mapping[str, Any]]
+) -> Sequence[Sequence[Mapping[str, Any]]]:
+    # executemany statements compile their columns from the first row, so rows setting different
+    # columns must be written in separate statements
+    grouped: Dict[Tuple[str, ...], List[Mapping[str, Any]]] = OrderedDict()
+    for row in rows:
+        grouped.setdefault(tuple(sorted(row.keys())), []).append(row)
+    return list(grouped.values())
+
+
+def _event_record_columns(include_event: bool) -> Sequence[Any]:
+    """The columns to select for building an event record from an event log row.
+
+    Without the event, the serialized event is still selected for the rows whose indexed columns
+    are incomplete, i.e. asset events written before the asset key column was added and rows
+    without a timestamp, so that their projections can be read from the event.
+    """
+    if include_event:
+        event_column = SqlEventLogStorageTable.c.event
+    else:
+        event_column = db.case(
+            [
+                (
+                    db.or_(
+                        db.and_(
+                            SqlEventLogStorageTable.c.asset_key.is_(None),
+                            SqlEventLogStorageTable.c.dagster_event_type.in_(
+                                [event_type.value for event_type in ASSET_EVENTS]
+                            ),
+                        ),
+                        SqlEventLogStorageTable.c.timestamp.is_(None),
+                    ),
+                    SqlEventLogStorageTable.c.event,
+                )
+            ],
+            else_=db.null(),
+        )
+
+    return [
+        SqlEventLogStorageTable.c.id,
+        event_column.label("event"),
+        SqlEventLogStorageTable.c.run_id,
+        SqlEventLogStorageTable.c.timestamp,
+        SqlEventLogStorageTable.c.asset_key,
+        SqlEventLogStorageTable.c.partition,
+    ]
+
+
+def _event_record_from_row(row: SqlAlchemyRow) -> EventLogRecord:
+    """Builds the record of a row selected with `_event_record_columns(include_event=True)`,
+    raising DagsterEventLogInvalidForRun if the event is malformed.
+    """
+    storage_id, serialized_event, run_id = row[0], row[1], row[2]
+    try:
+        event_log_entry = deserialize_as(serialized_event, EventLogEntry)
+    except (seven.JSONDecodeError, DeserializationError, check.CheckError) as err:
+        raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+    return EventLogRecord(storage_id=storage_id, event_log_entry=event_log_entry)
+
+
+def _event_record_projection(event_record: EventLogRecord) -> EventLogRecordProjection:
+    return EventLogRecordProjection(
+        storage_id=event_record.storage_id,
+        run_id=event_record.run_id,
+        timestamp=event_record.timestamp,
+        asset_key=event_record.asset_key,
+        partition_key=event_record.partition_key,
+    )
+
+
+def _event_record_projection_from_row(row: SqlAlchemyRow) -> EventLogRecordProjection:
+    """Builds the projection of a row selected with `_event_record_columns(include_event=False)`.
+    Rows that were selected with their event are read from the event, raising
+    DagsterEventLogInvalidForRun if it is malformed.
+    """
+    storage_id, serialized_event, run_id, timestamp, asset_key, partition = row
+    if serialized_event is not None:
+        return _event_record_projection(_event_record_from_row(row))
+
+    return EventLogRecordProjection(
+        storage_id=storage_id,
+        run_id=run_id,
+        timestamp=datetime_as_float(timestamp),
+        asset_key=AssetKey.from_db_string(asset_key),
+        partition_key=partition,
+    )
+
+
+def _event_records_from_rows(rows: Iterable[SqlAlchemyRow]) -> Iterator[EventLogRecord]:
+    """Builds the records of rows selected with `_event_record_columns(include_event=True)`,
+    skipping the rows whose event can't be decoded.
+    """
+    for row in rows:
+        try:
+            yield _event_record_from_row(row)
+        except DagsterEventLogInvalidForRun:
+            logging.warning("Could not parse event record id `%s`.", row[0])
+
+
+def _event_record_projections_from_rows(
+    rows: Iterable[SqlAlchemyRow],
+) -> Iterator[EventLogRecordProjection]:
+    """Builds the projections of rows selected with `_event_record_columns(include_event=False)`,
+    skipping the rows whose event can't be decoded.
+    """
+    for row in rows:
+        try:
+            yield _event_record_projection_from_row(row)
+        except DagsterEventLogInvalidForRun:
+            logging.warning("Could not parse event record id `%s`.", row[0])
+
+
+def _event_record_matches_tags(
+    event_record: EventLogRecord, tags: Mapping[str, Union[str, Sequence[str]]]
+) -> bool:
+    """Whether the event of the record has the given tags, for storages without the asset event
+    tags table.
+    """
+    event_record_tags = event_record.event_log_entry.tags
+    return bool(event_record_tags) and all(event_record_tags.get(k) == v for k, v in tags.items())
+
+
+class _ArchivedEventRowsCache:
+    """A bounded cache of the decompressed archived events of runs, keyed by run id. Entries are
+    only returned for the archive they were read from.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], List[List[Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, run_id: str, archive_key: Tuple[int, int]) -> Optional[List[List[Any]]]:
+        with self._lock:
+            entry = self._entries.get(run_id)
+            if entry is None or entry[0] != archive_key:
+                return None
+            self._entries.move_to_end(run_id)
+            return entry[1]
+
+    def set(self, run_id: str, archive_key: Tuple[int, int], rows: List[List[Any]]) -> None:
+        with self._lock:
+            self._entries[run_id] = (archive_key, rows)
+            self._entries.move_to_end(run_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+
+def _event_record_row_from_archived_row(
+    archived_row: Sequence[Any], run_id: str, include_event: bool
+) -> Tuple[Any, ...]:
+    """Converts an archived event to a row of the columns selected by `_event_record_columns`."""
+    storage_id, event, dagster_event_type, timestamp, asset_key, partition = archived_row
+    include_legacy_event = timestamp is None or (
+        asset_key is None
+        and dagster_event_type in {event_type.value for event_type in ASSET_EVENTS}
+    )
+    return (
+        storage_id,
+        event if include_event or include_legacy_event else None,
+        run_id,
+        datetime.utcfromtimestamp(timestamp) if timestamp is not None else None,
+        asset_key,
+        partition,
+    )
+
+
 def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
@@ -1,15 +1,18 @@
 import logging
 import os
+import threading
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Sequence, TypeVar
 
 from sqlalchemy.pool import NullPool
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
 import dagster._check as check
-from dagster._config import StringSource
+from dagster._config import Field, StringSource
+from dagster._core.definitions.events import AssetKey
+from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.pipeline_run import DagsterRunStatus
 from dagster._core.storage.sql import (
@@ -19,15 +22,24 @@
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster._core.storage.sqlite import create_db_conn_string
+from dagster._core.storage.sqlite import (
+    SqliteWriter,
+    create_db_conn_string,
+    create_pooled_sqlite_engine,
+)
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
-from dagster._utils import mkdir_p
+from dagster._utils import PrintFn, mkdir_p
 
 from ..schema import SqlEventLogStorageMetadata
 from ..sql_event_log import SqlDbConnection, SqlEventLogStorage
 
+if TYPE_CHECKING:
+    from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+
 SQLITE_EVENT_LOG_FILENAME = "event_log"
 
+T = TypeVar("T")
+
 
 class ConsolidatedSqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """SQLite-backed consolidated event log storage intended for test cases only.
@@ -48,11 +60,19 @@ class ConsolidatedSqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
             base_dir: /path/to/dir
 
     The ``base_dir`` param tells the event log storage where on disk to store the database.
+
+    Setting the optional ``single_writer`` param routes the event writes of each process through a
+    single connection, owned by a writer thread that commits concurrent writes in batches, and
+    serves reads from read-only pooled connections.
     """
 
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(self, base_dir, inst_data=None, single_writer=False):
         self._base_dir = check.str_param(base_dir, "base_dir")
         self._conn_string = create_db_conn_string(base_dir, SQLITE_EVENT_LOG_FILENAME)
+        self._single_writer = check.bool_param(single_writer, "single_writer")
+        self._engine = None
+        self._writer = None
+        self._lock = threading.Lock()
         self._secondary_index_cache = {}
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self._watchers = defaultdict(dict)
@@ -69,7 +89,7 @@ def inst_data(self):
 
     @classmethod
     def config_type(cls):
-        return {"base_dir": StringSource}
+        return {"base_dir": StringSource, "single_writer": Field(bool, is_required=False)}
 
     @staticmethod
     def from_config_value(inst_data, config_value):
@@ -96,6 +116,17 @@ def _init_db(self):
 
     @contextmanager
     def _connect(self):
+        if self._single_writer:
+            if self._writer and self._writer.in_writer_thread:
+                yield self._writer.connection
+            else:
+                with self._lock:
+                    if self._engine is None:
+                        self._engine = create_pooled_sqlite_engine(self._conn_string)
+                with self._engine.connect() as conn:
+                    yield conn
+            return
+
         engine = create_engine(self._conn_string, poolclass=NullPool)
         conn = engine.connect()
         try:
@@ -103,6 +134,30 @@ def _connect(self):
         finally:
             conn.close()
 
+    @property
+    def is_single_writer(self) -> bool:
+        return self._single_writer
+
+    def _write(self, fn: Callable[[], T]) -> T:
+        """Runs a write. In single writer mode, the write is run by the writer thread, where
+        connections to the db use the writer connection.
+        """
+        if not self._single_writer:
+            return fn()
+
+        with self._lock:
+            if self._writer is None:
+                self._writer = SqliteWriter(self._conn_string)
+        return self._writer.submit(lambda _conn: fn())
+
+    def store_event(self, event: EventLogEntry) -> None:
+        store_event = super(ConsolidatedSqliteEventLogStorage, self).store_event
+        self._write(lambda: store_event(event))
+
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        store_events = super(ConsolidatedSqliteEventLogStorage, self).store_events
+        self._write(lambda: store_events(events))
+
     def run_connection(self, run_id: Optional[str]) -> SqlDbConnection:
         return self._connect()
 
@@ -118,21 +173,117 @@ def get_db_path(self):
 
     def upgrade(self):
         alembic_config = get_alembic_config(__file__)
-        with self._connect() as conn:
-            run_alembic_upgrade(alembic_config, conn)
+
+        def _upgrade():
+            with self._connect() as conn:
+                run_alembic_upgrade(alembic_config, conn)
+
+        self._write(_upgrade)
 
     def has_secondary_index(self, name):
         if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                ConsolidatedSqliteEventLogStorage, self
-            ).has_secondary_index(name)
+            if not super(ConsolidatedSqliteEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
         return self._secondary_index_cache[name]
 
     def enable_secondary_index(self, name):
-        super(ConsolidatedSqliteEventLogStorage, self).enable_secondary_index(name)
+        enable_secondary_index = super(
+            ConsolidatedSqliteEventLogStorage, self
+        ).enable_secondary_index
+        self._write(lambda: enable_secondary_index(name))
         if name in self._secondary_index_cache:
             del self._secondary_index_cache[name]
 
+    # in single writer mode, the pooled connections are read-only, so every other write is also
+    # routed through the writer
+
+    def reindex_events(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
+        reindex_events = super(ConsolidatedSqliteEventLogStorage, self).reindex_events
+        self._write(lambda: reindex_events(print_fn, force))
+
+    def reindex_assets(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
+        reindex_assets = super(ConsolidatedSqliteEventLogStorage, self).reindex_assets
+        self._write(lambda: reindex_assets(print_fn, force))
+
+    def run_batched_data_migration(
+        self, migration_name: str, cursor: Optional[str], batch_size: int
+    ) -> Optional[str]:
+        run_batched_data_migration = super(
+            ConsolidatedSqliteEventLogStorage, self
+        ).run_batched_data_migration
+        return self._write(lambda: run_batched_data_migration(migration_name, cursor, batch_size))
+
+    def import_asset_key_rows(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        import_asset_key_rows = super(ConsolidatedSqliteEventLogStorage, self).import_asset_key_rows
+        return self._write(lambda: import_asset_key_rows(rows))
+
+    def import_event_log_rows(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        import_event_log_rows = super(ConsolidatedSqliteEventLogStorage, self).import_event_log_rows
+        return self._write(lambda: import_event_log_rows(rows))
+
+    def rebuild_indexes_after_import(
+        self, after_storage_id: Optional[int], print_fn: Optional[PrintFn] = None
+    ) -> None:
+        rebuild_indexes_after_import = super(
+            ConsolidatedSqliteEventLogStorage, self
+        ).rebuild_indexes_after_import
+        self._write(lambda: rebuild_indexes_after_import(after_storage_id, print_fn))
+
+    def add_asset_event_tags(
+        self,
+        event_id: int,
+        event_timestamp: float,
+        asset_key: AssetKey,
+        new_tags: Mapping[str, str],
+    ) -> None:
+        add_asset_event_tags = super(ConsolidatedSqliteEventLogStorage, self).add_asset_event_tags
+        self._write(lambda: add_asset_event_tags(event_id, event_timestamp, asset_key, new_tags))
+
+    def update_asset_cached_status_data(
+        self, asset_key: AssetKey, cache_values: "AssetStatusCacheValue"
+    ) -> None:
+        update_asset_cached_status_data = super(
+            ConsolidatedSqliteEventLogStorage, self
+        ).update_asset_cached_status_data
+        self._write(lambda: update_asset_cached_status_data(asset_key, cache_values))
+
+    def archive_events(self, run_id: str) -> int:
+        archive_events = super(ConsolidatedSqliteEventLogStorage, self).archive_events
+        return self._write(lambda: archive_events(run_id))
+
+    def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
+        update_event_log_record = super(
+            ConsolidatedSqliteEventLogStorage, self
+        ).update_event_log_record
+        self._write(lambda: update_event_log_record(record_id, event))
+
+    def add_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> None:
+        add_dynamic_partitions = super(
+            ConsolidatedSqliteEventLogStorage, self
+        ).add_dynamic_partitions
+        self._write(lambda: add_dynamic_partitions(partitions_def_name, partition_keys))
+
+    def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> None:
+        delete_dynamic_partition = super(
+            ConsolidatedSqliteEventLogStorage, self
+        ).delete_dynamic_partition
+        self._write(lambda: delete_dynamic_partition(partitions_def_name, partition_key))
+
+    def delete_events(self, run_id: str) -> None:
+        delete_events = super(ConsolidatedSqliteEventLogStorage, self).delete_events
+        self._write(lambda: delete_events(run_id))
+
+    def wipe(self) -> None:
+        wipe = super(ConsolidatedSqliteEventLogStorage, self).wipe
+        self._write(wipe)
+
+    def wipe_asset(self, asset_key: AssetKey) -> None:
+        wipe_asset = super(ConsolidatedSqliteEventLogStorage, self).wipe_asset
+        self._write(lambda: wipe_asset(asset_key))
+
     def watch(self, run_id, cursor, callback):
         if not self._obs:
             self._obs = Observer()
@@ -160,6 +311,10 @@ def on_modified(self):
                 self._watchers[run_id][callback] = connection.cursor
 
             for record in connection.records:
+                if callback not in self._watchers.get(run_id, {}):
+                    # the watch ended while the events were being fetched
+                    break
+
                 status = None
                 try:
                     status = callback(
@@ -185,6 +340,11 @@ def dispose(self):
             self._obs.stop()
             self._obs.join(timeout=15)
 
+        if self._writer:
+            self._writer.dispose()
+        if self._engine:
+            self._engine.dispose()
+
 
 class ConsolidatedSqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
     def __init__(self, event_log_storage, **kwargs):
@@ -192,10 +352,17 @@ def __init__(self, event_log_storage, **kwargs):
             event_log_storage, "event_log_storage", ConsolidatedSqliteEventLogStorage
         )
         self._log_path = event_log_storage.get_db_path()
+        # in single writer mode, writes land in the write-ahead log until it is checkpointed into
+        # the db file, which may not happen until the writer connection is closed
+        self._log_paths = (
+            [self._log_path, f"{self._log_path}-wal"]
+            if event_log_storage.is_single_writer
+            else [self._log_path]
+        )
         super(ConsolidatedSqliteEventLogStorageWatchdog, self).__init__(
-            patterns=[self._log_path], **kwargs
+            patterns=self._log_paths, **kwargs
         )
 
     def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
+        check.invariant(event.src_path in self._log_paths)
         self._event_log_storage.on_modified()
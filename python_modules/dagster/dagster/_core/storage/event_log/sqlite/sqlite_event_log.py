@@ -5,9 +5,23 @@
 import sqlite3
 import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, ContextManager, Iterable, Iterator, Optional, Sequence
+from itertools import groupby
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
@@ -18,39 +32,58 @@
 from watchdog.observers import Observer
 
 import dagster._check as check
-import dagster._seven as seven
-from dagster._config import StringSource
+from dagster._config import Field, StringSource
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterInvariantViolationError
-from dagster._core.event_api import EventHandlerFn
+from dagster._core.event_api import EventHandlerFn, EventLogRecordProjection
 from dagster._core.events import ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
+from dagster._core.storage.event_log.base import (
+    EVENT_RECORDS_BATCH_SIZE,
+    EventLogCursor,
+    EventLogRecord,
+    EventLogStorage,
+    EventRecordsFilter,
+)
 from dagster._core.storage.pipeline_run import DagsterRunStatus, RunsFilter
 from dagster._core.storage.sql import (
     AlembicVersion,
+    SqlAlchemyQuery,
     check_alembic_revision,
     create_engine,
     get_alembic_config,
+    iter_table_row_chunks,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster._core.storage.sqlite import create_db_conn_string
-from dagster._serdes import (
-    ConfigurableClass,
-    ConfigurableClassData,
-    deserialize_json_to_dagster_namedtuple,
+from dagster._core.storage.sqlite import (
+    SqliteWriter,
+    create_db_conn_string,
+    create_pooled_sqlite_engine,
 )
-from dagster._utils import mkdir_p
+from dagster._serdes import ConfigurableClass, ConfigurableClassData, deserialize_as
+from dagster._utils import PrintFn, mkdir_p
 
 from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..sql_event_log import (
+    RunShardedEventsCursor,
+    SqlEventLogStorage,
+    _event_record_columns,
+    _event_record_projections_from_rows,
+    _event_records_from_rows,
+)
 
 if TYPE_CHECKING:
+    from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
 INDEX_SHARD_NAME = "index"
 
+# the number of shards whose connection pools are kept open in single writer mode
+MAX_POOLED_SHARDS = 16
+
+T = TypeVar("T")
+
 
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """SQLite-backed event log storage.
@@ -75,15 +108,31 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     The ``base_dir`` param tells the event log storage where on disk to store the databases. To
     improve concurrent performance, event logs are stored in a separate SQLite database for each
     run.
+
+    Setting the optional ``single_writer`` param routes the event writes of each process through a
+    single connection per database, owned by a writer thread that commits concurrent writes in
+    batches, and serves reads from read-only pooled connections.
     """
 
-    def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        base_dir: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        single_writer: bool = False,
+    ):
         """Note that idempotent initialization of the SQLite database is done on a per-run_id
         basis in the body of connect, since each run is stored in a separate database.
         """
         self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
         mkdir_p(self._base_dir)
 
+        self._single_writer = check.bool_param(single_writer, "single_writer")
+        self._engines: Dict[str, Engine] = OrderedDict()
+        self._writers: Dict[str, SqliteWriter] = {}
+        # marks the writer threads running a write, whose connections to other shards are not
+        # served from the read-only pools
+        self._write_local = threading.local()
+
         self._obs = None
 
         self._watchers = defaultdict(dict)
@@ -96,6 +145,8 @@ def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = N
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
         self._db_lock = threading.Lock()
 
+        self._secondary_index_cache = {}
+
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
             conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
             engine = create_engine(conn_string, poolclass=NullPool)
@@ -111,15 +162,20 @@ def upgrade(self) -> None:
             f"Updating event log storage for {len(all_run_ids)} runs on disk..."
         )
         alembic_config = get_alembic_config(__file__)
-        if all_run_ids:
-            for run_id in tqdm(all_run_ids):
-                with self.run_connection(run_id) as conn:
-                    run_alembic_upgrade(alembic_config, conn, run_id)
 
-        print("Updating event log storage for index db on disk...")  # pylint: disable=print-call
-        with self.index_connection() as conn:
-            run_alembic_upgrade(alembic_config, conn, "index")
+        def _upgrade():
+            if all_run_ids:
+                for run_id in tqdm(all_run_ids):
+                    with self.run_connection(run_id) as conn:
+                        run_alembic_upgrade(alembic_config, conn, run_id)
 
+            print(
+                "Updating event log storage for index db on disk..."
+            )  # pylint: disable=print-call
+            with self.index_connection() as conn:
+                run_alembic_upgrade(alembic_config, conn, "index")
+
+        self._write(INDEX_SHARD_NAME, _upgrade)
         self._initialized_dbs = set()
 
     @property
@@ -128,7 +184,7 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return {"base_dir": StringSource}
+        return {"base_dir": StringSource, "single_writer": Field(bool, is_required=False)}
 
     @staticmethod
     def from_config_value(
@@ -149,6 +205,19 @@ def has_table(self, table_name: str) -> bool:
         engine = create_engine(conn_string, poolclass=NullPool)
         return bool(engine.dialect.has_table(engine.connect(), table_name))
 
+    def has_secondary_index(self, name: str) -> bool:
+        if name not in self._secondary_index_cache:
+            if not super(SqliteEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
+        return self._secondary_index_cache[name]
+
+    def enable_secondary_index(self, name: str) -> None:
+        enable_secondary_index = super(SqliteEventLogStorage, self).enable_secondary_index
+        self._write(INDEX_SHARD_NAME, lambda: enable_secondary_index(name))
+        if name in self._secondary_index_cache:
+            del self._secondary_index_cache[name]
+
     def path_for_shard(self, run_id: str) -> str:
         return os.path.join(self._base_dir, "{run_id}.db".format(run_id=run_id))
 
@@ -202,6 +271,26 @@ def _initdb(self, engine: Engine) -> None:
 
     @contextmanager
     def _connect(self, shard: str) -> Iterator[Connection]:
+        if self._single_writer:
+            writer = self._writers.get(shard)
+            if writer and writer.in_writer_thread:
+                yield writer.connection
+            elif getattr(self._write_local, "in_write", False):
+                # a write routed through the writer of another shard, e.g. a migration of the index
+                # shard that reads from the run shards, gets a read-write connection
+                self._pooled_engine(shard)  # ensure the shard db is initialized
+                engine = create_engine(self.conn_string_for_shard(shard), poolclass=NullPool)
+                conn = engine.connect()
+                try:
+                    yield conn
+                finally:
+                    conn.close()
+                    engine.dispose()
+            else:
+                with self._pooled_engine(shard).connect() as conn:
+                    yield conn
+            return
+
         with self._db_lock:
             check.str_param(shard, "shard")
 
@@ -220,6 +309,70 @@ def _connect(self, shard: str) -> Iterator[Connection]:
                 conn.close()
             engine.dispose()
 
+    def _pooled_engine(self, shard: str) -> Engine:
+        with self._db_lock:
+            check.str_param(shard, "shard")
+
+            engine = self._engines.pop(shard, None)
+            if engine is None:
+                conn_string = self.conn_string_for_shard(shard)
+                if shard not in self._initialized_dbs:
+                    # the pooled connections are read-only, so the db is initialized separately
+                    init_engine = create_engine(conn_string, poolclass=NullPool)
+                    self._initdb(init_engine)
+                    init_engine.dispose()
+                    self._initialized_dbs.add(shard)
+                engine = create_pooled_sqlite_engine(conn_string)
+
+            # keep the pools of the most recently used shards open
+            self._engines[shard] = engine
+            while len(self._engines) > MAX_POOLED_SHARDS:
+                _, evicted = self._engines.popitem(last=False)  # type: ignore
+                evicted.dispose()
+
+            return engine
+
+    @property
+    def is_single_writer(self) -> bool:
+        return self._single_writer
+
+    def _write(self, shard: str, fn: Callable[[], T]) -> T:
+        """Runs a write to the given shard. In single writer mode, the write is run by the writer
+        thread of the shard, where connections to the shard use the writer connection.
+        """
+        if not self._single_writer:
+            return fn()
+
+        self._pooled_engine(shard)  # ensure the shard db is initialized
+        with self._db_lock:
+            # writers are cheap to keep around, since their thread exits when idle
+            writer = self._writers.get(shard)
+            if writer is None:
+                writer = SqliteWriter(self.conn_string_for_shard(shard))
+                self._writers[shard] = writer
+
+        def _run_write(_conn):
+            in_write = getattr(self._write_local, "in_write", False)
+            self._write_local.in_write = True
+            try:
+                return fn()
+            finally:
+                self._write_local.in_write = in_write
+
+        return writer.submit(_run_write)
+
+    def _dispose_connections(self) -> None:
+        with self._db_lock:
+            writers = list(self._writers.values())
+            engines = list(self._engines.values())
+            self._writers = {}
+            self._engines = OrderedDict()
+
+        for writer in writers:
+            writer.dispose()
+        for engine in engines:
+            engine.dispose()
+
     def run_connection(self, run_id: Optional[str] = None) -> Any:
         return self._connect(run_id)  # type: ignore  # bad sig
 
@@ -238,8 +391,16 @@ def store_event(self, event: EventLogEntry) -> None:
         insert_event_statement = self.prepare_insert_event(event)
         run_id = event.run_id
 
-        with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+        should_update_run_stats = self.should_update_run_stats()
+
+        def _store_run_event():
+            with self.run_connection(run_id) as conn:
+                result = conn.execute(insert_event_statement)
+
+                if should_update_run_stats:
+                    self._update_stats_for_events(conn, [(event, result.inserted_primary_key[0])])
+
+        self._write(run_id, _store_run_event)
 
         if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
             check.invariant(
@@ -250,28 +411,117 @@ def store_event(self, event: EventLogEntry) -> None:
                 ),
             )
 
-            event_id = None
+            def _store_index_event():
+                event_id = None
+
+                # mirror the event in the cross-run index database
+                with self.index_connection() as conn:
+                    result = conn.execute(insert_event_statement)
+                    event_id = result.inserted_primary_key[0]
+
+                self.store_asset_event(event, event_id)
+
+                if event_id is None:
+                    raise DagsterInvariantViolationError(
+                        "Cannot store asset event tags for null event id."
+                    )
+
+                self.store_asset_event_tags(event, event_id)
+
+            self._write(INDEX_SHARD_NAME, _store_index_event)
 
-            # mirror the event in the cross-run index database
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """
+        Overridden method to write each run shard in a single transaction, and to mirror the asset
+        events of the whole batch in the index shard in a single transaction.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        should_update_run_stats = self.should_update_run_stats()
+        index_events = []
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events)
+
+            def _store_run_events(run_id=run_id, run_events=run_events):
+                with self.run_connection(run_id) as conn:
+                    with conn.begin():
+                        # storage ids in the run shard are only used to order the step stats
+                        stored_events = self._insert_events(
+                            conn, run_events, fetch_step_order_ids=should_update_run_stats
+                        )
+
+                    if should_update_run_stats:
+                        self._update_stats_for_events(conn, stored_events)
+
+            self._write(run_id, _store_run_events)
+
+            for event in run_events:
+                if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
+                    check.invariant(
+                        event.dagster_event_type in ASSET_EVENTS,
+                        (
+                            "Can only store asset materializations, materialization_planned, and"
+                            " observations in index database"
+                        ),
+                    )
+                    index_events.append(event)
+
+        if not index_events:
+            return
+
+        def _store_index_events():
+            # mirror the asset events in the cross-run index database
             with self.index_connection() as conn:
-                result = conn.execute(insert_event_statement)
-                event_id = result.inserted_primary_key[0]
+                with conn.begin():
+                    stored_events = self._insert_events(conn, index_events)
+
+            self.store_asset_events(
+                [(event, check.not_none(event_id)) for event, event_id in stored_events]
+            )
 
-            self.store_asset_event(event, event_id)
+        self._write(INDEX_SHARD_NAME, _store_index_events)
 
-            if event_id is None:
-                raise DagsterInvariantViolationError(
-                    "Cannot store asset event tags for null event id."
-                )
+    def iter_export_rows(
+        self, table: db.Table, chunk_size: int
+    ) -> Iterator[Sequence[Mapping[str, Any]]]:
+        """
+        Overridden method to read the event_logs rows from the run shards, skipping the asset
+        events mirrored in the index shard.
+        """
+        if table is not SqlEventLogStorageTable:
+            yield from super().iter_export_rows(table, chunk_size)
+            return
+
+        check.int_param(chunk_size, "chunk_size")
+        for run_id in self.get_all_run_ids():
+            with self.run_connection(run_id) as conn:
+                yield from iter_table_row_chunks(conn, table, chunk_size)
 
-            self.store_asset_event_tags(event, event_id)
+    def import_event_log_rows(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        """
+        Overridden method to store the imported events through `store_events`, which writes each
+        run shard in a single transaction and mirrors the asset events in the index shard.
+        """
+        check.sequence_param(rows, "rows", of_type=dict)
+        self.store_events([deserialize_as(row["event"], EventLogEntry) for row in rows])
+        return len(rows)
+
+    def rebuild_indexes_after_import(
+        self, after_storage_id: Optional[int], print_fn: Optional[PrintFn] = None
+    ) -> None:
+        # the indexes are kept up to date by `store_events` as the events are imported
+        pass
 
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
         limit: Optional[int] = None,
         ascending: bool = False,
-    ) -> Iterable[EventLogRecord]:
+        include_event: bool = True,
+    ) -> Iterable[Union[EventLogRecord, EventLogRecordProjection]]:
         """Overridden method to enable cross-run event queries in sqlite.
 
         The record id in sqlite does not auto increment cross runs, so instead of fetching events
@@ -280,16 +530,51 @@ def get_event_records(
         check.opt_inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
         check.opt_int_param(limit, "limit")
         check.bool_param(ascending, "ascending")
+        check.bool_param(include_event, "include_event")
 
         is_asset_query = event_records_filter and event_records_filter.event_type in ASSET_EVENTS
         if is_asset_query:
             # asset materializations, observations and materialization planned events
             # get mirrored into the index shard, so no custom run shard-aware cursor logic needed
             return super(SqliteEventLogStorage, self).get_event_records(
-                event_records_filter=event_records_filter, limit=limit, ascending=ascending
+                event_records_filter=event_records_filter,
+                limit=limit,
+                ascending=ascending,
+                include_event=include_event,
             )
 
-        query = db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+        query = self._get_run_sharded_event_records_query(event_records_filter, include_event)
+        if limit:
+            query = query.limit(limit)
+        if ascending:
+            query = query.order_by(SqlEventLogStorageTable.c.timestamp.asc())
+        else:
+            query = query.order_by(SqlEventLogStorageTable.c.timestamp.desc())
+
+        event_records = []
+        for run_id in self._get_run_ids_for_event_records(event_records_filter, ascending):
+            with self.run_connection(run_id) as conn:
+                results = conn.execute(query).fetchall()
+
+            for event_record in (
+                _event_records_from_rows(results)
+                if include_event
+                else _event_record_projections_from_rows(results)
+            ):
+                event_records.append(event_record)
+                if limit and len(event_records) >= limit:
+                    break
+
+            if limit and len(event_records) >= limit:
+                break
+
+        return event_records[:limit]
+
+    def _get_run_sharded_event_records_query(
+        self, event_records_filter: EventRecordsFilter, include_event: bool
+    ) -> SqlAlchemyQuery:
+        """Builds the query for the records matching the filter in a single run shard."""
+        query = db.select(_event_record_columns(include_event))
         if event_records_filter.asset_key:
             asset_details = next(iter(self._get_assets_details([event_records_filter.asset_key])))
         else:
@@ -307,19 +592,16 @@ def get_event_records(
             """
             )
 
-        query = self._apply_filter_to_query(
+        return self._apply_filter_to_query(
             query=query,
             event_records_filter=event_records_filter,
             asset_details=asset_details,
             apply_cursor_filters=False,  # run-sharded cursor filters don't really make sense
         )
-        if limit:
-            query = query.limit(limit)
-        if ascending:
-            query = query.order_by(SqlEventLogStorageTable.c.timestamp.asc())
-        else:
-            query = query.order_by(SqlEventLogStorageTable.c.timestamp.desc())
 
+    def _get_run_ids_for_event_records(
+        self, event_records_filter: EventRecordsFilter, ascending: bool
+    ) -> Sequence[str]:
         # workaround for the run-shard sqlite to enable cross-run queries: get a list of run_ids
         # whose events may qualify the query, and then open run_connection per run_id at a time.
         run_updated_after = (
@@ -332,47 +614,75 @@ def get_event_records(
             order_by="update_timestamp",
             ascending=ascending,
         )
+        return [run_record.dagster_run.run_id for run_record in run_records]
 
-        event_records = []
-        for run_record in run_records:
-            run_id = run_record.dagster_run.run_id
-            with self.run_connection(run_id) as conn:
-                results = conn.execute(query).fetchall()
+    def iterate_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        batch_size: int = EVENT_RECORDS_BATCH_SIZE,
+        include_event: bool = True,
+    ) -> Iterator[Union[EventLogRecord, EventLogRecordProjection]]:
+        """Overridden method to avoid holding a connection to a shard between pages, since
+        connections to a shard are exclusive outside of single writer mode.
+
+        Asset events are paged by their storage id in the index shard. Storage ids of other events
+        are not comparable across run shards, so those records are paged by storage id within each
+        run shard, visiting the runs in the order of their update timestamp.
+        """
+        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+        check.bool_param(include_event, "include_event")
+
+        if event_records_filter.event_type in ASSET_EVENTS:
+            yield from EventLogStorage.iterate_event_records(
+                self, event_records_filter, batch_size, include_event
+            )
+            return
 
-            for row_id, json_str in results:
-                try:
-                    event_record = deserialize_json_to_dagster_namedtuple(json_str)
-                    if not isinstance(event_record, EventLogEntry):
-                        logging.warning(
-                            "Could not resolve event record as EventLogEntry for id `%s`.", row_id
-                        )
-                        continue
-                    else:
-                        event_records.append(
-                            EventLogRecord(storage_id=row_id, event_log_entry=event_record)
-                        )
-                    if limit and len(event_records) >= limit:
-                        break
-                except seven.JSONDecodeError:
-                    logging.warning("Could not parse event record id `%s`.", row_id)
+        query = (
+            self._get_run_sharded_event_records_query(event_records_filter, include_event)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .limit(batch_size)
+        )
+        for run_id in self._get_run_ids_for_event_records(event_records_filter, ascending=True):
+            last_storage_id = None
+            while True:
+                page_query = (
+                    query
+                    if last_storage_id is None
+                    else query.where(SqlEventLogStorageTable.c.id > last_storage_id)
+                )
+                with self.run_connection(run_id) as conn:
+                    results = conn.execute(page_query).fetchall()
 
-            if limit and len(event_records) >= limit:
-                break
+                if include_event:
+                    yield from _event_records_from_rows(results)
+                else:
+                    yield from _event_record_projections_from_rows(results)
 
-        return event_records[:limit]
+                if len(results) < batch_size:
+                    break
+                last_storage_id = results[-1][0]
 
     def supports_event_consumer_queries(self) -> bool:
         return False
 
     def delete_events(self, run_id: str) -> None:
-        with self.run_connection(run_id) as conn:
-            self.delete_events_for_run(conn, run_id)
+        def _delete_events():
+            with self.run_connection(run_id) as conn:
+                self.delete_events_for_run(conn, run_id)
 
-        # delete the mirrored event in the cross-run index database
-        with self.index_connection() as conn:
-            self.delete_events_for_run(conn, run_id)
+            # delete the mirrored event in the cross-run index database
+            with self.index_connection() as conn:
+                self.delete_events_for_run(conn, run_id)
+
+        self._write(INDEX_SHARD_NAME, _delete_events)
 
     def wipe(self) -> None:
+        # close the connections to the dbs before deleting them
+        self._dispose_connections()
+
         # should delete all the run-sharded dbs as well as the index db
         for filename in (
             glob.glob(os.path.join(self._base_dir, "*.db"))
@@ -382,6 +692,7 @@ def wipe(self) -> None:
             os.unlink(filename)
 
         self._initialized_dbs = set()
+        self._secondary_index_cache = {}
 
     def _delete_mirrored_events_for_asset_key(self, asset_key: AssetKey) -> None:
         with self.index_connection() as conn:
@@ -398,8 +709,82 @@ def wipe_asset(self, asset_key: AssetKey) -> None:
         # default implementation will update the event_logs in the sharded dbs, and the asset_key
         # table in the asset shard, but will not remove the mirrored event_log events in the asset
         # shard
-        super(SqliteEventLogStorage, self).wipe_asset(asset_key)
-        self._delete_mirrored_events_for_asset_key(asset_key)
+        wipe_asset = super(SqliteEventLogStorage, self).wipe_asset
+
+        def _wipe_asset():
+            wipe_asset(asset_key)
+            self._delete_mirrored_events_for_asset_key(asset_key)
+
+        self._write(INDEX_SHARD_NAME, _wipe_asset)
+
+    # in single writer mode, the pooled connections are read-only, so the remaining writes are
+    # routed through the writer of the index shard, from which the run shards are written with
+    # read-write connections
+
+    def reindex_events(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
+        reindex_events = super(SqliteEventLogStorage, self).reindex_events
+        self._write(INDEX_SHARD_NAME, lambda: reindex_events(print_fn, force))
+
+    def reindex_assets(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
+        reindex_assets = super(SqliteEventLogStorage, self).reindex_assets
+        self._write(INDEX_SHARD_NAME, lambda: reindex_assets(print_fn, force))
+
+    def run_batched_data_migration(
+        self, migration_name: str, cursor: Optional[str], batch_size: int
+    ) -> Optional[str]:
+        run_batched_data_migration = super(SqliteEventLogStorage, self).run_batched_data_migration
+        return self._write(
+            INDEX_SHARD_NAME, lambda: run_batched_data_migration(migration_name, cursor, batch_size)
+        )
+
+    def import_asset_key_rows(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        import_asset_key_rows = super(SqliteEventLogStorage, self).import_asset_key_rows
+        return self._write(INDEX_SHARD_NAME, lambda: import_asset_key_rows(rows))
+
+    def add_asset_event_tags(
+        self,
+        event_id: int,
+        event_timestamp: float,
+        asset_key: AssetKey,
+        new_tags: Mapping[str, str],
+    ) -> None:
+        add_asset_event_tags = super(SqliteEventLogStorage, self).add_asset_event_tags
+        self._write(
+            INDEX_SHARD_NAME,
+            lambda: add_asset_event_tags(event_id, event_timestamp, asset_key, new_tags),
+        )
+
+    def update_asset_cached_status_data(
+        self, asset_key: AssetKey, cache_values: "AssetStatusCacheValue"
+    ) -> None:
+        update_asset_cached_status_data = super(
+            SqliteEventLogStorage, self
+        ).update_asset_cached_status_data
+        self._write(
+            INDEX_SHARD_NAME, lambda: update_asset_cached_status_data(asset_key, cache_values)
+        )
+
+    def archive_events(self, run_id: str) -> int:
+        archive_events = super(SqliteEventLogStorage, self).archive_events
+        return self._write(INDEX_SHARD_NAME, lambda: archive_events(run_id))
+
+    def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
+        update_event_log_record = super(SqliteEventLogStorage, self).update_event_log_record
+        self._write(INDEX_SHARD_NAME, lambda: update_event_log_record(record_id, event))
+
+    def add_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> None:
+        add_dynamic_partitions = super(SqliteEventLogStorage, self).add_dynamic_partitions
+        self._write(
+            INDEX_SHARD_NAME, lambda: add_dynamic_partitions(partitions_def_name, partition_keys)
+        )
+
+    def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> None:
+        delete_dynamic_partition = super(SqliteEventLogStorage, self).delete_dynamic_partition
+        self._write(
+            INDEX_SHARD_NAME, lambda: delete_dynamic_partition(partitions_def_name, partition_key)
+        )
 
     def watch(self, run_id: str, cursor: Optional[str], callback: EventHandlerFn) -> None:
         if not self._obs:
@@ -423,6 +808,8 @@ def dispose(self) -> None:
             self._obs.stop()
             self._obs.join(timeout=15)
 
+        self._dispose_connections()
+
     def alembic_version(self) -> AlembicVersion:
         alembic_config = get_alembic_config(__file__)
         with self.index_connection() as conn:
@@ -449,7 +836,14 @@ def __init__(
         self._cb = check.callable_param(callback, "callback")
         self._log_path = event_log_storage.path_for_shard(run_id)
         self._cursor = cursor
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
+        # in single writer mode, writes land in the write-ahead log until it is checkpointed into
+        # the db file, which may not happen until the writer connection is closed
+        self._log_paths = (
+            [self._log_path, f"{self._log_path}-wal"]
+            if event_log_storage.is_single_writer
+            else [self._log_path]
+        )
+        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=self._log_paths, **kwargs)
 
     def _process_log(self) -> None:
         connection = self._event_log_storage.get_records_for_run(self._run_id, self._cursor)
@@ -472,5 +866,5 @@ def _process_log(self) -> None:
                 self._event_log_storage.end_watch(self._run_id, self._cb)
 
     def on_modified(self, event: FileSystemEvent) -> None:
-        check.invariant(event.src_path == self._log_path)
+        check.invariant(event.src_path in self._log_paths)
         self._process_log()
@@ -1,6 +1,8 @@
+import threading
 from typing import (
     TYPE_CHECKING,
     Iterable,
+    Iterator,
     Mapping,
     Optional,
     Sequence,
@@ -12,23 +14,26 @@
 
 from dagster import _check as check
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.event_api import EventHandlerFn
+from dagster._core.event_api import EventHandlerFn, EventLogRecordProjection
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import PrintFn
 
 from .base_storage import DagsterStorage
 from .event_log.base import (
+    EVENT_RECORDS_BATCH_SIZE,
     AssetRecord,
     EventLogConnection,
+    EventLogProjectionConnection,
     EventLogRecord,
     EventLogStorage,
     EventRecordsFilter,
 )
 from .runs.base import RunGroupInfo, RunStorage
+from .runs.wakeup import RunWakeupChannel
 from .schedules.base import ScheduleStorage
 
 if TYPE_CHECKING:
-    from dagster._core.definitions.events import AssetKey
+    from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
     from dagster._core.definitions.run_request import InstigatorType
     from dagster._core.events import DagsterEvent, DagsterEventType
     from dagster._core.events.log import EventLogEntry
@@ -52,6 +57,7 @@
         RunPartitionData,
         RunRecord,
         RunsFilter,
+        RunStatusRecord,
         TagBucket,
     )
     from dagster._daemon.types import DaemonHeartbeat
@@ -193,6 +199,9 @@ def from_config_value(
     def add_run(self, pipeline_run: "DagsterRun") -> "DagsterRun":
         return self._storage.run_storage.add_run(pipeline_run)
 
+    def add_runs(self, pipeline_runs: Sequence["DagsterRun"]) -> Sequence["DagsterRun"]:
+        return self._storage.run_storage.add_runs(pipeline_runs)
+
     def handle_run_event(self, run_id: str, event: "DagsterEvent") -> None:
         return self._storage.run_storage.handle_run_event(run_id, event)
 
@@ -232,6 +241,18 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    def get_run_status_records(
+        self,
+        filters: Optional["RunsFilter"] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence["RunStatusRecord"]:
+        return self._storage.run_storage.get_run_status_records(
+            filters, limit, order_by, ascending, cursor
+        )
+
     def get_run_tags(
         self,
         tag_keys: Optional[Sequence[str]] = None,
@@ -307,6 +328,18 @@ def dispose(self) -> None:
     def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
         return self._storage.run_storage.optimize_for_dagit(statement_timeout, pool_recycle)
 
+    @property
+    def supports_wakeup_notifications(self) -> bool:
+        return self._storage.run_storage.supports_wakeup_notifications
+
+    def add_wakeup_listener(
+        self, channels: Sequence[RunWakeupChannel], wakeup_event: threading.Event
+    ) -> None:
+        return self._storage.run_storage.add_wakeup_listener(channels, wakeup_event)
+
+    def remove_wakeup_listener(self, wakeup_event: threading.Event) -> None:
+        return self._storage.run_storage.remove_wakeup_listener(wakeup_event)
+
     def add_daemon_heartbeat(self, daemon_heartbeat: "DaemonHeartbeat") -> None:
         return self._storage.run_storage.add_daemon_heartbeat(daemon_heartbeat)
 
@@ -408,9 +441,15 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_events(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
+    def archive_events(self, run_id: str) -> int:
+        return self._storage.event_log_storage.archive_events(run_id)
+
     def upgrade(self) -> None:
         return self._storage.event_log_storage.upgrade()
 
@@ -433,6 +472,10 @@ def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
     def is_persistent(self) -> bool:
         return self._storage.event_log_storage.is_persistent
 
+    @property
+    def is_run_sharded(self) -> bool:
+        return self._storage.event_log_storage.is_run_sharded
+
     def dispose(self) -> None:
         return self._storage.event_log_storage.dispose()
 
@@ -444,11 +487,22 @@ def get_event_records(
         event_records_filter: Optional[EventRecordsFilter] = None,
         limit: Optional[int] = None,
         ascending: bool = False,
-    ) -> Iterable[EventLogRecord]:
+        include_event: bool = True,
+    ) -> Iterable[Union[EventLogRecord, EventLogRecordProjection]]:
         # type ignored because `get_event_records` does not accept None. Unclear which type
         # annotation is wrong.
         return self._storage.event_log_storage.get_event_records(
-            event_records_filter, limit, ascending  # type: ignore
+            event_records_filter, limit, ascending, include_event  # type: ignore
+        )
+
+    def iterate_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        batch_size: int = EVENT_RECORDS_BATCH_SIZE,
+        include_event: bool = True,
+    ) -> Iterator[Union[EventLogRecord, EventLogRecordProjection]]:
+        return self._storage.event_log_storage.iterate_event_records(
+            event_records_filter, batch_size, include_event
         )
 
     def get_asset_records(
@@ -488,6 +542,13 @@ def get_materialization_count_by_partition(
             asset_keys, after_cursor
         )
 
+    def get_latest_asset_partition_materialization_records(
+        self, asset_partitions: Sequence["AssetKeyPartitionKey"]
+    ) -> Mapping["AssetKeyPartitionKey", EventLogRecord]:
+        return self._storage.event_log_storage.get_latest_asset_partition_materialization_records(
+            asset_partitions
+        )
+
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         return self._storage.event_log_storage.get_dynamic_partitions(partitions_def_name)
 
@@ -534,8 +595,11 @@ def get_records_for_run(
         cursor: Optional[str] = None,
         of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
         limit: Optional[int] = None,
-    ) -> EventLogConnection:
-        return self._storage.event_log_storage.get_records_for_run(run_id, cursor, of_type, limit)
+        include_event: bool = True,
+    ) -> Union[EventLogConnection, EventLogProjectionConnection]:
+        return self._storage.event_log_storage.get_records_for_run(
+            run_id, cursor, of_type, limit, include_event
+        )
 
 
 class LegacyScheduleStorage(ScheduleStorage, ConfigurableClass):
@@ -592,12 +656,20 @@ def all_instigator_state(
     def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional["InstigatorState"]:
         return self._storage.schedule_storage.get_instigator_state(origin_id, selector_id)
 
+    def get_instigator_states(self, selector_ids: Sequence[str]) -> Mapping[str, "InstigatorState"]:
+        return self._storage.schedule_storage.get_instigator_states(selector_ids)
+
     def add_instigator_state(self, state: "InstigatorState") -> "InstigatorState":
         return self._storage.schedule_storage.add_instigator_state(state)
 
     def update_instigator_state(self, state: "InstigatorState") -> "InstigatorState":
         return self._storage.schedule_storage.update_instigator_state(state)
 
+    def update_instigator_states(
+        self, states: Sequence["InstigatorState"]
+    ) -> Sequence["InstigatorState"]:
+        return self._storage.schedule_storage.update_instigator_states(states)
+
     def delete_instigator_state(self, origin_id: str, selector_id: str) -> None:
         return self._storage.schedule_storage.delete_instigator_state(origin_id, selector_id)
 
@@ -629,9 +701,15 @@ def get_ticks(
     def create_tick(self, tick_data: "TickData") -> "InstigatorTick":
         return self._storage.schedule_storage.create_tick(tick_data)
 
+    def create_ticks(self, tick_datas: Sequence["TickData"]) -> Sequence["InstigatorTick"]:
+        return self._storage.schedule_storage.create_ticks(tick_datas)
+
     def update_tick(self, tick: "InstigatorTick") -> "InstigatorTick":
         return self._storage.schedule_storage.update_tick(tick)
 
+    def update_ticks(self, ticks: Sequence["InstigatorTick"]) -> Sequence["InstigatorTick"]:
+        return self._storage.schedule_storage.update_ticks(ticks)
+
     def purge_ticks(
         self,
         origin_id: str,
@@ -0,0 +1,112 @@
+"""Batched, resumable execution of the data migrations of the run and event log storages.
+
+Each batched data migration processes a bounded amount of rows per call, and returns a cursor to
+resume from, or None once it is complete. The driver below persists the cursors in the key value
+store of the run storage, so that the migrations can run online, a batch at a time, from the
+`DataMigrationDaemon` or from `dagster instance reindex --batched`, and pick up where they left
+off after an interruption. A storage only enables the secondary index built by a migration once the
+migration is complete, so reads keep using the old columns and tables until then.
+"""
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Mapping, Optional
+
+from typing_extensions import TypeAlias
+
+import dagster._check as check
+import dagster._seven as seven
+from dagster._utils import PrintFn
+
+if TYPE_CHECKING:
+    from dagster._core.instance import DagsterInstance
+
+# Called with a storage, the cursor returned by the previous batch (None for the first batch), and
+# a batch size. Returns the cursor to resume from, or None once the migration is complete.
+BatchedMigrationFn: TypeAlias = Callable[[Any, Optional[str], int], Optional[str]]
+
+DEFAULT_DATA_MIGRATION_BATCH_SIZE = 1000
+DEFAULT_DATA_MIGRATION_THROTTLE_SECONDS = 0.1
+
+BATCHED_MIGRATION_CURSOR_KEY_PREFIX = "batched_data_migration_cursor"
+
+
+def load_migration_cursor(cursor: Optional[str]) -> Dict[str, Any]:
+    return seven.json.loads(cursor) if cursor else {}
+
+
+def dump_migration_cursor(state: Mapping[str, Any]) -> str:
+    return seven.json.dumps(state)
+
+
+def _cursor_key(storage_name: str, migration_name: str) -> str:
+    return f"{BATCHED_MIGRATION_CURSOR_KEY_PREFIX}/{storage_name}/{migration_name}"
+
+
+def execute_batched_data_migrations(
+    instance: "DagsterInstance",
+    batch_size: int = DEFAULT_DATA_MIGRATION_BATCH_SIZE,
+    throttle_seconds: float = DEFAULT_DATA_MIGRATION_THROTTLE_SECONDS,
+    time_limit_seconds: Optional[float] = None,
+    print_fn: Optional[PrintFn] = None,
+) -> Iterator[None]:
+    """Run the pending data migrations of the run and event log storages of an instance, a batch
+    at a time, yielding after each batch. Progress is persisted after every batch, so that a later
+    call resumes where this one stopped.
+
+    Args:
+        instance (DagsterInstance): The instance to migrate.
+        batch_size (int): The maximum number of rows each batch processes.
+        throttle_seconds (float): How long to pause between batches, to bound the load that the
+            migrations put on the database.
+        time_limit_seconds (Optional[float]): Stop starting new batches after this many seconds.
+            Defaults to running until every migration is complete.
+        print_fn (Optional[Callable[[str], None]]): Called with progress messages.
+    """
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    check.int_param(batch_size, "batch_size")
+    check.invariant(batch_size > 0, "batch_size must be positive")
+    check.numeric_param(throttle_seconds, "throttle_seconds")
+    check.opt_numeric_param(time_limit_seconds, "time_limit_seconds")
+
+    run_storage = instance.run_storage
+    if not isinstance(run_storage, SqlRunStorage) or not run_storage.supports_kvs():
+        # there is nowhere to persist progress, and only sql storages have data migrations
+        return
+
+    storages = [("run_storage", run_storage)]
+    if isinstance(instance.event_log_storage, SqlEventLogStorage):
+        storages.append(("event_log_storage", instance.event_log_storage))
+
+    start_time = time.time()
+    for storage_name, storage in storages:
+        for migration_name in storage.get_pending_batched_data_migrations():
+            key = _cursor_key(storage_name, migration_name)
+            cursor = run_storage.kvs_get({key}).get(key) or None
+            if print_fn:
+                verb = "Resuming" if cursor else "Starting"
+                print_fn(f"{verb} batched data migration: {migration_name}")
+
+            while True:
+                if (
+                    time_limit_seconds is not None
+                    and time.time() - start_time >= time_limit_seconds
+                ):
+                    if print_fn:
+                        print_fn(
+                            f"Reached the time limit, pausing data migration: {migration_name}"
+                        )
+                    return
+
+                cursor = storage.run_batched_data_migration(migration_name, cursor, batch_size)
+                # the cursor is cleared once complete, so that rebuilding the index later starts over
+                run_storage.kvs_set({key: cursor or ""})
+                yield
+
+                if cursor is None:
+                    if print_fn:
+                        print_fn(f"Finished batched data migration: {migration_name}")
+                    break
+
+                if throttle_seconds:
+                    time.sleep(throttle_seconds)
@@ -0,0 +1,199 @@
+"""Bulk transfer of the history of an instance (its snapshots, runs, run tags, asset keys, and event
+logs) to another instance, e.g. to move from sqlite to postgres or to consolidate instances.
+
+The history is exported as a gzipped file of newline-delimited json, holding a header line followed
+by one line per chunk of table rows. Rows are read and written a chunk at a time, so neither side
+ever holds more than a chunk in memory. Importing inserts each chunk with the fastest bulk path the
+storage has (``COPY`` on Postgres, batched inserts elsewhere), skipping the runs and snapshots the
+target instance already has, and rebuilds the asset and stats indexes once at the end rather than
+per event.
+"""
+import base64
+import gzip
+import json
+from collections import defaultdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Set, Tuple
+
+import sqlalchemy as db
+
+import dagster._check as check
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._utils import PrintFn
+
+if TYPE_CHECKING:
+    from dagster._core.instance import DagsterInstance
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+BULK_TRANSFER_FORMAT_VERSION = 1
+DEFAULT_BULK_TRANSFER_CHUNK_SIZE = 10000
+
+
+def _get_transfer_tables() -> Tuple[Tuple[db.Table, ...], Tuple[db.Table, ...]]:
+    # Tables are exported in dependency order: snapshots before the runs that reference them, runs
+    # before their tags and events, and asset keys before the events that update them.
+    from dagster._core.storage.event_log.schema import AssetKeyTable, SqlEventLogStorageTable
+    from dagster._core.storage.runs.schema import RunsTable, RunTagsTable, SnapshotsTable
+
+    return (SnapshotsTable, RunsTable, RunTagsTable), (AssetKeyTable, SqlEventLogStorageTable)
+
+
+def _get_sql_storages(
+    instance: "DagsterInstance",
+) -> Tuple["SqlRunStorage", "SqlEventLogStorage"]:
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    run_storage = instance.run_storage
+    event_log_storage = instance.event_log_storage
+    if not isinstance(run_storage, SqlRunStorage) or not isinstance(
+        event_log_storage, SqlEventLogStorage
+    ):
+        raise DagsterInvariantViolationError(
+            "Bulk transfer is only supported between instances with SQL run and event log storage."
+        )
+    return run_storage, event_log_storage
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    return value
+
+
+def _decode_row(table: db.Table, row: Mapping[str, Any]) -> Dict[str, Any]:
+    decoded = {}
+    for name, value in row.items():
+        column_type = table.c[name].type
+        if value is not None and isinstance(column_type, db.DateTime):
+            value = datetime.fromisoformat(value)
+        elif value is not None and isinstance(column_type, db.LargeBinary):
+            value = base64.b64decode(value)
+        decoded[name] = value
+    return decoded
+
+
+def export_instance_history(
+    instance: "DagsterInstance",
+    output_file: str,
+    chunk_size: int = DEFAULT_BULK_TRANSFER_CHUNK_SIZE,
+    print_fn: Optional[PrintFn] = None,
+) -> Mapping[str, int]:
+    """Export the snapshots, runs, run tags, asset keys, and event logs of an instance to a gzipped
+    bulk transfer file. Returns the number of rows exported from each table.
+
+    Args:
+        instance (DagsterInstance): The instance to export.
+        output_file (str): The path of the file to write.
+        chunk_size (int): The maximum number of rows read and written at a time.
+        print_fn (Optional[Callable[[str], None]]): Called with progress messages.
+    """
+    from dagster import __version__ as dagster_version
+
+    check.str_param(output_file, "output_file")
+    check.int_param(chunk_size, "chunk_size")
+    check.invariant(chunk_size > 0, "chunk_size must be positive")
+    run_storage, event_log_storage = _get_sql_storages(instance)
+    run_storage_tables, event_log_tables = _get_transfer_tables()
+
+    row_counts: Dict[str, int] = {}
+    with gzip.open(output_file, "wt", encoding="utf-8") as file:
+        header = {"format_version": BULK_TRANSFER_FORMAT_VERSION, "version": dagster_version}
+        file.write(json.dumps(header) + "\n")
+        for storage, tables in (
+            (run_storage, run_storage_tables),
+            (event_log_storage, event_log_tables),
+        ):
+            for table in tables:
+                row_counts[table.name] = 0
+                for rows in storage.iter_export_rows(table, chunk_size):
+                    chunk = {
+                        "table": table.name,
+                        "rows": [
+                            {name: _encode_value(value) for name, value in row.items()}
+                            for row in rows
+                        ],
+                    }
+                    file.write(json.dumps(chunk) + "\n")
+                    row_counts[table.name] += len(rows)
+
+                if print_fn:
+                    print_fn(f"Exported {row_counts[table.name]} rows from {table.name}.")
+
+    return row_counts
+
+
+def import_instance_history(
+    instance: "DagsterInstance",
+    input_file: str,
+    print_fn: Optional[PrintFn] = None,
+) -> Mapping[str, int]:
+    """Import a bulk transfer file written by `export_instance_history` into an instance. Runs
+    and snapshots that already exist in the instance are skipped, along with the tags and events
+    of the skipped runs, so that the history of several instances can be consolidated into one.
+    Returns the number of rows imported into each table.
+
+    Args:
+        instance (DagsterInstance): The instance to import into.
+        input_file (str): The path of the bulk transfer file.
+        print_fn (Optional[Callable[[str], None]]): Called with progress messages.
+    """
+    from dagster._core.storage.event_log.schema import AssetKeyTable
+    from dagster._core.storage.runs.schema import RunsTable, RunTagsTable, SnapshotsTable
+
+    check.str_param(input_file, "input_file")
+    run_storage, event_log_storage = _get_sql_storages(instance)
+    run_storage_tables, event_log_tables = _get_transfer_tables()
+    tables_by_name = {table.name: table for table in run_storage_tables + event_log_tables}
+
+    # events imported after this storage id are folded into the asset and stats indexes at the end
+    after_storage_id = event_log_storage.get_maximum_record_id()
+    skipped_run_ids: Set[str] = set()
+    row_counts: Dict[str, int] = defaultdict(int)
+    with gzip.open(input_file, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline() or "{}")
+        if header.get("format_version") != BULK_TRANSFER_FORMAT_VERSION:
+            raise DagsterInvariantViolationError(
+                f"{input_file} is not a bulk transfer file written by `dagster instance export`."
+            )
+
+        for line in file:
+            chunk = json.loads(line)
+            table = tables_by_name.get(chunk["table"])
+            if table is None:
+                raise DagsterInvariantViolationError(
+                    f"Unexpected table {chunk['table']} in bulk transfer file {input_file}."
+                )
+
+            rows = [_decode_row(table, row) for row in chunk["rows"]]
+            if table is SnapshotsTable:
+                row_counts[table.name] += run_storage.import_snapshot_rows(rows)
+            elif table is RunsTable:
+                imported_run_ids = set(run_storage.import_run_rows(rows))
+                skipped_run_ids.update(
+                    row["run_id"] for row in rows if row["run_id"] not in imported_run_ids
+                )
+                row_counts[table.name] += len(imported_run_ids)
+            elif table is RunTagsTable:
+                row_counts[table.name] += run_storage.import_run_tag_rows(
+                    [row for row in rows if row["run_id"] not in skipped_run_ids]
+                )
+            elif table is AssetKeyTable:
+                row_counts[table.name] += event_log_storage.import_asset_key_rows(rows)
+            else:
+                row_counts[table.name] += event_log_storage.import_event_log_rows(
+                    [row for row in rows if row["run_id"] not in skipped_run_ids]
+                )
+
+    if print_fn:
+        for table_name in tables_by_name:
+            print_fn(f"Imported {row_counts[table_name]} rows into {table_name}.")
+        if skipped_run_ids:
+            print_fn(f"Skipped {len(skipped_run_ids)} runs that already exist in the instance.")
+        print_fn("Rebuilding asset and run stats indexes...")
+
+    event_log_storage.rebuild_indexes_after_import(after_storage_id, print_fn)
+    return dict(row_counts)
@@ -210,18 +210,29 @@ def _get_updated_status_cache(
     This method accepts the current asset status cache value, and fetches unevaluated
     records from the event log. It then updates the cache value with the new materializations.
     """
-    unevaluated_event_records = instance.get_event_records(
+    latest_storage_id = None
+    newly_materialized_partitions = set()
+    for unevaluated_materialization in instance.iterate_event_records(
         event_records_filter=EventRecordsFilter(
             event_type=DagsterEventType.ASSET_MATERIALIZATION,
             asset_key=asset_key,
             after_cursor=current_status_cache_value.latest_storage_id,
         )
-    )
+    ):
+        if not (
+            unevaluated_materialization.event_log_entry.dagster_event
+            and unevaluated_materialization.event_log_entry.dagster_event.is_step_materialization
+        ):
+            check.failed("Expected materialization event")
+        latest_storage_id = unevaluated_materialization.storage_id
+        if unevaluated_materialization.event_log_entry.dagster_event.partition:
+            newly_materialized_partitions.add(
+                unevaluated_materialization.event_log_entry.dagster_event.partition
+            )
 
-    if not unevaluated_event_records:
+    if latest_storage_id is None:
         return current_status_cache_value
 
-    latest_storage_id = max([record.storage_id for record in unevaluated_event_records])
     if not partitions_def or not isinstance(partitions_def, CACHEABLE_PARTITION_TYPES):
         return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
 
@@ -237,19 +248,6 @@ def _get_updated_status_cache(
         and current_status_cache_value.serialized_materialized_partition_subset
         else partitions_def.empty_subset()
     )
-    newly_materialized_partitions = set()
-
-    for unevaluated_materializations in unevaluated_event_records:
-        if not (
-            unevaluated_materializations.event_log_entry.dagster_event
-            and unevaluated_materializations.event_log_entry.dagster_event.is_step_materialization
-        ):
-            check.failed("Expected materialization event")
-        if unevaluated_materializations.event_log_entry.dagster_event.partition:
-            newly_materialized_partitions.add(
-                unevaluated_materializations.event_log_entry.dagster_event.partition
-            )
-
     materialized_subset = materialized_subset.with_partition_keys(
         get_validated_partition_keys(instance, partitions_def, newly_materialized_partitions)
     )
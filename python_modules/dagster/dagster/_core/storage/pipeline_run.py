@@ -38,6 +38,7 @@
 from .tags import (
     BACKFILL_ID_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     RESUME_RETRY_TAG,
     SCHEDULE_NAME_TAG,
@@ -726,6 +727,102 @@ def pipeline_run(self) -> DagsterRun:
         return self.dagster_run
 
 
+class RunStatusRecord(
+    NamedTuple(
+        "_RunStatusRecord",
+        [
+            ("storage_id", int),
+            ("run_id", str),
+            ("status", DagsterRunStatus),
+            ("tags", Mapping[str, str]),
+            ("location_name", Optional[str]),
+            ("create_timestamp", datetime),
+            ("update_timestamp", datetime),
+        ],
+    )
+):
+    """Internal projection of a run record, holding the fields needed to queue and monitor runs.
+    Unlike a :py:class:`RunRecord`, it is built from the indexed columns of the run storage, without
+    deserializing the body of the run.
+
+    Users should not invoke this class directly.
+    """
+
+    def __new__(
+        cls,
+        storage_id: int,
+        run_id: str,
+        status: DagsterRunStatus,
+        tags: Mapping[str, str],
+        location_name: Optional[str],
+        create_timestamp: datetime,
+        update_timestamp: datetime,
+    ):
+        return super(RunStatusRecord, cls).__new__(
+            cls,
+            storage_id=check.int_param(storage_id, "storage_id"),
+            run_id=check.str_param(run_id, "run_id"),
+            status=check.inst_param(status, "status", DagsterRunStatus),
+            tags=check.mapping_param(tags, "tags", key_type=str, value_type=str),
+            location_name=check.opt_str_param(location_name, "location_name"),
+            create_timestamp=check.inst_param(create_timestamp, "create_timestamp", datetime),
+            update_timestamp=check.inst_param(update_timestamp, "update_timestamp", datetime),
+        )
+
+    @staticmethod
+    def from_run_record(run_record: RunRecord) -> "RunStatusRecord":
+        dagster_run = run_record.dagster_run
+        return RunStatusRecord(
+            storage_id=run_record.storage_id,
+            run_id=dagster_run.run_id,
+            status=dagster_run.status,
+            tags=dagster_run.tags,
+            location_name=(
+                dagster_run.external_pipeline_origin.location_name
+                if dagster_run.external_pipeline_origin
+                else None
+            ),
+            create_timestamp=run_record.create_timestamp,
+            update_timestamp=run_record.update_timestamp,
+        )
+
+    @staticmethod
+    def from_storage_tags(
+        storage_id: int,
+        run_id: str,
+        status: DagsterRunStatus,
+        storage_tags: Mapping[str, str],
+        create_timestamp: datetime,
+        update_timestamp: datetime,
+    ) -> "RunStatusRecord":
+        """Builds the record from the tags of the run as stored in the run storage, which include
+        the repository label of the run (see `DagsterRun.tags_for_storage`).
+        """
+        tags = dict(storage_tags)
+        repository_label = tags.pop(REPOSITORY_LABEL_TAG, None)
+        return RunStatusRecord(
+            storage_id=storage_id,
+            run_id=run_id,
+            status=status,
+            tags=tags,
+            # the repository label is formatted as `repository_name@location_name`
+            location_name=(
+                repository_label.split("@", 1)[1]
+                if repository_label and "@" in repository_label
+                else None
+            ),
+            create_timestamp=create_timestamp,
+            update_timestamp=update_timestamp,
+        )
+
+    @property
+    def priority(self) -> int:
+        try:
+            return int(self.tags.get(PRIORITY_TAG, "0"))
+        except ValueError:
+            return 0
+
+
 @whitelist_for_serdes
 class RunPartitionData(
     NamedTuple(
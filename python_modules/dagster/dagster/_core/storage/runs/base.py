@@ -1,3 +1,4 @@
+import threading
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Iterable, Mapping, Optional, Sequence, Set, Tuple, Union
 
@@ -13,12 +14,15 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunStatusRecord,
     TagBucket,
 )
 from dagster._core.storage.sql import AlembicVersion
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._utils import PrintFn
 
+from .wakeup import RunWakeupChannel
+
 if TYPE_CHECKING:
     from dagster._core.host_representation.origin import ExternalPipelineOrigin
 
@@ -51,6 +55,16 @@ def add_run(self, pipeline_run: DagsterRun) -> DagsterRun:
             pipeline_run (PipelineRun): The run to add.
         """
 
+    def add_runs(self, pipeline_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        """Add a batch of runs to storage.
+
+        Storages that can insert many runs in a single round trip should override this.
+
+        Args:
+            pipeline_runs (Sequence[PipelineRun]): The runs to add.
+        """
+        return [self.add_run(pipeline_run) for pipeline_run in pipeline_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         """Update run storage in accordance to a pipeline run related DagsterEvent.
@@ -172,6 +186,36 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    def get_run_status_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunStatusRecord]:
+        """Return a list of run status records, which project the run records stored in the run
+        storage onto the fields needed to queue and monitor runs, sorted by the given column in
+        given order.
+
+        Args:
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            order_by (Optional[str]): Name of the column to sort by. Defaults to id.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+            cursor (Optional[str]): Only return the runs stored before the run with this run id.
+
+        Returns:
+            List[RunStatusRecord]: List of run status records stored in the run storage.
+        """
+        return [
+            RunStatusRecord.from_run_record(run_record)
+            for run_record in self.get_run_records(
+                filters=filters, limit=limit, order_by=order_by, ascending=ascending, cursor=cursor
+            )
+        ]
+
     @abstractmethod
     def get_run_tags(
         self,
@@ -357,6 +401,28 @@ def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
         """Allows for optimizing database connection / use in the context of a long lived dagit process.
         """
 
+    @property
+    def supports_wakeup_notifications(self) -> bool:
+        return False
+
+    def add_wakeup_listener(
+        self, channels: Sequence[RunWakeupChannel], wakeup_event: threading.Event
+    ) -> None:
+        """Set the given event whenever a notification is published on one of the given channels.
+        Storages that do not support wakeup notifications ignore the listener.
+
+        Args:
+            channels (Sequence[RunWakeupChannel]): The channels to listen to.
+            wakeup_event (threading.Event): The event to set.
+        """
+
+    def remove_wakeup_listener(self, wakeup_event: threading.Event) -> None:
+        """Stop setting the given event on notifications.
+
+        Args:
+            wakeup_event (threading.Event): The event passed to add_wakeup_listener.
+        """
+
     # Daemon Heartbeat Storage
     #
     # Holds heartbeats from the Dagster Daemon so that other system components can alert when it's not
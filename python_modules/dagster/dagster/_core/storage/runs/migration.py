@@ -8,6 +8,7 @@
 from typing_extensions import Final, TypeAlias
 
 import dagster._check as check
+from dagster._core.storage.migration.batched import dump_migration_cursor, load_migration_cursor
 from dagster._serdes import deserialize_as
 
 from ...execution.job_backfill import PartitionBackfill
@@ -25,6 +26,7 @@
 
 PrintFn: TypeAlias = Callable[[Any], None]
 MigrationFn: TypeAlias = Callable[[RunStorage, Optional[PrintFn]], None]
+BatchedMigrationFn: TypeAlias = Callable[[RunStorage, Optional[str], int], Optional[str]]
 
 # for `dagster instance migrate`, paired with schema changes
 REQUIRED_DATA_MIGRATIONS: Final[Mapping[str, Callable[[], MigrationFn]]] = {
@@ -36,6 +38,13 @@
 OPTIONAL_DATA_MIGRATIONS: Final[Mapping[str, Callable[[], MigrationFn]]] = {
     RUN_START_END: lambda: migrate_run_start_end,
 }
+# batched equivalents of the data migrations above, run by `execute_batched_data_migrations`
+BATCHED_DATA_MIGRATIONS: Final[Mapping[str, Callable[[], BatchedMigrationFn]]] = {
+    RUN_PARTITIONS: lambda: migrate_run_partition_batch,
+    RUN_REPO_LABEL_TAGS: lambda: migrate_run_repo_tags_batch,
+    BULK_ACTION_TYPES: lambda: migrate_bulk_actions_batch,
+    RUN_START_END: lambda: migrate_run_start_end_batch,
+}
 
 CHUNK_SIZE = 100
 
@@ -114,6 +123,24 @@ def migrate_run_partition(storage: RunStorage, print_fn: Optional[PrintFn] = Non
         storage.add_run_tags(run.run_id, run.tags)
 
 
+def migrate_run_partition_batch(
+    storage: RunStorage, cursor: Optional[str], batch_size: int
+) -> Optional[str]:
+    """
+    Batched equivalent of `migrate_run_partition`, from the most recent run to the oldest.
+    """
+    runs = storage.get_runs(
+        cursor=load_migration_cursor(cursor).get("after_run_id"), limit=batch_size
+    )
+    for run in runs:
+        if PARTITION_NAME_TAG in run.tags and PARTITION_SET_TAG in run.tags:
+            storage.add_run_tags(run.run_id, run.tags)
+
+    if len(runs) < batch_size:
+        return None
+    return dump_migration_cursor({"after_run_id": runs[-1].run_id})
+
+
 def migrate_run_start_end(storage: RunStorage, print_fn: Optional[PrintFn] = None) -> None:
     """
     Utility method that updates the start and end times of historical runs using the completed event log.
@@ -133,6 +160,24 @@ def migrate_run_start_end(storage: RunStorage, print_fn: Optional[PrintFn] = Non
         add_run_stats(storage, run_record.dagster_run.run_id)
 
 
+def migrate_run_start_end_batch(
+    storage: RunStorage, cursor: Optional[str], batch_size: int
+) -> Optional[str]:
+    """
+    Batched equivalent of `migrate_run_start_end`, from the most recent run to the oldest.
+    """
+    run_records = storage.get_run_records(
+        cursor=load_migration_cursor(cursor).get("after_run_id"), limit=batch_size
+    )
+    for run_record in run_records:
+        if run_record.dagster_run.status not in UNSTARTED_RUN_STATUSES:
+            add_run_stats(storage, run_record.dagster_run.run_id)
+
+    if len(run_records) < batch_size:
+        return None
+    return dump_migration_cursor({"after_run_id": run_records[-1].dagster_run.run_id})
+
+
 def add_run_stats(run_storage: RunStorage, run_id: str) -> None:
     from dagster._core.instance import DagsterInstance
     from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
@@ -166,39 +211,51 @@ def migrate_run_repo_tags(run_storage: RunStorage, print_fn: Optional[PrintFn] =
     if print_fn:
         print_fn("Querying run storage.")
 
+    cursor = migrate_run_repo_tags_batch(run_storage, None, CHUNK_SIZE)
+    while cursor:
+        cursor = migrate_run_repo_tags_batch(run_storage, cursor, CHUNK_SIZE)
+
+
+def migrate_run_repo_tags_batch(
+    run_storage: RunStorage, cursor: Optional[str], batch_size: int
+) -> Optional[str]:
+    """
+    Writes the repository label tag of a batch of runs that are missing it, in storage id order.
+    """
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(run_storage, SqlRunStorage):
+        return None
+
     subquery = (
         db.select([RunTagsTable.c.run_id.label("tags_run_id")])
         .where(RunTagsTable.c.key == REPOSITORY_LABEL_TAG)
         .alias("tag_subquery")
     )
-    base_query = (
+    query = (
         db.select([RunsTable.c.run_body, RunsTable.c.id])
         .select_from(
             RunsTable.join(subquery, RunsTable.c.run_id == subquery.c.tags_run_id, isouter=True)
         )
         .where(subquery.c.tags_run_id.is_(None))
         .order_by(db.asc(RunsTable.c.id))
-        .limit(CHUNK_SIZE)
+        .limit(batch_size)
     )
+    after_id = load_migration_cursor(cursor).get("after_id")
+    if after_id:
+        query = query.where(RunsTable.c.id > after_id)
 
-    cursor = None
-    has_more = True
-    while has_more:
-        if cursor:
-            query = base_query.where(RunsTable.c.id > cursor)
-        else:
-            query = base_query
+    with run_storage.connect() as conn:
+        result_proxy = conn.execute(query)
+        rows = result_proxy.fetchall()
+        result_proxy.close()
 
-        with run_storage.connect() as conn:
-            result_proxy = conn.execute(query)
-            rows = result_proxy.fetchall()
-            result_proxy.close()
+        for row in rows:
+            write_repo_tag(conn, deserialize_as(row[0], DagsterRun))
 
-            has_more = len(rows) >= CHUNK_SIZE
-            for row in rows:
-                run = deserialize_as(row[0], DagsterRun)
-                cursor = row[1]
-                write_repo_tag(conn, run)
+    if len(rows) < batch_size:
+        return None
+    return dump_migration_cursor({"after_id": rows[-1][1]})
 
 
 def write_repo_tag(conn: Connection, run: DagsterRun) -> None:
@@ -229,36 +286,49 @@ def migrate_bulk_actions(run_storage: RunStorage, print_fn: Optional[PrintFn] =
     if print_fn:
         print_fn("Querying run storage.")
 
-    base_query = (
+    cursor = migrate_bulk_actions_batch(run_storage, None, CHUNK_SIZE)
+    while cursor:
+        cursor = migrate_bulk_actions_batch(run_storage, cursor, CHUNK_SIZE)
+
+
+def migrate_bulk_actions_batch(
+    run_storage: RunStorage, cursor: Optional[str], batch_size: int
+) -> Optional[str]:
+    """
+    Writes the selector id and action type columns of a batch of bulk actions that are missing
+    them, in storage id order.
+    """
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(run_storage, SqlRunStorage):
+        return None
+
+    query = (
         db.select([BulkActionsTable.c.body, BulkActionsTable.c.id])
         .where(BulkActionsTable.c.action_type.is_(None))
         .order_by(db.asc(BulkActionsTable.c.id))
-        .limit(CHUNK_SIZE)
+        .limit(batch_size)
     )
+    after_id = load_migration_cursor(cursor).get("after_id")
+    if after_id:
+        query = query.where(BulkActionsTable.c.id > after_id)
 
-    cursor = None
-    has_more = True
-    while has_more:
-        if cursor:
-            query = base_query.where(BulkActionsTable.c.id > cursor)
-        else:
-            query = base_query
-
-        with run_storage.connect() as conn:
-            result_proxy = conn.execute(query)
-            rows = result_proxy.fetchall()
-            result_proxy.close()
-
-            has_more = len(rows) >= CHUNK_SIZE
-            for row in rows:
-                backfill = deserialize_as(row[0], PartitionBackfill)
-                storage_id = row[1]
-                conn.execute(
-                    BulkActionsTable.update()
-                    .values(
-                        selector_id=backfill.selector_id,
-                        action_type=backfill.bulk_action_type.value,
-                    )
-                    .where(BulkActionsTable.c.id == storage_id)
+    with run_storage.connect() as conn:
+        result_proxy = conn.execute(query)
+        rows = result_proxy.fetchall()
+        result_proxy.close()
+
+        for row in rows:
+            backfill = deserialize_as(row[0], PartitionBackfill)
+            conn.execute(
+                BulkActionsTable.update()
+                .values(
+                    selector_id=backfill.selector_id,
+                    action_type=backfill.bulk_action_type.value,
                 )
-                cursor = storage_id
+                .where(BulkActionsTable.c.id == row[1])
+            )
+
+    if len(rows) < batch_size:
+        return None
+    return dump_migration_cursor({"after_id": rows[-1][1]})
@@ -0,0 +1,97 @@
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple, Union
+
+import dagster._check as check
+from dagster._core.snap import ExecutionPlanSnapshot, PipelineSnapshot
+
+Snapshot = Union[PipelineSnapshot, ExecutionPlanSnapshot]
+
+# Default bound on the total serialized json size of the cached snapshots. The deserialized snapshots
+# take about twice the size of their json in memory
+DEFAULT_SNAPSHOT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+class SnapshotCacheStats(
+    NamedTuple(
+        "_SnapshotCacheStats",
+        [
+            ("hits", int),
+            ("misses", int),
+            ("evictions", int),
+            ("num_entries", int),
+            ("size_bytes", int),
+            ("max_bytes", int),
+        ],
+    )
+):
+    """Counters of a snapshot cache since it was created."""
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SnapshotCache:
+    """A thread-safe LRU cache of deserialized pipeline and execution plan snapshots, keyed by
+    snapshot id.
+
+    Snapshot ids are content hashes, so a cached snapshot never goes stale. The cache is bounded by
+    the total size of the serialized json of its entries, which is known without measuring the
+    deserialized objects and grows in proportion to them, unlike the size of the compressed bodies
+    that are stored. A snapshot larger than the whole cache is never cached.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_SNAPSHOT_CACHE_MAX_BYTES):
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Snapshot, int]]" = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, snapshot_id: str) -> Optional[Snapshot]:
+        with self._lock:
+            entry = self._entries.get(snapshot_id)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(snapshot_id)
+            return entry[0]
+
+    def put(self, snapshot_id: str, snapshot: Snapshot, size_bytes: int) -> None:
+        if size_bytes > self._max_bytes:
+            return
+
+        with self._lock:
+            existing = self._entries.pop(snapshot_id, None)
+            if existing is not None:
+                self._size_bytes -= existing[1]
+
+            self._entries[snapshot_id] = (snapshot, size_bytes)
+            self._size_bytes += size_bytes
+
+            while self._size_bytes > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def get_stats(self) -> SnapshotCacheStats:
+        with self._lock:
+            return SnapshotCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                num_entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self._max_bytes,
+            )
@@ -11,6 +11,7 @@
     ContextManager,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -43,7 +44,7 @@
     create_execution_plan_snapshot_id,
     create_pipeline_snapshot_id,
 )
-from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
+from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow, iter_table_row_chunks
 from dagster._core.storage.tags import (
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
@@ -52,8 +53,10 @@
 )
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import (
+    SerdesFormat,
     deserialize_as,
     serialize_dagster_namedtuple,
+    serialize_value,
 )
 from dagster._serdes.serdes import deserialize_json_to_dagster_namedtuple
 from dagster._seven import JSONDecodeError
@@ -67,13 +70,17 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunStatusRecord,
     TagBucket,
 )
 from .base import RunGroupInfo, RunStorage
 from .migration import (
+    BATCHED_DATA_MIGRATIONS,
+    BULK_ACTION_TYPES,
     OPTIONAL_DATA_MIGRATIONS,
     REQUIRED_DATA_MIGRATIONS,
     RUN_PARTITIONS,
+    RUN_START_END,
     MigrationFn,
 )
 from .schema import (
@@ -86,6 +93,11 @@
     SecondaryIndexMigrationTable,
     SnapshotsTable,
 )
+from .snapshot_cache import SnapshotCache, SnapshotCacheStats
+from .wakeup import RunWakeupChannel
+
+# Maximum number of values bound in a single IN clause when checking imported rows for conflicts
+IMPORT_LOOKUP_BATCH_SIZE = 500
 
 
 class SnapshotType(Enum):
@@ -96,6 +108,8 @@ class SnapshotType(Enum):
 class SqlRunStorage(RunStorage):  # pylint: disable=no-init
     """Base class for SQL based run storages."""
 
+    _snapshot_cache: Optional[SnapshotCache] = None
+
     @abstractmethod
     def connect(self) -> ContextManager[Connection]:
         """Context manager yielding a sqlalchemy.engine.Connection."""
@@ -106,6 +120,22 @@ def upgrade(self) -> None:
         out-of-date instance of the storage up to date.
         """
 
+    @property
+    def serdes_format(self) -> SerdesFormat:
+        """The format used to serialize run bodies written to this storage."""
+        instance = self._instance
+        return instance.get_serdes_format("run_storage") if instance else SerdesFormat.JSON
+
+    @property
+    def snapshot_cache(self) -> SnapshotCache:
+        """In-process cache of the deserialized snapshots read from or written to this storage."""
+        if self._snapshot_cache is None:
+            self._snapshot_cache = SnapshotCache()
+        return self._snapshot_cache
+
+    def get_snapshot_cache_stats(self) -> SnapshotCacheStats:
+        return self.snapshot_cache.get_stats()
+
     def fetchall(self, query: SqlAlchemyQuery) -> Sequence[Any]:
         with self.connect() as conn:
             result_proxy = conn.execute(query)
@@ -122,31 +152,35 @@ def fetchone(self, query: SqlAlchemyQuery) -> Optional[Any]:
 
         return row
 
-    def add_run(self, pipeline_run: DagsterRun) -> DagsterRun:
-        check.inst_param(pipeline_run, "pipeline_run", DagsterRun)
-
-        if pipeline_run.pipeline_snapshot_id and not self.has_pipeline_snapshot(
-            pipeline_run.pipeline_snapshot_id
-        ):
-            raise DagsterSnapshotDoesNotExist(
-                "Snapshot {ss_id} does not exist in run storage".format(
-                    ss_id=pipeline_run.pipeline_snapshot_id
-                )
-            )
-
+    def _get_run_row(self, pipeline_run: DagsterRun) -> Mapping[str, Any]:
         has_tags = pipeline_run.tags and len(pipeline_run.tags) > 0
         partition = pipeline_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
         partition_set = pipeline_run.tags.get(PARTITION_SET_TAG) if has_tags else None
 
-        runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=pipeline_run.run_id,
             pipeline_name=pipeline_run.pipeline_name,
             status=pipeline_run.status.value,
-            run_body=serialize_dagster_namedtuple(pipeline_run),
+            run_body=serialize_value(pipeline_run, serdes_format=self.serdes_format),
             snapshot_id=pipeline_run.pipeline_snapshot_id,
             partition=partition,
             partition_set=partition_set,
         )
+
+    def _check_pipeline_snapshot_exists(self, pipeline_snapshot_id: Optional[str]) -> None:
+        if pipeline_snapshot_id and not self.has_pipeline_snapshot(pipeline_snapshot_id):
+            raise DagsterSnapshotDoesNotExist(
+                "Snapshot {ss_id} does not exist in run storage".format(ss_id=pipeline_snapshot_id)
+            )
+
+    def add_run(self, pipeline_run: DagsterRun) -> DagsterRun:
+        check.inst_param(pipeline_run, "pipeline_run", DagsterRun)
+
+        self._check_pipeline_snapshot_exists(pipeline_run.pipeline_snapshot_id)
+
+        runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._get_run_row(pipeline_run)
+        )
         with self.connect() as conn:
             try:
                 conn.execute(runs_insert)
@@ -163,8 +197,48 @@ def add_run(self, pipeline_run: DagsterRun) -> DagsterRun:
                     ],
                 )
 
+            if pipeline_run.status == DagsterRunStatus.QUEUED:
+                self._publish_wakeup(conn, RunWakeupChannel.RUN_QUEUED)
+
         return pipeline_run
 
+    def add_runs(self, pipeline_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        check.sequence_param(pipeline_runs, "pipeline_runs", of_type=DagsterRun)
+        if not pipeline_runs:
+            return []
+
+        # runs created together usually share a snapshot, so each one is only checked once
+        for pipeline_snapshot_id in {
+            pipeline_run.pipeline_snapshot_id for pipeline_run in pipeline_runs
+        }:
+            self._check_pipeline_snapshot_exists(pipeline_snapshot_id)
+
+        with self.connect() as conn:
+            try:
+                conn.execute(
+                    RunsTable.insert(),  # pylint: disable=no-value-for-parameter
+                    [self._get_run_row(pipeline_run) for pipeline_run in pipeline_runs],
+                )
+            except db_exc.IntegrityError as exc:
+                raise DagsterRunAlreadyExists from exc
+
+            tags_to_insert = [
+                dict(run_id=pipeline_run.run_id, key=k, value=v)
+                for pipeline_run in pipeline_runs
+                for k, v in pipeline_run.tags_for_storage().items()
+            ]
+            if tags_to_insert:
+                conn.execute(
+                    RunTagsTable.insert(), tags_to_insert  # pylint: disable=no-value-for-parameter
+                )
+
+            if any(
+                pipeline_run.status == DagsterRunStatus.QUEUED for pipeline_run in pipeline_runs
+            ):
+                self._publish_wakeup(conn, RunWakeupChannel.RUN_QUEUED)
+
+        return list(pipeline_runs)
+
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         check.str_param(run_id, "run_id")
         check.inst_param(event, "event", DagsterEvent)
@@ -202,12 +276,25 @@ def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
                 RunsTable.update()  # pylint: disable=no-value-for-parameter
                 .where(RunsTable.c.run_id == run_id)
                 .values(
-                    run_body=serialize_dagster_namedtuple(run.with_status(new_pipeline_status)),
+                    run_body=serialize_value(
+                        run.with_status(new_pipeline_status), serdes_format=self.serdes_format
+                    ),
                     status=new_pipeline_status.value,
                     update_timestamp=now,
                     **kwargs,
                 )
             )
+            self._publish_wakeup(
+                conn,
+                RunWakeupChannel.RUN_QUEUED
+                if new_pipeline_status == DagsterRunStatus.QUEUED
+                else RunWakeupChannel.RUN_STATUS_CHANGED,
+            )
+
+    def _publish_wakeup(self, conn: Connection, channel: RunWakeupChannel) -> None:
+        """Publishes a wakeup notification on the connection of the write that caused it. Storages
+        that support wakeup notifications override this.
+        """
 
     def _row_to_run(self, row: SqlAlchemyRow) -> DagsterRun:
         run = deserialize_as(row["run_body"], DagsterRun)
@@ -526,6 +613,53 @@ def get_run_records(
             for row in rows
         ]
 
+    def get_run_status_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunStatusRecord]:
+        filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
+        check.opt_int_param(limit, "limit")
+
+        runs_query = self._runs_query(
+            filters=filters,
+            limit=limit,
+            columns=["id", "run_id", "status", "create_timestamp", "update_timestamp"],
+            order_by=order_by,
+            ascending=ascending,
+            cursor=cursor,
+        )
+        rows = self.fetchall(runs_query)
+        if not rows:
+            return []
+
+        # fetch the tags of all the runs in a single query, joining against the runs query rather
+        # than binding every run id as a parameter
+        runs_subquery = runs_query.alias("runs_subquery")
+        tags_query = db.select(
+            [RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value]
+        ).select_from(
+            RunTagsTable.join(runs_subquery, RunTagsTable.c.run_id == runs_subquery.c.run_id)
+        )
+        tags_by_run_id: Dict[str, Dict[str, str]] = defaultdict(dict)
+        for run_id, key, value in self.fetchall(tags_query):
+            tags_by_run_id[run_id][key] = value
+
+        return [
+            RunStatusRecord.from_storage_tags(
+                storage_id=check.int_param(row["id"], "id"),
+                run_id=row["run_id"],
+                status=DagsterRunStatus(row["status"]),
+                storage_tags=tags_by_run_id[row["run_id"]],
+                create_timestamp=check.inst(row["create_timestamp"], datetime),
+                update_timestamp=check.inst(row["update_timestamp"], datetime),
+            )
+            for row in rows
+        ]
+
     def get_run_tags(
         self,
         tag_keys: Optional[Sequence[str]] = None,
@@ -578,8 +712,9 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
                 RunsTable.update()  # pylint: disable=no-value-for-parameter
                 .where(RunsTable.c.run_id == run_id)
                 .values(
-                    run_body=serialize_dagster_namedtuple(
-                        run.with_tags(merge_dicts(current_tags, new_tags))
+                    run_body=serialize_value(
+                        run.with_tags(merge_dicts(current_tags, new_tags)),
+                        serdes_format=self.serdes_format,
                     ),
                     partition=partition,
                     partition_set=partition_set,
@@ -860,18 +995,20 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
         check.not_none_param(snapshot_obj, "snapshot_obj")
         check.inst_param(snapshot_type, "snapshot_type", SnapshotType)
 
+        snapshot_json = serialize_dagster_namedtuple(snapshot_obj)
+        snapshot_body = zlib.compress(snapshot_json.encode("utf-8"))
         with self.connect() as conn:
             snapshot_insert = (
                 SnapshotsTable.insert().values(  # pylint: disable=no-value-for-parameter
                     snapshot_id=snapshot_id,
-                    snapshot_body=zlib.compress(
-                        serialize_dagster_namedtuple(snapshot_obj).encode("utf-8")
-                    ),
+                    snapshot_body=snapshot_body,
                     snapshot_type=snapshot_type.value,
                 )
             )
             conn.execute(snapshot_insert)
-            return snapshot_id
+
+        self.snapshot_cache.put(snapshot_id, snapshot_obj, len(snapshot_json))
+        return snapshot_id
 
     def get_run_storage_id(self) -> str:
         query = db.select([InstanceInfo.c.run_storage_id])
@@ -894,13 +1031,100 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str) -> Optional[PipelineSnapshot]:
+        # snapshot ids are content hashes, so cached snapshots never need to be invalidated
+        cached = self.snapshot_cache.get(snapshot_id)
+        if cached is not None:
+            return cached  # type: ignore
+
         query = db.select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
+        if not row:
+            return None
+
+        snapshot_json = _defensively_decode_snapshot_body(logging, row)  # type: ignore
+        if snapshot_json is None:
+            return None
+
+        snapshot = _defensively_deserialize_snapshot(logging, snapshot_json)  # type: ignore
+        if snapshot is not None:
+            self.snapshot_cache.put(snapshot_id, snapshot, len(snapshot_json))
+        return snapshot
+
+    def iter_export_rows(
+        self, table: db.Table, chunk_size: int
+    ) -> Iterator[Sequence[Mapping[str, Any]]]:
+        """Yields the rows of one of the runs, run_tags, or snapshots tables in chunks, for bulk
+        transfer to another instance.
+        """
+        check.invariant(
+            table in (RunsTable, RunTagsTable, SnapshotsTable),
+            f"Cannot export rows of table {table.name} from run storage.",
+        )
+        check.int_param(chunk_size, "chunk_size")
+        with self.connect() as conn:
+            yield from iter_table_row_chunks(conn, table, chunk_size)
 
-        return defensively_unpack_pipeline_snapshot_query(logging, row) if row else None  # type: ignore
+    def _bulk_insert_rows(
+        self, conn: Connection, table: db.Table, rows: Sequence[Mapping[str, Any]]
+    ) -> None:
+        """Insert a chunk of exported rows into a table. Uses a single executemany, which drivers
+        that support it (e.g. mysql) send as multi-row inserts. Overridden by storages that have a
+        faster bulk loading path, like ``COPY`` on Postgres.
+        """
+        conn.execute(table.insert(), rows)  # pylint: disable=no-value-for-parameter
+
+    def _select_existing_values(
+        self, conn: Connection, column: db.Column, values: Sequence[str]
+    ) -> Set[str]:
+        existing: Set[str] = set()
+        for i in range(0, len(values), IMPORT_LOOKUP_BATCH_SIZE):
+            batch = values[i : i + IMPORT_LOOKUP_BATCH_SIZE]
+            existing.update(
+                row[0] for row in conn.execute(db.select([column]).where(column.in_(batch)))
+            )
+        return existing
+
+    def import_snapshot_rows(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        """Insert a chunk of exported snapshot rows, skipping snapshots that already exist.
+        Returns the number of rows inserted.
+        """
+        check.sequence_param(rows, "rows", of_type=dict)
+        with self.connect() as conn:
+            existing = self._select_existing_values(
+                conn, SnapshotsTable.c.snapshot_id, [row["snapshot_id"] for row in rows]
+            )
+            to_insert = [row for row in rows if row["snapshot_id"] not in existing]
+            if to_insert:
+                with conn.begin():
+                    self._bulk_insert_rows(conn, SnapshotsTable, to_insert)
+        return len(to_insert)
+
+    def import_run_rows(self, rows: Sequence[Mapping[str, Any]]) -> Sequence[str]:
+        """Insert a chunk of exported run rows, skipping runs that already exist. Returns the ids
+        of the runs inserted, so that the tags and events of skipped runs can be skipped as well.
+        """
+        check.sequence_param(rows, "rows", of_type=dict)
+        with self.connect() as conn:
+            existing = self._select_existing_values(
+                conn, RunsTable.c.run_id, [row["run_id"] for row in rows]
+            )
+            to_insert = [row for row in rows if row["run_id"] not in existing]
+            if to_insert:
+                with conn.begin():
+                    self._bulk_insert_rows(conn, RunsTable, to_insert)
+        return [row["run_id"] for row in to_insert]
+
+    def import_run_tag_rows(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        """Insert a chunk of exported run tag rows. Returns the number of rows inserted."""
+        check.sequence_param(rows, "rows", of_type=dict)
+        if rows:
+            with self.connect() as conn:
+                with conn.begin():
+                    self._bulk_insert_rows(conn, RunTagsTable, rows)
+        return len(rows)
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -995,6 +1219,41 @@ def migrate(self, print_fn: Optional[PrintFn] = None, force_rebuild_all: bool =
     def optimize(self, print_fn: Optional[PrintFn] = None, force_rebuild_all: bool = False) -> None:
         self._execute_data_migrations(OPTIONAL_DATA_MIGRATIONS, print_fn, force_rebuild_all)
 
+    def get_pending_batched_data_migrations(self) -> Sequence[str]:
+        """Returns the names of the data migrations that can be run a batch at a time with
+        `run_batched_data_migration`, and whose indexes have not been built yet. Migrations that
+        depend on columns missing from the schema are left out until `dagster instance migrate`
+        adds them.
+        """
+        pending = []
+        for migration_name in BATCHED_DATA_MIGRATIONS:
+            if self.has_built_index(migration_name):
+                continue
+            if migration_name == RUN_START_END and not self.has_run_stats_index_cols():
+                continue
+            if migration_name == BULK_ACTION_TYPES and not self.has_bulk_actions_selector_cols():
+                continue
+            pending.append(migration_name)
+        return pending
+
+    def run_batched_data_migration(
+        self, migration_name: str, cursor: Optional[str], batch_size: int
+    ) -> Optional[str]:
+        """Runs a single batch of a data migration, resuming from the cursor returned by the
+        previous batch. Returns the cursor to resume from, or None once the migration is complete,
+        at which point its index is marked as built and reads switch over to it.
+        """
+        check.invariant(
+            migration_name in BATCHED_DATA_MIGRATIONS,
+            f"Unknown batched data migration {migration_name}",
+        )
+        check.opt_str_param(cursor, "cursor")
+        check.int_param(batch_size, "batch_size")
+        next_cursor = BATCHED_DATA_MIGRATIONS[migration_name]()(self, cursor, batch_size)
+        if next_cursor is None:
+            self.mark_index_built(migration_name)
+        return next_cursor
+
     def has_built_index(self, migration_name: str) -> bool:
         query = (
             db.select([1])
@@ -1081,6 +1340,8 @@ def wipe(self) -> None:
             conn.execute(DaemonHeartbeatsTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(BulkActionsTable.delete())  # pylint: disable=no-value-for-parameter
 
+        self.snapshot_cache.clear()
+
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
@@ -1130,6 +1391,7 @@ def add_backfill(self, partition_backfill: PartitionBackfill) -> None:
             conn.execute(
                 BulkActionsTable.insert().values(**values)  # pylint: disable=no-value-for-parameter
             )
+            self._publish_wakeup(conn, RunWakeupChannel.BACKFILL_CREATED)
 
     def update_backfill(self, partition_backfill: PartitionBackfill) -> None:
         check.inst_param(partition_backfill, "partition_backfill", PartitionBackfill)
@@ -1182,7 +1444,9 @@ def replace_job_origin(self, run: DagsterRun, job_origin: ExternalPipelineOrigin
                 RunsTable.update()  # pylint: disable=no-value-for-parameter
                 .where(RunsTable.c.run_id == run.run_id)
                 .values(
-                    run_body=serialize_dagster_namedtuple(run.with_job_origin(job_origin)),
+                    run_body=serialize_value(
+                        run.with_job_origin(job_origin), serdes_format=self.serdes_format
+                    ),
                 )
             )
             conn.execute(
@@ -1199,31 +1463,45 @@ def replace_job_origin(self, run: DagsterRun, job_origin: ExternalPipelineOrigin
 def defensively_unpack_pipeline_snapshot_query(
     logger: logging.Logger, row: SqlAlchemyRow
 ) -> Optional[PipelineSnapshot]:
+    snapshot_json = _defensively_decode_snapshot_body(logger, row)
+    if snapshot_json is None:
+        return None
+    return _defensively_deserialize_snapshot(logger, snapshot_json)
+
+
+def _warn_snapshot_unpack(logger: logging.Logger, msg: str) -> None:
+    logger.warning("get-pipeline-snapshot: {msg}".format(msg=msg))
+
+
+def _defensively_decode_snapshot_body(logger: logging.Logger, row: SqlAlchemyRow) -> Optional[str]:
     # no checking here because sqlalchemy returns a special
     # row proxy and don't want to instance check on an internal
     # implementation detail
 
-    def _warn(msg: str) -> None:
-        logger.warning("get-pipeline-snapshot: {msg}".format(msg=msg))
-
     if not isinstance(row[0], bytes):
-        _warn("First entry in row is not a binary type.")
+        _warn_snapshot_unpack(logger, "First entry in row is not a binary type.")
         return None
 
     try:
         uncompressed_bytes = zlib.decompress(row[0])
     except zlib.error:
-        _warn("Could not decompress bytes stored in snapshot table.")
+        _warn_snapshot_unpack(logger, "Could not decompress bytes stored in snapshot table.")
         return None
 
     try:
-        decoded_str = uncompressed_bytes.decode("utf-8")
+        return uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
-        _warn("Could not unicode decode decompressed bytes stored in snapshot table.")
+        _warn_snapshot_unpack(
+            logger, "Could not unicode decode decompressed bytes stored in snapshot table."
+        )
         return None
 
+
+def _defensively_deserialize_snapshot(
+    logger: logging.Logger, snapshot_json: str
+) -> Optional[PipelineSnapshot]:
     try:
-        return deserialize_json_to_dagster_namedtuple(decoded_str)  # type: ignore
+        return deserialize_json_to_dagster_namedtuple(snapshot_json)  # type: ignore
     except JSONDecodeError:
-        _warn("Could not parse json in snapshot table.")
+        _warn_snapshot_unpack(logger, "Could not parse json in snapshot table.")
         return None
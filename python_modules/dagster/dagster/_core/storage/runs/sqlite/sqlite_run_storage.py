@@ -1,6 +1,16 @@
 import os
+import threading
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Iterator, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 from urllib.parse import urljoin, urlparse
 
 import sqlalchemy as db
@@ -8,10 +18,15 @@
 from sqlalchemy.pool import NullPool
 
 from dagster import (
+    Field,
     StringSource,
     _check as check,
 )
 from dagster._config.config_schema import UserConfigSchema
+from dagster._core.events import DagsterEvent
+from dagster._core.execution.backfill import PartitionBackfill
+from dagster._core.host_representation.origin import ExternalPipelineOrigin
+from dagster._core.storage.pipeline_run import DagsterRun
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -21,17 +36,25 @@
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster._core.storage.sqlite import create_db_conn_string, get_sqlite_version
+from dagster._core.storage.sqlite import (
+    SqliteWriter,
+    create_db_conn_string,
+    create_pooled_sqlite_engine,
+    get_sqlite_version,
+)
+from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
-from dagster._utils import mkdir_p
+from dagster._utils import PrintFn, mkdir_p
 
 from ..schema import InstanceInfo, RunsTable, RunStorageSqlMetadata, RunTagsTable
-from ..sql_run_storage import SqlRunStorage
+from ..sql_run_storage import SnapshotType, SqlRunStorage
 
 if TYPE_CHECKING:
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
 MINIMUM_SQLITE_BUCKET_VERSION = [3, 25, 0]
 
+T = TypeVar("T")
+
 
 class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
     """SQLite-backed run storage.
@@ -54,12 +77,25 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
             base_dir: /path/to/dir
 
     The ``base_dir`` param tells the run storage where on disk to store the database.
+
+    Setting the optional ``single_writer`` param routes the run writes of each process through a
+    single connection, owned by a writer thread that commits concurrent writes in batches, and
+    serves reads from read-only pooled connections.
     """
 
-    def __init__(self, conn_string: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        conn_string: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        single_writer: bool = False,
+    ):
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._single_writer = check.bool_param(single_writer, "single_writer")
+        self._engine = None
+        self._writer = None
+        self._lock = threading.Lock()
         super().__init__()
 
     @property
@@ -68,7 +104,7 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return {"base_dir": StringSource}
+        return {"base_dir": StringSource, "single_writer": Field(bool, is_required=False)}
 
     @staticmethod
     def from_config_value(
@@ -78,7 +114,10 @@ def from_config_value(
 
     @classmethod
     def from_local(
-        cls, base_dir: str, inst_data: Optional[ConfigurableClassData] = None
+        cls,
+        base_dir: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        single_writer: bool = False,
     ) -> "SqliteRunStorage":
         check.str_param(base_dir, "base_dir")
         mkdir_p(base_dir)
@@ -99,7 +138,7 @@ def from_local(
             if "instance_info" not in table_names:
                 InstanceInfo.create(engine)
 
-        run_storage = cls(conn_string, inst_data)
+        run_storage = cls(conn_string, inst_data, single_writer=single_writer)
 
         if should_mark_indexes:
             run_storage.migrate()
@@ -109,6 +148,17 @@ def from_local(
 
     @contextmanager
     def connect(self) -> Iterator[Connection]:
+        if self._single_writer:
+            if self._writer and self._writer.in_writer_thread:
+                yield self._writer.connection
+            else:
+                with self._lock:
+                    if self._engine is None:
+                        self._engine = create_pooled_sqlite_engine(self._conn_string)
+                with self._engine.connect() as conn:
+                    yield conn
+            return
+
         engine = create_engine(self._conn_string, poolclass=NullPool)
         conn = engine.connect()
         try:
@@ -116,15 +166,118 @@ def connect(self) -> Iterator[Connection]:
         finally:
             conn.close()
 
+    def _write(self, fn: Callable[[], T]) -> T:
+        """Runs a write. In single writer mode, the write is run by the writer thread, where
+        connections to the db use the writer connection.
+        """
+        if not self._single_writer:
+            return fn()
+
+        with self._lock:
+            if self._writer is None:
+                self._writer = SqliteWriter(self._conn_string)
+        return self._writer.submit(lambda _conn: fn())
+
+    def add_run(self, pipeline_run: DagsterRun) -> DagsterRun:
+        add_run = super(SqliteRunStorage, self).add_run
+        return self._write(lambda: add_run(pipeline_run))
+
+    def add_runs(self, pipeline_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        add_runs = super(SqliteRunStorage, self).add_runs
+        return self._write(lambda: add_runs(pipeline_runs))
+
+    def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
+        handle_run_event = super(SqliteRunStorage, self).handle_run_event
+        self._write(lambda: handle_run_event(run_id, event))
+
+    def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
+        add_run_tags = super(SqliteRunStorage, self).add_run_tags
+        self._write(lambda: add_run_tags(run_id, new_tags))
+
+    # the remaining writes are routed through the writer as well, since the pooled connections are
+    # read-only
+
+    def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
+        add_snapshot = super(SqliteRunStorage, self)._add_snapshot
+        return self._write(lambda: add_snapshot(snapshot_id, snapshot_obj, snapshot_type))
+
+    def get_run_storage_id(self) -> str:
+        # inserts the id on first use
+        return self._write(super(SqliteRunStorage, self).get_run_storage_id)
+
+    def import_snapshot_rows(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        import_snapshot_rows = super(SqliteRunStorage, self).import_snapshot_rows
+        return self._write(lambda: import_snapshot_rows(rows))
+
+    def import_run_rows(self, rows: Sequence[Mapping[str, Any]]) -> Sequence[str]:
+        import_run_rows = super(SqliteRunStorage, self).import_run_rows
+        return self._write(lambda: import_run_rows(rows))
+
+    def import_run_tag_rows(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        import_run_tag_rows = super(SqliteRunStorage, self).import_run_tag_rows
+        return self._write(lambda: import_run_tag_rows(rows))
+
+    def migrate(self, print_fn: Optional[PrintFn] = None, force_rebuild_all: bool = False) -> None:
+        migrate = super(SqliteRunStorage, self).migrate
+        self._write(lambda: migrate(print_fn, force_rebuild_all))
+
+    def optimize(self, print_fn: Optional[PrintFn] = None, force_rebuild_all: bool = False) -> None:
+        optimize = super(SqliteRunStorage, self).optimize
+        self._write(lambda: optimize(print_fn, force_rebuild_all))
+
+    def run_batched_data_migration(
+        self, migration_name: str, cursor: Optional[str], batch_size: int
+    ) -> Optional[str]:
+        run_batched_data_migration = super(SqliteRunStorage, self).run_batched_data_migration
+        return self._write(lambda: run_batched_data_migration(migration_name, cursor, batch_size))
+
+    def mark_index_built(self, migration_name: str) -> None:
+        mark_index_built = super(SqliteRunStorage, self).mark_index_built
+        self._write(lambda: mark_index_built(migration_name))
+
+    def add_daemon_heartbeat(self, daemon_heartbeat: DaemonHeartbeat) -> None:
+        add_daemon_heartbeat = super(SqliteRunStorage, self).add_daemon_heartbeat
+        self._write(lambda: add_daemon_heartbeat(daemon_heartbeat))
+
+    def wipe(self) -> None:
+        self._write(super(SqliteRunStorage, self).wipe)
+
+    def wipe_daemon_heartbeats(self) -> None:
+        self._write(super(SqliteRunStorage, self).wipe_daemon_heartbeats)
+
+    def add_backfill(self, partition_backfill: PartitionBackfill) -> None:
+        add_backfill = super(SqliteRunStorage, self).add_backfill
+        self._write(lambda: add_backfill(partition_backfill))
+
+    def update_backfill(self, partition_backfill: PartitionBackfill) -> None:
+        update_backfill = super(SqliteRunStorage, self).update_backfill
+        self._write(lambda: update_backfill(partition_backfill))
+
+    def kvs_set(self, pairs: Mapping[str, str]) -> None:
+        kvs_set = super(SqliteRunStorage, self).kvs_set
+        self._write(lambda: kvs_set(pairs))
+
+    def replace_job_origin(self, run: DagsterRun, job_origin: ExternalPipelineOrigin) -> None:
+        replace_job_origin = super(SqliteRunStorage, self).replace_job_origin
+        self._write(lambda: replace_job_origin(run, job_origin))
+
     def _alembic_upgrade(self, rev: str = "head") -> None:
         alembic_config = get_alembic_config(__file__)
-        with self.connect() as conn:
-            run_alembic_upgrade(alembic_config, conn, rev=rev)
+
+        def _upgrade():
+            with self.connect() as conn:
+                run_alembic_upgrade(alembic_config, conn, rev=rev)
+
+        self._write(_upgrade)
 
     def _alembic_downgrade(self, rev: str = "head") -> None:
         alembic_config = get_alembic_config(__file__)
-        with self.connect() as conn:
-            run_alembic_downgrade(alembic_config, conn, rev=rev)
+
+        def _downgrade():
+            with self.connect() as conn:
+                run_alembic_downgrade(alembic_config, conn, rev=rev)
+
+        self._write(_downgrade)
 
     @property
     def supports_bucket_queries(self) -> bool:
@@ -169,11 +322,21 @@ def delete_run(self, run_id: str) -> None:
         check.str_param(run_id, "run_id")
         remove_tags = db.delete(RunTagsTable).where(RunTagsTable.c.run_id == run_id)
         remove_run = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
-        with self.connect() as conn:
-            conn.execute(remove_tags)
-            conn.execute(remove_run)
+
+        def _delete_run():
+            with self.connect() as conn:
+                conn.execute(remove_tags)
+                conn.execute(remove_run)
+
+        self._write(_delete_run)
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
             return check_alembic_revision(alembic_config, conn)
+
+    def dispose(self) -> None:
+        if self._writer:
+            self._writer.dispose()
+        if self._engine:
+            self._engine.dispose()
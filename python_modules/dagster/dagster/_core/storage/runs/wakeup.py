@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class RunWakeupChannel(Enum):
+    """Notification channels that daemons can subscribe to in order to start their next iteration
+    as soon as there is new work, rather than after their polling interval.
+    """
+
+    RUN_QUEUED = "dagster_run_queued"
+    RUN_STATUS_CHANGED = "dagster_run_status_changed"
+    BACKFILL_CREATED = "dagster_backfill_created"
@@ -44,6 +44,20 @@ def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional[Ins
             selector_id (str): The logical instigator identifier
         """
 
+    def get_instigator_states(self, selector_ids: Sequence[str]) -> Mapping[str, InstigatorState]:
+        """Return the instigator states for the given logical instigator identifiers, keyed by
+        selector id. Instigators without a stored state are omitted.
+
+        Args:
+            selector_ids (Sequence[str]): The logical instigator identifiers
+        """
+        selector_id_set = set(selector_ids)
+        return {
+            state.selector_id: state
+            for state in self.all_instigator_state()
+            if state.selector_id in selector_id_set
+        }
+
     @abc.abstractmethod
     def add_instigator_state(self, state: InstigatorState) -> InstigatorState:
         """Add an instigator state to storage.
@@ -60,6 +74,16 @@ def update_instigator_state(self, state: InstigatorState) -> InstigatorState:
             state (InstigatorState): The state to update
         """
 
+    def update_instigator_states(
+        self, states: Sequence[InstigatorState]
+    ) -> Sequence[InstigatorState]:
+        """Update a batch of instigator states in storage.
+
+        Args:
+            states (Sequence[InstigatorState]): The states to update
+        """
+        return [self.update_instigator_state(state) for state in states]
+
     @abc.abstractmethod
     def delete_instigator_state(self, origin_id: str, selector_id: str) -> None:
         """Delete a state in storage.
@@ -106,6 +130,14 @@ def create_tick(self, tick_data: TickData) -> InstigatorTick:
             tick_data (TickData): The tick to add
         """
 
+    def create_ticks(self, tick_datas: Sequence[TickData]) -> Sequence[InstigatorTick]:
+        """Add a batch of ticks to storage, returning them in the given order.
+
+        Args:
+            tick_datas (Sequence[TickData]): The ticks to add
+        """
+        return [self.create_tick(tick_data) for tick_data in tick_datas]
+
     @abc.abstractmethod
     def update_tick(self, tick: InstigatorTick) -> InstigatorTick:
         """Update a tick already in storage.
@@ -114,6 +146,14 @@ def update_tick(self, tick: InstigatorTick) -> InstigatorTick:
             tick (InstigatorTick): The tick to update
         """
 
+    def update_ticks(self, ticks: Sequence[InstigatorTick]) -> Sequence[InstigatorTick]:
+        """Update a batch of ticks already in storage.
+
+        Args:
+            ticks (Sequence[InstigatorTick]): The ticks to update
+        """
+        return [self.update_tick(tick) for tick in ticks]
+
     @abc.abstractmethod
     def purge_ticks(
         self,
@@ -2,9 +2,11 @@
 from collections import defaultdict
 from datetime import datetime
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     ContextManager,
+    Dict,
     Iterable,
     Mapping,
     Optional,
@@ -27,7 +29,11 @@
     TickStatus,
 )
 from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
-from dagster._serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster._serdes import (
+    SerdesFormat,
+    deserialize_json_to_dagster_namedtuple,
+    serialize_value,
+)
 from dagster._utils import PrintFn, utc_datetime_from_timestamp
 
 from .base import ScheduleStorage
@@ -39,14 +45,27 @@
 )
 from .schema import InstigatorsTable, JobTable, JobTickTable, SecondaryIndexMigrationTable
 
+# Maximum number of selector ids bound into a single IN clause, which stays within the bound
+# variable limits of every supported database
+SELECTOR_ID_BATCH_SIZE = 500
+
 
 class SqlScheduleStorage(ScheduleStorage):
     """Base class for SQL backed schedule storage."""
 
+    # the instigators table is never dropped once created, so only a positive check is cached
+    _has_instigators_table_cache: bool = False
+
     @abstractmethod
     def connect(self) -> ContextManager[Connection]:
         """Context manager yielding a sqlalchemy.engine.Connection."""
 
+    @property
+    def serdes_format(self) -> SerdesFormat:
+        """The format used to serialize instigator states and ticks written to this storage."""
+        instance = self._instance
+        return instance.get_serdes_format("schedule_storage") if instance else SerdesFormat.JSON
+
     def execute(self, query: SqlAlchemyQuery) -> Sequence[SqlAlchemyRow]:
         with self.connect() as conn:
             result_proxy = conn.execute(query)
@@ -104,6 +123,28 @@ def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional[Ins
         rows = self.execute(query)
         return cast(InstigatorState, self._deserialize_rows(rows[:1])[0]) if len(rows) else None
 
+    def get_instigator_states(self, selector_ids: Sequence[str]) -> Mapping[str, InstigatorState]:
+        check.sequence_param(selector_ids, "selector_ids", of_type=str)
+
+        if not (self.has_instigators_table() and self.has_built_index(SCHEDULE_JOBS_SELECTOR_ID)):
+            return super().get_instigator_states(selector_ids)
+
+        states: Dict[str, InstigatorState] = {}
+        for start in range(0, len(selector_ids), SELECTOR_ID_BATCH_SIZE):
+            query = (
+                db.select([InstigatorsTable.c.instigator_body])
+                .select_from(InstigatorsTable)
+                .where(
+                    InstigatorsTable.c.selector_id.in_(
+                        selector_ids[start : start + SELECTOR_ID_BATCH_SIZE]
+                    )
+                )
+            )
+            for state in self._deserialize_rows(self.execute(query)):
+                state = cast(InstigatorState, state)
+                states[state.selector_id] = state
+        return states
+
     def _has_instigator_state_by_selector(self, selector_id: str) -> bool:
         check.str_param(selector_id, "selector_id")
 
@@ -125,7 +166,7 @@ def _add_or_update_instigators_table(self, conn: Connection, state: InstigatorSt
                     repository_selector_id=state.repository_selector_id,
                     status=state.status.value,
                     instigator_type=state.instigator_type.value,
-                    instigator_body=serialize_dagster_namedtuple(state),
+                    instigator_body=serialize_value(state, serdes_format=self.serdes_format),
                 )
             )
         except db_exc.IntegrityError:
@@ -135,7 +176,7 @@ def _add_or_update_instigators_table(self, conn: Connection, state: InstigatorSt
                 .values(
                     status=state.status.value,
                     instigator_type=state.instigator_type.value,
-                    instigator_body=serialize_dagster_namedtuple(state),
+                    instigator_body=serialize_value(state, serdes_format=self.serdes_format),
                     update_timestamp=pendulum.now("UTC"),
                 )
             )
@@ -150,7 +191,7 @@ def add_instigator_state(self, state: InstigatorState) -> InstigatorState:
                         repository_origin_id=state.repository_origin_id,
                         status=state.status.value,
                         job_type=state.instigator_type.value,
-                        job_body=serialize_dagster_namedtuple(state),
+                        job_body=serialize_value(state, serdes_format=self.serdes_format),
                     )
                 )
             except db_exc.IntegrityError as exc:
@@ -175,7 +216,7 @@ def update_instigator_state(self, state: InstigatorState) -> InstigatorState:
 
         values = {
             "status": state.status.value,
-            "job_body": serialize_dagster_namedtuple(state),
+            "job_body": serialize_value(state, serdes_format=self.serdes_format),
             "update_timestamp": pendulum.now("UTC"),
         }
         if self.has_instigators_table():
@@ -192,6 +233,128 @@ def update_instigator_state(self, state: InstigatorState) -> InstigatorState:
 
         return state
 
+    def update_instigator_states(
+        self, states: Sequence[InstigatorState]
+    ) -> Sequence[InstigatorState]:
+        check.sequence_param(states, "states", of_type=InstigatorState)
+        if not states:
+            return []
+
+        # the last state wins if a state is updated more than once
+        states_by_origin_id = {state.instigator_origin_id: state for state in states}
+        bodies_by_origin_id = {
+            origin_id: serialize_value(state, serdes_format=self.serdes_format)
+            for origin_id, state in states_by_origin_id.items()
+        }
+
+        with self.connect() as conn:
+            has_instigators_table = self._has_instigators_table(conn)
+            existing_origin_ids = self._select_existing(
+                conn, JobTable.c.job_origin_id, list(states_by_origin_id.keys())
+            )
+            missing_origin_ids = [
+                origin_id
+                for origin_id in states_by_origin_id
+                if origin_id not in existing_origin_ids
+            ]
+            if missing_origin_ids:
+                raise DagsterInvariantViolationError(
+                    f"InstigatorState {missing_origin_ids[0]} is not present in storage"
+                )
+
+            job_values = {
+                "status": db.bindparam("_status"),
+                "job_body": db.bindparam("_job_body"),
+                "update_timestamp": pendulum.now("UTC"),
+            }
+            if has_instigators_table:
+                job_values["selector_id"] = db.bindparam("_selector_id")
+            conn.execute(
+                JobTable.update()  # pylint: disable=no-value-for-parameter
+                .where(JobTable.c.job_origin_id == db.bindparam("_origin_id"))
+                .values(**job_values),
+                [
+                    dict(
+                        _origin_id=origin_id,
+                        _status=state.status.value,
+                        _job_body=bodies_by_origin_id[origin_id],
+                        _selector_id=state.selector_id,
+                    )
+                    for origin_id, state in states_by_origin_id.items()
+                ],
+            )
+
+            if has_instigators_table:
+                self._add_or_update_instigators_table_batch(
+                    conn, list(states_by_origin_id.values()), bodies_by_origin_id
+                )
+
+        return states
+
+    def _add_or_update_instigators_table_batch(
+        self,
+        conn: Connection,
+        states: Sequence[InstigatorState],
+        bodies_by_origin_id: Mapping[str, str],
+    ) -> None:
+        states_by_selector_id = {state.selector_id: state for state in states}
+        existing_selector_ids = self._select_existing(
+            conn, InstigatorsTable.c.selector_id, list(states_by_selector_id.keys())
+        )
+
+        new_rows = [
+            dict(
+                selector_id=selector_id,
+                repository_selector_id=state.repository_selector_id,
+                status=state.status.value,
+                instigator_type=state.instigator_type.value,
+                instigator_body=bodies_by_origin_id[state.instigator_origin_id],
+            )
+            for selector_id, state in states_by_selector_id.items()
+            if selector_id not in existing_selector_ids
+        ]
+        if new_rows:
+            conn.execute(
+                InstigatorsTable.insert(), new_rows  # pylint: disable=no-value-for-parameter
+            )
+
+        updated_rows = [
+            dict(
+                _selector_id=selector_id,
+                _status=state.status.value,
+                _instigator_type=state.instigator_type.value,
+                _instigator_body=bodies_by_origin_id[state.instigator_origin_id],
+            )
+            for selector_id, state in states_by_selector_id.items()
+            if selector_id in existing_selector_ids
+        ]
+        if updated_rows:
+            conn.execute(
+                InstigatorsTable.update()  # pylint: disable=no-value-for-parameter
+                .where(InstigatorsTable.c.selector_id == db.bindparam("_selector_id"))
+                .values(
+                    status=db.bindparam("_status"),
+                    instigator_type=db.bindparam("_instigator_type"),
+                    instigator_body=db.bindparam("_instigator_body"),
+                    update_timestamp=pendulum.now("UTC"),
+                ),
+                updated_rows,
+            )
+
+    def _select_existing(
+        self, conn: Connection, column: Any, values: Sequence[str]
+    ) -> AbstractSet[str]:
+        existing = set()
+        for start in range(0, len(values), SELECTOR_ID_BATCH_SIZE):
+            result = conn.execute(
+                db.select([column]).where(
+                    column.in_(values[start : start + SELECTOR_ID_BATCH_SIZE])
+                )
+            )
+            existing.update(row[0] for row in result.fetchall())
+            result.close()
+        return existing
+
     def delete_instigator_state(self, origin_id: str, selector_id: str) -> None:
         check.str_param(origin_id, "origin_id")
         check.str_param(selector_id, "selector_id")
@@ -255,12 +418,16 @@ def supports_batch_queries(self) -> bool:
         return self.has_instigators_table() and self.has_built_index(SCHEDULE_TICKS_SELECTOR_ID)
 
     def has_instigators_table(self) -> bool:
+        if self._has_instigators_table_cache:
+            return True
         with self.connect() as conn:
             return self._has_instigators_table(conn)
 
     def _has_instigators_table(self, conn: Connection) -> bool:
-        table_names = db.inspect(conn).get_table_names()
-        return "instigators" in table_names
+        if not self._has_instigators_table_cache:
+            table_names = db.inspect(conn).get_table_names()
+            self._has_instigators_table_cache = "instigators" in table_names
+        return self._has_instigators_table_cache
 
     def get_batch_ticks(
         self,
@@ -355,18 +522,24 @@ def get_ticks(
             map(lambda r: InstigatorTick(r[0], deserialize_json_to_dagster_namedtuple(r[1])), rows)  # type: ignore
         )
 
-    def create_tick(self, tick_data: TickData) -> InstigatorTick:
-        check.inst_param(tick_data, "tick_data", TickData)
-
+    def _get_tick_insert_values(
+        self, tick_data: TickData, has_instigators_table: bool
+    ) -> Dict[str, Any]:
         values = {
             "job_origin_id": tick_data.instigator_origin_id,
             "status": tick_data.status.value,
             "type": tick_data.instigator_type.value,
             "timestamp": utc_datetime_from_timestamp(tick_data.timestamp),
-            "tick_body": serialize_dagster_namedtuple(tick_data),
+            "tick_body": serialize_value(tick_data, serdes_format=self.serdes_format),
         }
-        if self.has_instigators_table() and tick_data.selector_id:
+        if has_instigators_table:
             values["selector_id"] = tick_data.selector_id
+        return values
+
+    def create_tick(self, tick_data: TickData) -> InstigatorTick:
+        check.inst_param(tick_data, "tick_data", TickData)
+
+        values = self._get_tick_insert_values(tick_data, self.has_instigators_table())
 
         with self.connect() as conn:
             try:
@@ -382,6 +555,39 @@ def create_tick(self, tick_data: TickData) -> InstigatorTick:
                     " storage"
                 ) from exc
 
+    def create_ticks(self, tick_datas: Sequence[TickData]) -> Sequence[InstigatorTick]:
+        check.sequence_param(tick_datas, "tick_datas", of_type=TickData)
+        if not tick_datas:
+            return []
+
+        has_instigators_table = self.has_instigators_table()
+        rows = [
+            self._get_tick_insert_values(tick_data, has_instigators_table)
+            for tick_data in tick_datas
+        ]
+        with self.connect() as conn:
+            try:
+                tick_ids = self._insert_ticks(conn, rows)
+            except db_exc.IntegrityError as exc:
+                raise DagsterInvariantViolationError(
+                    "Unable to insert InstigatorTicks in storage"
+                ) from exc
+
+        return [
+            InstigatorTick(tick_id, tick_data) for tick_id, tick_data in zip(tick_ids, tick_datas)
+        ]
+
+    def _insert_ticks(self, conn: Connection, rows: Sequence[Mapping[str, Any]]) -> Sequence[int]:
+        """Inserts the given tick rows and returns their ids, in order. Storages whose database
+        returns the ids of multi-row inserts can override this to insert all rows in one statement.
+        """
+        return [
+            conn.execute(
+                JobTickTable.insert().values(**row)  # pylint: disable=no-value-for-parameter
+            ).inserted_primary_key[0]
+            for row in rows
+        ]
+
     def update_tick(self, tick: InstigatorTick) -> InstigatorTick:
         check.inst_param(tick, "tick", InstigatorTick)
 
@@ -389,7 +595,7 @@ def update_tick(self, tick: InstigatorTick) -> InstigatorTick:
             "status": tick.status.value,
             "type": tick.instigator_type.value,
             "timestamp": utc_datetime_from_timestamp(tick.timestamp),
-            "tick_body": serialize_dagster_namedtuple(tick.tick_data),
+            "tick_body": serialize_value(tick.tick_data, serdes_format=self.serdes_format),
         }
         if self.has_instigators_table() and tick.selector_id:
             values["selector_id"] = tick.selector_id
@@ -403,6 +609,45 @@ def update_tick(self, tick: InstigatorTick) -> InstigatorTick:
 
         return tick
 
+    def update_ticks(self, ticks: Sequence[InstigatorTick]) -> Sequence[InstigatorTick]:
+        check.sequence_param(ticks, "ticks", of_type=InstigatorTick)
+        if not ticks:
+            return []
+
+        values = {
+            "status": db.bindparam("_status"),
+            "type": db.bindparam("_type"),
+            "timestamp": db.bindparam("_timestamp"),
+            "tick_body": db.bindparam("_tick_body"),
+        }
+        if self.has_instigators_table():
+            # like update_tick, a tick without a selector id keeps the stored one
+            values["selector_id"] = db.func.coalesce(
+                db.bindparam("_selector_id"), JobTickTable.c.selector_id
+            )
+
+        with self.connect() as conn:
+            conn.execute(
+                JobTickTable.update()  # pylint: disable=no-value-for-parameter
+                .where(JobTickTable.c.id == db.bindparam("_tick_id"))
+                .values(**values),
+                [
+                    dict(
+                        _tick_id=tick.tick_id,
+                        _status=tick.status.value,
+                        _type=tick.instigator_type.value,
+                        _timestamp=utc_datetime_from_timestamp(tick.timestamp),
+                        _tick_body=serialize_value(
+                            tick.tick_data, serdes_format=self.serdes_format
+                        ),
+                        _selector_id=tick.selector_id,
+                    )
+                    for tick in ticks
+                ],
+            )
+
+        return ticks
+
     def purge_ticks(
         self,
         origin_id: str,
@@ -1,6 +1,6 @@
 import threading
 from functools import lru_cache
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 import sqlalchemy as db
 from alembic.command import downgrade, stamp, upgrade
@@ -18,6 +18,134 @@
 create_engine = db.create_engine  # exported
 
 
+class SqlPoolStats(
+    NamedTuple(
+        "_SqlPoolStats",
+        [
+            ("pool_size", int),
+            ("max_overflow", int),
+            ("checked_out", int),
+            ("checked_in", int),
+            ("overflow", int),
+            ("total_checkouts", int),
+        ],
+    )
+):
+    """Usage of the connection pool of a shared engine.
+
+    Args:
+        pool_size (int): The number of connections the pool keeps open.
+        max_overflow (int): The number of connections the pool may open beyond ``pool_size``.
+        checked_out (int): The number of connections currently in use.
+        checked_in (int): The number of idle connections held by the pool.
+        overflow (int): The number of connections currently open beyond ``pool_size``. Negative
+            while the pool holds fewer than ``pool_size`` connections.
+        total_checkouts (int): The number of connections handed out since the engine was created.
+    """
+
+
+class _SharedEngine(NamedTuple):
+    engine: db.engine.Engine
+    max_overflow: int
+    checkouts: Dict[str, int]
+
+
+_shared_engines: Dict[str, _SharedEngine] = {}
+_shared_engines_lock = threading.Lock()
+
+
+def get_shared_engine(
+    url: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_recycle: int,
+    pool_timeout: int,
+    **kwargs: Any,
+) -> db.engine.Engine:
+    """Returns a pooled engine for the given url, shared by every storage in the process that
+    requests an engine with the same url and arguments, so that the run, event log and schedule
+    storages of an instance draw from a single bounded connection pool.
+    """
+    key = repr((url, pool_size, max_overflow, pool_recycle, pool_timeout, sorted(kwargs.items())))
+    with _shared_engines_lock:
+        if key not in _shared_engines:
+            engine = create_engine(
+                url,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_recycle=pool_recycle,
+                pool_timeout=pool_timeout,
+                **kwargs,
+            )
+            checkouts = {"total": 0}
+
+            def _on_checkout(_dbapi_conn, _conn_record, _conn_proxy):
+                checkouts["total"] += 1
+
+            db.event.listen(engine, "checkout", _on_checkout)
+            _shared_engines[key] = _SharedEngine(engine, max_overflow, checkouts)
+
+        return _shared_engines[key].engine
+
+
+def _get_pool_stats(shared_engine: _SharedEngine) -> SqlPoolStats:
+    pool = shared_engine.engine.pool
+    return SqlPoolStats(
+        pool_size=pool.size(),  # type: ignore  # (QueuePool)
+        max_overflow=shared_engine.max_overflow,
+        checked_out=pool.checkedout(),  # type: ignore  # (QueuePool)
+        checked_in=pool.checkedin(),  # type: ignore  # (QueuePool)
+        overflow=pool.overflow(),  # type: ignore  # (QueuePool)
+        total_checkouts=shared_engine.checkouts["total"],
+    )
+
+
+def get_engine_pool_stats(engine: db.engine.Engine) -> Optional[SqlPoolStats]:
+    """Returns the pool usage of the given engine, or None if it is not a shared engine."""
+    with _shared_engines_lock:
+        shared_engine = next(
+            (shared for shared in _shared_engines.values() if shared.engine is engine), None
+        )
+    return _get_pool_stats(shared_engine) if shared_engine else None
+
+
+def get_shared_engine_pool_stats() -> Mapping[str, SqlPoolStats]:
+    """Returns the pool usage of every shared engine in the process, keyed by database url with
+    the password redacted.
+    """
+    with _shared_engines_lock:
+        shared_engines = list(_shared_engines.values())
+
+    return {
+        repr(shared_engine.engine.url): _get_pool_stats(shared_engine)
+        for shared_engine in shared_engines
+    }
+
+
+def iter_table_row_chunks(
+    conn: Connection, table: db.Table, chunk_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yields the rows of a table with an integer ``id`` primary key in chunks of at most
+    ``chunk_size`` rows, in id order. Each chunk is fetched with a keyset query on the id column,
+    so that reading a large table never requires an offset scan. The ``id`` column is not included
+    in the yielded rows.
+    """
+    columns = [column for column in table.columns if column.name != "id"]
+    last_id = None
+    while True:
+        query = db.select([table.c.id, *columns]).order_by(table.c.id.asc()).limit(chunk_size)
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+        rows = conn.execute(query).fetchall()
+        if not rows:
+            return
+
+        last_id = rows[-1][0]
+        yield [{column.name: value for column, value in zip(columns, row[1:])} for row in rows]
+        if len(rows) < chunk_size:
+            return
+
+
 ALEMBIC_SCRIPTS_LOCATION = "dagster:_core/storage/alembic"
 
 # Stand-in for a typed query object, which is only available in sqlalchemy 2+
@@ -1,7 +1,30 @@
 import os
+import queue
 import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple, TypeVar
+
+import sqlalchemy as db
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import NullPool, QueuePool
 
 import dagster._check as check
+from dagster._core.errors import DagsterInvariantViolationError
+
+T = TypeVar("T")
+
+# how long a connection waits on the write lock held by another connection before failing with
+# "database is locked"
+SQLITE_BUSY_TIMEOUT_MS = 30000
+
+# the maximum number of queued writes that a SqliteWriter commits in a single transaction
+SQLITE_WRITER_MAX_BATCH_SIZE = 256
+
+# how long the thread of a SqliteWriter waits for writes before exiting (and closing its connection)
+SQLITE_WRITER_IDLE_TIMEOUT = 5
+
+SQLITE_POOL_SIZE = 4
 
 
 def create_db_conn_string(base_dir: str, db_name: str) -> str:
@@ -23,3 +46,204 @@ def create_in_memory_conn_string(db_name: str) -> str:
 
 def get_sqlite_version() -> str:
     return str(sqlite3.sqlite_version)
+
+
+def create_pooled_sqlite_engine(conn_string: str) -> Engine:
+    """Creates an engine for a SQLite database in WAL mode that keeps a small pool of open
+    connections, instead of connecting to the database file on every checkout. The pooled
+    connections are read-only, writes go through a `SqliteWriter`.
+    """
+    check.str_param(conn_string, "conn_string")
+    engine = db.create_engine(
+        conn_string,
+        poolclass=QueuePool,
+        pool_size=SQLITE_POOL_SIZE,
+        connect_args={"check_same_thread": False},
+    )
+
+    @db.event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, _connection_record):
+        dbapi_connection.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS};")
+        dbapi_connection.execute("PRAGMA query_only=ON;")
+
+    return engine
+
+
+class _SqliteWrite(NamedTuple):
+    fn: Callable[[Connection], Any]
+    future: Future
+
+
+class SqliteWriter:
+    """Serializes the writes to a SQLite database file through a single connection owned by a
+    dedicated thread.
+
+    Writes submitted from any thread are queued and committed by the writer thread in batches:
+    every write that is queued while a batch is being committed is written in the next transaction,
+    so that concurrent writers share a single commit (and a single acquisition of the database write
+    lock) instead of contending for the lock. Each write runs in its own savepoint, so that a failed
+    write is rolled back without affecting the other writes in its batch.
+
+    The writer connection uses WAL journaling with ``synchronous=NORMAL``, and starts each
+    transaction with ``BEGIN IMMEDIATE``, so that writes from other processes wait on the busy
+    timeout instead of failing on a lock upgrade.
+    """
+
+    def __init__(self, conn_string: str, max_batch_size: int = SQLITE_WRITER_MAX_BATCH_SIZE):
+        self._conn_string = check.str_param(conn_string, "conn_string")
+        self._max_batch_size = check.int_param(max_batch_size, "max_batch_size")
+        self._queue: "queue.Queue[Optional[_SqliteWrite]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # holds the connection of the writer thread, which is replaced when the thread restarts
+        self._local = threading.local()
+        self._disposed = False
+
+    @property
+    def in_writer_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    @property
+    def connection(self) -> Connection:
+        """The connection of the writer thread, with the transaction of the current batch open.
+        Only available from within a submitted write.
+        """
+        check.invariant(self.in_writer_thread, "Can only use the writer connection from a write")
+        return check.not_none(getattr(self._local, "connection", None))
+
+    def _create_engine(self) -> Engine:
+        engine = db.create_engine(self._conn_string, poolclass=NullPool)
+
+        @db.event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, _connection_record):
+            # disable the pysqlite driver's transaction handling, so that transactions and
+            # savepoints are emitted by sqlalchemy
+            dbapi_connection.isolation_level = None
+            dbapi_connection.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS};")
+            dbapi_connection.execute("PRAGMA journal_mode=WAL;")
+            dbapi_connection.execute("PRAGMA synchronous=NORMAL;")
+
+        @db.event.listens_for(engine, "begin")
+        def _on_begin(connection):
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+        return engine
+
+    def submit(self, fn: Callable[[Connection], T]) -> T:
+        """Runs `fn` with the writer connection in the writer thread, and blocks until the batch it
+        was written in is committed. Returns the result of `fn`, or raises the exception it raised.
+        """
+        check.callable_param(fn, "fn")
+
+        if self.in_writer_thread:
+            # a write submitted from within another write joins its batch
+            return fn(self.connection)
+
+        write = _SqliteWrite(fn, Future())
+        with self._lock:
+            if self._disposed:
+                raise DagsterInvariantViolationError(
+                    "Cannot submit a write to a SqliteWriter that has been disposed."
+                )
+            self._queue.put(write)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+                self._thread.start()
+
+        return write.future.result()
+
+    def _run(self) -> None:
+        engine = self._create_engine()
+        try:
+            while True:
+                batch, stopped = self._next_batch()
+                if batch:
+                    self._write_batch(engine, batch)
+                if stopped:
+                    return
+        finally:
+            connection = getattr(self._local, "connection", None)
+            if connection is not None:
+                connection.close()
+                self._local.connection = None
+            engine.dispose()
+
+    def _next_batch(self) -> Tuple[List[_SqliteWrite], bool]:
+        """Blocks until there are queued writes, and returns them along with whether the writer
+        thread should stop after writing them.
+        """
+        try:
+            write = self._queue.get(timeout=SQLITE_WRITER_IDLE_TIMEOUT)
+        except queue.Empty:
+            with self._lock:
+                # the writer thread exits when idle, and is restarted by the next write
+                if self._queue.empty():
+                    self._thread = None
+                    return [], True
+            write = self._queue.get()
+
+        if write is None:
+            return [], True
+
+        batch: List[_SqliteWrite] = [write]
+        while len(batch) < self._max_batch_size:
+            try:
+                write = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if write is None:
+                return batch, True
+            batch.append(write)
+
+        return batch, False
+
+    def _write_batch(self, engine: Engine, batch: List[_SqliteWrite]) -> None:
+        results: List[Any] = []
+        errors: List[Optional[BaseException]] = []
+        try:
+            if getattr(self._local, "connection", None) is None:
+                self._local.connection = engine.connect()
+            conn = self._local.connection
+
+            with conn.begin():
+                for write in batch:
+                    savepoint = conn.begin_nested()
+                    try:
+                        results.append(write.fn(conn))
+                        errors.append(None)
+                        if savepoint.is_active:
+                            savepoint.commit()
+                        else:
+                            savepoint.rollback()
+                    except Exception as exc:
+                        results.append(None)
+                        errors.append(exc)
+                        savepoint.rollback()
+        except Exception as exc:
+            # none of the batch was committed
+            if getattr(self._local, "connection", None) is not None:
+                self._local.connection.invalidate()
+                self._local.connection.close()
+                self._local.connection = None
+            for write in batch:
+                write.future.set_exception(exc)
+            return
+
+        for write, result, error in zip(batch, results, errors):
+            if error is not None:
+                write.future.set_exception(error)
+            else:
+                write.future.set_result(result)
+
+    def dispose(self) -> None:
+        """Commits the queued writes and stops the writer thread."""
+        with self._lock:
+            if self._disposed:
+                return
+            self._disposed = True
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(None)
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
@@ -1,11 +1,11 @@
 import os
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 import yaml
-from typing_extensions import Self, TypedDict
+from typing_extensions import NotRequired, Self, TypedDict
 
 from dagster import _check as check
-from dagster._config import StringSource
+from dagster._config import Field, StringSource
 from dagster._config.config_schema import UserConfigSchema
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import mkdir_p
@@ -24,6 +24,7 @@
 
 class SqliteStorageConfig(TypedDict):
     base_dir: str
+    single_writer: NotRequired[bool]
 
 
 def _runs_directory(base: str) -> str:
@@ -56,12 +57,25 @@ class DagsterSqliteStorage(DagsterStorage, ConfigurableClass):
           sqlite:
             base_dir: /path/to/dir
 
+    Setting the optional ``single_writer`` param routes the writes of each process to the run and
+    event log databases through a writer thread per database, which commits concurrent writes in
+    batches.
     """
 
-    def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        base_dir: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        single_writer: bool = False,
+    ):
         self.base_dir = check.str_param(base_dir, "base_dir")
-        self._run_storage = SqliteRunStorage.from_local(_runs_directory(base_dir))
-        self._event_log_storage = SqliteEventLogStorage(_event_logs_directory(base_dir))
+        self.single_writer = check.bool_param(single_writer, "single_writer")
+        self._run_storage = SqliteRunStorage.from_local(
+            _runs_directory(base_dir), single_writer=single_writer
+        )
+        self._event_log_storage = SqliteEventLogStorage(
+            _event_logs_directory(base_dir), single_writer=single_writer
+        )
         self._schedule_storage = SqliteScheduleStorage.from_local(_schedule_directory(base_dir))
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         super().__init__()
@@ -72,7 +86,7 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return {"base_dir": StringSource}
+        return {"base_dir": StringSource, "single_writer": Field(bool, is_required=False)}
 
     @staticmethod
     def from_config_value(
@@ -81,10 +95,23 @@ def from_config_value(
         return DagsterSqliteStorage.from_local(inst_data=inst_data, **config_value)
 
     @classmethod
-    def from_local(cls, base_dir: str, inst_data: Optional[ConfigurableClassData] = None) -> Self:
+    def from_local(
+        cls,
+        base_dir: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        single_writer: bool = False,
+    ) -> Self:
         check.str_param(base_dir, "base_dir")
         mkdir_p(base_dir)
-        return cls(base_dir, inst_data=inst_data)
+        return cls(base_dir, inst_data=inst_data, single_writer=single_writer)
+
+    def _storage_config_yaml(self, base_dir: str) -> str:
+        config: Mapping[str, Any] = (
+            {"base_dir": base_dir, "single_writer": True}
+            if self.single_writer
+            else {"base_dir": base_dir}
+        )
+        return yaml.dump(config, default_flow_style=False)
 
     def register_instance(self, instance: "DagsterInstance") -> None:
         if not self._run_storage._instance:
@@ -111,7 +138,7 @@ def event_storage_data(self) -> Optional[ConfigurableClassData]:
         return ConfigurableClassData(
             "dagster._core.storage.event_log",
             "SqliteEventLogStorage",
-            yaml.dump({"base_dir": _runs_directory(self.base_dir)}, default_flow_style=False),
+            self._storage_config_yaml(_runs_directory(self.base_dir)),
         )
 
     @property
@@ -119,7 +146,7 @@ def run_storage_data(self) -> Optional[ConfigurableClassData]:
         return ConfigurableClassData(
             "dagster._core.storage.runs",
             "SqliteRunStorage",
-            yaml.dump({"base_dir": _event_logs_directory(self.base_dir)}, default_flow_style=False),
+            self._storage_config_yaml(_event_logs_directory(self.base_dir)),
         )
 
     @property
@@ -17,10 +17,12 @@
 from dagster._daemon.daemon import (
     BackfillDaemon,
     DagsterDaemon,
+    DataMigrationDaemon,
     MonitoringDaemon,
     SchedulerDaemon,
     SensorDaemon,
 )
+from dagster._daemon.data_migration import DEFAULT_DATA_MIGRATION_INTERVAL_SECONDS
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
 from dagster._daemon.types import DaemonHeartbeat, DaemonStatus
 from dagster._utils.interrupts import raise_interrupts_as
@@ -317,6 +319,12 @@ def create_daemon_of_type(daemon_type, instance):
         return MonitoringDaemon(interval_seconds=instance.run_monitoring_poll_interval_seconds)
     elif daemon_type == EventLogConsumerDaemon.daemon_type():
         return EventLogConsumerDaemon()
+    elif daemon_type == DataMigrationDaemon.daemon_type():
+        return DataMigrationDaemon(
+            interval_seconds=instance.data_migrations_settings.get(
+                "interval_seconds", DEFAULT_DATA_MIGRATION_INTERVAL_SECONDS
+            )
+        )
     else:
         raise Exception(f"Unexpected daemon type {daemon_type}")
 
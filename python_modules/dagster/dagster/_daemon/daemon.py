@@ -6,7 +6,7 @@
 from collections import deque
 from contextlib import AbstractContextManager
 from threading import Event
-from typing import Generator, Generic, TypeVar, Union
+from typing import Generator, Generic, Sequence, TypeVar, Union
 
 import pendulum
 
@@ -15,9 +15,11 @@
     _check as check,
 )
 from dagster._core.scheduler.scheduler import DagsterDaemonScheduler
+from dagster._core.storage.runs.wakeup import RunWakeupChannel
 from dagster._core.telemetry import DAEMON_ALIVE, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._daemon.backfill import execute_backfill_iteration
+from dagster._daemon.data_migration import execute_data_migration_iteration
 from dagster._daemon.monitoring import execute_monitoring_iteration
 from dagster._daemon.sensor import execute_sensor_iteration_loop
 from dagster._daemon.types import DaemonHeartbeat
@@ -31,6 +33,7 @@ def get_default_daemon_logger(daemon_name) -> logging.Logger:
 
 DAEMON_HEARTBEAT_ERROR_LIMIT = 5  # Show at most 5 errors
 TELEMETRY_LOGGING_INTERVAL = 3600 * 24  # Interval (in seconds) at which to log that daemon is alive
+DEFAULT_MIN_WAKEUP_INTERVAL_SECONDS = 1
 _telemetry_daemon_session_id = str(uuid.uuid4())
 
 
@@ -200,6 +203,14 @@ def core_loop(
 
 
 class IntervalDaemon(DagsterDaemon[TContext], ABC):
+    # If the run storage supports wakeup notifications, a notification on one of these channels
+    # starts the next iteration without waiting for the rest of the interval
+    wakeup_channels: Sequence[RunWakeupChannel] = []
+
+    # The minimum time between the starts of two iterations when a notification ends the wait
+    # early, so that a busy instance publishing many notifications doesn't run back to back passes
+    min_wakeup_interval_seconds: float = DEFAULT_MIN_WAKEUP_INTERVAL_SECONDS
+
     def __init__(self, interval_seconds):
         self.interval_seconds = check.numeric_param(interval_seconds, "interval_seconds")
         super().__init__()
@@ -209,19 +220,40 @@ def core_loop(
         workspace_process_context: TContext,
         shutdown_event: Event,
     ) -> TDaemonGenerator:
-        while True:
-            start_time = time.time()
-            try:
-                yield None  # Heartbeat once at the beginning to kick things off
-                yield from self.run_iteration(workspace_process_context)
-            except Exception:
-                error_info = serializable_error_info_from_exc_info(sys.exc_info())
-                self._logger.error("Caught error:\n%s", error_info)
-                yield error_info
-            while time.time() - start_time < self.interval_seconds:
-                shutdown_event.wait(0.5)
+        instance = workspace_process_context.instance
+        wakeup_event = Event()
+        if self.wakeup_channels:
+            instance.add_run_wakeup_listener(self.wakeup_channels, wakeup_event)
+
+        try:
+            while True:
+                start_time = time.time()
+                # notifications that arrive during the iteration start another one right after it
+                wakeup_event.clear()
+                try:
+                    yield None  # Heartbeat once at the beginning to kick things off
+                    yield from self.run_iteration(workspace_process_context)
+                except Exception:
+                    error_info = serializable_error_info_from_exc_info(sys.exc_info())
+                    self._logger.error("Caught error:\n%s", error_info)
+                    yield error_info
+                while time.time() - start_time < self.interval_seconds:
+                    if shutdown_event.is_set():
+                        break
+                    if wakeup_event.is_set():
+                        remaining_wakeup_interval = self.min_wakeup_interval_seconds - (
+                            time.time() - start_time
+                        )
+                        if remaining_wakeup_interval <= 0:
+                            break
+                        time.sleep(min(remaining_wakeup_interval, 0.5))
+                    else:
+                        wakeup_event.wait(0.5)
+                    yield None
                 yield None
-            yield None
+        finally:
+            if self.wakeup_channels:
+                instance.remove_run_wakeup_listener(wakeup_event)
 
     @abstractmethod
     def run_iteration(self, workspace_process_context: TContext) -> TDaemonGenerator:
@@ -269,6 +301,8 @@ def core_loop(
 
 
 class BackfillDaemon(IntervalDaemon):
+    wakeup_channels = [RunWakeupChannel.BACKFILL_CREATED]
+
     @classmethod
     def daemon_type(cls):
         return "BACKFILL"
@@ -290,3 +324,15 @@ def run_iteration(
         workspace_process_context: IWorkspaceProcessContext,
     ) -> TDaemonGenerator:
         yield from execute_monitoring_iteration(workspace_process_context, self._logger)
+
+
+class DataMigrationDaemon(IntervalDaemon):
+    @classmethod
+    def daemon_type(cls):
+        return "DATA_MIGRATION"
+
+    def run_iteration(
+        self,
+        workspace_process_context: IWorkspaceProcessContext,
+    ) -> TDaemonGenerator:
+        yield from execute_data_migration_iteration(workspace_process_context, self._logger)
@@ -0,0 +1,31 @@
+import logging
+from typing import Iterable, Optional
+
+from dagster._core.storage.migration.batched import (
+    DEFAULT_DATA_MIGRATION_BATCH_SIZE,
+    DEFAULT_DATA_MIGRATION_THROTTLE_SECONDS,
+    execute_batched_data_migrations,
+)
+from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._utils.error import SerializableErrorInfo
+
+DEFAULT_DATA_MIGRATION_INTERVAL_SECONDS = 60
+# each iteration stops starting new batches after this long, leaving the rest of the interval idle
+DEFAULT_DATA_MIGRATION_TIME_LIMIT_SECONDS = 30
+
+
+def execute_data_migration_iteration(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+) -> Iterable[Optional[SerializableErrorInfo]]:
+    instance = workspace_process_context.instance
+    settings = instance.data_migrations_settings
+    yield from execute_batched_data_migrations(
+        instance,
+        batch_size=settings.get("batch_size", DEFAULT_DATA_MIGRATION_BATCH_SIZE),
+        throttle_seconds=settings.get("throttle_seconds", DEFAULT_DATA_MIGRATION_THROTTLE_SECONDS),
+        time_limit_seconds=settings.get(
+            "time_limit_seconds", DEFAULT_DATA_MIGRATION_TIME_LIMIT_SECONDS
+        ),
+        print_fn=logger.info,
+    )
@@ -103,14 +103,35 @@ def execute_monitoring_iteration(
     )
 
     # TODO: consider limiting number of runs to fetch
-    runs = list(instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)))
+    run_status_records = instance.get_run_status_records(
+        filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+    )
 
-    if not runs:
+    if not run_status_records:
         return
 
-    logger.info(f"Collected {len(runs)} runs for monitoring")
+    # only the runs in status STARTING or STARTED are checked, so the runs are only deserialized for
+    # those statuses
+    run_ids_to_check = [
+        record.run_id
+        for record in run_status_records
+        if record.status in (DagsterRunStatus.STARTING, DagsterRunStatus.STARTED)
+    ]
+    runs_by_id = (
+        {run.run_id: run for run in instance.get_runs(filters=RunsFilter(run_ids=run_ids_to_check))}
+        if run_ids_to_check
+        else {}
+    )
+
+    logger.info(f"Collected {len(run_status_records)} runs for monitoring")
     workspace = workspace_process_context.create_request_context()
-    for run in runs:
+    for record in run_status_records:
+        run = runs_by_id.get(record.run_id)
+        if run is None or run.status not in IN_PROGRESS_RUN_STATUSES:
+            # the run is canceling, or was deleted or finished since its status was fetched
+            yield
+            continue
+
         try:
             logger.info(f"Checking run {run.run_id}")
 
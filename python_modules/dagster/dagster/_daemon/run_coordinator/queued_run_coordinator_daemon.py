@@ -3,7 +3,7 @@
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, List, Optional
 
 from dagster import (
     DagsterEvent,
@@ -18,19 +18,13 @@
     QueuedRunCoordinator,
     RunQueueConfig,
 )
-from dagster._core.storage.pipeline_run import (
-    IN_PROGRESS_RUN_STATUSES,
-    DagsterRun,
-    DagsterRunStatus,
-    RunsFilter,
-)
-from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._core.storage.pipeline_run import DagsterRunStatus, RunStatusRecord
+from dagster._core.storage.runs.wakeup import RunWakeupChannel
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
 from dagster._daemon.daemon import IntervalDaemon, TDaemonGenerator
-from dagster._utils import len_iter
+from dagster._daemon.run_coordinator.run_queue_state import RunQueueState
 from dagster._utils.error import serializable_error_info_from_exc_info
-from dagster._utils.tags import TagConcurrencyLimitsCounter
 
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
@@ -39,11 +33,16 @@ class QueuedRunCoordinatorDaemon(IntervalDaemon):
     store and launches them.
     """
 
+    # a run finishing can free up a slot for a queued run
+    wakeup_channels = [RunWakeupChannel.RUN_QUEUED, RunWakeupChannel.RUN_STATUS_CHANGED]
+
     def __init__(self, interval_seconds):
         self._exit_stack = ExitStack()
         self._executor = None
         self._location_timeouts_lock = threading.Lock()
         self._location_timeouts: Dict[str, float] = {}
+        self._run_queue_state_lock = threading.Lock()
+        self._run_queue_state: Optional[RunQueueState] = None
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -93,7 +92,7 @@ def _dequeue_runs_iter(
         self,
         workspace_process_context: IWorkspaceProcessContext,
         run_coordinator: QueuedRunCoordinator,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[RunStatusRecord],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ):
@@ -116,7 +115,7 @@ def _dequeue_runs_iter(
     def _dequeue_run_thread(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        run: DagsterRun,
+        run: RunStatusRecord,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> bool:
@@ -131,7 +130,7 @@ def _dequeue_run_thread(
     def _dequeue_runs_iter_threaded(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[RunStatusRecord],
         max_workers: Optional[int],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
@@ -159,7 +158,7 @@ def _dequeue_runs_iter_threaded(
     def _dequeue_runs_iter_loop(
         self,
         workspace_process_context: IWorkspaceProcessContext,
-        runs_to_dequeue: List[DagsterRun],
+        runs_to_dequeue: List[RunStatusRecord],
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ):
@@ -185,30 +184,27 @@ def _get_runs_to_dequeue(
         instance: DagsterInstance,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
-    ) -> List[DagsterRun]:
+    ) -> List[RunStatusRecord]:
         if not isinstance(instance.run_coordinator, QueuedRunCoordinator):
             check.failed(f"Expected QueuedRunCoordinator, got {instance.run_coordinator}")
 
         max_concurrent_runs = run_queue_config.max_concurrent_runs
-        tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
+        run_queue_state = self._get_run_queue_state(instance, run_queue_config)
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
-        max_runs_to_launch = max_concurrent_runs - len_iter(in_progress_runs)
+        max_runs_to_launch = max_concurrent_runs - run_queue_state.num_in_progress_runs
         if max_concurrent_runs_enabled:
             # Possibly under 0 if runs were launched without queuing
             if max_runs_to_launch <= 0:
                 self._logger.info(
                     "{} runs are currently in progress. Maximum is {}, won't launch more.".format(
-                        len_iter(in_progress_runs), max_concurrent_runs
+                        run_queue_state.num_in_progress_runs, max_concurrent_runs
                     )
                 )
                 return []
 
-        queued_runs = self._get_queued_runs(instance)
-
-        if not queued_runs:
+        if not run_queue_state.num_queued_runs:
             self._logger.debug("Poll returned no queued runs.")
             return []
 
@@ -229,27 +225,22 @@ def _get_runs_to_dequeue(
             )
 
         self._logger.info(
-            f"Retrieved %d queued runs, checking limits.{locations_clause}", len(queued_runs)
+            f"Retrieved %d queued runs, checking limits.{locations_clause}",
+            run_queue_state.num_queued_runs,
         )
 
-        # place in order
-        sorted_runs = self._priority_sort(queued_runs)
-        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-            tag_concurrency_limits, in_progress_runs
-        )
+        tag_concurrency_limits_counter = run_queue_state.copy_in_progress_counter()
 
-        batch: List[DagsterRun] = []
-        for run in sorted_runs:
+        batch: List[RunStatusRecord] = []
+        # the queued runs are already in priority order
+        for run in run_queue_state.iter_queued_runs():
             if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
                 break
 
             if tag_concurrency_limits_counter.is_blocked(run):
                 continue
 
-            location_name = (
-                run.external_pipeline_origin.location_name if run.external_pipeline_origin else None
-            )
-            if location_name and location_name in paused_location_names:
+            if run.location_name and run.location_name in paused_location_names:
                 continue
 
             tag_concurrency_limits_counter.update_counters_with_launched_item(run)
@@ -257,26 +248,27 @@ def _get_runs_to_dequeue(
 
         return batch
 
-    def _get_queued_runs(self, instance):
-        queued_runs_filter = RunsFilter(statuses=[DagsterRunStatus.QUEUED])
-
-        # Reversed for fifo ordering
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
-
-    def _get_in_progress_runs(self, instance: DagsterInstance) -> Iterable[DagsterRun]:
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+    def _get_run_queue_state(
+        self, instance: DagsterInstance, run_queue_config: RunQueueConfig
+    ) -> RunQueueState:
+        """Returns the run queue state of the instance, synced with the runs updated since the
+        previous iteration. The state is rebuilt when the instance or its run queue config changes.
+        """
+        if (
+            self._run_queue_state is None
+            or self._run_queue_state.instance is not instance
+            or self._run_queue_state.run_queue_config != run_queue_config
+        ):
+            self._run_queue_state = RunQueueState(instance, run_queue_config)
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> Sequence[DagsterRun]:
-        def get_priority(run):
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+        self._run_queue_state.sync()
+        return self._run_queue_state
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+    def _discard_from_run_queue_state(self, run_id: str) -> None:
+        # runs may be dequeued from the worker threads
+        with self._run_queue_state_lock:
+            if self._run_queue_state is not None:
+                self._run_queue_state.discard(run_id)
 
     def _is_location_pausing_dequeues(self, location_name, now):
         with self._location_timeouts_lock:
@@ -289,12 +281,16 @@ def _dequeue_run(
         self,
         instance: DagsterInstance,
         workspace: IWorkspace,
-        run: DagsterRun,
+        queued_run: RunStatusRecord,
         run_queue_config: RunQueueConfig,
         fixed_iteration_time: Optional[float],
     ) -> bool:
         # double check that the run is still queued before dequeing
-        run = check.not_none(instance.get_run_by_id(run.run_id))
+        run = instance.get_run_by_id(queued_run.run_id)
+        if run is None:
+            self._logger.info("Run %s was deleted while queued, skipping", queued_run.run_id)
+            self._discard_from_run_queue_state(queued_run.run_id)
+            return False
 
         now = fixed_iteration_time or time.time()
 
@@ -304,6 +300,8 @@ def _dequeue_run(
                 run.run_id,
                 run.status,
             )
+            # in progress runs are added back by the next sync, which refetches them
+            self._discard_from_run_queue_state(run.run_id)
             return False
 
         # Very old (pre 0.10.0) runs and programatically submitted runs may not have an
@@ -0,0 +1,228 @@
+import bisect
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from dagster import _check as check
+from dagster._core.instance import DagsterInstance
+from dagster._core.run_coordinator.queued_run_coordinator import RunQueueConfig
+from dagster._core.storage.pipeline_run import (
+    IN_PROGRESS_RUN_STATUSES,
+    DagsterRunStatus,
+    RunsFilter,
+    RunStatusRecord,
+)
+from dagster._utils.tags import TagConcurrencyLimitsCounter
+
+# Interval at which the state is rebuilt from all the queued and in progress runs, which bounds how
+# long the state can keep queued runs whose updates were not picked up incrementally, e.g. deleted
+# runs
+FULL_SYNC_INTERVAL_SECONDS = 60
+
+# Runs updated up to this long before the latest update seen are refetched on every sync, to pick up
+# updates whose timestamps were written out of order by concurrent writers
+UPDATE_TIMESTAMP_MARGIN = timedelta(seconds=10)
+
+# Number of new queued runs fetched per query when looking for runs added since the last sync
+NEW_RUNS_BATCH_SIZE = 100
+
+_QueueKey = Tuple[int, int]
+
+
+def _queue_key(record: RunStatusRecord) -> _QueueKey:
+    # highest priority first, then fifo
+    return (-record.priority, record.storage_id)
+
+
+class RunQueueState:
+    """The queued and in progress runs of an instance, as seen by the run queue, along with the tag
+    concurrency counters of the in progress runs.
+
+    The state is built from all the queued and in progress runs, and then kept up to date by
+    applying the runs updated since the previous sync, found by their update timestamp, and the
+    runs added since the previous sync, found by their storage id. The queued runs are kept sorted
+    in dequeue order, so that a sync costs a query over the changed runs rather than over the whole
+    queue. The in progress runs, which are bounded by the concurrency limits, are refetched on
+    every sync, so that a run whose update was missed never keeps counting against the limits.
+    """
+
+    def __init__(self, instance: DagsterInstance, run_queue_config: RunQueueConfig):
+        self._instance = check.inst_param(instance, "instance", DagsterInstance)
+        self._run_queue_config = check.inst_param(
+            run_queue_config, "run_queue_config", RunQueueConfig
+        )
+        self._queued_runs: Dict[str, RunStatusRecord] = {}
+        self._queue: List[_QueueKey] = []
+        self._queued_run_ids_by_key: Dict[_QueueKey, str] = {}
+        self._in_progress_runs: Dict[str, RunStatusRecord] = {}
+        self._in_progress_counter = TagConcurrencyLimitsCounter(
+            run_queue_config.tag_concurrency_limits, []
+        )
+        self._max_storage_id: Optional[int] = None
+        self._update_cursor: Optional[datetime] = None
+        self._last_full_sync_time: Optional[float] = None
+
+    @property
+    def instance(self) -> DagsterInstance:
+        return self._instance
+
+    @property
+    def run_queue_config(self) -> RunQueueConfig:
+        return self._run_queue_config
+
+    @property
+    def num_in_progress_runs(self) -> int:
+        return len(self._in_progress_runs)
+
+    @property
+    def num_queued_runs(self) -> int:
+        return len(self._queued_runs)
+
+    def iter_queued_runs(self) -> Iterator[RunStatusRecord]:
+        """Yields the queued runs in dequeue order, by descending priority and then fifo."""
+        for key in self._queue:
+            run_id = self._queued_run_ids_by_key.get(key)
+            if run_id is not None:
+                yield self._queued_runs[run_id]
+
+    def copy_in_progress_counter(self) -> TagConcurrencyLimitsCounter:
+        """A copy of the tag concurrency counters of the in progress runs, to be updated with the
+        runs launched by a dequeue iteration.
+        """
+        return self._in_progress_counter.copy()
+
+    def sync(self) -> None:
+        now = time.time()
+        if (
+            self._last_full_sync_time is None
+            or now - self._last_full_sync_time >= FULL_SYNC_INTERVAL_SECONDS
+        ):
+            self.full_sync()
+            self._last_full_sync_time = now
+        else:
+            self._sync_updated_runs()
+            self._sync_new_runs()
+            self._sync_in_progress_runs()
+
+    def full_sync(self) -> None:
+        # read the latest update before the runs, so that no update after the runs were read is
+        # missed by the next sync
+        latest_updated = self._instance.get_run_status_records(limit=1, order_by="update_timestamp")
+        latest_added = self._instance.get_run_status_records(limit=1)
+
+        records = self._instance.get_run_status_records(
+            filters=RunsFilter(statuses=[DagsterRunStatus.QUEUED, *IN_PROGRESS_RUN_STATUSES]),
+            ascending=True,
+        )
+
+        self._queued_runs = {}
+        self._queue = []
+        self._queued_run_ids_by_key = {}
+        self._in_progress_runs = {}
+        self._in_progress_counter = TagConcurrencyLimitsCounter(
+            self._run_queue_config.tag_concurrency_limits, []
+        )
+        for record in records:
+            self._apply(record)
+
+        self._update_cursor = latest_updated[0].update_timestamp if latest_updated else None
+        self._max_storage_id = latest_added[0].storage_id if latest_added else None
+
+    def _sync_updated_runs(self) -> None:
+        if self._update_cursor is None:
+            records = self._instance.get_run_status_records(
+                order_by="update_timestamp", ascending=True
+            )
+        else:
+            records = self._instance.get_run_status_records(
+                filters=RunsFilter(updated_after=self._update_cursor - UPDATE_TIMESTAMP_MARGIN),
+                order_by="update_timestamp",
+                ascending=True,
+            )
+
+        for record in records:
+            self._apply(record)
+
+        if records:
+            self._update_cursor = max(
+                self._update_cursor or records[-1].update_timestamp, records[-1].update_timestamp
+            )
+
+    def _sync_new_runs(self) -> None:
+        """Applies the queued runs added since the previous sync, which are not necessarily found by
+        their update timestamp, since new runs are stamped by the clock of the database.
+        """
+        cursor = None
+        new_records: List[RunStatusRecord] = []
+        while True:
+            records = self._instance.get_run_status_records(
+                filters=RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
+                limit=NEW_RUNS_BATCH_SIZE,
+                cursor=cursor,
+            )
+            new_records.extend(
+                record
+                for record in records
+                if self._max_storage_id is None or record.storage_id > self._max_storage_id
+            )
+            if (
+                len(records) < NEW_RUNS_BATCH_SIZE
+                or self._max_storage_id is not None
+                and records[-1].storage_id <= self._max_storage_id
+            ):
+                break
+            cursor = records[-1].run_id
+
+        for record in new_records:
+            self._apply(record)
+            self._max_storage_id = max(self._max_storage_id or 0, record.storage_id)
+
+    def _sync_in_progress_runs(self) -> None:
+        """Replaces the in progress runs with the ones in storage, dropping the runs that finished or
+        were deleted without their update being found by its timestamp, e.g. because of clock skew
+        between the writers.
+        """
+        records = self._instance.get_run_status_records(
+            filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+        )
+        in_progress_run_ids = {record.run_id for record in records}
+        for run_id in list(self._in_progress_runs):
+            if run_id not in in_progress_run_ids:
+                self._discard(run_id)
+
+        for record in records:
+            self._apply(record)
+
+    def discard(self, run_id: str) -> None:
+        """Removes a run from the state, e.g. a queued run that was found to be deleted when it was
+        dequeued.
+        """
+        self._discard(run_id)
+
+    def _apply(self, record: RunStatusRecord) -> None:
+        """Replaces the state of a run with the given record. Applying the same record twice has no
+        further effect.
+        """
+        self._discard(record.run_id)
+
+        if record.status == DagsterRunStatus.QUEUED:
+            key = _queue_key(record)
+            self._queued_runs[record.run_id] = record
+            self._queued_run_ids_by_key[key] = record.run_id
+            bisect.insort(self._queue, key)
+        elif record.status in IN_PROGRESS_RUN_STATUSES:
+            self._in_progress_runs[record.run_id] = record
+            self._in_progress_counter.update_counters_with_launched_item(record)
+
+    def _discard(self, run_id: str) -> None:
+        queued = self._queued_runs.pop(run_id, None)
+        if queued is not None:
+            key = _queue_key(queued)
+            del self._queued_run_ids_by_key[key]
+            index = bisect.bisect_left(self._queue, key)
+            if index < len(self._queue) and self._queue[index] == key:
+                del self._queue[index]
+
+        in_progress = self._in_progress_runs.pop(run_id, None)
+        if in_progress is not None:
+            self._in_progress_counter.update_counters_with_finished_item(in_progress)
@@ -7,17 +7,28 @@
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Dict, Generator, List, Mapping, NamedTuple, Optional, Sequence, Union
+from typing import Dict, Generator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 
 import pendulum
 
 import dagster._check as check
 import dagster._seven as seven
 from dagster._core.definitions.run_request import InstigatorType, RunRequest
+from dagster._core.definitions.run_status_feed import (
+    DEFAULT_RUN_STATUS_EVENT_BATCH_SIZE,
+    RunStatusFeedSlice,
+    get_run_status_feed_entries,
+)
+from dagster._core.definitions.run_status_sensor_definition import RunStatusSensorCursor
 from dagster._core.definitions.selector import PipelineSelector
-from dagster._core.definitions.sensor_definition import DefaultSensorStatus, SensorExecutionData
+from dagster._core.definitions.sensor_definition import (
+    DefaultSensorStatus,
+    SensorExecutionData,
+    SensorType,
+)
 from dagster._core.definitions.utils import validate_tags
 from dagster._core.errors import DagsterError
+from dagster._core.events import PIPELINE_RUN_STATUS_TO_EVENT_TYPE, DagsterEventType
 from dagster._core.host_representation.external import ExternalPipeline, ExternalSensor
 from dagster._core.host_representation.external_data import ExternalTargetData
 from dagster._core.host_representation.repository_location import RepositoryLocation
@@ -30,10 +41,12 @@
     TickData,
     TickStatus,
 )
+from dagster._core.storage.event_log.base import EventRecordsFilter
 from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, RunsFilter
 from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._scheduler.async_evaluator import AsyncEvaluator
 from dagster._scheduler.stale import resolve_stale_or_unknown_assets
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.merger import merge_dicts
@@ -226,7 +239,19 @@ def execute_sensor_iteration_loop(
     sensor_tick_futures: Dict[str, Future] = {}
     with ExitStack() as stack:
         settings = workspace_process_context.instance.get_settings("sensors")
-        if settings.get("use_threads"):
+        async_evaluation_settings = settings.get("async_evaluation") or {}
+        if async_evaluation_settings.get("enabled"):
+            # sensors are evaluated on the event loop of the async evaluator, and the threadpool
+            # only processes the results of the evaluations
+            async_evaluator = stack.enter_context(
+                AsyncEvaluator.from_settings(
+                    async_evaluation_settings, thread_name="sensor_daemon_async_evaluator"
+                )
+            )
+        else:
+            async_evaluator = None
+
+        if settings.get("use_threads") or async_evaluator:
             threadpool_executor = stack.enter_context(
                 ThreadPoolExecutor(
                     max_workers=settings.get("num_workers"),
@@ -254,11 +279,16 @@ def execute_sensor_iteration_loop(
                 sensor_tick_futures=sensor_tick_futures,
                 sensor_state_lock=sensor_state_lock,
                 log_verbose_checks=verbose_logs_iteration,
+                async_evaluator=async_evaluator,
             )
             # Yield to check for heartbeats in case there were no yields within
             # execute_sensor_iteration
             yield None
 
+            if async_evaluator and verbose_logs_iteration:
+                for message in async_evaluator.get_latency_report():
+                    logger.info(message)
+
             end_time = pendulum.now("UTC").timestamp()
 
             if verbose_logs_iteration:
@@ -279,12 +309,18 @@ def execute_sensor_iteration(
     sensor_state_lock: Optional[threading.Lock] = None,
     log_verbose_checks: bool = True,
     debug_crash_flags=None,
+    async_evaluator: Optional[AsyncEvaluator] = None,
 ):
     instance = workspace_process_context.instance
 
     if not sensor_state_lock:
         sensor_state_lock = threading.Lock()
 
+    check.invariant(
+        async_evaluator is None or threadpool_executor is not None,
+        "threadpool_executor must be passed with async_evaluator",
+    )
+
     workspace_snapshot = {
         location_entry.origin.location_name: location_entry
         for location_entry in workspace_process_context.create_request_context()
@@ -363,9 +399,8 @@ def execute_sensor_iteration(
         yield
         return
 
+    sensors_to_tick: List[ExternalSensor] = []
     for external_sensor in sensors.values():
-        sensor_name = external_sensor.name
-        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
         sensor_state = all_sensor_states.get(external_sensor.selector_id)
         if not sensor_state:
             assert external_sensor.default_status == DefaultSensorStatus.RUNNING
@@ -390,17 +425,69 @@ def execute_sensor_iteration(
             ):
                 continue
 
+        sensors_to_tick.append(external_sensor)
+
+    if not sensors_to_tick:
+        return
+
+    # the states of all of the due sensors are read in a single storage query, while each tick is
+    # only created right before its sensor is evaluated
+    sensor_states = instance.get_instigator_states(
+        [external_sensor.selector_id for external_sensor in sensors_to_tick]
+    )
+    due_sensors = [
+        (external_sensor, sensor_states[external_sensor.selector_id])
+        for external_sensor in sensors_to_tick
+        if external_sensor.selector_id in sensor_states
+    ]
+    run_status_feeds = _get_run_status_feeds(instance, due_sensors)
+    for external_sensor, sensor_state in due_sensors:
+        sensor_name = external_sensor.name
+        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
+        run_status_feed = run_status_feeds.get(external_sensor.selector_id)
+
+        if async_evaluator:
+            # the tick is created before the sensor is evaluated on the event loop
+            try:
+                tick = _create_sensor_tick(
+                    instance, external_sensor, sensor_state, sensor_state_lock
+                )
+            except Exception:
+                logger.exception(f"Sensor daemon caught an error for sensor {sensor_name}")
+                continue
+
+            if not tick:
+                continue
+
+            check.not_none(sensor_tick_futures)[external_sensor.selector_id] = _submit_async_tick(
+                async_evaluator,
+                check.not_none(threadpool_executor),
+                workspace_process_context,
+                logger,
+                external_sensor,
+                sensor_state,
+                tick,
+                sensor_state_lock,
+                sensor_debug_crash_flags,
+                tick_retention_settings,
+                run_status_feed,
+            )
+            yield
+
+        elif threadpool_executor:
             future = threadpool_executor.submit(
                 _process_tick,
                 workspace_process_context,
                 logger,
                 external_sensor,
                 sensor_state,
+                None,
                 sensor_state_lock,
                 sensor_debug_crash_flags,
                 tick_retention_settings,
+                run_status_feed,
             )
-            sensor_tick_futures[external_sensor.selector_id] = future
+            check.not_none(sensor_tick_futures)[external_sensor.selector_id] = future
             yield
 
         else:
@@ -411,20 +498,129 @@ def execute_sensor_iteration(
                 logger,
                 external_sensor,
                 sensor_state,
+                None,
                 sensor_state_lock,
                 sensor_debug_crash_flags,
                 tick_retention_settings,
+                run_status_feed,
             )
 
 
+def _create_sensor_tick(
+    instance: DagsterInstance,
+    external_sensor: ExternalSensor,
+    sensor_state: InstigatorState,
+    sensor_state_lock: threading.Lock,
+) -> Optional[InstigatorTick]:
+    """Marks the state of the sensor as ticking and creates a started tick for it, returning None
+    if the sensor is no longer due for evaluation.
+    """
+    with sensor_state_lock:
+        # acquire the lock to avoid a race condition where we're updating the recently touched
+        # timestamp on the sensor state, but clobbering it with an older timestamp which might open
+        # us up to a new evaluation being delegated within the minimum interval
+        now = pendulum.now("UTC")
+        if _is_under_min_interval(sensor_state, external_sensor):
+            # check again, since the sensor may have waited to be evaluated since it was due
+            return None
+
+        instance.update_instigator_state(
+            _get_sensor_state_for_tick(external_sensor, sensor_state, now)
+        )
+
+    return instance.create_tick(
+        TickData(
+            instigator_origin_id=sensor_state.instigator_origin_id,
+            instigator_name=sensor_state.instigator_name,
+            instigator_type=InstigatorType.SENSOR,
+            status=TickStatus.STARTED,
+            timestamp=now.timestamp(),
+            selector_id=external_sensor.selector_id,
+        )
+    )
+
+
+def _submit_async_tick(
+    async_evaluator: AsyncEvaluator,
+    threadpool_executor: ThreadPoolExecutor,
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    external_sensor: ExternalSensor,
+    sensor_state: InstigatorState,
+    tick: InstigatorTick,
+    sensor_state_lock: threading.Lock,
+    sensor_debug_crash_flags,
+    tick_retention_settings,
+    run_status_feed: Optional[RunStatusFeedSlice],
+) -> Future:
+    """Evaluates the sensor on the event loop of the async evaluator, without holding a thread while
+    the code location evaluates it, then processes the evaluation on the threadpool. Returns a
+    future that resolves once the tick has been processed.
+    """
+    location_name = external_sensor.handle.location_name
+    repo_location = workspace_process_context.create_request_context().get_repository_location(
+        location_name
+    )
+    instigator_data = _sensor_instigator_data(sensor_state)
+    evaluation_future = async_evaluator.submit(
+        location_name,
+        lambda: repo_location.get_external_sensor_execution_data_async(
+            workspace_process_context.instance,
+            external_sensor.handle.repository_handle,
+            external_sensor.name,
+            instigator_data.last_tick_timestamp if instigator_data else None,
+            instigator_data.last_run_key if instigator_data else None,
+            instigator_data.cursor if instigator_data else None,
+            run_status_feed=run_status_feed,
+        ),
+    )
+
+    tick_future: Future = Future()
+
+    def _on_tick_processed(processing_future: Future) -> None:
+        error = processing_future.exception()
+        if error:
+            tick_future.set_exception(error)
+        else:
+            tick_future.set_result(processing_future.result())
+
+    def _on_evaluated(_evaluation_future: Future) -> None:
+        try:
+            processing_future = threadpool_executor.submit(
+                _process_tick,
+                workspace_process_context,
+                logger,
+                external_sensor,
+                sensor_state,
+                tick,
+                sensor_state_lock,
+                sensor_debug_crash_flags,
+                tick_retention_settings,
+                run_status_feed,
+                evaluation_future,
+            )
+        except RuntimeError as e:
+            # the threadpool has shut down, the tick is retried on the next daemon run
+            tick_future.set_exception(e)
+            return
+
+        processing_future.add_done_callback(_on_tick_processed)
+
+    evaluation_future.add_done_callback(_on_evaluated)
+    return tick_future
+
+
 def _process_tick(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
     external_sensor: ExternalSensor,
     sensor_state: InstigatorState,
+    tick: Optional[InstigatorTick],
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags,
     tick_retention_settings,
+    run_status_feed: Optional[RunStatusFeedSlice] = None,
+    evaluation_future: Optional[Future] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -434,9 +630,12 @@ def _process_tick(
             logger,
             external_sensor,
             sensor_state,
+            tick,
             sensor_state_lock,
             sensor_debug_crash_flags,
             tick_retention_settings,
+            run_status_feed,
+            evaluation_future,
         )
     )
 
@@ -446,39 +645,23 @@ def _process_tick_generator(
     logger: logging.Logger,
     external_sensor: ExternalSensor,
     sensor_state: InstigatorState,
+    tick: Optional[InstigatorTick],
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags,
     tick_retention_settings,
+    run_status_feed: Optional[RunStatusFeedSlice] = None,
+    evaluation_future: Optional[Future] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
-    with sensor_state_lock:
-        # acquire the lock to avoid a race condition where we're updating the recently touched
-        # timestamp on the sensor state, but clobbering it with an older timestamp which might open
-        # us up to a new evaluation being delegated within the minimum interval
-        now = pendulum.now("UTC")
-        sensor_state = check.not_none(
-            instance.get_instigator_state(
-                external_sensor.get_external_origin_id(), external_sensor.selector_id
-            )
-        )
-        if _is_under_min_interval(sensor_state, external_sensor):
-            # check the since we might have been queued before processing
-            return
-        else:
-            _mark_sensor_state_for_tick(instance, external_sensor, sensor_state, now)
 
     try:
-        tick = instance.create_tick(
-            TickData(
-                instigator_origin_id=sensor_state.instigator_origin_id,
-                instigator_name=sensor_state.instigator_name,
-                instigator_type=InstigatorType.SENSOR,
-                status=TickStatus.STARTED,
-                timestamp=now.timestamp(),
-                selector_id=external_sensor.selector_id,
-            )
-        )
+        if not tick:
+            # the tick is created right before the sensor is evaluated, so that it is stamped with
+            # the time of the evaluation
+            tick = _create_sensor_tick(instance, external_sensor, sensor_state, sensor_state_lock)
+            if not tick:
+                return
 
         _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
 
@@ -492,6 +675,8 @@ def _process_tick_generator(
                 external_sensor,
                 sensor_state,
                 sensor_debug_crash_flags,
+                run_status_feed,
+                evaluation_future,
             )
 
     except Exception:
@@ -501,6 +686,65 @@ def _process_tick_generator(
     yield error_info
 
 
+def _get_run_status_feeds(
+    instance: DagsterInstance,
+    due_sensors: Sequence[Tuple[ExternalSensor, InstigatorState]],
+) -> Mapping[str, RunStatusFeedSlice]:
+    """Reads the new run lifecycle events once for all of the due run status sensors, rather than
+    once per sensor, along with their runs, and returns the slice of events after the cursor of
+    each sensor, keyed by selector id.
+
+    The events of each event type are read after the earliest cursor of the sensors monitoring it,
+    up to the configured batch size. A sensor whose cursor is past the last event read gets no
+    slice, and reads the events after its cursor itself.
+    """
+    if instance.event_log_storage.is_run_sharded:
+        # storage ids are not unique across run shards, so each sensor queries the shards itself
+        return {}
+
+    record_ids_by_event_type: Dict[DagsterEventType, Dict[str, int]] = defaultdict(dict)
+    for external_sensor, sensor_state in due_sensors:
+        if external_sensor.sensor_type != SensorType.RUN_STATUS or not external_sensor.run_status:
+            continue
+
+        instigator_data = _sensor_instigator_data(sensor_state)
+        cursor = instigator_data.cursor if instigator_data else None
+        if not cursor or not RunStatusSensorCursor.is_valid(cursor):
+            # the sensor initializes its own cursor
+            continue
+
+        event_type = PIPELINE_RUN_STATUS_TO_EVENT_TYPE[external_sensor.run_status]
+        record_ids_by_event_type[event_type][
+            external_sensor.selector_id
+        ] = RunStatusSensorCursor.from_json(cursor).record_id
+
+    if not record_ids_by_event_type:
+        return {}
+
+    batch_size = instance.get_settings("sensors").get(
+        "run_status_batch_size", DEFAULT_RUN_STATUS_EVENT_BATCH_SIZE
+    )
+    run_status_feeds = {}
+    for event_type, record_ids in record_ids_by_event_type.items():
+        event_records = instance.get_event_records(
+            EventRecordsFilter(event_type=event_type, after_cursor=min(record_ids.values())),
+            ascending=True,
+            limit=batch_size,
+        )
+        entries = get_run_status_feed_entries(instance, event_records)
+        has_more = bool(event_records) and len(event_records) == batch_size
+        for selector_id, record_id in record_ids.items():
+            if has_more and record_id >= event_records[-1].storage_id:
+                continue
+
+            run_status_feeds[selector_id] = RunStatusFeedSlice(
+                after_storage_id=record_id,
+                entries=[entry for entry in entries if entry.event_record.storage_id > record_id],
+            )
+
+    return run_status_feeds
+
+
 def _sensor_instigator_data(state: InstigatorState) -> Optional[SensorInstigatorData]:
     instigator_data = state.instigator_data
     if instigator_data is None or isinstance(instigator_data, SensorInstigatorData):
@@ -509,24 +753,19 @@ def _sensor_instigator_data(state: InstigatorState) -> Optional[SensorInstigator
         check.failed(f"Expected SensorInstigatorData, got {instigator_data}")
 
 
-def _mark_sensor_state_for_tick(
-    instance: DagsterInstance,
+def _get_sensor_state_for_tick(
     external_sensor: ExternalSensor,
     sensor_state: InstigatorState,
     now: datetime.datetime,
-):
+) -> InstigatorState:
     instigator_data = _sensor_instigator_data(sensor_state)
-    instance.update_instigator_state(
-        sensor_state.with_data(
-            SensorInstigatorData(
-                last_tick_timestamp=instigator_data.last_tick_timestamp
-                if instigator_data
-                else None,
-                last_run_key=instigator_data.last_run_key if instigator_data else None,
-                min_interval=external_sensor.min_interval_seconds,
-                cursor=instigator_data.cursor if instigator_data else None,
-                last_tick_start_timestamp=now.timestamp(),
-            )
+    return sensor_state.with_data(
+        SensorInstigatorData(
+            last_tick_timestamp=instigator_data.last_tick_timestamp if instigator_data else None,
+            last_run_key=instigator_data.last_run_key if instigator_data else None,
+            min_interval=external_sensor.min_interval_seconds,
+            cursor=instigator_data.cursor if instigator_data else None,
+            last_tick_start_timestamp=now.timestamp(),
         )
     )
 
@@ -537,6 +776,8 @@ def _evaluate_sensor(
     external_sensor: ExternalSensor,
     state: InstigatorState,
     sensor_debug_crash_flags=None,
+    run_status_feed: Optional[RunStatusFeedSlice] = None,
+    evaluation_future: Optional[Future] = None,
 ):
     instance = workspace_process_context.instance
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
@@ -549,14 +790,19 @@ def _evaluate_sensor(
 
     instigator_data = _sensor_instigator_data(state)
 
-    sensor_runtime_data = repo_location.get_external_sensor_execution_data(
-        instance,
-        repository_handle,
-        external_sensor.name,
-        instigator_data.last_tick_timestamp if instigator_data else None,
-        instigator_data.last_run_key if instigator_data else None,
-        instigator_data.cursor if instigator_data else None,
-    )
+    if evaluation_future is not None:
+        # the sensor was already evaluated on the event loop of the async evaluator
+        sensor_runtime_data = evaluation_future.result()
+    else:
+        sensor_runtime_data = repo_location.get_external_sensor_execution_data(
+            instance,
+            repository_handle,
+            external_sensor.name,
+            instigator_data.last_tick_timestamp if instigator_data else None,
+            instigator_data.last_run_key if instigator_data else None,
+            instigator_data.cursor if instigator_data else None,
+            run_status_feed=run_status_feed,
+        )
 
     yield
 
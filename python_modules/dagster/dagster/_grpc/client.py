@@ -2,9 +2,9 @@
 import subprocess
 import sys
 import warnings
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from threading import Event
-from typing import Any, Iterator, Optional, Sequence, Tuple
+from typing import Any, AsyncIterator, Iterator, List, Optional, Sequence, Tuple
 
 import grpc
 from google.protobuf.reflection import GeneratedProtocolMessageType
@@ -54,6 +54,15 @@ def client_heartbeat_thread(client: "DagsterGrpcClient", shutdown_event: Event)
             continue
 
 
+def _get_sensor_timeout_message(timeout) -> str:
+    return (
+        f"The sensor tick timed out due to taking longer than {timeout} seconds to execute the"
+        " sensor function. One way to avoid this error is to break up the sensor work into"
+        " chunks, using cursors to let subsequent sensor calls pick up where the previous call"
+        " left off."
+    )
+
+
 class DagsterGrpcClient:
     def __init__(
         self,
@@ -99,12 +108,15 @@ def metadata(self) -> Sequence[Tuple[str, str]]:
     def use_ssl(self) -> bool:
         return self._use_ssl
 
-    @contextmanager
-    def _channel(self) -> Iterator[grpc.Channel]:
-        options = [
+    def _channel_options(self) -> Sequence[Tuple[str, int]]:
+        return [
             ("grpc.max_receive_message_length", max_rx_bytes()),
             ("grpc.max_send_message_length", max_send_bytes()),
         ]
+
+    @contextmanager
+    def _channel(self) -> Iterator[grpc.Channel]:
+        options = self._channel_options()
         with (
             grpc.secure_channel(
                 self._server_address,
@@ -121,6 +133,25 @@ def _channel(self) -> Iterator[grpc.Channel]:
         ) as channel:
             yield channel
 
+    @asynccontextmanager
+    async def _async_channel(self) -> AsyncIterator[grpc.aio.Channel]:
+        options = self._channel_options()
+        async with (
+            grpc.aio.secure_channel(
+                self._server_address,
+                self._ssl_creds,
+                options=options,
+                compression=grpc.Compression.Gzip,
+            )
+            if self._use_ssl
+            else grpc.aio.insecure_channel(
+                self._server_address,
+                options=options,
+                compression=grpc.Compression.Gzip,
+            )
+        ) as channel:
+            yield channel
+
     def _get_response(
         self,
         method: str,
@@ -187,6 +218,30 @@ def _streaming_query(
                 e, timeout=timeout, custom_timeout_message=custom_timeout_message
             )
 
+    async def _async_streaming_query(
+        self,
+        method,
+        request_type,
+        timeout=DEFAULT_GRPC_TIMEOUT,
+        custom_timeout_message=None,
+        **kwargs,
+    ) -> List[Any]:
+        # the responses are collected within the channel context, since async channels can not be
+        # left open across the yields of a generator
+        try:
+            async with self._async_channel() as channel:
+                stub = DagsterApiStub(channel)
+                return [
+                    response
+                    async for response in getattr(stub, method)(
+                        request_type(**kwargs), metadata=self._metadata, timeout=timeout
+                    )
+                ]
+        except Exception as e:
+            self._raise_grpc_exception(
+                e, timeout=timeout, custom_timeout_message=custom_timeout_message
+            )
+
     def ping(self, echo: str):
         check.str_param(echo, "echo")
         res = self._query("Ping", api_pb2.PingRequest, echo=echo)
@@ -381,6 +436,26 @@ def external_schedule_execution(self, external_schedule_execution_args):
 
         return "".join([chunk.serialized_chunk for chunk in chunks])
 
+    async def external_schedule_execution_async(
+        self, external_schedule_execution_args, timeout=DEFAULT_GRPC_TIMEOUT
+    ):
+        check.inst_param(
+            external_schedule_execution_args,
+            "external_schedule_execution_args",
+            ExternalScheduleExecutionArgs,
+        )
+
+        chunks = await self._async_streaming_query(
+            "ExternalScheduleExecution",
+            api_pb2.ExternalScheduleExecutionRequest,
+            timeout=timeout,
+            serialized_external_schedule_execution_args=serialize_dagster_namedtuple(
+                external_schedule_execution_args
+            ),
+        )
+
+        return "".join([chunk.serialized_chunk for chunk in chunks])
+
     def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_TIMEOUT):
         check.inst_param(
             sensor_execution_args,
@@ -388,13 +463,6 @@ def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_
             SensorExecutionArgs,
         )
 
-        custom_timeout_message = (
-            f"The sensor tick timed out due to taking longer than {timeout} seconds to execute the"
-            " sensor function. One way to avoid this error is to break up the sensor work into"
-            " chunks, using cursors to let subsequent sensor calls pick up where the previous call"
-            " left off."
-        )
-
         chunks = list(
             self._streaming_query(
                 "ExternalSensorExecution",
@@ -403,12 +471,33 @@ def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_
                 serialized_external_sensor_execution_args=serialize_dagster_namedtuple(
                     sensor_execution_args
                 ),
-                custom_timeout_message=custom_timeout_message,
+                custom_timeout_message=_get_sensor_timeout_message(timeout),
             )
         )
 
         return "".join([chunk.serialized_chunk for chunk in chunks])
 
+    async def external_sensor_execution_async(
+        self, sensor_execution_args, timeout=DEFAULT_GRPC_TIMEOUT
+    ):
+        check.inst_param(
+            sensor_execution_args,
+            "sensor_execution_args",
+            SensorExecutionArgs,
+        )
+
+        chunks = await self._async_streaming_query(
+            "ExternalSensorExecution",
+            api_pb2.ExternalSensorExecutionRequest,
+            timeout=timeout,
+            serialized_external_sensor_execution_args=serialize_dagster_namedtuple(
+                sensor_execution_args
+            ),
+            custom_timeout_message=_get_sensor_timeout_message(timeout),
+        )
+
+        return "".join([chunk.serialized_chunk for chunk in chunks])
+
     def external_notebook_data(self, notebook_path: str):
         check.str_param(notebook_path, "notebook_path")
         res = self._query(
@@ -12,6 +12,7 @@
 from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.reconstruct import ReconstructablePipeline
 from dagster._core.definitions.repository_definition import RepositoryDefinition
+from dagster._core.definitions.run_status_feed import RunStatusFeedSlice
 from dagster._core.definitions.sensor_definition import SensorEvaluationContext
 from dagster._core.errors import (
     DagsterExecutionInterruptedError,
@@ -302,6 +303,7 @@ def get_external_sensor_execution(
     last_completion_timestamp: Optional[float],
     last_run_key: Optional[str],
     cursor: Optional[str],
+    run_status_feed: Optional[RunStatusFeedSlice] = None,
 ):
     sensor_def = repo_def.get_sensor_def(sensor_name)
 
@@ -315,6 +317,7 @@ def get_external_sensor_execution(
                 repository_name=repo_def.name,
                 repository_def=repo_def,
                 sensor_name=sensor_name,
+                run_status_feed=run_status_feed,
             )
         )
 
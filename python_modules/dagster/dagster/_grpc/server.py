@@ -631,6 +631,7 @@ def ExternalSensorExecution(self, request, _context):
                 args.last_completion_time,
                 args.last_run_key,
                 args.cursor,
+                args.run_status_feed,
             )
         )
 
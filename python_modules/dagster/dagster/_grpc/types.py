@@ -5,6 +5,7 @@
 import dagster._check as check
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.run_status_feed import RunStatusFeedSlice
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.retries import RetryMode
 from dagster._core.host_representation.origin import (
@@ -541,6 +542,7 @@ class SensorExecutionArgs(
             ("last_completion_time", Optional[float]),
             ("last_run_key", Optional[str]),
             ("cursor", Optional[str]),
+            ("run_status_feed", Optional[RunStatusFeedSlice]),
         ],
     )
 ):
@@ -552,6 +554,7 @@ def __new__(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        run_status_feed: Optional[RunStatusFeedSlice] = None,
     ):
         return super(SensorExecutionArgs, cls).__new__(
             cls,
@@ -565,6 +568,9 @@ def __new__(
             ),
             last_run_key=check.opt_str_param(last_run_key, "last_run_key"),
             cursor=check.opt_str_param(cursor, "cursor"),
+            run_status_feed=check.opt_inst_param(
+                run_status_feed, "run_status_feed", RunStatusFeedSlice
+            ),
         )
 
 
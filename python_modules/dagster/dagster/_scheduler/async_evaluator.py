@@ -0,0 +1,209 @@
+"""Asynchronous evaluation of sensors and schedules against their code locations.
+
+Evaluating a sensor or schedule is dominated by waiting on a call to the code location. Rather than
+dedicating a thread to each in-flight evaluation, the `AsyncEvaluator` runs evaluations as
+coroutines on a single event loop, using the async gRPC stubs of the code servers. The number of
+evaluations in flight against each code location is capped separately, so that a slow code location
+holds up only its own evaluations, and each evaluation fails once it exceeds the timeout of its
+location. The latency of each evaluation is recorded in a histogram per code location.
+"""
+import asyncio
+import bisect
+import threading
+import time
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+import dagster._check as check
+from dagster._core.errors import DagsterUserCodeUnreachableError
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENT_EVALUATIONS_PER_LOCATION = 10
+
+# Upper bounds, in seconds, of the buckets of the evaluation latency histograms
+EVALUATION_LATENCY_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class LatencyHistogram:
+    """Counts observed latencies in buckets with the given upper bounds, plus an overflow bucket."""
+
+    def __init__(self, buckets: Sequence[float] = EVALUATION_LATENCY_BUCKETS):
+        self._buckets = sorted(check.sequence_param(buckets, "buckets", of_type=float))
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self._counts[bisect.bisect_left(self._buckets, seconds)] += 1
+        self._sum += seconds
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._sum / self.count if self.count else None
+
+    @property
+    def bucket_counts(self) -> Mapping[str, int]:
+        labels = [f"<={bucket:g}s" for bucket in self._buckets] + [f">{self._buckets[-1]:g}s"]
+        return dict(zip(labels, self._counts))
+
+    def __str__(self) -> str:
+        if not self.count:
+            return "no evaluations"
+        buckets = ", ".join(f"{label}: {count}" for label, count in self.bucket_counts.items())
+        return f"{self.count} evaluations, mean {self.mean:.3f}s ({buckets})"
+
+
+class EvaluationLimits(
+    NamedTuple(
+        "_EvaluationLimits",
+        [("max_concurrent_evaluations", int), ("timeout_seconds", Optional[float])],
+    )
+):
+    def __new__(cls, max_concurrent_evaluations: int, timeout_seconds: Optional[float] = None):
+        check.int_param(max_concurrent_evaluations, "max_concurrent_evaluations")
+        check.invariant(
+            max_concurrent_evaluations > 0, "max_concurrent_evaluations must be positive"
+        )
+        return super(EvaluationLimits, cls).__new__(
+            cls,
+            max_concurrent_evaluations=max_concurrent_evaluations,
+            timeout_seconds=check.opt_numeric_param(timeout_seconds, "timeout_seconds"),
+        )
+
+
+class AsyncEvaluator:
+    """Runs evaluations as coroutines on an event loop in a background thread, with a cap on the
+    evaluations in flight and a timeout per code location.
+
+    Use as a context manager, which starts the event loop thread on entry and stops it on exit.
+
+    Args:
+        max_concurrent_evaluations (int): The default maximum number of evaluations in flight
+            against a single code location.
+        timeout_seconds (Optional[float]): The default number of seconds an evaluation may take
+            before it fails. Defaults to no timeout beyond that of the code location call itself.
+        location_limits (Optional[Mapping[str, Mapping[str, Any]]]): Overrides of
+            `max_concurrent_evaluations` and `timeout_seconds`, keyed by code location name.
+        thread_name (str): The name of the event loop thread.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_evaluations: int = DEFAULT_MAX_CONCURRENT_EVALUATIONS_PER_LOCATION,
+        timeout_seconds: Optional[float] = None,
+        location_limits: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        thread_name: str = "async_evaluator",
+    ):
+        self._default_limits = EvaluationLimits(max_concurrent_evaluations, timeout_seconds)
+        self._location_limits = {
+            location_name: EvaluationLimits(
+                limits.get("max_concurrent_evaluations", max_concurrent_evaluations),
+                limits.get("timeout_seconds", timeout_seconds),
+            )
+            for location_name, limits in check.opt_mapping_param(
+                location_limits, "location_limits", key_type=str
+            ).items()
+        }
+        self._thread_name = check.str_param(thread_name, "thread_name")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # only accessed from the event loop thread
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        self._lock = threading.Lock()
+        self._latency_histograms: Dict[str, LatencyHistogram] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Mapping[str, Any], thread_name: str) -> "AsyncEvaluator":
+        """Creates an evaluator from the `async_evaluation` settings of the sensor or schedule
+        daemon.
+        """
+        return cls(
+            max_concurrent_evaluations=settings.get(
+                "max_concurrent_evaluations", DEFAULT_MAX_CONCURRENT_EVALUATIONS_PER_LOCATION
+            ),
+            timeout_seconds=settings.get("timeout_seconds"),
+            location_limits=settings.get("locations"),
+            thread_name=thread_name,
+        )
+
+    def __enter__(self) -> "AsyncEvaluator":
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name=self._thread_name, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback) -> None:
+        loop = check.not_none(self._loop)
+        loop.call_soon_threadsafe(loop.stop)
+        check.not_none(self._thread).join()
+        loop.close()
+        self._loop = None
+        self._thread = None
+
+    def get_limits(self, location_name: str) -> EvaluationLimits:
+        return self._location_limits.get(location_name, self._default_limits)
+
+    def submit(self, location_name: str, evaluate: Callable[[], Awaitable[T]]) -> "Future[T]":
+        """Schedules a call of the given coroutine function against the given code location, and
+        returns a future that resolves to its result. Evaluations beyond the limit of the code
+        location wait for an earlier evaluation to finish before starting.
+        """
+        check.str_param(location_name, "location_name")
+        check.callable_param(evaluate, "evaluate")
+        check.invariant(self._loop is not None, "AsyncEvaluator must be used as a context manager")
+
+        return asyncio.run_coroutine_threadsafe(
+            self._evaluate(location_name, evaluate), check.not_none(self._loop)
+        )
+
+    async def _evaluate(self, location_name: str, evaluate: Callable[[], Awaitable[T]]) -> T:
+        limits = self.get_limits(location_name)
+        if location_name not in self._semaphores:
+            self._semaphores[location_name] = asyncio.Semaphore(limits.max_concurrent_evaluations)
+
+        async with self._semaphores[location_name]:
+            start_time = time.monotonic()
+            try:
+                return await asyncio.wait_for(evaluate(), limits.timeout_seconds)
+            except asyncio.TimeoutError as e:
+                raise DagsterUserCodeUnreachableError(
+                    f"Evaluation against code location {location_name} timed out after"
+                    f" {limits.timeout_seconds} seconds."
+                ) from e
+            finally:
+                latency = time.monotonic() - start_time
+                with self._lock:
+                    if location_name not in self._latency_histograms:
+                        self._latency_histograms[location_name] = LatencyHistogram()
+                    self._latency_histograms[location_name].observe(latency)
+
+    def get_latency_histograms(self) -> Mapping[str, LatencyHistogram]:
+        """Returns the histogram of evaluation latencies of each code location evaluated so far."""
+        with self._lock:
+            return dict(self._latency_histograms)
+
+    def get_latency_report(self) -> List[str]:
+        with self._lock:
+            return [
+                f"Evaluation latency for code location {location_name}: {histogram}"
+                for location_name, histogram in sorted(self._latency_histograms.items())
+            ]
@@ -7,7 +7,7 @@
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, Mapping, Optional, Sequence, cast
 
 import pendulum
 
@@ -35,6 +35,7 @@
 from dagster._core.storage.tags import RUN_KEY_TAG, SCHEDULED_EXECUTION_TIME_TAG
 from dagster._core.telemetry import SCHEDULED_RUN_CREATED, hash_name, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._scheduler.async_evaluator import AsyncEvaluator
 from dagster._scheduler.stale import resolve_stale_or_unknown_assets
 from dagster._seven.compat.pendulum import to_timezone
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -121,7 +122,17 @@ def execute_scheduler_iteration_loop(
 
     with ExitStack() as stack:
         settings = workspace_process_context.instance.get_settings("schedules")
-        if settings.get("use_threads"):
+        async_evaluation_settings = settings.get("async_evaluation") or {}
+        if async_evaluation_settings.get("enabled"):
+            async_evaluator = stack.enter_context(
+                AsyncEvaluator.from_settings(
+                    async_evaluation_settings, thread_name="schedule_daemon_async_evaluator"
+                )
+            )
+        else:
+            async_evaluator = None
+
+        if settings.get("use_threads") or async_evaluator:
             threadpool_executor = stack.enter_context(
                 ThreadPoolExecutor(
                     max_workers=settings.get("num_workers"),
@@ -150,10 +161,15 @@ def execute_scheduler_iteration_loop(
                 max_catchup_runs=max_catchup_runs,
                 max_tick_retries=max_tick_retries,
                 log_verbose_checks=verbose_logs_iteration,
+                async_evaluator=async_evaluator,
             )
             yield
             end_time = pendulum.now("UTC").timestamp()
 
+            if async_evaluator and verbose_logs_iteration:
+                for message in async_evaluator.get_latency_report():
+                    logger.info(message)
+
             if verbose_logs_iteration:
                 last_verbose_time = end_time
 
@@ -177,12 +193,18 @@ def launch_scheduled_runs(
     max_tick_retries: int = 0,
     debug_crash_flags=None,
     log_verbose_checks: bool = True,
+    async_evaluator: Optional[AsyncEvaluator] = None,
 ):
     instance = workspace_process_context.instance
 
     if not schedule_state_lock:
         schedule_state_lock = threading.Lock()
 
+    check.invariant(
+        async_evaluator is None or threadpool_executor is not None,
+        "threadpool_executor must be passed with async_evaluator",
+    )
+
     workspace_snapshot = {
         location_entry.origin.location_name: location_entry
         for location_entry in workspace_process_context.create_request_context()
@@ -289,6 +311,30 @@ def launch_scheduled_runs(
         schedule_names = ", ".join([schedule.name for schedule in schedules.values()])
         logger.info(f"Checking for new runs for the following schedules: {schedule_names}")
 
+    # fetch the latest tick of every schedule that is not already in flight in a single query,
+    # rather than a query per schedule
+    latest_ticks_by_selector_id = _get_latest_ticks(
+        instance,
+        [
+            selector_id
+            for selector_id in schedules
+            if not (
+                scheduler_run_futures
+                and selector_id in scheduler_run_futures
+                and not scheduler_run_futures[selector_id].done()
+            )
+        ],
+        schedule_state_lock,
+    )
+
+    # the number of schedule ticks still in flight against each code location, so that a slow code
+    # location can't take up every worker of the threadpool
+    in_flight_by_location: Dict[str, int] = defaultdict(int)
+    if async_evaluator and scheduler_run_futures:
+        for selector_id, future in scheduler_run_futures.items():
+            if selector_id in schedules and not future.done():
+                in_flight_by_location[schedules[selector_id].handle.location_name] += 1
+
     for external_schedule in schedules.values():
         error_info = None
         try:
@@ -323,6 +369,20 @@ def launch_scheduled_runs(
                 ):
                     continue
 
+                location_name = external_schedule.handle.location_name
+                if async_evaluator:
+                    max_concurrent_evaluations = async_evaluator.get_limits(
+                        location_name
+                    ).max_concurrent_evaluations
+                    if in_flight_by_location[location_name] >= max_concurrent_evaluations:
+                        logger.debug(
+                            f"Deferring schedule {external_schedule.name} to the next iteration,"
+                            f" {max_concurrent_evaluations} evaluations are already in flight"
+                            f" against code location {location_name}."
+                        )
+                        continue
+                    in_flight_by_location[location_name] += 1
+
                 future = threadpool_executor.submit(
                     launch_scheduled_runs_for_schedule,
                     workspace_process_context,
@@ -336,6 +396,8 @@ def launch_scheduled_runs(
                     tick_retention_settings,
                     schedule_debug_crash_flags,
                     log_verbose_checks=log_verbose_checks,
+                    latest_ticks=latest_ticks_by_selector_id.get(external_schedule.selector_id),
+                    async_evaluator=async_evaluator,
                 )
                 scheduler_run_futures[external_schedule.selector_id] = future
                 yield
@@ -355,6 +417,7 @@ def launch_scheduled_runs(
                     tick_retention_settings,
                     schedule_debug_crash_flags,
                     log_verbose_checks=log_verbose_checks,
+                    latest_ticks=latest_ticks_by_selector_id.get(external_schedule.selector_id),
                 )
         except Exception:
             error_info = serializable_error_info_from_exc_info(sys.exc_info())
@@ -362,6 +425,22 @@ def launch_scheduled_runs(
         yield error_info
 
 
+def _get_latest_ticks(
+    instance: DagsterInstance,
+    selector_ids: Sequence[str],
+    schedule_state_lock: threading.Lock,
+) -> Mapping[str, Sequence[InstigatorTick]]:
+    if not selector_ids or not instance.supports_batch_tick_queries:
+        return {}
+
+    with schedule_state_lock:
+        ticks_by_selector_id = instance.get_batch_ticks(selector_ids, limit=1)
+
+    return {
+        selector_id: list(ticks_by_selector_id.get(selector_id, [])) for selector_id in selector_ids
+    }
+
+
 def launch_scheduled_runs_for_schedule(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -374,6 +453,8 @@ def launch_scheduled_runs_for_schedule(
     tick_retention_settings,
     schedule_debug_crash_flags,
     log_verbose_checks,
+    latest_ticks: Optional[Sequence[InstigatorTick]] = None,
+    async_evaluator: Optional[AsyncEvaluator] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -390,6 +471,8 @@ def launch_scheduled_runs_for_schedule(
             tick_retention_settings,
             schedule_debug_crash_flags,
             log_verbose_checks,
+            latest_ticks,
+            async_evaluator,
         )
     )
 
@@ -406,15 +489,20 @@ def launch_scheduled_runs_for_schedule_iterator(
     tick_retention_settings,
     schedule_debug_crash_flags,
     log_verbose_checks,
+    latest_ticks: Optional[Sequence[InstigatorTick]] = None,
+    async_evaluator: Optional[AsyncEvaluator] = None,
 ):
     schedule_state = check.inst_param(schedule_state, "schedule_state", InstigatorState)
     end_datetime_utc = check.inst_param(end_datetime_utc, "end_datetime_utc", datetime.datetime)
     instance = workspace_process_context.instance
 
-    with schedule_state_lock:
-        instigator_origin_id = external_schedule.get_external_origin_id()
-        ticks = instance.get_ticks(instigator_origin_id, external_schedule.selector_id, limit=1)
-        latest_tick: Optional[InstigatorTick] = ticks[0] if ticks else None
+    instigator_origin_id = external_schedule.get_external_origin_id()
+    if latest_ticks is None:
+        with schedule_state_lock:
+            latest_ticks = instance.get_ticks(
+                instigator_origin_id, external_schedule.selector_id, limit=1
+            )
+    latest_tick: Optional[InstigatorTick] = latest_ticks[0] if latest_ticks else None
 
     instigator_data = cast(ScheduleInstigatorData, schedule_state.instigator_data)
     start_timestamp_utc = instigator_data.start_timestamp if schedule_state else None
@@ -516,6 +604,7 @@ def launch_scheduled_runs_for_schedule_iterator(
                     schedule_time,
                     tick_context,
                     schedule_debug_crash_flags,
+                    async_evaluator,
                 )
             except Exception as e:
                 if isinstance(e, DagsterUserCodeUnreachableError):
@@ -573,6 +662,7 @@ def _schedule_runs_at_time(
     schedule_time: datetime.datetime,
     tick_context: _ScheduleLaunchContext,
     debug_crash_flags,
+    async_evaluator: Optional[AsyncEvaluator] = None,
 ):
     schedule_name = external_schedule.name
     instance = workspace_process_context.instance
@@ -583,12 +673,23 @@ def _schedule_runs_at_time(
         schedule_origin.external_repository_origin.repository_location_origin.location_name
     )
 
-    schedule_execution_data = repo_location.get_external_schedule_execution_data(
-        instance=instance,
-        repository_handle=repository_handle,
-        schedule_name=external_schedule.name,
-        scheduled_execution_time=schedule_time,
-    )
+    if async_evaluator:
+        schedule_execution_data = async_evaluator.submit(
+            repo_location.name,
+            lambda: repo_location.get_external_schedule_execution_data_async(
+                instance=instance,
+                repository_handle=repository_handle,
+                schedule_name=external_schedule.name,
+                scheduled_execution_time=schedule_time,
+            ),
+        ).result()
+    else:
+        schedule_execution_data = repo_location.get_external_schedule_execution_data(
+            instance=instance,
+            repository_handle=repository_handle,
+            schedule_name=external_schedule.name,
+            scheduled_execution_time=schedule_time,
+        )
     yield None
 
     if schedule_execution_data.captured_log_key:
@@ -3,6 +3,7 @@
     ConfigurableClassData as ConfigurableClassData,
     class_from_code_pointer as class_from_code_pointer,
 )
+from .encoding import SerdesFormat as SerdesFormat
 from .serdes import (
     DefaultNamedTupleSerializer as DefaultNamedTupleSerializer,
     WhitelistMap as WhitelistMap,
@@ -0,0 +1,170 @@
+"""
+Encodings for the serialized form of packed values.
+
+By default, packed values are encoded as JSON text. Storage payloads can instead be written with one
+of the binary formats below, which trade human readability for smaller payloads and (with msgpack)
+cheaper parsing. Binary payloads are still written as text, so that they fit in the existing text
+columns, in the form::
+
+    #dgs<version>:<codec>:<base64 encoded body>
+
+``<codec>`` records how the body was actually encoded, which may differ from the requested format:
+small payloads are left uncompressed, and values that msgpack cannot represent fall back to JSON.
+A JSON document can never start with ``#``, so readers accept both binary payloads and plain JSON.
+
+Base64 inflates the body by a third, which msgpack alone does not make up for: the events of a
+typical run come out about 3% larger as uncompressed msgpack than as JSON, and about half the size
+of the JSON with either compression. So a binary payload is only written when it is shorter than
+the JSON text, which is written otherwise.
+
+Binary bodies are built from the JSON form of the value, so that values read back the same in every
+format. In particular, JSON turns non-string dict keys into strings, which msgpack would keep.
+"""
+
+import base64
+import zlib
+from enum import Enum
+from typing import Any, Optional
+
+import dagster._seven as seven
+
+from .errors import DeserializationError, SerdesUsageError
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+BINARY_HEADER_PREFIX = "#dgs"
+BINARY_FORMAT_VERSION = 1
+
+# bodies smaller than this are written uncompressed, since compressing them rarely pays for the
+# header and base64 overhead
+COMPRESSION_MIN_BYTES = 256
+
+JSON_ENCODING = "json"
+MSGPACK_ENCODING = "msgpack"
+ZLIB_COMPRESSION = "zlib"
+ZSTD_COMPRESSION = "zstd"
+
+ZSTD_COMPRESSION_LEVEL = 3
+
+
+class SerdesFormat(Enum):
+    JSON = "json"
+    JSON_ZLIB = "json+zlib"
+    JSON_ZSTD = "json+zstd"
+    MSGPACK = "msgpack"
+    MSGPACK_ZLIB = "msgpack+zlib"
+    MSGPACK_ZSTD = "msgpack+zstd"
+
+    @property
+    def body_encoding(self) -> str:
+        return self.value.split("+")[0]
+
+    @property
+    def compression(self) -> Optional[str]:
+        parts = self.value.split("+")
+        return parts[1] if len(parts) > 1 else None
+
+
+def check_serdes_format_available(serdes_format: SerdesFormat) -> None:
+    """Raises a SerdesUsageError if a library needed to write the given format is not installed."""
+    if serdes_format.body_encoding == MSGPACK_ENCODING:
+        _check_library_installed(msgpack, "msgpack", serdes_format.value)
+    if serdes_format.compression == ZSTD_COMPRESSION:
+        _check_library_installed(zstandard, "zstandard", serdes_format.value)
+
+
+def _check_library_installed(module: Any, library_name: str, what: str) -> None:
+    if module is None:
+        raise SerdesUsageError(
+            f"The {library_name} library is required for the {what} serialization format. "
+            "Install it with `pip install dagster[binary-serdes]`."
+        )
+
+
+def encode_packed_value(packed: Any, serdes_format: SerdesFormat = SerdesFormat.JSON) -> str:
+    """Encode an already packed value in the given format."""
+    if serdes_format == SerdesFormat.JSON:
+        return seven.json.dumps(packed)
+
+    check_serdes_format_available(serdes_format)
+
+    json_str = seven.json.dumps(packed)
+    body_encoding = serdes_format.body_encoding
+    body = None
+    if body_encoding == MSGPACK_ENCODING:
+        try:
+            body = msgpack.packb(seven.json.loads(json_str), use_bin_type=True)
+        except (OverflowError, TypeError, ValueError):
+            # e.g. integers wider than 64 bits, which json can represent
+            body_encoding = JSON_ENCODING
+
+    if body is None:
+        body = json_str.encode("utf-8")
+
+    compression = serdes_format.compression
+    if compression and len(body) >= COMPRESSION_MIN_BYTES:
+        if compression == ZLIB_COMPRESSION:
+            body = zlib.compress(body)
+        else:
+            body = zstandard.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL).compress(body)
+        codec = f"{body_encoding}+{compression}"
+    elif body_encoding == JSON_ENCODING:
+        return json_str
+    else:
+        codec = body_encoding
+
+    header = f"{BINARY_HEADER_PREFIX}{BINARY_FORMAT_VERSION}:{codec}:"
+    serialized = header + base64.b64encode(body).decode("ascii")
+    return serialized if len(serialized) < len(json_str) else json_str
+
+
+def decode_packed_value(serialized: str) -> Any:
+    """Decode a serialized string written in any of the supported formats in to its packed form."""
+    if not serialized.startswith(BINARY_HEADER_PREFIX):
+        return seven.json.loads(serialized)
+
+    try:
+        version, codec, payload = serialized[len(BINARY_HEADER_PREFIX) :].split(":", 2)
+    except ValueError:
+        raise DeserializationError("Malformed header for binary serialized value.")
+
+    if version != str(BINARY_FORMAT_VERSION):
+        raise DeserializationError(
+            f"Unsupported binary serialization format version {version}. The value was likely "
+            "written by a newer version of dagster."
+        )
+
+    body_encoding, _, compression = codec.partition("+")
+    body = base64.b64decode(payload)
+
+    if compression == ZLIB_COMPRESSION:
+        body = zlib.decompress(body)
+    elif compression == ZSTD_COMPRESSION:
+        _check_decode_library_installed(zstandard, "zstandard", codec)
+        body = zstandard.ZstdDecompressor().decompress(body)
+    elif compression:
+        raise DeserializationError(f"Unknown compression {compression} in serialized value.")
+
+    if body_encoding == JSON_ENCODING:
+        return seven.json.loads(body.decode("utf-8"))
+    elif body_encoding == MSGPACK_ENCODING:
+        _check_decode_library_installed(msgpack, "msgpack", codec)
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+
+    raise DeserializationError(f"Unknown encoding {body_encoding} in serialized value.")
+
+
+def _check_decode_library_installed(module: Any, library_name: str, codec: str) -> None:
+    if module is None:
+        raise DeserializationError(
+            f"The {library_name} library is required to read values serialized as {codec}. "
+            "Install it with `pip install dagster[binary-serdes]`."
+        )
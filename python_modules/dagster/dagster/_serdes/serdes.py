@@ -38,6 +38,7 @@
 import dagster._check as check
 import dagster._seven as seven
 
+from .encoding import SerdesFormat, decode_packed_value, encode_packed_value
 from .errors import DeserializationError, SerdesUsageError, SerializationError
 
 ###################################################################################################
@@ -55,6 +56,9 @@ class WhitelistMap(NamedTuple):
     enums: Dict[str, EnumEntry]
     serialized_names: Dict[str, str]
     deserialized_names: Dict[str, str]
+    # specialized (un)packers, compiled the first time each class is (de)serialized
+    compiled_unpackers: Dict[str, Callable[[Dict[str, Any]], Any]]
+    compiled_packers: Dict[type, Callable[[Any], Dict[str, Any]]]
 
     def register_tuple(
         self,
@@ -73,6 +77,7 @@ def register_tuple(
             args_for_class: the inspect.signature paramaters for __new__
         """
         self.tuples[name] = (nt, serializer or DefaultNamedTupleSerializer, args_for_class)
+        self.clear_compiled()
 
     def has_tuple_entry(self, name: str) -> bool:
         return name in self.tuples
@@ -87,6 +92,7 @@ def register_enum(
         serializer: Optional[Type["EnumSerializer"]],
     ):
         self.enums[name] = (enum, serializer or DefaultEnumSerializer)
+        self.clear_compiled()
 
     def has_enum_entry(self, name: str) -> bool:
         return name in self.enums
@@ -96,6 +102,7 @@ def get_enum_entry(self, name: str) -> EnumEntry:
 
     def register_serialized_name(self, name: str, serialized_name: str):
         self.serialized_names[name] = serialized_name
+        self.clear_compiled()
 
     def has_serialized_name(self, name: str) -> bool:
         return name in self.serialized_names
@@ -105,6 +112,7 @@ def get_serialized_name(self, name: str) -> str:
 
     def register_deserialized_name(self, name: str, deserialized_name: str):
         self.deserialized_names[name] = deserialized_name
+        self.clear_compiled()
 
     def has_deserialized_name(self, name: str) -> bool:
         return name in self.deserialized_names
@@ -112,9 +120,21 @@ def has_deserialized_name(self, name: str) -> bool:
     def get_deserialized_name(self, name: str) -> str:
         return self.deserialized_names[name]
 
+    def clear_compiled(self):
+        """Discard the compiled (un)packers, which are specialized to the current registrations."""
+        self.compiled_unpackers.clear()
+        self.compiled_packers.clear()
+
     @staticmethod
     def create():
-        return WhitelistMap(tuples={}, enums={}, serialized_names={}, deserialized_names={})
+        return WhitelistMap(
+            tuples={},
+            enums={},
+            serialized_names={},
+            deserialized_names={},
+            compiled_unpackers={},
+            compiled_packers={},
+        )
 
 
 _WHITELIST_MAP = WhitelistMap.create()
@@ -352,10 +372,15 @@ def _serialize_dagster_namedtuple(
     return seven.json.dumps(pack_inner_value(nt, whitelist_map, _root(nt)), **json_kwargs)
 
 
-def serialize_value(val: Any, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> str:
-    """Serialize a value to a json encoded string."""
-    return seven.json.dumps(
-        pack_inner_value(val, whitelist_map=whitelist_map, descent_path=_root(val))
+def serialize_value(
+    val: Any,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+    serdes_format: SerdesFormat = SerdesFormat.JSON,
+) -> str:
+    """Serialize a value to a string, json encoded unless another format is requested."""
+    return encode_packed_value(
+        pack_inner_value(val, whitelist_map=whitelist_map, descent_path=_root(val)),
+        serdes_format=serdes_format,
     )
 
 
@@ -373,6 +398,17 @@ def pack_value(val: Any) -> Any:
 
 
 def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    if _COMPILED_ENABLED:
+        try:
+            return pack_compiled(val, whitelist_map)
+        except SerializationError:
+            # the compiled packers do not track the descent path, so pack the value again to raise
+            # an error that points at the offending value
+            pass
+    return _pack_inner_value(val, whitelist_map, descent_path)
+
+
+def _pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
             pack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
@@ -479,14 +515,14 @@ def opt_deserialize_as(json_str: Optional[str], cls: Type[T]) -> Optional[T]:
 
 
 def _deserialize_json(json_str: str, whitelist_map: WhitelistMap):
-    value = seven.json.loads(json_str)
+    value = decode_packed_value(json_str)
     return unpack_inner_value(value, whitelist_map=whitelist_map, descent_path=_root(value))
 
 
 def deserialize_value(val: str, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> Any:
-    """Deserialize a json encoded string in to its original value."""
+    """Deserialize a string in any of the supported formats in to its original value."""
     return unpack_inner_value(
-        seven.json.loads(check.str_param(val, "val")),
+        decode_packed_value(check.str_param(val, "val")),
         whitelist_map=whitelist_map,
         descent_path="",
     )
@@ -502,13 +538,24 @@ def unpack_value(val: Any) -> Any:
 
 
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    if _COMPILED_ENABLED:
+        try:
+            return unpack_compiled(val, whitelist_map)
+        except DeserializationError:
+            # the compiled unpackers do not track the descent path, so unpack the value again to
+            # raise an error that points at the offending value
+            pass
+    return _unpack_inner_value(val, whitelist_map, descent_path)
+
+
+def _unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
             unpack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, dict) and val.get("__class__"):
-        klass_name = cast(str, val.pop("__class__"))
+        klass_name = cast(str, val["__class__"])
         lookup_name = (
             whitelist_map.get_deserialized_name(klass_name)
             if whitelist_map.has_deserialized_name(klass_name)
@@ -533,7 +580,11 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
             return None
 
         return serializer.value_from_storage_dict(
-            val, klass, args_for_class, whitelist_map, descent_path
+            {key: value for key, value in val.items() if key != "__class__"},
+            klass,
+            args_for_class,
+            whitelist_map,
+            descent_path,
         )
     if isinstance(val, dict) and val.get("__enum__"):
         name, member = val["__enum__"].split(".")
@@ -562,6 +613,238 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
     return val
 
 
+###################################################################################################
+# Compiled (un)packers
+###################################################################################################
+
+# The reference implementations above (_pack_inner_value / _unpack_inner_value) resolve every value
+# generically: they look up the serializer for each namedtuple by name and build the descent path
+# to every value as they go, so that errors can point at the offending value. pack_compiled and
+# unpack_compiled produce the same output, but compile a specialized packer and unpacker for each
+# namedtuple class the first time it is (de)serialized, and do not track descent paths.
+# pack_inner_value and unpack_inner_value use them, and only fall back to the reference
+# implementations to report errors. Neither implementation modifies the value being unpacked, so
+# that it can be unpacked again.
+#
+# Only namedtuples using the default (un)packing of DefaultNamedTupleSerializer are compiled, custom
+# serializers are called as usual (and their calls to pack_inner_value / unpack_inner_value for
+# nested values use the compiled path in turn).
+
+# Can be disabled to only use the reference implementations, e.g. for benchmarking
+_COMPILED_ENABLED = True
+
+_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def pack_compiled(val: Any, whitelist_map: WhitelistMap) -> Any:
+    """Equivalent to pack_inner_value, using compiled packers for whitelisted namedtuples."""
+    if val.__class__ in _SCALAR_TYPES:
+        return val
+    if isinstance(val, list):
+        return [pack_compiled(item, whitelist_map) for item in val]
+    if isinstance(val, tuple):
+        packer = whitelist_map.compiled_packers.get(val.__class__)
+        if packer is None:
+            packer = _compile_packer(val.__class__, whitelist_map)
+            whitelist_map.compiled_packers[val.__class__] = packer
+        return packer(val)
+    if isinstance(val, Enum):
+        klass_name = val.__class__.__name__
+        if not whitelist_map.has_enum_entry(klass_name):
+            raise SerializationError(
+                f"Can only serialize whitelisted Enums, received {klass_name}."
+            )
+        _, enum_serializer = whitelist_map.get_enum_entry(klass_name)
+        return {"__enum__": enum_serializer.value_to_storage_str(val, whitelist_map, "")}
+    if isinstance(val, set):
+        return {
+            "__set__": [pack_compiled(item, whitelist_map) for item in sorted(list(val), key=str)]
+        }
+    if isinstance(val, frozenset):
+        return {
+            "__frozenset__": [
+                pack_compiled(item, whitelist_map) for item in sorted(list(val), key=str)
+            ]
+        }
+    if isinstance(val, dict):
+        return {key: pack_compiled(value, whitelist_map) for key, value in val.items()}
+
+    return val
+
+
+def unpack_compiled(val: Any, whitelist_map: WhitelistMap) -> Any:
+    """Equivalent to unpack_inner_value, using compiled unpackers for whitelisted namedtuples."""
+    if val.__class__ in _SCALAR_TYPES:
+        return val
+    if isinstance(val, list):
+        return [
+            item if item.__class__ in _SCALAR_TYPES else unpack_compiled(item, whitelist_map)
+            for item in val
+        ]
+    if not isinstance(val, dict):
+        return val
+
+    klass_name = val.get("__class__")
+    if klass_name:
+        unpacker = whitelist_map.compiled_unpackers.get(klass_name)
+        if unpacker is None:
+            unpacker = _compile_unpacker(klass_name, whitelist_map)
+            whitelist_map.compiled_unpackers[klass_name] = unpacker
+        return unpacker(val)
+    if val.get("__enum__"):
+        name, member = val["__enum__"].split(".")
+        if not whitelist_map.has_enum_entry(name):
+            raise DeserializationError(
+                f"Attempted to deserialize enum {name} which was not in the whitelist."
+            )
+        enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
+        return enum_serializer.value_from_storage_str(member, enum_class)
+    if val.get("__set__") is not None:
+        return set([unpack_compiled(item, whitelist_map) for item in val["__set__"]])
+    if val.get("__frozenset__") is not None:
+        return frozenset([unpack_compiled(item, whitelist_map) for item in val["__frozenset__"]])
+    return {
+        key: value if value.__class__ in _SCALAR_TYPES else unpack_compiled(value, whitelist_map)
+        for key, value in val.items()
+    }
+
+
+def _is_default_serializer_method(serializer: Type[Serializer], method_name: str) -> bool:
+    return (
+        getattr(serializer, method_name).__func__
+        is getattr(DefaultNamedTupleSerializer, method_name).__func__
+    )
+
+
+def _compile_function(
+    name: str, lines: List[str], namespace: Dict[str, Any], filename: str
+) -> Callable[..., Any]:
+    exec(compile("\n".join(lines), filename, "exec"), namespace)  # pylint: disable=exec-used
+    return namespace[name]
+
+
+def _compile_packer(klass: Type[Any], whitelist_map: WhitelistMap) -> Callable[[Any], Any]:
+    klass_name = klass.__name__
+    if not whitelist_map.has_tuple_entry(klass_name):
+        raise SerializationError(f"Can only serialize whitelisted namedtuples, received {klass}.")
+
+    _, serializer, _ = whitelist_map.get_tuple_entry(klass_name)
+    if not _is_default_serializer_method(serializer, "value_to_storage_dict"):
+        return lambda value: serializer.value_to_storage_dict(value, whitelist_map, "")
+
+    serializer = cast(Type[DefaultNamedTupleSerializer], serializer)
+    skip_when_empty_fields = serializer.skip_when_empty()
+    storage_name = (
+        whitelist_map.get_serialized_name(klass_name)
+        if whitelist_map.has_serialized_name(klass_name)
+        else klass_name
+    )
+
+    # generates e.g.
+    #
+    # def pack(value):
+    #     storage_dict = {}
+    #     field_value = value[0]
+    #     storage_dict['name'] = field_value if field_value.__class__ in scalar_types else pack(...)
+    #     ...
+    #     storage_dict['__class__'] = storage_name
+    #     return storage_dict
+    lines = ["def pack(value):", "    storage_dict = {}"]
+    for index, field in enumerate(klass._fields):
+        lines.append(f"    field_value = value[{index}]")
+        indent = "    "
+        if field in skip_when_empty_fields:
+            lines.append("    if field_value not in empty_values:")
+            indent = "        "
+        lines.append(
+            f"{indent}storage_dict[{field!r}] = field_value if field_value.__class__ in"
+            " scalar_types else pack_compiled(field_value, whitelist_map)"
+        )
+    lines += ["    storage_dict['__class__'] = storage_name", "    return storage_dict"]
+
+    return _compile_function(
+        "pack",
+        lines,
+        {
+            "empty_values": EMPTY_VALUES_TO_SKIP,
+            "scalar_types": _SCALAR_TYPES,
+            "pack_compiled": pack_compiled,
+            "whitelist_map": whitelist_map,
+            "storage_name": storage_name,
+        },
+        f"<serdes packer for {klass_name}>",
+    )
+
+
+def _compile_unpacker(
+    klass_name: str, whitelist_map: WhitelistMap
+) -> Callable[[Dict[str, Any]], Any]:
+    lookup_name = (
+        whitelist_map.get_deserialized_name(klass_name)
+        if whitelist_map.has_deserialized_name(klass_name)
+        else klass_name
+    )
+    if not whitelist_map.has_tuple_entry(lookup_name):
+        raise DeserializationError(
+            f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.'
+        )
+
+    klass, serializer, args_for_class = whitelist_map.get_tuple_entry(lookup_name)
+
+    if klass is None:
+        return lambda storage_dict: None
+
+    if not _is_default_serializer_method(serializer, "value_from_storage_dict"):
+        return lambda storage_dict: serializer.value_from_storage_dict(
+            {key: value for key, value in storage_dict.items() if key != "__class__"},
+            klass,
+            args_for_class,
+            whitelist_map,
+            "",
+        )
+
+    serializer = cast(Type[DefaultNamedTupleSerializer], serializer)
+    construct = (
+        "klass(**unpacked)"
+        if _is_default_serializer_method(serializer, "value_from_unpacked")
+        else "serializer.value_from_unpacked(unpacked, klass)"
+    )
+
+    # generates e.g.
+    #
+    # def unpack(storage_dict):
+    #     unpacked = {}
+    #     if 'name' in storage_dict:
+    #         value = storage_dict['name']
+    #         unpacked['name'] = value if value.__class__ in scalar_types else unpack_compiled(...)
+    #     ...
+    #     return klass(**unpacked)
+    lines = ["def unpack(storage_dict):", "    unpacked = {}"]
+    for arg in args_for_class:
+        lines += [
+            f"    if {arg!r} in storage_dict:",
+            f"        value = storage_dict[{arg!r}]",
+            (
+                f"        unpacked[{arg!r}] = value if value.__class__ in scalar_types else"
+                " unpack_compiled(value, whitelist_map)"
+            ),
+        ]
+    lines.append(f"    return {construct}")
+
+    return _compile_function(
+        "unpack",
+        lines,
+        {
+            "klass": klass,
+            "serializer": serializer,
+            "scalar_types": _SCALAR_TYPES,
+            "unpack_compiled": unpack_compiled,
+            "whitelist_map": whitelist_map,
+        },
+        f"<serdes unpacker for {klass_name}>",
+    )
+
+
 ###################################################################################################
 # Back compat
 ###################################################################################################
@@ -165,7 +165,9 @@ def _get_planned_materializations_for_run_from_events(
         self, run_id: str
     ) -> AbstractSet[AssetKey]:
         materializations_planned = self._instance.get_records_for_run(
-            run_id=run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
+            run_id=run_id,
+            of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+            include_event=False,
         ).records
         return set(cast(AssetKey, record.asset_key) for record in materializations_planned)
 
@@ -186,9 +188,40 @@ def get_current_materializations_for_run(self, run_id: str) -> AbstractSet[Asset
         materializations = self._instance.get_records_for_run(
             run_id=run_id,
             of_type=DagsterEventType.ASSET_MATERIALIZATION,
+            include_event=False,
         ).records
         return set(cast(AssetKey, record.asset_key) for record in materializations)
 
+    def prefetch_latest_materialization_records(
+        self, asset_partitions: Iterable[AssetKeyPartitionKey]
+    ) -> None:
+        """For performance, fetches the latest materialization records of many partitions of
+        assets with a single call to the instance.
+        """
+        materialized_partition_counts = self._asset_partition_count_cache[None]
+        to_fetch = [
+            asset_partition
+            for asset_partition in asset_partitions
+            if asset_partition.partition_key is not None
+            and asset_partition not in self._latest_materialization_record_cache
+            # skip partitions that are already known to have never been materialized
+            and not (
+                asset_partition.asset_key in materialized_partition_counts
+                and asset_partition.partition_key
+                not in materialized_partition_counts[asset_partition.asset_key]
+            )
+        ]
+        if not to_fetch:
+            return
+
+        records = self._instance.get_latest_asset_partition_materialization_records(to_fetch)
+        for asset_partition in to_fetch:
+            record = records.get(asset_partition)
+            if record is None:
+                self._no_materializations_after_cursor_cache[asset_partition] = -1
+            else:
+                self._latest_materialization_record_cache[asset_partition] = record
+
     @cached_method
     def _get_materialization_record(
         self,
@@ -196,6 +229,15 @@ def _get_materialization_record(
         after_cursor: Optional[int] = None,
         before_cursor: Optional[int] = None,
     ) -> Optional[EventLogRecord]:
+        if asset_partition.partition_key is not None and before_cursor is None:
+            # the latest materialization after the cursor, if any, is the latest materialization
+            record = self._instance.get_latest_asset_partition_materialization_records(
+                [asset_partition]
+            ).get(asset_partition)
+            if record is None or (after_cursor is not None and record.storage_id <= after_cursor):
+                return None
+            return record
+
         records = self._instance.get_event_records(
             EventRecordsFilter(
                 event_type=DagsterEventType.ASSET_MATERIALIZATION,
@@ -377,25 +419,60 @@ def set_known_used_data(
         record: EventLogRecord,
         new_known_data: Mapping[AssetKey, Tuple[Optional[int], Optional[float]]],
     ):
-        event_log_storage = self._instance.event_log_storage
         if (
-            event_log_storage.supports_add_asset_event_tags()
-            and record.asset_key is not None
+            record.asset_key is not None
             and record.storage_id is not None
             and record.event_log_entry.timestamp is not None
         ):
             current_known_data = self.get_known_used_data(record.asset_key, record.storage_id)
-            known_data = merge_dicts(current_known_data, new_known_data)
+            self._store_used_data(
+                asset_key=record.asset_key,
+                record_id=record.storage_id,
+                record_timestamp=record.event_log_entry.timestamp,
+                used_data=merge_dicts(current_known_data, new_known_data),
+            )
+
+    def _store_used_data(
+        self,
+        asset_key: AssetKey,
+        record_id: int,
+        record_timestamp: float,
+        used_data: Mapping[AssetKey, Tuple[Optional[int], Optional[float]]],
+    ) -> None:
+        event_log_storage = self._instance.event_log_storage
+        if event_log_storage.supports_add_asset_event_tags():
             serialized_times = json.dumps(
-                {key.to_user_string(): value for key, value in known_data.items()}
+                {key.to_user_string(): value for key, value in used_data.items()}
             )
             event_log_storage.add_asset_event_tags(
-                event_id=record.storage_id,
-                event_timestamp=record.event_log_entry.timestamp,
-                asset_key=record.asset_key,
+                event_id=record_id,
+                event_timestamp=record_timestamp,
+                asset_key=asset_key,
                 new_tags={USED_DATA_TAG: serialized_times},
             )
 
+    @cached_method
+    def _can_store_used_data(self, asset_graph: AssetGraph, asset_key: AssetKey) -> bool:
+        """
+        The used data of a materialization of an unpartitioned asset is stored alongside it, so
+        that it only needs to be calculated once. This is the case for assets with a freshness
+        policy, and for any asset whose used data can not change after it has been materialized.
+
+        The used data of a time-partitioned asset depends on the partitions materialized so far,
+        rather than on the materialization itself, so the used data of anything downstream of a
+        time-partitioned asset may change and is not stored unless the asset has a freshness policy.
+        """
+        if asset_graph.is_partitioned(asset_key):
+            return False
+
+        if asset_graph.freshness_policies_by_key.get(asset_key) is not None:
+            return True
+
+        return not any(
+            isinstance(asset_graph.get_partitions_def(upstream_key), TimeWindowPartitionsDefinition)
+            for upstream_key in asset_graph.upstream_key_iterator(asset_key)
+        )
+
     def get_known_used_data(
         self, asset_key: AssetKey, record_id: int
     ) -> Dict[AssetKey, Tuple[Optional[int], Optional[float]]]:
@@ -562,7 +639,10 @@ def _calculate_used_data_unpartitioned(
             return {asset_key: (record_id, record_timestamp)}
 
         # grab the existing upstream data times already calculated for this record (if any)
-        if asset_graph.freshness_policies_by_key.get(asset_key) is not None:
+        can_store_used_data = self._can_store_used_data(
+            asset_graph=asset_graph, asset_key=asset_key
+        )
+        if can_store_used_data:
             known_data = self.get_known_used_data(asset_key, record_id)
             if known_data:
                 return known_data
@@ -615,6 +695,16 @@ def _calculate_used_data_unpartitioned(
                 else:
                     known_data[key] = min(known_data.get(key, tup), tup)
 
+        # store the upstream data times, so that neither this record nor the records downstream of
+        # it need to walk upstream of this record again
+        if can_store_used_data and known_data and record_timestamp is not None:
+            self._store_used_data(
+                asset_key=asset_key,
+                record_id=record_id,
+                record_timestamp=record_timestamp,
+                used_data=known_data,
+            )
+
         return known_data
 
     @cached_method
@@ -672,10 +762,6 @@ def get_used_data_times_for_record(
             record_timestamp=record.event_log_entry.timestamp,
             record_tags=frozendict(record.asset_materialization.tags or {}),
         )
-        if asset_graph.freshness_policies_by_key.get(
-            record.asset_key
-        ) is not None and not asset_graph.is_partitioned(record.asset_key):
-            self.set_known_used_data(record, new_known_data=data)
 
         return {
             key: datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
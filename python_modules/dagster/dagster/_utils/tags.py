@@ -81,3 +81,31 @@ def update_counters_with_launched_item(self, item):
 
             if key in self._unique_value_limits:
                 self._unique_value_counts[tag_tuple] += 1
+
+    def update_counters_with_finished_item(self, item):
+        """
+        Remove an in progress item that has finished from the counters
+        """
+        for key, value in item.tags.items():
+            if key in self._key_limits:
+                self._key_counts[key] -= 1
+
+            tag_tuple = (key, value)
+            if tag_tuple in self._key_value_limits:
+                self._key_value_counts[tag_tuple] -= 1
+
+            if key in self._unique_value_limits:
+                self._unique_value_counts[tag_tuple] -= 1
+
+    def copy(self) -> "TagConcurrencyLimitsCounter":
+        """
+        Copy of the counters, which can be updated with launched items without affecting this one
+        """
+        counter = TagConcurrencyLimitsCounter([], [])
+        counter._key_limits = self._key_limits
+        counter._key_value_limits = self._key_value_limits
+        counter._unique_value_limits = self._unique_value_limits
+        counter._key_counts.update(self._key_counts)
+        counter._key_value_counts.update(self._key_value_counts)
+        counter._unique_value_counts.update(self._unique_value_counts)
+        return counter
@@ -13,6 +13,7 @@
     InstigatorStatus,
     InstigatorType,
     ScheduleInstigatorData,
+    SensorInstigatorData,
     TickData,
     TickStatus,
 )
@@ -408,6 +409,60 @@ def test_update_state_not_found(self, storage):
         with pytest.raises(Exception):
             storage.update_instigator_state(state)
 
+    def test_get_instigator_states(self, storage):
+        assert storage
+
+        state = self.build_sensor("my_sensor")
+        state_2 = self.build_sensor("my_sensor_2")
+        storage.add_instigator_state(state)
+        storage.add_instigator_state(state_2)
+        storage.add_instigator_state(self.build_sensor("my_sensor_3"))
+
+        states = storage.get_instigator_states(
+            [state.selector_id, state_2.selector_id, "fake_selector"]
+        )
+        assert set(states.keys()) == {state.selector_id, state_2.selector_id}
+        assert states[state.selector_id].instigator_name == "my_sensor"
+        assert states[state_2.selector_id].instigator_name == "my_sensor_2"
+
+        assert storage.get_instigator_states([]) == {}
+
+    def test_update_instigator_states(self, storage):
+        assert storage
+
+        state = self.build_sensor("my_sensor")
+        state_2 = self.build_sensor("my_sensor_2")
+        storage.add_instigator_state(state)
+        storage.add_instigator_state(state_2)
+
+        storage.update_instigator_states(
+            [
+                state.with_status(InstigatorStatus.RUNNING),
+                state_2.with_data(SensorInstigatorData(cursor="foo")),
+            ]
+        )
+
+        state = storage.get_instigator_state(state.instigator_origin_id, state.selector_id)
+        assert state.status == InstigatorStatus.RUNNING
+        state_2 = storage.get_instigator_state(state_2.instigator_origin_id, state_2.selector_id)
+        assert state_2.status == InstigatorStatus.STOPPED
+        assert state_2.instigator_data.cursor == "foo"
+
+        states = storage.get_instigator_states([state.selector_id, state_2.selector_id])
+        assert states[state.selector_id].status == InstigatorStatus.RUNNING
+        assert states[state_2.selector_id].instigator_data.cursor == "foo"
+
+    def test_update_instigator_states_not_found(self, storage):
+        assert storage
+
+        state = self.build_sensor("my_sensor")
+        storage.add_instigator_state(state)
+
+        with pytest.raises(Exception):
+            storage.update_instigator_states(
+                [state.with_status(InstigatorStatus.RUNNING), self.build_sensor("my_sensor_2")]
+            )
+
     def test_delete_instigator_state(self, storage):
         assert storage
 
@@ -647,3 +702,44 @@ def test_ticks_batched(self, storage):
         assert len(ticks_by_origin["sensor_one"]) == 1
         assert ticks_by_origin["sensor_one"][0].tick_id == b.tick_id
         assert ticks_by_origin["sensor_two"][0].tick_id == d.tick_id
+
+    def test_create_and_update_ticks_batched(self, storage):
+        assert storage
+
+        current_time = time.time()
+        ticks = storage.create_ticks(
+            [
+                self.build_sensor_tick(current_time, name="sensor_one"),
+                self.build_sensor_tick(current_time + 1, name="sensor_two"),
+                self.build_sensor_tick(current_time + 2, name="sensor_one"),
+            ]
+        )
+        assert [tick.instigator_name for tick in ticks] == [
+            "sensor_one",
+            "sensor_two",
+            "sensor_one",
+        ]
+        assert len({tick.tick_id for tick in ticks}) == 3
+
+        ticks_one = storage.get_ticks("sensor_one", "sensor_one")
+        assert [tick.tick_id for tick in ticks_one] == [ticks[2].tick_id, ticks[0].tick_id]
+        assert storage.get_ticks("sensor_two", "sensor_two")[0].tick_id == ticks[1].tick_id
+
+        storage.update_ticks(
+            [
+                ticks[0].with_status(TickStatus.SUCCESS).with_run_info(run_id="fake_run_id"),
+                ticks[1].with_status(TickStatus.SKIPPED),
+            ]
+        )
+
+        ticks_one = storage.get_ticks("sensor_one", "sensor_one")
+        assert ticks_one[0].status == TickStatus.STARTED
+        assert ticks_one[1].status == TickStatus.SUCCESS
+        assert ticks_one[1].run_ids == ["fake_run_id"]
+        assert ticks_one[1].timestamp == current_time
+        ticks_two = storage.get_ticks("sensor_two", "sensor_two")
+        assert len(ticks_two) == 1
+        assert ticks_two[0].status == TickStatus.SKIPPED
+
+        assert storage.create_ticks([]) == []
+        assert storage.update_ticks([]) == []
@@ -0,0 +1,154 @@
+"""Compares the cost of a run queue dequeue tick when the queued and in progress runs are rescanned
+on every tick with the incrementally maintained run queue state of the run coordinator daemon.
+
+Every tick picks the runs to launch, marks them as started and finishes the runs launched by the
+previous tick, so that both approaches see the same stream of launches and completions.
+
+    python -m dagster_tests.benchmarks.run_queue_benchmark [--runs N] [--tag-limits N] [--ticks N]
+"""
+import argparse
+import sys
+from typing import List, Sequence
+
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.host_representation.origin import (
+    ExternalPipelineOrigin,
+    ExternalRepositoryOrigin,
+    RegisteredRepositoryLocationOrigin,
+)
+from dagster._core.instance import DagsterInstance
+from dagster._core.run_coordinator.queued_run_coordinator import RunQueueConfig
+from dagster._core.storage.pipeline_run import (
+    IN_PROGRESS_RUN_STATUSES,
+    DagsterRunStatus,
+    RunsFilter,
+    RunStatusRecord,
+)
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
+from dagster._utils.tags import TagConcurrencyLimitsCounter
+
+from .utils import BenchmarkResult, format_results, run_benchmark
+
+MAX_CONCURRENT_RUNS = 100
+
+# queued runs need an origin, which is never loaded since the benchmark does not launch them
+BENCHMARK_PIPELINE_ORIGIN = ExternalPipelineOrigin(
+    ExternalRepositoryOrigin(RegisteredRepositoryLocationOrigin("benchmark"), "benchmark"),
+    "benchmark",
+)
+
+
+def _rescan_runs_to_dequeue(
+    instance: DagsterInstance, run_queue_config: RunQueueConfig
+) -> List[RunStatusRecord]:
+    """The dequeue logic of the daemon before the run queue state, which reads every queued and in
+    progress run on each tick.
+    """
+    in_progress_runs = instance.get_run_status_records(
+        filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+    )
+    max_runs_to_launch = run_queue_config.max_concurrent_runs - len(in_progress_runs)
+    queued_runs = instance.get_run_status_records(
+        filters=RunsFilter(statuses=[DagsterRunStatus.QUEUED]), ascending=True
+    )
+    counter = TagConcurrencyLimitsCounter(run_queue_config.tag_concurrency_limits, in_progress_runs)
+
+    batch: List[RunStatusRecord] = []
+    for run in sorted(queued_runs, key=lambda run: run.priority, reverse=True):
+        if len(batch) >= max_runs_to_launch:
+            break
+        if counter.is_blocked(run):
+            continue
+        counter.update_counters_with_launched_item(run)
+        batch.append(run)
+    return batch
+
+
+def _set_status(instance: DagsterInstance, run_id: str, event_type: DagsterEventType) -> None:
+    instance.handle_run_event(
+        run_id, DagsterEvent(event_type_value=event_type.value, pipeline_name="benchmark")
+    )
+
+
+def _tag_concurrency_limits(num_tag_limits: int) -> Sequence[dict]:
+    return [{"key": f"tag_{i}", "limit": 1} for i in range(num_tag_limits)]
+
+
+def run_run_queue_benchmarks(
+    num_runs: int, num_tag_limits: int, ticks: int, repeat: int = 3
+) -> List[BenchmarkResult]:
+    overrides = {
+        "run_coordinator": {
+            "module": "dagster._core.run_coordinator",
+            "class": "QueuedRunCoordinator",
+            "config": {
+                "max_concurrent_runs": MAX_CONCURRENT_RUNS,
+                "tag_concurrency_limits": _tag_concurrency_limits(num_tag_limits),
+            },
+        },
+    }
+
+    results = []
+    with instance_for_test(overrides=overrides) as instance:
+        for i in range(num_runs):
+            create_run_for_test(
+                instance,
+                pipeline_name="benchmark",
+                status=DagsterRunStatus.QUEUED,
+                external_pipeline_origin=BENCHMARK_PIPELINE_ORIGIN,
+                tags={f"tag_{i % num_tag_limits}": "value"},
+            )
+
+        run_queue_config = instance.run_coordinator.get_run_queue_config()
+        daemon = QueuedRunCoordinatorDaemon(interval_seconds=1)
+
+        def _incremental_runs_to_dequeue():
+            # pylint: disable=protected-access
+            return daemon._get_runs_to_dequeue(instance, run_queue_config, None)
+
+        def _rescan():
+            return _rescan_runs_to_dequeue(instance, run_queue_config)
+
+        for name, get_runs_to_dequeue in [
+            ("rescan", _rescan),
+            ("incremental", _incremental_runs_to_dequeue),
+        ]:
+            launched: List[str] = []
+
+            def _tick(get_runs_to_dequeue=get_runs_to_dequeue, launched=launched):
+                for run_id in launched:
+                    _set_status(instance, run_id, DagsterEventType.PIPELINE_SUCCESS)
+                launched.clear()
+                for run in get_runs_to_dequeue():
+                    _set_status(instance, run.run_id, DagsterEventType.PIPELINE_START)
+                    launched.append(run.run_id)
+
+            results.append(
+                run_benchmark(
+                    f"dequeue tick, {num_runs} queued runs, {num_tag_limits} tag limits ({name})",
+                    _tick,
+                    ticks,
+                    repeat=repeat,
+                )
+            )
+
+            for run_id in launched:
+                _set_status(instance, run_id, DagsterEventType.PIPELINE_SUCCESS)
+
+    return results
+
+
+def main(argv: Sequence[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10000)
+    parser.add_argument("--tag-limits", type=int, default=50)
+    parser.add_argument("--ticks", type=int, default=10)
+    args = parser.parse_args(argv)
+    print(  # pylint: disable=print-call
+        format_results(run_run_queue_benchmarks(args.runs, args.tag_limits, args.ticks))
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,98 @@
+"""Compares the compiled serdes (un)packers with the reference implementation on event, run and
+snapshot payloads from a real run.
+
+    python -m dagster_tests.benchmarks.serdes_benchmark [--iterations N]
+"""
+import argparse
+import sys
+from contextlib import contextmanager
+from typing import Iterator, List, Mapping, Sequence
+
+import dagster._serdes.serdes as serdes
+from dagster import AssetMaterialization, In, Output, job, op
+from dagster._core.test_utils import instance_for_test
+from dagster._serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+
+from .utils import BenchmarkResult, format_results, run_benchmark
+
+
+@op
+def emit(context):
+    for i in range(5):
+        context.log.info(f"message {i}")
+        yield AssetMaterialization(f"asset_{i}", metadata={"index": i, "text": "hello"})
+    yield Output(1)
+
+
+@op(ins={"value": In(int)})
+def add_one(value):
+    return value + 1
+
+
+@job
+def benchmark_job():
+    add_one.alias("add_two")(add_one(emit()))
+
+
+def build_payloads() -> Mapping[str, Sequence[str]]:
+    """Serialized events, run and snapshots, grouped by kind."""
+    with instance_for_test() as instance:
+        result = benchmark_job.execute_in_process(instance=instance)
+        run = instance.get_run_by_id(result.run_id)
+        assert run
+        events = instance.all_logs(result.run_id)
+        pipeline_snapshot = instance.get_pipeline_snapshot(run.pipeline_snapshot_id)  # type: ignore
+        execution_plan_snapshot = instance.get_execution_plan_snapshot(
+            run.execution_plan_snapshot_id  # type: ignore
+        )
+
+    return {
+        "events": [serialize_dagster_namedtuple(event) for event in events],
+        "run": [serialize_dagster_namedtuple(run)],
+        "pipeline_snapshot": [serialize_dagster_namedtuple(pipeline_snapshot)],
+        "execution_plan_snapshot": [serialize_dagster_namedtuple(execution_plan_snapshot)],
+    }
+
+
+@contextmanager
+def _compiled(enabled: bool) -> Iterator[None]:
+    previous = serdes._COMPILED_ENABLED  # pylint: disable=protected-access
+    serdes._COMPILED_ENABLED = enabled  # pylint: disable=protected-access
+    try:
+        yield
+    finally:
+        serdes._COMPILED_ENABLED = previous  # pylint: disable=protected-access
+
+
+def run_serdes_benchmarks(iterations: int) -> List[BenchmarkResult]:
+    results = []
+    for kind, payloads in build_payloads().items():
+        values = [deserialize_json_to_dagster_namedtuple(payload) for payload in payloads]
+
+        def _deserialize(payloads=payloads):
+            for payload in payloads:
+                deserialize_json_to_dagster_namedtuple(payload)
+
+        def _serialize(values=values):
+            for value in values:
+                serialize_dagster_namedtuple(value)
+
+        for enabled, label in [(False, "reference"), (True, "compiled")]:
+            with _compiled(enabled):
+                results.append(
+                    run_benchmark(f"deserialize {kind} ({label})", _deserialize, iterations)
+                )
+                results.append(run_benchmark(f"serialize {kind} ({label})", _serialize, iterations))
+
+    return results
+
+
+def main(argv: Sequence[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args(argv)
+    print(format_results(run_serdes_benchmarks(args.iterations)))  # pylint: disable=print-call
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
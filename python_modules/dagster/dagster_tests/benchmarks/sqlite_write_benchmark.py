@@ -0,0 +1,175 @@
+"""Measures the event write throughput of the sqlite event log storages when several step processes
+write the events of a run concurrently, with and without single writer mode.
+
+    python -m dagster_tests.benchmarks.sqlite_write_benchmark [--processes N] [--events N]
+"""
+import argparse
+import multiprocessing
+import sys
+import tempfile
+import time
+from typing import List, NamedTuple, Optional, Sequence
+
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+)
+from dagster._core.utils import make_new_run_id
+
+STORAGE_CLASSES = {
+    "sharded": SqliteEventLogStorage,
+    "consolidated": ConsolidatedSqliteEventLogStorage,
+}
+
+
+class WriteBenchmarkResult(NamedTuple):
+    name: str
+    processes: int
+    events: int
+    seconds: float
+    errors: int
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.seconds if self.seconds else 0.0
+
+
+def _create_storage(storage_name: str, base_dir: str, single_writer: bool):
+    return STORAGE_CLASSES[storage_name](base_dir, single_writer=single_writer)
+
+
+def _engine_event(run_id: str, message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message=message,
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "benchmark",
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def _write_events(
+    storage_name: str,
+    base_dir: str,
+    single_writer: bool,
+    run_id: str,
+    process_index: int,
+    num_events: int,
+    start,
+    errors,
+) -> None:
+    storage = _create_storage(storage_name, base_dir, single_writer)
+    events = [_engine_event(run_id, f"{process_index}-{i}") for i in range(num_events)]
+    start.wait()
+    try:
+        for event in events:
+            try:
+                storage.store_event(event)
+            except Exception as exc:
+                errors.put(str(exc))
+    finally:
+        storage.dispose()
+
+
+def run_write_benchmark(
+    storage_name: str, single_writer: bool, processes: int, events_per_process: int
+) -> WriteBenchmarkResult:
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as base_dir:
+        # initialize the dbs before starting the writers
+        _create_storage(storage_name, base_dir, single_writer).dispose()
+
+        run_id = make_new_run_id()
+        start = ctx.Event()
+        errors = ctx.Queue()
+        workers = [
+            ctx.Process(
+                target=_write_events,
+                args=(
+                    storage_name,
+                    base_dir,
+                    single_writer,
+                    run_id,
+                    i,
+                    events_per_process,
+                    start,
+                    errors,
+                ),
+            )
+            for i in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+
+        # give the workers time to start up, so that process startup is not measured
+        time.sleep(2)
+        start_time = time.perf_counter()
+        start.set()
+        for worker in workers:
+            worker.join()
+        seconds = time.perf_counter() - start_time
+
+        error_count = 0
+        while not errors.empty():
+            errors.get()
+            error_count += 1
+
+        storage = _create_storage(storage_name, base_dir, single_writer)
+        try:
+            stored = len(storage.get_logs_for_run(run_id))
+        finally:
+            storage.dispose()
+
+    mode = "single writer" if single_writer else "default"
+    return WriteBenchmarkResult(
+        name=f"{storage_name} ({mode})",
+        processes=processes,
+        events=stored,
+        seconds=seconds,
+        errors=error_count,
+    )
+
+
+def run_sqlite_write_benchmarks(
+    processes: int, events_per_process: int, storage_names: Optional[Sequence[str]] = None
+) -> List[WriteBenchmarkResult]:
+    return [
+        run_write_benchmark(storage_name, single_writer, processes, events_per_process)
+        for storage_name in (storage_names or list(STORAGE_CLASSES.keys()))
+        for single_writer in [False, True]
+    ]
+
+
+def format_write_results(results: Sequence[WriteBenchmarkResult]) -> str:
+    width = max(len(result.name) for result in results)
+    lines = [
+        f"{'benchmark'.ljust(width)}  {'processes':>9}  {'events':>7}  {'seconds':>8}"
+        f"  {'events/s':>9}  {'errors':>6}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.name.ljust(width)}  {result.processes:>9}  {result.events:>7}"
+            f"  {result.seconds:>8.2f}  {result.events_per_second:>9.0f}  {result.errors:>6}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--events", type=int, default=500, help="events written per process")
+    parser.add_argument("--storage", choices=list(STORAGE_CLASSES.keys()), action="append")
+    args = parser.parse_args(argv)
+    results = run_sqlite_write_benchmarks(args.processes, args.events, args.storage)
+    print(format_write_results(results))  # pylint: disable=print-call
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
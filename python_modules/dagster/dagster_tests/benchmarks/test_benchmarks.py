@@ -0,0 +1,33 @@
+from .run_queue_benchmark import run_run_queue_benchmarks
+from .serdes_benchmark import run_serdes_benchmarks
+from .sqlite_write_benchmark import run_sqlite_write_benchmarks
+
+
+def test_serdes_benchmark():
+    results = run_serdes_benchmarks(iterations=1)
+    assert {result.name for result in results} >= {
+        "deserialize events (reference)",
+        "deserialize events (compiled)",
+        "serialize pipeline_snapshot (compiled)",
+    }
+
+
+def test_sqlite_write_benchmark():
+    results = run_sqlite_write_benchmarks(
+        processes=2, events_per_process=5, storage_names=["consolidated"]
+    )
+    assert [result.name for result in results] == [
+        "consolidated (default)",
+        "consolidated (single writer)",
+    ]
+    for result in results:
+        assert result.events == 10
+        assert result.errors == 0
+
+
+def test_run_queue_benchmark():
+    results = run_run_queue_benchmarks(num_runs=20, num_tag_limits=5, ticks=1, repeat=1)
+    assert [result.name for result in results] == [
+        "dequeue tick, 20 queued runs, 5 tag limits (rescan)",
+        "dequeue tick, 20 queued runs, 5 tag limits (incremental)",
+    ]
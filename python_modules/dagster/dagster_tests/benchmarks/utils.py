@@ -0,0 +1,43 @@
+import time
+from typing import Callable, List, NamedTuple, Sequence
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    iterations: int
+    best_seconds: float
+    mean_seconds: float
+
+
+def run_benchmark(
+    name: str, fn: Callable[[], object], iterations: int, repeat: int = 5
+) -> BenchmarkResult:
+    """Times `iterations` calls of `fn`, `repeat` times, and reports the best and mean time per
+    call.
+    """
+    fn()  # warm up
+
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        timings.append((time.perf_counter() - start) / iterations)
+
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        best_seconds=min(timings),
+        mean_seconds=sum(timings) / len(timings),
+    )
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    width = max(len(result.name) for result in results)
+    lines = [f"{'benchmark'.ljust(width)}  {'best (ms)':>10}  {'mean (ms)':>10}"]
+    for result in results:
+        lines.append(
+            f"{result.name.ljust(width)}  {result.best_seconds * 1000:>10.3f} "
+            f" {result.mean_seconds * 1000:>10.3f}"
+        )
+    return "\n".join(lines)
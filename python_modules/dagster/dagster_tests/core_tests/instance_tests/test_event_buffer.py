@@ -0,0 +1,201 @@
+import threading
+import time
+
+import pytest
+from dagster import job, op
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance.event_buffer import EventBuffer
+from dagster._core.storage.pipeline_run import DagsterRunStatus
+from dagster._core.test_utils import instance_for_test
+
+
+def _log_entry(message):
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=message,
+        run_id="foo",
+        timestamp=time.time(),
+    )
+
+
+def test_event_buffer_batches():
+    batches = []
+    event_buffer = EventBuffer(batches.append, flush_batch_size=3, flush_interval_seconds=60)
+    try:
+        for i in range(7):
+            event_buffer.put(_log_entry(str(i)))
+        event_buffer.flush()
+
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert [event.user_message for batch in batches for event in batch] == [
+            str(i) for i in range(7)
+        ]
+
+        stats = event_buffer.get_stats()
+        assert stats.queue_depth == 0
+        assert stats.flushed_batches == 3
+        assert stats.flushed_events == 7
+        assert stats.last_flush_latency is not None
+        assert stats.max_flush_latency is not None
+    finally:
+        event_buffer.dispose()
+
+
+def test_event_buffer_flush_interval():
+    batches = []
+    event_buffer = EventBuffer(batches.append, flush_batch_size=100, flush_interval_seconds=0.1)
+    try:
+        event_buffer.put(_log_entry("a"))
+        start = time.time()
+        while not batches:
+            assert time.time() - start < 5
+            time.sleep(0.05)
+        assert [event.user_message for event in batches[0]] == ["a"]
+    finally:
+        event_buffer.dispose()
+
+
+def test_event_buffer_dispose_writes_pending():
+    batches = []
+    event_buffer = EventBuffer(batches.append, flush_batch_size=100, flush_interval_seconds=60)
+    event_buffer.put(_log_entry("a"))
+    event_buffer.dispose()
+    assert [event.user_message for batch in batches for event in batch] == ["a"]
+
+
+def test_event_buffer_write_error():
+    def _fail(_batch):
+        raise Exception("write failed")
+
+    event_buffer = EventBuffer(_fail, flush_batch_size=100, flush_interval_seconds=60)
+    try:
+        event_buffer.put(_log_entry("a"))
+
+        # the error is only raised to the thread that put the events of the failed batch
+        other_thread = threading.Thread(target=event_buffer.flush)
+        other_thread.start()
+        other_thread.join()
+
+        with pytest.raises(Exception, match="write failed"):
+            event_buffer.flush()
+
+        # the error is only raised once
+        event_buffer.flush()
+    finally:
+        event_buffer.dispose()
+
+
+def test_event_buffer_write_error_on_next_put():
+    def _fail(_batch):
+        raise Exception("write failed")
+
+    event_buffer = EventBuffer(_fail, flush_batch_size=1, flush_interval_seconds=60)
+    try:
+        event_buffer.put(_log_entry("a"))
+        start = time.time()
+        while True:
+            assert time.time() - start < 5
+            try:
+                event_buffer.put(_log_entry("b"))
+            except Exception as e:
+                assert "write failed" in str(e)
+                break
+            time.sleep(0.05)
+    finally:
+        event_buffer.dispose()
+
+
+def test_event_buffer_put_and_flush_on_writer_thread():
+    batches = []
+
+    def _write(batch):
+        batches.append([event.user_message for event in batch])
+        if batch[0].user_message == "a":
+            # events handled while writing are written synchronously instead of deadlocking
+            event_buffer.put(_log_entry("nested"))
+            event_buffer.flush()
+
+    event_buffer = EventBuffer(_write, flush_batch_size=100, flush_interval_seconds=60)
+    try:
+        event_buffer.put(_log_entry("a"))
+        flush_thread = threading.Thread(target=event_buffer.flush, daemon=True)
+        flush_thread.start()
+        flush_thread.join(timeout=5)
+        assert not flush_thread.is_alive()
+
+        assert batches == [["a"], ["nested"]]
+    finally:
+        event_buffer.dispose()
+
+
+def test_buffered_instance_events():
+    @op
+    def chatty_op(context):
+        for i in range(50):
+            context.log.info(f"message {i}")
+
+    @job
+    def chatty_job():
+        chatty_op()
+
+    with instance_for_test(
+        overrides={
+            "event_log_buffer": {
+                "enabled": True,
+                "flush_batch_size": 20,
+                "flush_interval_seconds": 60,
+            }
+        }
+    ) as instance:
+        assert instance.event_log_buffer_enabled
+        assert instance.get_event_buffer_stats() is None
+
+        result = chatty_job.execute_in_process(instance=instance)
+        assert result.success
+
+        # the run success event forces a flush, so the run status and all prior events are stored
+        run = instance.get_run_by_id(result.run_id)
+        assert run.status == DagsterRunStatus.SUCCESS
+
+        instance.flush_event_buffer()
+        messages = [event.user_message for event in instance.all_logs(result.run_id)]
+        assert [f"message {i}" for i in range(50)] == [
+            message for message in messages if message.startswith("message ")
+        ]
+
+        stats = instance.get_event_buffer_stats()
+        assert stats.queue_depth == 0
+        assert stats.flushed_events == len(messages)
+        assert stats.flushed_batches < len(messages)
+
+
+def test_buffered_instance_events_handled_by_producer():
+    with instance_for_test(
+        overrides={
+            "event_log_buffer": {
+                "enabled": True,
+                "flush_batch_size": 20,
+                "flush_interval_seconds": 60,
+            }
+        }
+    ) as instance:
+        handled = []
+
+        def _listener(event):
+            handled.append((event.user_message, threading.current_thread()))
+            # flushing from a subscriber callback does not deadlock
+            instance.flush_event_buffer()
+
+        instance.add_event_listener("foo", _listener)
+        instance.handle_new_event(_log_entry("a"))
+        instance.handle_new_event(_log_entry("b"))
+        assert handled == []
+
+        # the events are handled on the thread that flushes, once they have been written
+        instance.flush_event_buffer()
+        assert handled == [
+            ("a", threading.current_thread()),
+            ("b", threading.current_thread()),
+        ]
+        assert [event.user_message for event in instance.all_logs("foo")] == ["a", "b"]
@@ -1,12 +1,17 @@
 import re
 
+import pendulum
 import pytest
+import sqlalchemy as db
 import yaml
 from dagster import (
+    AssetKey,
     _check as check,
     _seven,
+    asset,
     execute_job,
     job,
+    materialize,
     op,
     reconstructable,
 )
@@ -28,6 +33,19 @@
     create_pipeline_snapshot_id,
     snapshot_from_execution_plan,
 )
+from dagster._core.storage.event_log.schema import (
+    SecondaryIndexMigrationTable as EventLogSecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+)
+from dagster._core.storage.migration.batched import execute_batched_data_migrations
+from dagster._core.storage.migration.bulk_transfer import (
+    export_instance_history,
+    import_instance_history,
+)
+from dagster._core.storage.pipeline_run import DagsterRunStatus
+from dagster._core.storage.runs.schema import (
+    SecondaryIndexMigrationTable as RunSecondaryIndexMigrationTable,
+)
 from dagster._core.storage.sqlite_storage import (
     _event_logs_directory,
     _runs_directory,
@@ -40,7 +58,7 @@
     instance_for_test,
 )
 from dagster._legacy import PipelineDefinition
-from dagster._serdes import ConfigurableClass
+from dagster._serdes import ConfigurableClass, SerdesFormat
 from dagster._serdes.config_class import ConfigurableClassData
 
 from dagster_tests.api_tests.utils import get_bar_workspace
@@ -102,6 +120,23 @@ def test_unified_storage(tmpdir):
         pass
 
 
+def test_unified_storage_single_writer(tmpdir):
+    with instance_for_test(
+        overrides={
+            "storage": {
+                "sqlite": {
+                    "base_dir": str(tmpdir),
+                    "single_writer": True,
+                }
+            }
+        }
+    ) as instance:
+        result = noop_job.execute_in_process(instance=instance)
+        assert result.success
+        assert instance.get_run_by_id(result.run_id).status == DagsterRunStatus.SUCCESS
+        assert instance.get_run_stats(result.run_id).steps_succeeded == 1
+
+
 @pytest.mark.skipif(_seven.IS_WINDOWS, reason="Windows paths formatted differently")
 def test_unified_storage_env_var(tmpdir):
     with environ({"SQLITE_STORAGE_BASE_DIR": str(tmpdir)}):
@@ -198,6 +233,50 @@ def test_create_execution_plan_snapshot():
         assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
 
 
+def test_create_runs():
+    with instance_for_test() as instance:
+        pipeline_snapshot = noop_job.get_pipeline_snapshot()
+        execution_plan_snapshot = snapshot_from_execution_plan(
+            create_execution_plan(noop_job), noop_job.get_pipeline_snapshot_id()
+        )
+
+        runs = instance.create_runs(
+            [
+                dict(
+                    pipeline_name=noop_job.name,
+                    run_id=None,
+                    run_config=None,
+                    mode=None,
+                    status=DagsterRunStatus.NOT_STARTED,
+                    tags={"partition": str(i)},
+                    root_run_id=None,
+                    parent_run_id=None,
+                    step_keys_to_execute=None,
+                    execution_plan_snapshot=execution_plan_snapshot,
+                    pipeline_snapshot=pipeline_snapshot,
+                    parent_pipeline_snapshot=None,
+                    asset_selection=None,
+                    solids_to_execute=None,
+                    solid_selection=None,
+                    external_pipeline_origin=None,
+                    pipeline_code_origin=None,
+                )
+                for i in range(3)
+            ]
+        )
+
+        assert len(runs) == 3
+        assert instance.get_runs_count() == 3
+        assert len({run.run_id for run in runs}) == 3
+        for run in runs:
+            assert run.pipeline_snapshot_id == create_pipeline_snapshot_id(pipeline_snapshot)
+            assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(
+                execution_plan_snapshot
+            )
+        assert instance.has_snapshot(runs[0].pipeline_snapshot_id)
+        assert instance.has_snapshot(runs[0].execution_plan_snapshot_id)
+
+
 def test_submit_run():
     with instance_for_test(
         overrides={
@@ -366,6 +445,33 @@ def test_cancellation_thread():
         assert instance.cancellation_thread_poll_interval_seconds == 10
 
 
+def test_handle_new_events():
+    @op
+    def noop_op(context):
+        context.log.info("hello")
+
+    @job
+    def noop_job():
+        noop_op()
+
+    with instance_for_test() as source_instance:
+        result = noop_job.execute_in_process(instance=source_instance)
+        events = source_instance.all_logs(result.run_id)
+
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, pipeline_name="noop_job", run_id=result.run_id)
+        received = []
+        instance.add_event_listener(run.run_id, received.append)
+
+        instance.handle_new_events(events)
+
+        assert [event.message for event in instance.all_logs(run.run_id)] == [
+            event.message for event in events
+        ]
+        assert received == events
+        assert instance.get_run_by_id(run.run_id).status == DagsterRunStatus.SUCCESS
+
+
 def test_dagster_home_not_set():
     with environ({"DAGSTER_HOME": ""}):
         with pytest.raises(
@@ -539,3 +645,158 @@ def test_configurable_class_missing_methods():
             }
         ) as instance:
             print(instance.run_launcher)  # pylint: disable=print-call
+
+
+def test_serialization_settings():
+    @op
+    def noisy_op(context):
+        context.log.info("x" * 1000)
+
+    @job
+    def noisy_job():
+        noisy_op()
+
+    with instance_for_test() as instance:
+        assert instance.get_serdes_format("event_log_storage") == SerdesFormat.JSON
+
+    with instance_for_test(
+        overrides={
+            "serialization": {
+                "event_log_storage": "json+zlib",
+                "run_storage": "json+zlib",
+            }
+        }
+    ) as instance:
+        assert instance.get_serdes_format("event_log_storage") == SerdesFormat.JSON_ZLIB
+        assert instance.get_serdes_format("schedule_storage") == SerdesFormat.JSON
+
+        result = noisy_job.execute_in_process(instance=instance)
+        assert result.success
+
+        messages = [event.user_message for event in instance.all_logs(result.run_id)]
+        assert "x" * 1000 in messages
+        with instance.event_log_storage.run_connection(result.run_id) as conn:
+            event_bodies = [
+                row[0] for row in conn.execute(db.select([SqlEventLogStorageTable.c.event]))
+            ]
+        assert any(body.startswith("#dgs1:json+zlib:") for body in event_bodies)
+
+        assert instance.get_run_by_id(result.run_id).status == DagsterRunStatus.SUCCESS
+
+    with pytest.raises(DagsterInvalidConfigError):
+        with instance_for_test(overrides={"serialization": {"run_storage": "pickle"}}):
+            pass
+
+
+def test_compact_event_logs():
+    with instance_for_test() as instance:
+        result = noop_job.execute_in_process(instance=instance)
+        assert result.success
+        logs = instance.all_logs(result.run_id)
+
+        # the run finished after the cutoff, so its events are left in place
+        assert instance.compact_event_logs(pendulum.now("UTC").subtract(days=1)) == 0
+
+        messages = []
+        archived = instance.compact_event_logs(pendulum.now("UTC").add(days=1), messages.append)
+        assert archived > 0
+        assert any(f"Archived {archived} events from 1 runs" in message for message in messages)
+        assert instance.all_logs(result.run_id) == logs
+        assert instance.get_run_stats(result.run_id).steps_succeeded == 1
+
+        assert instance.compact_event_logs(pendulum.now("UTC").add(days=1)) == 0
+
+
+@asset
+def transferred_asset():
+    return 1
+
+
+def test_export_import_instance_history(tmpdir):
+    output_file = str(tmpdir / "history.gz")
+    with instance_for_test() as source:
+        result = noop_job.execute_in_process(instance=source)
+        assert result.success
+        asset_result = materialize([transferred_asset], instance=source)
+        assert asset_result.success
+
+        # a small chunk size exercises reading and writing multiple chunks per table
+        row_counts = export_instance_history(source, output_file, chunk_size=2)
+        assert row_counts["runs"] == 2
+        assert row_counts["event_logs"] > 2
+
+        with instance_for_test() as target:
+            messages = []
+            imported = import_instance_history(target, output_file, messages.append)
+            assert imported["runs"] == 2
+            assert imported["event_logs"] == row_counts["event_logs"]
+            assert any("Rebuilding" in message for message in messages)
+
+            for run_id in (result.run_id, asset_result.run_id):
+                assert target.get_run_by_id(run_id) == source.get_run_by_id(run_id)
+                assert target.all_logs(run_id) == source.all_logs(run_id)
+                assert target.get_run_stats(run_id).steps_succeeded == 1
+
+            assert target.get_asset_keys() == [AssetKey("transferred_asset")]
+            materialization = target.get_latest_materialization_event(AssetKey("transferred_asset"))
+            assert materialization and materialization.run_id == asset_result.run_id
+
+            # runs that already exist are skipped, along with their tags and events
+            reimported = import_instance_history(target, output_file)
+            assert reimported["runs"] == 0
+            assert reimported["event_logs"] == 0
+            assert len(target.get_runs()) == 2
+
+
+def test_batched_data_migrations():
+    with instance_for_test() as source_instance:
+        result = noop_job.execute_in_process(instance=source_instance)
+        assert result.success
+        asset_result = materialize([transferred_asset], instance=source_instance)
+        assert asset_result.success
+
+        assert not source_instance.run_storage.get_pending_batched_data_migrations()
+        assert not source_instance.event_log_storage.get_pending_batched_data_migrations()
+
+        # mark every index as unbuilt, so that reads fall back until the migrations complete
+        with source_instance.run_storage.connect() as conn:
+            conn.execute(RunSecondaryIndexMigrationTable.delete())
+        with source_instance.event_log_storage.index_connection() as conn:
+            conn.execute(EventLogSecondaryIndexMigrationTable.delete())
+
+        # a new process, which has not seen the indexes built
+        with DagsterInstance.from_ref(source_instance.get_ref()) as instance:
+            run_storage = instance.run_storage
+            event_log_storage = instance.event_log_storage
+            pending_run_migrations = run_storage.get_pending_batched_data_migrations()
+            pending_event_log_migrations = event_log_storage.get_pending_batched_data_migrations()
+            assert pending_run_migrations
+            assert pending_event_log_migrations
+
+            # the stats tables are kept up to date while they are being built
+            assert not event_log_storage.has_run_stats_tables()
+            assert event_log_storage.should_update_run_stats()
+
+            # no batches start once the time limit is reached
+            for _ in execute_batched_data_migrations(instance, time_limit_seconds=0):
+                assert False
+
+            messages = []
+            batches = list(
+                execute_batched_data_migrations(
+                    instance, batch_size=1, throttle_seconds=0, print_fn=messages.append
+                )
+            )
+            assert len(batches) > len(pending_run_migrations) + len(pending_event_log_migrations)
+            assert not run_storage.get_pending_batched_data_migrations()
+            assert not event_log_storage.get_pending_batched_data_migrations()
+            for migration_name in pending_run_migrations + pending_event_log_migrations:
+                assert f"Finished batched data migration: {migration_name}" in messages
+
+            assert instance.get_asset_keys() == [AssetKey("transferred_asset")]
+            assert instance.get_run_stats(result.run_id).steps_succeeded == 1
+            assert list(execute_batched_data_migrations(instance)) == []
+
+        # the indexes built by another process are picked up by the original one
+        assert source_instance.event_log_storage.has_run_stats_tables()
+        assert not source_instance.event_log_storage.get_pending_batched_data_migrations()
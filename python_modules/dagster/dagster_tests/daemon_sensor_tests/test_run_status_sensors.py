@@ -11,9 +11,14 @@
     file_relative_path,
 )
 from dagster._core.definitions.instigation_logger import get_instigation_log_records
+from dagster._core.definitions.run_status_feed import RunStatusFeedSlice
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._core.host_representation import ExternalRepository, RepositoryLocation
+from dagster._core.host_representation import (
+    ExternalRepository,
+    GrpcServerRepositoryLocation,
+    RepositoryLocation,
+)
 from dagster._core.instance import DagsterInstance
 from dagster._core.log_manager import DAGSTER_META_KEY
 from dagster._core.scheduler.instigation import TickStatus
@@ -21,6 +26,8 @@
 from dagster._core.test_utils import create_test_daemon_workspace_context, instance_for_test
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._core.workspace.load_target import WorkspaceFileTarget
+from dagster._daemon.sensor import _get_run_status_feeds
+from dagster._serdes import deserialize_as, serialize_value
 
 from .conftest import create_workspace_load_target
 from .test_sensor_run import (
@@ -574,6 +581,71 @@ def test_run_status_sensor_interleave(storage_config_fn, executor):
                 assert ticks[0].origin_run_ids[0] == run1.run_id
 
 
+@pytest.mark.parametrize("executor", get_sensor_executors())
+def test_run_status_feed(executor):
+    freeze_datetime = pendulum.now()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        overrides = {
+            **sql_event_log_storage_config_fn(temp_dir),
+            "sensors": {"run_status_batch_size": 1},
+        }
+        with instance_with_sensors(overrides=overrides) as (
+            instance,
+            workspace_context,
+            external_repo,
+        ):
+            with pendulum.test(freeze_datetime):
+                failure_sensor = external_repo.get_external_sensor("my_run_failure_sensor")
+                assert failure_sensor.run_status == DagsterRunStatus.FAILURE
+                instance.start_sensor(failure_sensor)
+                evaluate_sensors(workspace_context, executor)
+                freeze_datetime = freeze_datetime.add(seconds=60)
+                time.sleep(1)
+
+            with pendulum.test(freeze_datetime):
+                external_pipeline = external_repo.get_full_external_job("hanging_pipeline")
+                runs = []
+                for _ in range(2):
+                    run = instance.create_run_for_pipeline(
+                        hanging_pipeline,
+                        external_pipeline_origin=external_pipeline.get_external_origin(),
+                        pipeline_code_origin=external_pipeline.get_python_origin(),
+                    )
+                    instance.report_run_failed(run)
+                    runs.append(run)
+                freeze_datetime = freeze_datetime.add(seconds=60)
+
+            # the daemon reads the failure events for the sensor, a batch at a time
+            sensor_state = instance.get_instigator_state(
+                failure_sensor.get_external_origin_id(), failure_sensor.selector_id
+            )
+            run_status_feeds = _get_run_status_feeds(instance, [(failure_sensor, sensor_state)])
+            run_status_feed = run_status_feeds[failure_sensor.selector_id]
+            feed_entries = run_status_feed.entries
+            assert len(feed_entries) == 1
+            assert feed_entries[0].dagster_run.run_id == runs[0].run_id
+            assert deserialize_as(serialize_value(run_status_feed), RunStatusFeedSlice) == (
+                run_status_feed
+            )
+
+            # the feed is sent to the sensor in its code server
+            repository_location = next(
+                iter(workspace_context.create_request_context().get_workspace_snapshot().values())
+            ).repository_location
+            assert isinstance(repository_location, GrpcServerRepositoryLocation)
+
+            for run in runs:
+                with pendulum.test(freeze_datetime):
+                    evaluate_sensors(workspace_context, executor)
+
+                    ticks = instance.get_ticks(
+                        failure_sensor.get_external_origin_id(), failure_sensor.selector_id
+                    )
+                    validate_tick(ticks[0], failure_sensor, freeze_datetime, TickStatus.SUCCESS)
+                    assert list(ticks[0].origin_run_ids) == [run.run_id]
+                    freeze_datetime = freeze_datetime.add(seconds=60)
+
+
 @pytest.mark.parametrize("storage_config_fn", [sql_event_log_storage_config_fn])
 @pytest.mark.parametrize("executor", get_sensor_executors())
 def test_run_failure_sensor_empty_run_records(storage_config_fn, executor):
@@ -1114,6 +1114,91 @@ def test_error_sensor(caplog, executor, instance, workspace_context, external_re
         assert state.instigator_data.last_tick_timestamp == freeze_datetime.timestamp()
 
 
+@pytest.mark.parametrize("executor", get_sensor_executors())
+def test_sensor_tick_creation_error(caplog, executor, instance, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with pendulum.test(freeze_datetime):
+        error_sensor = external_repo.get_external_sensor("simple_sensor")
+        external_sensor = external_repo.get_external_sensor("always_on_sensor")
+        for running_sensor in [error_sensor, external_sensor]:
+            instance.add_instigator_state(
+                InstigatorState(
+                    running_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+        create_tick = DagsterInstance.create_tick
+
+        def _create_tick(self, tick_data):
+            if tick_data.instigator_name == error_sensor.name:
+                raise Exception("Failed to create tick")
+            return create_tick(self, tick_data)
+
+        # failing to create the tick of one sensor does not keep the other sensors from ticking
+        with mock.patch.object(DagsterInstance, "create_tick", _create_tick):
+            evaluate_sensors(workspace_context, executor)
+
+        assert not instance.get_ticks(
+            error_sensor.get_external_origin_id(), error_sensor.selector_id
+        )
+        assert "Failed to create tick" in caplog.text
+
+        ticks = instance.get_ticks(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+        assert len(ticks) == 1
+        validate_tick(ticks[0], external_sensor, freeze_datetime, TickStatus.SUCCESS)
+
+
+def test_sensor_ticks_created_when_evaluated(instance, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with pendulum.test(freeze_datetime):
+        external_sensors = [
+            external_repo.get_external_sensor("simple_sensor"),
+            external_repo.get_external_sensor("always_on_sensor"),
+        ]
+        for external_sensor in external_sensors:
+            instance.add_instigator_state(
+                InstigatorState(
+                    external_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+        create_tick = DagsterInstance.create_tick
+        started_tick_counts = []
+
+        def _create_tick(self, tick_data):
+            started_tick_counts.append(
+                len(
+                    [
+                        tick
+                        for external_sensor in external_sensors
+                        for tick in self.get_ticks(
+                            external_sensor.get_external_origin_id(), external_sensor.selector_id
+                        )
+                        if tick.status == TickStatus.STARTED
+                    ]
+                )
+            )
+            return create_tick(self, tick_data)
+
+        # sensors evaluated synchronously only create their tick once the previous one has finished
+        with mock.patch.object(DagsterInstance, "create_tick", _create_tick):
+            evaluate_sensors(workspace_context, None)
+
+        assert started_tick_counts == [0, 0]
+
+
 @pytest.mark.parametrize("executor", get_sensor_executors())
 def test_wrong_config_sensor(caplog, executor, instance, workspace_context, external_repo):
     freeze_datetime = to_timezone(
@@ -32,7 +32,14 @@
 )
 from dagster._core.storage.pipeline_run import DagsterRunStatus, RunsFilter
 from dagster._core.storage.tags import BACKFILL_ID_TAG, PARTITION_NAME_TAG, PARTITION_SET_TAG
-from dagster._core.test_utils import step_did_not_run, step_failed, step_succeeded
+from dagster._core.test_utils import (
+    create_run_for_test,
+    create_test_daemon_workspace_context,
+    instance_for_test,
+    step_did_not_run,
+    step_failed,
+    step_succeeded,
+)
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._daemon import get_default_daemon_logger
 from dagster._daemon.backfill import execute_backfill_iteration
@@ -41,6 +48,8 @@
 from dagster._utils import touch_file
 from dagster._utils.error import SerializableErrorInfo
 
+from .conftest import workspace_load_target
+
 default_mode_def = ModeDefinition(resource_defs={"io_manager": fs_io_manager})
 
 
@@ -573,6 +582,67 @@ def test_large_backfill(instance, workspace_context, external_repo):
     assert instance.get_runs_count() == 3
 
 
+def test_batched_threaded_backfill():
+    with instance_for_test(
+        overrides={
+            "run_coordinator": {
+                "module": "dagster._core.run_coordinator.queued_run_coordinator",
+                "class": "QueuedRunCoordinator",
+            },
+            "backfills": {
+                "chunk_size": 2,
+                "batch_run_creation": True,
+                "use_threads": True,
+                "num_workers": 2,
+                "max_submissions_per_second": 100.0,
+            },
+        }
+    ) as instance, create_test_daemon_workspace_context(
+        workspace_load_target=workspace_load_target(), instance=instance
+    ) as workspace_context:
+        external_repo = next(
+            iter(workspace_context.create_request_context().get_workspace_snapshot().values())
+        ).repository_location.get_repository("the_repo")
+        external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+        instance.add_backfill(
+            PartitionBackfill(
+                backfill_id="batched",
+                partition_set_origin=external_partition_set.get_external_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["one", "two", "three"],
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=pendulum.now().timestamp(),
+            )
+        )
+
+        # a run created by an iteration that stopped before submitting it is submitted, rather
+        # than created again
+        unsubmitted_run = create_run_for_test(
+            instance,
+            pipeline_name="the_pipeline",
+            status=DagsterRunStatus.NOT_STARTED,
+            tags={BACKFILL_ID_TAG: "batched", PARTITION_NAME_TAG: "one"},
+        )
+
+        list(
+            execute_backfill_iteration(
+                workspace_context, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+
+        assert instance.get_backfill("batched").status == BulkActionStatus.COMPLETED
+        runs = instance.get_runs()
+        assert len(runs) == 3
+        assert {run.tags[PARTITION_NAME_TAG] for run in runs} == {"one", "two", "three"}
+        assert all(run.status == DagsterRunStatus.QUEUED for run in runs)
+        assert instance.get_run_by_id(unsubmitted_run.run_id).status == DagsterRunStatus.QUEUED
+
+        created_runs = [run for run in runs if run.run_id != unsubmitted_run.run_id]
+        assert len({run.pipeline_snapshot_id for run in created_runs}) == 1
+
+
 def test_unloadable_backfill(instance, workspace_context):
     unloadable_origin = _unloadable_partition_set_origin()
     instance.add_backfill(
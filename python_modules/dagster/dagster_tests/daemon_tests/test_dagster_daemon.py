@@ -1,10 +1,15 @@
+import threading
+import time
+
+import mock
 import pytest
 from click.testing import CliRunner
+from dagster._core.storage.runs.wakeup import RunWakeupChannel
 from dagster._core.test_utils import instance_for_test
 from dagster._core.workspace.load_target import EmptyWorkspaceTarget
 from dagster._daemon.cli import run_command
 from dagster._daemon.controller import daemon_controller_from_instance
-from dagster._daemon.daemon import SchedulerDaemon
+from dagster._daemon.daemon import IntervalDaemon, SchedulerDaemon
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
 
 
@@ -51,3 +56,49 @@ def test_ephemeral_instance():
     runner = CliRunner()
     with pytest.raises(Exception, match="DAGSTER_HOME is not set"):
         runner.invoke(run_command, env={"DAGSTER_HOME": ""}, catch_exceptions=False)
+
+
+class _WakeupTestDaemon(IntervalDaemon):
+    wakeup_channels = [RunWakeupChannel.RUN_STATUS_CHANGED]
+    min_wakeup_interval_seconds = 0.5
+
+    def __init__(self):
+        super().__init__(interval_seconds=60)
+        self.iteration_times = []
+
+    @classmethod
+    def daemon_type(cls):
+        return "WAKEUP_TEST"
+
+    def run_iteration(self, workspace_process_context):
+        self.iteration_times.append(time.time())
+        yield None
+
+
+class _WakeupEveryIterationInstance:
+    """Sets the wakeup event as soon as it is cleared, like a busy instance would."""
+
+    def add_run_wakeup_listener(self, channels, wakeup_event):
+        self.wakeup_event = wakeup_event
+
+    def remove_run_wakeup_listener(self, wakeup_event):
+        pass
+
+
+def test_min_wakeup_interval():
+    instance = _WakeupEveryIterationInstance()
+    workspace_process_context = mock.MagicMock(instance=instance)
+    daemon = _WakeupTestDaemon()
+    shutdown_event = threading.Event()
+
+    loop = daemon.core_loop(workspace_process_context, shutdown_event)
+    start_time = time.time()
+    while time.time() - start_time < 1.6:
+        next(loop)
+        instance.wakeup_event.set()
+    loop.close()
+
+    # woken up continuously, but no more often than the minimum wakeup interval
+    assert 3 <= len(daemon.iteration_times) <= 5
+    for earlier, later in zip(daemon.iteration_times, daemon.iteration_times[1:]):
+        assert later - earlier >= 0.5
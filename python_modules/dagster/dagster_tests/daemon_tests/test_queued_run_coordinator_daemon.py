@@ -1,5 +1,6 @@
 # pylint: disable=redefined-outer-name
 
+import datetime
 import time
 from contextlib import contextmanager
 
@@ -7,6 +8,7 @@
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.host_representation.repository_location import GrpcServerRepositoryLocation
 from dagster._core.storage.pipeline_run import IN_PROGRESS_RUN_STATUSES, DagsterRunStatus
+from dagster._core.storage.runs.schema import RunsTable
 from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.test_utils import (
     create_run_for_test,
@@ -837,3 +839,121 @@ def test_key_limit_with_extra_tags(use_threads, workspace_context, daemon, pipel
 
         list(daemon.run_iteration(bounded_ctx))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_run_queue_state_between_iterations(workspace_context, pipeline_handle, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        create_queued_run(instance, pipeline_handle, run_id="tiny-1", tags={"database": "tiny"})
+        create_queued_run(instance, pipeline_handle, run_id="tiny-2", tags={"database": "tiny"})
+
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1"]
+
+        # runs queued after the first iteration are picked up in priority order
+        create_queued_run(instance, pipeline_handle, run_id="tiny-3", tags={"database": "tiny"})
+        create_queued_run(
+            instance,
+            pipeline_handle,
+            run_id="tiny-4",
+            tags={"database": "tiny", PRIORITY_TAG: "5"},
+        )
+
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1"]
+
+        # finishing the in progress run frees up its tag concurrency slot
+        instance.report_run_failed(instance.get_run_by_id("tiny-1"))
+
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1", "tiny-4"]
+
+
+@pytest.mark.parametrize(
+    "use_threads",
+    [False, True],
+)
+def test_run_deleted_while_queued(pipeline_handle, daemon, use_threads):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=1, dequeue_use_threads=use_threads
+    ) as instance:
+        with create_test_daemon_workspace_context(
+            workspace_load_target=EmptyWorkspaceTarget(), instance=instance
+        ) as workspace_context:
+            create_run(instance, pipeline_handle, run_id="running", status=DagsterRunStatus.STARTED)
+            create_queued_run(instance, pipeline_handle, run_id="deleted-run")
+            create_queued_run(instance, pipeline_handle, run_id="good-run")
+
+            list(daemon.run_iteration(workspace_context))
+            assert get_run_ids(instance.run_launcher.queue()) == []
+
+            instance.delete_run("deleted-run")
+            instance.report_run_failed(instance.get_run_by_id("running"))
+
+            # the deleted run is still in the run queue state, and is skipped when dequeued
+            list(daemon.run_iteration(workspace_context))
+            assert get_run_ids(instance.run_launcher.queue()) == []
+
+            list(daemon.run_iteration(workspace_context))
+            assert get_run_ids(instance.run_launcher.queue()) == ["good-run"]
+
+
+def test_finished_run_missed_by_update_timestamp(workspace_context, pipeline_handle, daemon):
+    with instance_for_queued_run_coordinator(max_concurrent_runs=1) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        create_run(instance, pipeline_handle, run_id="running", status=DagsterRunStatus.STARTED)
+        create_queued_run(instance, pipeline_handle, run_id="queued-run")
+
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == []
+
+        # the run finishes with an update timestamp from a writer with a clock far behind
+        with instance.run_storage.connect() as conn:
+            conn.execute(
+                RunsTable.update()
+                .where(RunsTable.c.run_id == "running")
+                .values(
+                    status=DagsterRunStatus.SUCCESS.value,
+                    update_timestamp=datetime.datetime(2000, 1, 1),
+                )
+            )
+
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["queued-run"]
+
+
+def test_canceled_run_missed_by_update_timestamp(workspace_context, pipeline_handle, daemon):
+    with instance_for_queued_run_coordinator(max_concurrent_runs=1) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        create_run(instance, pipeline_handle, run_id="running", status=DagsterRunStatus.STARTED)
+        create_queued_run(instance, pipeline_handle, run_id="canceled-run")
+        create_queued_run(instance, pipeline_handle, run_id="good-run")
+
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == []
+
+        # the queued run is canceled with an update timestamp from a writer with a clock far
+        # behind, so it stays at the head of the run queue state until it is dequeued
+        with instance.run_storage.connect() as conn:
+            conn.execute(
+                RunsTable.update()
+                .where(RunsTable.c.run_id == "canceled-run")
+                .values(
+                    status=DagsterRunStatus.CANCELED.value,
+                    update_timestamp=datetime.datetime(2000, 1, 1),
+                )
+            )
+        instance.report_run_failed(instance.get_run_by_id("running"))
+
+        # the canceled run is skipped when dequeued, and no longer holds back the queue
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == []
+
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["good-run"]
@@ -33,6 +33,7 @@
 )
 from dagster._core.definitions.asset_reconciliation_sensor import (
     AssetReconciliationCursor,
+    ReconciliationPhaseTimer,
     reconcile,
 )
 from dagster._core.definitions.freshness_policy import FreshnessPolicy
@@ -1265,3 +1266,75 @@ def repo():
         )
         result2 = reconciliation_sensor(context2)
         assert len(list(result2)) == 0
+
+
+def test_deferred_dirty_asset_partitions():
+    assets = [
+        asset_def("asset1"),
+        asset_def("asset2"),
+        asset_def("asset3", ["asset1"]),
+        asset_def("asset4", ["asset2"]),
+    ]
+
+    @repository
+    def repo():
+        return assets
+
+    instance = DagsterInstance.ephemeral()
+    do_run(
+        [AssetKey("asset1"), AssetKey("asset2"), AssetKey("asset3"), AssetKey("asset4")],
+        None,
+        assets,
+        instance,
+    )
+
+    run_requests, cursor = reconcile(
+        repository_def=repo,
+        asset_selection=AssetSelection.all(),
+        instance=instance,
+        cursor=AssetReconciliationCursor.empty(),
+        run_tags={},
+    )
+    assert run_requests == []
+    assert cursor.latest_storage_id is not None
+
+    do_run([AssetKey("asset1")], None, assets, instance)
+    do_run([AssetKey("asset2")], None, assets, instance)
+
+    # only the earliest materialized asset partition is evaluated, the other is deferred
+    phase_timer = ReconciliationPhaseTimer()
+    run_requests, cursor = reconcile(
+        repository_def=repo,
+        asset_selection=AssetSelection.all(),
+        instance=instance,
+        cursor=AssetReconciliationCursor.from_serialized(cursor.serialize(), repo.asset_graph),
+        run_tags={},
+        max_dirty_asset_partitions=1,
+        phase_timer=phase_timer,
+    )
+    assert [set(run_request.asset_selection) for run_request in run_requests] == [
+        {AssetKey("asset3")}
+    ]
+    assert [dirty.asset_partition.asset_key for dirty in cursor.dirty_asset_partitions] == [
+        AssetKey("asset2")
+    ]
+    assert "find_dirty_asset_partitions" in phase_timer.timings
+    assert "filter_candidates" in phase_timer.timings
+
+    cursor = AssetReconciliationCursor.from_serialized(cursor.serialize(), repo.asset_graph)
+    assert [dirty.asset_partition.asset_key for dirty in cursor.dirty_asset_partitions] == [
+        AssetKey("asset2")
+    ]
+
+    run_requests, cursor = reconcile(
+        repository_def=repo,
+        asset_selection=AssetSelection.all(),
+        instance=instance,
+        cursor=cursor,
+        run_tags={},
+        max_dirty_asset_partitions=1,
+    )
+    assert [set(run_request.asset_selection) for run_request in run_requests] == [
+        {AssetKey("asset4")}
+    ]
+    assert cursor.dirty_asset_partitions == []
@@ -16,7 +16,12 @@
 )
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.asset_out import AssetOut
-from dagster._core.definitions.asset_reconciliation_sensor import build_asset_reconciliation_sensor
+from dagster._core.definitions.asset_reconciliation_sensor import (
+    AssetReconciliationCursor,
+    ReconciliationPhaseTimer,
+    build_asset_reconciliation_sensor,
+    reconcile,
+)
 from dagster._core.definitions.assets import AssetsDefinition
 from dagster._core.definitions.decorators.asset_decorator import multi_asset
 from dagster._core.definitions.events import Output
@@ -235,6 +240,66 @@ def do_scenario(self: "PerfScenario"):
                 assert execution_time_seconds < self.max_execution_time_seconds
 
 
+class IncrementalPerfScenario(NamedTuple):
+    """Measures a tick of the sensor after a few runs, once every prior materialization has been
+    seen by the sensor, so that only the descendants of the new materializations are evaluated.
+    """
+
+    assets: RandomAssets
+    n_runs: int
+    max_execution_time_seconds: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.assets.name}_incremental_{self.n_runs}_runs"
+
+    def do_scenario(self: "IncrementalPerfScenario"):
+        sources, roots, multi_asset = self.assets.get_definitions()
+
+        @repository
+        def repo():
+            return [*sources, *roots, multi_asset]
+
+        asset_graph = repo.asset_graph
+        with DagsterInstance.ephemeral() as instance:
+            # a cursor for a sensor that has seen the whole (empty) event log and requested every
+            # root asset
+            cursor = AssetReconciliationCursor.empty()._replace(
+                latest_storage_id=0,
+                materialized_or_requested_root_asset_keys={
+                    key
+                    for key in asset_graph.all_asset_keys
+                    if not asset_graph.is_source(key)
+                    and not asset_graph.has_non_source_parents(key)
+                },
+            )
+
+            random.seed(31415)
+            for _ in range(self.n_runs):
+                target_asset = random.randint(0, 100)
+                selected_keys = (
+                    AssetSelection.keys(AssetKey(f"asset_{target_asset}"))
+                    .upstream()
+                    .resolve(asset_graph)
+                )
+                materialize_to_memory([multi_asset.subset_for(selected_keys)], instance=instance)
+
+            phase_timer = ReconciliationPhaseTimer()
+            start = time.time()
+            reconcile(
+                repository_def=repo,
+                asset_selection=AssetSelection.all(),
+                instance=instance,
+                cursor=cursor,
+                run_tags=None,
+                phase_timer=phase_timer,
+            )
+            execution_time_seconds = time.time() - start
+            assert (
+                execution_time_seconds < self.max_execution_time_seconds
+            ), f"Tick took {execution_time_seconds:.2f}s ({phase_timer})"
+
+
 # ==============================================
 # Instance Snapshots
 #
@@ -364,3 +429,23 @@ def test_reconciliation_perf(scenario: PerfScenario):
         pytest.skip("Skipping slow test on BK")
 
     scenario.do_scenario()
+
+
+incremental_perf_scenarios = [
+    # 20000 assets, no partitions
+    IncrementalPerfScenario(
+        assets=RandomAssets(name="huge_unpartitioned_assets", n_assets=20000, n_sources=1000),
+        n_runs=2,
+        max_execution_time_seconds=30,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "scenario", incremental_perf_scenarios, ids=[s.name for s in incremental_perf_scenarios]
+)
+def test_incremental_reconciliation_perf(scenario: IncrementalPerfScenario):
+    if os.getenv("BUILDKITE") is not None and scenario.max_execution_time_seconds > 20:
+        pytest.skip("Skipping slow test on BK")
+
+    scenario.do_scenario()
@@ -22,13 +22,17 @@
 )
 from dagster._cli.debug import DebugRunPayload
 from dagster._core.definitions.dependency import NodeHandle
+from dagster._core.definitions.events import AssetKeyPartitionKey
 from dagster._core.errors import DagsterInvalidInvocationError
 from dagster._core.events import DagsterEvent
 from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.scheduler.instigation import InstigatorState, InstigatorTick
-from dagster._core.storage.event_log.migration import migrate_event_log_data
+from dagster._core.storage.event_log.migration import (
+    ASSET_PARTITION_LATEST_TABLE,
+    migrate_event_log_data,
+)
 from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 from dagster._core.storage.migration.utils import upgrading_instance
 from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, RunsFilter
@@ -1103,3 +1107,67 @@ def test_add_dynamic_partitions_table():
             instance.upgrade()
             assert "dynamic_partitions" in get_sqlite3_tables(db_path)
             assert instance.get_dynamic_partitions("foo") == []
+
+
+def test_add_run_and_step_stats_tables():
+    src_dir = file_relative_path(
+        __file__, "snapshot_1_0_17_pre_add_cached_status_data_column/sqlite"
+    )
+    run_id = "f0726a33-1f88-411b-8445-cbc723ea8185"
+
+    with copy_directory(src_dir) as test_dir:
+        index_db_path = os.path.join(test_dir, "history", "runs", "index.db")
+        run_db_path = os.path.join(test_dir, "history", "runs", f"{run_id}.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert "run_stats" not in get_sqlite3_tables(run_db_path)
+            assert "step_stats" not in get_sqlite3_tables(run_db_path)
+
+            storage = instance._event_storage  # pylint: disable=protected-access
+            assert not storage.has_run_stats_tables()
+            step_stats = storage.get_step_stats_for_run(run_id)
+            run_stats = storage.get_stats_for_run(run_id)
+
+            instance.upgrade()
+            assert "run_stats" in get_sqlite3_tables(index_db_path)
+            assert "run_stats" in get_sqlite3_tables(run_db_path)
+            assert "step_stats" in get_sqlite3_tables(run_db_path)
+
+            instance.reindex()
+            assert storage.has_run_stats_tables()
+            assert storage.get_step_stats_for_run(run_id) == step_stats
+            assert storage.get_stats_for_run(run_id) == run_stats
+
+
+def test_add_asset_partition_latest_table():
+    src_dir = file_relative_path(
+        __file__, "snapshot_1_0_17_pre_add_cached_status_data_column/sqlite"
+    )
+
+    with copy_directory(src_dir) as test_dir:
+        index_db_path = os.path.join(test_dir, "history", "runs", "index.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert "asset_partition_latest" not in get_sqlite3_tables(index_db_path)
+
+            storage = instance._event_storage  # pylint: disable=protected-access
+            assert not storage.has_secondary_index(ASSET_PARTITION_LATEST_TABLE)
+            asset_keys = instance.all_asset_keys()
+            asset_partitions = [
+                AssetKeyPartitionKey(asset_key, partition)
+                for asset_key, counts in instance.get_materialization_count_by_partition(
+                    asset_keys
+                ).items()
+                for partition in counts
+            ]
+            latest = instance.get_latest_asset_partition_materialization_records(asset_partitions)
+
+            instance.upgrade()
+            assert "asset_partition_latest" in get_sqlite3_tables(index_db_path)
+
+            instance.reindex()
+            assert storage.has_secondary_index(ASSET_PARTITION_LATEST_TABLE)
+            assert (
+                instance.get_latest_asset_partition_materialization_records(asset_partitions)
+                == latest
+            )
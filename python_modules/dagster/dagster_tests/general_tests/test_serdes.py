@@ -2,11 +2,12 @@
 import string
 from collections import namedtuple
 from enum import Enum
-from typing import NamedTuple, Set
+from typing import NamedTuple, Optional, Set
 
 import pytest
 from dagster import _seven
 from dagster._check import ParameterCheckError, inst_param, set_param
+from dagster._serdes.encoding import SerdesFormat, msgpack, zstandard
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._serdes.serdes import (
     DefaultEnumSerializer,
@@ -14,7 +15,9 @@
     EnumSerializer,
     WhitelistMap,
     _deserialize_json,
+    _pack_inner_value,
     _serialize_dagster_namedtuple,
+    _unpack_inner_value,
     _whitelist_for_serdes,
     deserialize_json_to_dagster_namedtuple,
     deserialize_value,
@@ -718,3 +721,179 @@ class Thing(NamedTuple):  # pylint: disable=unused-variable
 
     assert wmap.get_serialized_name("Thing") == "SerializedThing"
     assert wmap.get_deserialized_name("SerializedThing") == "Thing"
+
+
+def test_compiled_matches_reference():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Color(Enum):
+        RED = "RED"
+
+    class SkipSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def skip_when_empty(cls):
+            return {"tags"}
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=SkipSerializer)
+    class Inner(NamedTuple):
+        name: str
+        tags: Optional[dict] = None
+
+    class CustomSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def value_from_storage_dict(
+            cls, storage_dict, klass, args_for_class, whitelist_map, descent_path
+        ):
+            return klass(
+                inner=unpack_inner_value(storage_dict["inner"], whitelist_map, descent_path),
+                colors=frozenset(),
+            )
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=CustomSerializer)
+    class Custom(NamedTuple):
+        inner: Inner
+        colors: frozenset
+
+    @_whitelist_for_serdes(whitelist_map=test_map, storage_name="OldOuter")
+    class Outer(NamedTuple):
+        inners: list
+        color: Color
+        ids: set
+        custom: Custom
+        mapping: dict
+
+    value = Outer(
+        inners=[Inner("a"), Inner("b", {"x": 1})],
+        color=Color.RED,
+        ids={3, 1, 2},
+        custom=Custom(Inner("c"), frozenset([Color.RED])),
+        mapping={"a": [Inner("d", {"y": [None, 1.5]})]},
+    )
+
+    packed = pack_inner_value(value, test_map, "")
+    assert packed == _pack_inner_value(value, test_map, "")
+    assert packed["__class__"] == "OldOuter"
+    assert packed["inners"][0] == {"name": "a", "__class__": "Inner"}
+
+    packed_json = _seven.json.dumps(packed)
+    assert unpack_inner_value(_seven.json.loads(packed_json), test_map, "") == _unpack_inner_value(
+        _seven.json.loads(packed_json), test_map, ""
+    )
+
+    # unpacking does not modify the packed value
+    loaded = _seven.json.loads(packed_json)
+    unpacked = unpack_inner_value(loaded, test_map, "")
+    assert loaded == _seven.json.loads(packed_json)
+    assert unpacked == value._replace(custom=Custom(Inner("c"), frozenset()))
+
+
+def test_compiled_reregistration():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Thing(NamedTuple):  # pylint: disable=function-redefined
+        name: str
+
+    serialized = _serialize_dagster_namedtuple(Thing("foo"), test_map)
+    assert _deserialize_json(serialized, test_map) == Thing("foo")
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Thing(NamedTuple):  # pylint: disable=function-redefined
+        name: str
+        count: int = 0
+
+    # the unpacker compiled for the first registration is discarded
+    assert _deserialize_json(serialized, test_map) == Thing("foo", 0)
+    assert _seven.json.loads(_serialize_dagster_namedtuple(Thing("foo", 1), test_map))["count"] == 1
+
+
+def _binary_serdes_formats():
+    formats = [SerdesFormat.JSON_ZLIB]
+    if msgpack:
+        formats.extend([SerdesFormat.MSGPACK, SerdesFormat.MSGPACK_ZLIB])
+    if zstandard:
+        formats.append(SerdesFormat.JSON_ZSTD)
+    if msgpack and zstandard:
+        formats.append(SerdesFormat.MSGPACK_ZSTD)
+    return formats
+
+
+@pytest.mark.parametrize("serdes_format", _binary_serdes_formats())
+def test_binary_serdes_formats(serdes_format):
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Record(NamedTuple):
+        name: str
+        tags: dict
+        num: int
+
+    value = Record("foo" * 200, {"a": [1, 2.5, None, True]}, 9876543210)
+    serialized = serialize_value(value, whitelist_map=test_map, serdes_format=serdes_format)
+    if serdes_format.compression:
+        assert serialized.startswith("#dgs1:")
+        assert len(serialized) < len(serialize_value(value, whitelist_map=test_map))
+    else:
+        # base64 encoded msgpack is not shorter than the json, which is written instead
+        assert serialized == serialize_value(value, whitelist_map=test_map)
+    assert deserialize_value(serialized, whitelist_map=test_map) == value
+    assert _deserialize_json(serialized, test_map) == value
+
+    # json written before the format was changed can still be read
+    json_str = serialize_value(value, whitelist_map=test_map)
+    assert deserialize_value(json_str, whitelist_map=test_map) == value
+
+    # small payloads are not compressed, and are written as json unless that is longer
+    small = Record("foo", {}, 1)
+    small_serialized = serialize_value(small, whitelist_map=test_map, serdes_format=serdes_format)
+    if serdes_format.body_encoding == "json":
+        assert small_serialized == serialize_value(small, whitelist_map=test_map)
+    else:
+        assert len(small_serialized) <= len(serialize_value(small, whitelist_map=test_map))
+        assert not small_serialized.startswith("#dgs1:msgpack+")
+    assert deserialize_value(small_serialized, whitelist_map=test_map) == small
+
+    # integers msgpack cannot represent fall back to json
+    big = Record("foo", {}, 98765432109876543210)
+    big_serialized = serialize_value(big, whitelist_map=test_map, serdes_format=serdes_format)
+    assert deserialize_value(big_serialized, whitelist_map=test_map) == big
+
+
+@pytest.mark.parametrize("serdes_format", _binary_serdes_formats())
+def test_binary_serdes_non_string_keys(serdes_format):
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Record(NamedTuple):
+        name: str
+        tags: dict
+
+    # json turns non-string keys into strings, and every format reads them back the same way
+    value = Record("foo" * 200, {1: "one", 2: "two"})
+    json_value = deserialize_value(serialize_value(value, whitelist_map=test_map), test_map)
+    assert json_value.tags == {"1": "one", "2": "two"}
+
+    serialized = serialize_value(value, whitelist_map=test_map, serdes_format=serdes_format)
+    if serdes_format.compression:
+        assert serialized.startswith(f"#dgs1:{serdes_format.value}:")
+    assert deserialize_value(serialized, whitelist_map=test_map) == json_value
+
+
+def test_binary_serdes_errors():
+    with pytest.raises(DeserializationError, match="Unsupported binary serialization format"):
+        deserialize_value("#dgs2:json:e30=")
+
+    with pytest.raises(DeserializationError, match="Malformed header"):
+        deserialize_value("#dgs1")
+
+    with pytest.raises(DeserializationError, match="Unknown compression"):
+        deserialize_value("#dgs1:json+lz4:e30=")
+
+    assert deserialize_value("#dgs1:json:e30=") == {}
+
+    if not msgpack:
+        with pytest.raises(SerdesUsageError, match="msgpack library is required"):
+            serialize_value({}, serdes_format=SerdesFormat.MSGPACK)
+        with pytest.raises(DeserializationError, match="msgpack library is required"):
+            deserialize_value("#dgs1:msgpack:gA==")
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from dagster._core.errors import DagsterUserCodeUnreachableError
+from dagster._scheduler.async_evaluator import AsyncEvaluator, EvaluationLimits, LatencyHistogram
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(buckets=[1.0, 10.0])
+    assert histogram.count == 0
+    assert histogram.mean is None
+    assert str(histogram) == "no evaluations"
+
+    for seconds in [0.5, 1.0, 5.0, 20.0]:
+        histogram.observe(seconds)
+
+    assert histogram.count == 4
+    assert histogram.mean == pytest.approx(6.625)
+    assert histogram.bucket_counts == {"<=1s": 2, "<=10s": 1, ">10s": 1}
+
+
+def test_location_limits():
+    evaluator = AsyncEvaluator(
+        max_concurrent_evaluations=5,
+        timeout_seconds=30.0,
+        location_limits={"slow_location": {"max_concurrent_evaluations": 1}},
+    )
+    assert evaluator.get_limits("other_location") == EvaluationLimits(5, 30.0)
+    assert evaluator.get_limits("slow_location") == EvaluationLimits(1, 30.0)
+
+
+def test_concurrency_limit_per_location():
+    in_flight = {"limited": 0, "unlimited": 0}
+    max_in_flight = {"limited": 0, "unlimited": 0}
+
+    def _evaluate(location_name):
+        async def _evaluation():
+            in_flight[location_name] += 1
+            max_in_flight[location_name] = max(
+                max_in_flight[location_name], in_flight[location_name]
+            )
+            await asyncio.sleep(0.01)
+            in_flight[location_name] -= 1
+            return location_name
+
+        return _evaluation
+
+    with AsyncEvaluator(
+        max_concurrent_evaluations=10,
+        location_limits={"limited": {"max_concurrent_evaluations": 2}},
+    ) as evaluator:
+        futures = [
+            evaluator.submit(location_name, _evaluate(location_name))
+            for location_name in ["limited", "unlimited"]
+            for _ in range(10)
+        ]
+        results = [future.result(timeout=10) for future in futures]
+
+        assert results == ["limited"] * 10 + ["unlimited"] * 10
+        assert max_in_flight["limited"] == 2
+        assert max_in_flight["unlimited"] == 10
+
+        histograms = evaluator.get_latency_histograms()
+        assert histograms["limited"].count == 10
+        assert histograms["unlimited"].count == 10
+        assert len(evaluator.get_latency_report()) == 2
+
+
+def test_evaluation_timeout():
+    async def _hang():
+        await asyncio.sleep(60)
+
+    with AsyncEvaluator(timeout_seconds=0.01) as evaluator:
+        future = evaluator.submit("hanging_location", lambda: _hang())
+        with pytest.raises(DagsterUserCodeUnreachableError, match="timed out"):
+            future.result(timeout=10)
+
+        assert evaluator.get_latency_histograms()["hanging_location"].count == 1
@@ -2,6 +2,7 @@
 import os
 import sys
 import tempfile
+import threading
 import traceback
 
 import pytest
@@ -17,8 +18,9 @@
 from dagster._core.storage.legacy_storage import LegacyEventLogStorage
 from dagster._core.storage.sql import create_engine
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
+from dagster._core.utils import make_new_run_id
 
-from .utils.event_log_storage import TestEventLogStorage
+from .utils.event_log_storage import TestEventLogStorage, create_test_event_log_record
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -114,6 +116,38 @@ def test_concurrent_sqlite_event_log_connections(self, storage):
         assert not excs, excs
 
 
+class TestSingleWriterSqliteEventLogStorage(TestEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(scope="function", name="storage")
+    def event_log_storage(self):  # pylint: disable=arguments-differ
+        # make the temp dir in the cwd since default temp roots
+        # have issues with FS notif based event log watching
+        with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
+            storage = SqliteEventLogStorage(tmpdir_path, single_writer=True)
+            try:
+                yield storage
+            finally:
+                storage.dispose()
+
+    def test_concurrent_single_writer_store_events(self, storage):
+        run_id = make_new_run_id()
+
+        def _store_events(thread_index):
+            for i in range(20):
+                storage.store_event(create_test_event_log_record(f"{thread_index}-{i}", run_id))
+
+        threads = [threading.Thread(target=_store_events, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        logs = storage.get_logs_for_run(run_id)
+        assert len(logs) == 160
+        assert len({log.user_message for log in logs}) == 160
+
+
 class TestConsolidatedSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
 
@@ -129,6 +163,21 @@ def event_log_storage(self):  # pylint: disable=arguments-differ
                 storage.dispose()
 
 
+class TestSingleWriterConsolidatedSqliteEventLogStorage(TestEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(scope="function", name="storage")
+    def event_log_storage(self):  # pylint: disable=arguments-differ
+        # make the temp dir in the cwd since default temp roots
+        # have issues with FS notif based event log watching
+        with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
+            storage = ConsolidatedSqliteEventLogStorage(tmpdir_path, single_writer=True)
+            try:
+                yield storage
+            finally:
+                storage.dispose()
+
+
 class TestLegacyStorage(TestEventLogStorage):
     __test__ = True
 
@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Callable, Union
@@ -6,7 +7,11 @@
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 
 
@@ -40,6 +45,10 @@ def end_watch(self, run_id: str, handler: Callable[[EventLogEntry], None]):
         check.callable_param(handler, "handler")
         self._watcher.unwatch_run(run_id, handler)
 
+    @property
+    def event_watcher(self) -> SqlPollingEventWatcher:
+        return self._watcher
+
     def __del__(self):
         self.dispose()
 
@@ -70,7 +79,11 @@ def create_event(count: int, run_id: str = RUN_ID):
 @contextmanager
 def create_sqlite_run_event_logstorage():
     with tempfile.TemporaryDirectory() as tmpdir_path:
-        yield SqlitePollingEventLogStorage(tmpdir_path)
+        storage = SqlitePollingEventLogStorage(tmpdir_path)
+        try:
+            yield storage
+        finally:
+            storage.dispose()
 
 
 def test_using_logstorage():
@@ -111,7 +124,7 @@ def watch_two(event, _cursor):
         time.sleep(0.3)  # this value scientifically selected from a range of attractive values
         storage.store_event(create_event(5))
 
-        attempts = 10
+        attempts = 20
         while len(watched_2) < 2 and attempts > 0:
             time.sleep(0.1)
             attempts -= 1
@@ -129,3 +142,127 @@ def watch_two(event, _cursor):
 
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
+
+
+def test_watch_multiple_runs():
+    with create_sqlite_run_event_logstorage() as storage:
+        run_ids = [f"run_{i}" for i in range(5)]
+        watched = {run_id: [] for run_id in run_ids}
+
+        def _make_callback(run_id):
+            def _callback(event, _cursor):
+                watched[run_id].append(event)
+
+            return _callback
+
+        callbacks = {run_id: _make_callback(run_id) for run_id in run_ids}
+        for run_id in run_ids:
+            storage.store_event(create_event(0, run_id))
+            storage.watch(run_id, None, callbacks[run_id])
+
+        for run_id in run_ids:
+            storage.store_event(create_event(1, run_id))
+
+        attempts = 20
+        while any(len(events) < 2 for events in watched.values()) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        # all of the runs are watched from a single thread
+        assert len([t for t in threading.enumerate() if t.name == "sql-event-watch"]) == 1
+        for run_id in run_ids:
+            assert [int(evt.message) for evt in watched[run_id]] == [0, 1]
+            storage.end_watch(run_id, callbacks[run_id])
+            assert not storage.event_watcher.has_run_id(run_id)
+
+
+def test_watch_consolidated_storage():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage)
+        try:
+            watched = {"run_1": [], "run_2": []}
+            storage.store_event(create_event(0, "run_1"))
+            storage.store_event(create_event(0, "run_2"))
+            watcher.watch_run("run_1", None, lambda event, _cursor: watched["run_1"].append(event))
+            watcher.watch_run(
+                "run_2",
+                str(EventLogCursor.from_storage_id(2)),
+                lambda event, _cursor: watched["run_2"].append(event),
+            )
+            for i in range(1, 4):
+                storage.store_event(create_event(i, "run_1"))
+                storage.store_event(create_event(i, "run_2"))
+
+            attempts = 20
+            while (len(watched["run_1"]) < 4 or len(watched["run_2"]) < 3) and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+
+            assert [int(evt.message) for evt in watched["run_1"]] == [0, 1, 2, 3]
+            assert [int(evt.message) for evt in watched["run_2"]] == [1, 2, 3]
+        finally:
+            watcher.close()
+            storage.dispose()
+
+
+def test_watch_events_committed_out_of_order():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage)
+        try:
+            watched = {"run_1": [], "run_2": []}
+            for run_id in watched:
+                watcher.watch_run(
+                    run_id,
+                    None,
+                    lambda event, _cursor, run_id=run_id: watched[run_id].append(event),
+                )
+
+            def _store_event_with_storage_id(event, storage_id):
+                with storage.index_connection() as conn:
+                    conn.execute(storage.prepare_insert_event(event).values(id=storage_id))
+
+            # an event of run_2 becomes visible before an event of run_1 with a smaller storage id
+            _store_event_with_storage_id(create_event(0, "run_2"), 10)
+            attempts = 20
+            while not watched["run_2"] and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+            assert [int(evt.message) for evt in watched["run_2"]] == [0]
+
+            _store_event_with_storage_id(create_event(0, "run_1"), 5)
+            attempts = 20
+            while not watched["run_1"] and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+            assert [int(evt.message) for evt in watched["run_1"]] == [0]
+        finally:
+            watcher.close()
+            storage.dispose()
+
+
+def test_callbacks_called_without_lock():
+    with create_sqlite_run_event_logstorage() as storage:
+        watched = []
+
+        def _callback(event, _cursor):
+            # callbacks may watch and unwatch runs
+            storage.watch("other_run", None, _other_callback)
+            storage.end_watch(RUN_ID, _callback)
+            watched.append(event)
+
+        def _other_callback(_event, _cursor):
+            pass
+
+        storage.store_event(create_event(0))
+        storage.watch(RUN_ID, None, _callback)
+
+        attempts = 20
+        while not watched and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched] == [0]
+        assert not storage.event_watcher.has_run_id(RUN_ID)
+        assert storage.event_watcher.has_run_id("other_run")
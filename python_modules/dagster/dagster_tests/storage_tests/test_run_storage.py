@@ -5,6 +5,7 @@
 import pytest
 from dagster._core.storage.legacy_storage import LegacyRunStorage
 from dagster._core.storage.runs import InMemoryRunStorage, SqliteRunStorage
+from dagster._core.storage.runs.snapshot_cache import SnapshotCache
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
 
 from dagster_tests.storage_tests.utils.run_storage import TestRunStorage
@@ -16,6 +17,16 @@ def create_sqlite_run_storage():
         yield SqliteRunStorage.from_local(tempdir)
 
 
+@contextmanager
+def create_single_writer_sqlite_run_storage():
+    with tempfile.TemporaryDirectory() as tempdir:
+        storage = SqliteRunStorage.from_local(tempdir, single_writer=True)
+        try:
+            yield storage
+        finally:
+            storage.dispose()
+
+
 @contextmanager
 def create_non_bucket_sqlite_run_storage():
     with tempfile.TemporaryDirectory() as tempdir:
@@ -53,7 +64,10 @@ def create_legacy_run_storage():
 class TestSqliteImplementation(TestRunStorage):
     __test__ = True
 
-    @pytest.fixture(name="storage", params=[create_sqlite_run_storage])
+    @pytest.fixture(
+        name="storage",
+        params=[create_sqlite_run_storage, create_single_writer_sqlite_run_storage],
+    )
     def run_storage(self, request):
         with request.param() as s:
             yield s
@@ -109,3 +123,29 @@ def run_storage(self, request):
 
     def test_storage_telemetry(self, storage):
         pass
+
+
+def test_snapshot_cache_evicts_least_recently_used():
+    cache = SnapshotCache(max_bytes=10)
+    snapshots = {key: object() for key in ["a", "b", "c", "d"]}
+
+    cache.put("a", snapshots["a"], 4)
+    cache.put("b", snapshots["b"], 4)
+    assert cache.get("a") is snapshots["a"]
+
+    # evicts b, which was used less recently than a
+    cache.put("c", snapshots["c"], 4)
+    assert cache.get("b") is None
+    assert cache.get("a") is snapshots["a"]
+    assert cache.get("c") is snapshots["c"]
+
+    # larger than the whole cache
+    cache.put("d", snapshots["d"], 11)
+    assert cache.get("d") is None
+
+    stats = cache.get_stats()
+    assert stats.hits == 3
+    assert stats.misses == 2
+    assert stats.evictions == 1
+    assert stats.num_entries == 2
+    assert stats.size_bytes == 8
@@ -1,8 +1,8 @@
 import datetime
 import logging  # noqa: F401; used by mock in string form
-import re
 import sys
 import time
+import zlib
 from contextlib import ExitStack, contextmanager
 from typing import List, Optional, Sequence, Tuple, cast
 
@@ -15,6 +15,7 @@
     AssetObservation,
     DagsterInstance,
     EventLogRecord,
+    EventLogRecordProjection,
     EventRecordsFilter,
     Field,
     In,
@@ -34,6 +35,7 @@
 from dagster._core.assets import AssetDetails
 from dagster._core.definitions import ExpectationResult
 from dagster._core.definitions.dependency import NodeHandle
+from dagster._core.definitions.events import AssetKeyPartitionKey
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionKey
 from dagster._core.definitions.pipeline_base import InMemoryPipeline
 from dagster._core.events import (
@@ -48,7 +50,7 @@
 from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
 from dagster._core.execution.results import PipelineExecutionResult
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.stats import StepEventStatus, build_run_step_stats_from_events
 from dagster._core.host_representation.origin import (
     ExternalPipelineOrigin,
     ExternalRepositoryOrigin,
@@ -57,9 +59,10 @@
 from dagster._core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
 from dagster._core.storage.event_log.base import EventLogStorage
 from dagster._core.storage.event_log.migration import (
+    ASSET_PARTITION_LATEST_TABLE,
     EVENT_LOG_DATA_MIGRATIONS,
-    migrate_asset_key_data,
 )
+from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 from dagster._core.test_utils import create_run_for_test, instance_for_test
@@ -67,7 +70,7 @@
 from dagster._core.utils import make_new_run_id
 from dagster._legacy import AssetGroup, build_assets_job
 from dagster._loggers import colored_console_logger
-from dagster._serdes import deserialize_json_to_dagster_namedtuple
+from dagster._serdes import deserialize_as, deserialize_json_to_dagster_namedtuple, serialize_value
 from dagster._utils import datetime_as_float
 
 TEST_TIMEOUT = 5
@@ -630,6 +633,94 @@ def test_event_log_step_stats(self, test_run_id, storage):
         assert len(d_stats.expectation_results) == 2
         assert len(c_stats.attempts_list) == 1
 
+    def test_run_stats_tables(self, test_run_id, storage):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_run_stats_tables():
+            pytest.skip("This test is for SQL-backed Event Log behavior with run stats tables")
+
+        records = _stats_records(run_id=test_run_id)
+        storage.store_event(records[0])
+        storage.store_events(records[1:])
+
+        def _sorted_step_stats():
+            return sorted(
+                storage.get_step_stats_for_run(test_run_id), key=lambda stats: stats.step_key
+            )
+
+        expected_step_stats = sorted(
+            build_run_step_stats_from_events(test_run_id, storage.get_logs_for_run(test_run_id)),
+            key=lambda stats: stats.step_key,
+        )
+        assert _sorted_step_stats() == expected_step_stats
+        assert [
+            stats.step_key for stats in storage.get_step_stats_for_run(test_run_id, ["B", "D"])
+        ] == ["B", "D"]
+
+        run_stats = storage.get_stats_for_run(test_run_id)
+        assert run_stats.steps_succeeded == 2
+        assert run_stats.steps_failed == 1
+        assert run_stats.materializations == 3
+        assert run_stats.expectations == 2
+
+        # rebuilding the stats tables from the event log yields the same stats
+        storage.reindex_events(force=True)
+        assert _sorted_step_stats() == expected_step_stats
+        assert storage.get_stats_for_run(test_run_id) == run_stats
+
+        storage.delete_events(test_run_id)
+        assert storage.get_step_stats_for_run(test_run_id) == []
+        assert storage.get_stats_for_run(test_run_id).steps_succeeded == 0
+
+    def test_step_stats_order_with_timestamp_ties(self, test_run_id, storage):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_run_stats_tables():
+            pytest.skip("This test is for SQL-backed Event Log behavior with run stats tables")
+
+        # the steps start at the same time, and the clock goes back before the last one starts
+        now = time.time()
+        records = [
+            _event_record(test_run_id, "B", now, DagsterEventType.STEP_START),
+            _event_record(test_run_id, "A", now, DagsterEventType.STEP_START),
+            _event_record(test_run_id, "C", now - 1, DagsterEventType.STEP_START),
+            _event_record(
+                test_run_id,
+                "A",
+                now,
+                DagsterEventType.STEP_SUCCESS,
+                StepSuccessData(duration_ms=0.0),
+            ),
+        ]
+        storage.store_event(records[0])
+        storage.store_events(records[1:])
+
+        # the step stats table orders the steps like the step stats built from the event log
+        legacy_step_stats = build_run_step_stats_from_events(
+            test_run_id, storage.get_logs_for_run(test_run_id)
+        )
+        assert [stats.step_key for stats in legacy_step_stats] == ["B", "A", "C"]
+        assert storage.get_step_stats_for_run(test_run_id) == legacy_step_stats
+
+        storage.reindex_events(force=True)
+        assert storage.get_step_stats_for_run(test_run_id) == legacy_step_stats
+
+    def test_step_stats_update_conflict(self, test_run_id, storage):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_run_stats_tables():
+            pytest.skip("This test is for SQL-backed Event Log behavior with run stats tables")
+
+        records = _stats_records(run_id=test_run_id)
+        storage.store_event(records[0])
+
+        # failing to update the step stats leaves them stale instead of failing the event writes
+        with mock.patch(
+            "dagster._core.storage.event_log.sql_event_log.MAX_STEP_STATS_UPDATE_ATTEMPTS", 0
+        ), mock.patch(
+            "dagster._core.storage.event_log.sql_event_log.logging.warning"
+        ) as mock_warning:
+            storage.store_event(records[1])
+            storage.store_events(records[2:])
+
+        assert len(storage.get_logs_for_run(test_run_id)) == len(records)
+        assert mock_warning.call_count > 0
+        assert mock_warning.call_args[0][0].startswith("Could not update the stats for step")
+
     def test_secondary_index(self, storage):
         if not isinstance(storage, SqlEventLogStorage):
             pytest.skip("This test is for SQL-backed Event Log behavior")
@@ -993,70 +1084,35 @@ def _ops():
             for event in events_one:
                 storage.store_event(event)
 
-            with ExitStack() as stack:
-                stack.enter_context(
-                    mock.patch(
-                        "dagster._core.storage.event_log.sql_event_log.logging.warning",
-                        side_effect=mock_log,
-                    )
-                )
-                # for generic sql-based event log storage
-                stack.enter_context(
-                    mock.patch(
-                        "dagster._core.storage.event_log.sql_event_log.deserialize_json_to_dagster_namedtuple",
-                        return_value="not_an_event_record",
-                    )
-                )
-                # for sqlite event log storage, which overrides the record fetching implementation
-                stack.enter_context(
-                    mock.patch(
-                        "dagster._core.storage.event_log.sqlite.sqlite_event_log.deserialize_json_to_dagster_namedtuple",
-                        return_value="not_an_event_record",
-                    )
-                )
-
-                assert asset_key in set(storage.all_asset_keys())
-                _records = storage.get_event_records(
-                    EventRecordsFilter(
-                        event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                        asset_key=asset_key,
-                    )
-                )
-                assert len(_logs) == 1
-                assert re.match("Could not resolve event record as EventLogEntry", _logs[0])
-
-            with ExitStack() as stack:
+            for deserialize_error in [
+                check.CheckError("Deserialized object was not expected target type"),
+                seven.JSONDecodeError("error", "", 0),
+            ]:
                 _logs = []  # reset logs
-                stack.enter_context(
-                    mock.patch(
-                        "dagster._core.storage.event_log.sql_event_log.logging.warning",
-                        side_effect=mock_log,
-                    )
-                )
-
-                # for generic sql-based event log storage
-                stack.enter_context(
-                    mock.patch(
-                        "dagster._core.storage.event_log.sql_event_log.deserialize_json_to_dagster_namedtuple",
-                        side_effect=seven.JSONDecodeError("error", "", 0),
+                with ExitStack() as stack:
+                    stack.enter_context(
+                        mock.patch(
+                            "dagster._core.storage.event_log.sql_event_log.logging.warning",
+                            side_effect=mock_log,
+                        )
                     )
-                )
-                # for sqlite event log storage, which overrides the record fetching implementation
-                stack.enter_context(
-                    mock.patch(
-                        "dagster._core.storage.event_log.sqlite.sqlite_event_log.deserialize_json_to_dagster_namedtuple",
-                        side_effect=seven.JSONDecodeError("error", "", 0),
+                    stack.enter_context(
+                        mock.patch(
+                            "dagster._core.storage.event_log.sql_event_log.deserialize_as",
+                            side_effect=deserialize_error,
+                        )
                     )
-                )
-                assert asset_key in set(storage.all_asset_keys())
-                _records = storage.get_event_records(
-                    EventRecordsFilter(
-                        event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                        asset_key=asset_key,
+
+                    assert asset_key in set(storage.all_asset_keys())
+                    records = storage.get_event_records(
+                        EventRecordsFilter(
+                            event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                            asset_key=asset_key,
+                        )
                     )
-                )
-                assert len(_logs) == 1
-                assert re.match("Could not parse event record id", _logs[0])
+                    assert len(records) == 0
+                    assert len(_logs) == 1
+                    assert _logs[0].startswith("Could not parse event record id")
 
     def test_secondary_index_asset_keys(self, storage, instance):
         asset_key_one = AssetKey(["one"])
@@ -1089,7 +1145,7 @@ def _two():
             asset_keys = storage.all_asset_keys()
             assert len(asset_keys) == 1
             assert asset_key_one in set(asset_keys)
-            migrate_asset_key_data(storage)
+            storage.reindex_events(force=True)
             asset_keys = storage.all_asset_keys()
             assert len(asset_keys) == 1
             assert asset_key_one in set(asset_keys)
@@ -1762,7 +1818,7 @@ def test_asset_secondary_index(self, storage, instance):
 
                 asset_keys = storage.all_asset_keys()
                 assert len(asset_keys) == 1
-                migrate_asset_key_data(storage)
+                storage.reindex_events(force=True)
 
                 two_first_run_id = "first"
                 two_second_run_id = "second"
@@ -2000,6 +2056,88 @@ def _fetch_counts(storage, after_cursor=None):
                     )
                     assert _fetch_counts(storage, after_cursor=9999999999) == {c: {}, d: {}}
 
+    def test_get_latest_asset_partition_materialization_records(self, storage, instance):
+        a = AssetKey("partitioned_asset")
+        b = AssetKey("other_partitioned_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a, partition="x")
+            yield AssetMaterialization(a, partition="y")
+            yield AssetMaterialization(b, partition="x")
+            yield AssetObservation(a, partition="z")
+            yield Output(None)
+
+        @op
+        def materialize_again():
+            yield AssetMaterialization(a, partition="x")
+            yield Output(None)
+
+        def _fetch_latest():
+            return storage.get_latest_asset_partition_materialization_records(
+                [
+                    AssetKeyPartitionKey(a, "x"),
+                    AssetKeyPartitionKey(a, "y"),
+                    AssetKeyPartitionKey(a, "z"),
+                    AssetKeyPartitionKey(b, "x"),
+                ]
+            )
+
+        def _latest_from_event_records(asset_key, partition):
+            return storage.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                    asset_key=asset_key,
+                    asset_partitions=[partition],
+                ),
+                limit=1,
+            )[0]
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+                events, _ = _synthesize_events(
+                    lambda: materialize(), instance=created_instance, run_id=run_id_1
+                )
+                storage.store_events(events)
+                events, _ = _synthesize_events(
+                    lambda: materialize_again(), instance=created_instance, run_id=run_id_2
+                )
+                for event in events:
+                    storage.store_event(event)
+
+                latest = _fetch_latest()
+                assert set(latest.keys()) == {
+                    AssetKeyPartitionKey(a, "x"),
+                    AssetKeyPartitionKey(a, "y"),
+                    AssetKeyPartitionKey(b, "x"),
+                }
+                for asset_partition, record in latest.items():
+                    assert record == _latest_from_event_records(
+                        asset_partition.asset_key, asset_partition.partition_key
+                    )
+                assert latest[AssetKeyPartitionKey(a, "x")].run_id == run_id_2
+
+                if isinstance(storage, SqlEventLogStorage) and storage.has_secondary_index(
+                    ASSET_PARTITION_LATEST_TABLE
+                ):
+                    # rebuilding the index from the event log yields the same records
+                    storage.reindex_events(force=True)
+                    assert _fetch_latest() == latest
+
+                storage.delete_events(run_id_2)
+                latest = _fetch_latest()
+                assert latest[AssetKeyPartitionKey(a, "x")].run_id == run_id_1
+                assert latest[AssetKeyPartitionKey(a, "x")] == _latest_from_event_records(a, "x")
+
+                if self.can_wipe():
+                    storage.wipe_asset(a)
+                    assert set(_fetch_latest().keys()) == {AssetKeyPartitionKey(b, "x")}
+
     def test_get_observation(self, storage, test_run_id):
         a = AssetKey(["key_a"])
 
@@ -2436,6 +2574,316 @@ def my_op():
                 {"dagster/partition/country": "US", "dagster/partition/date": "2022-10-13"}
             ]
 
+    def test_store_events_batch(self, storage, instance):
+        @op
+        def my_op():
+            yield AssetMaterialization(asset_key=AssetKey("a"), tags={"dagster/foo": "bar"})
+            yield AssetObservation(asset_key=AssetKey("b"))
+            yield AssetMaterialization(asset_key=AssetKey("a"), tags={"dagster/foo": "baz"})
+            yield Output(5)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: my_op(), run_id)
+            storage.store_events(events)
+
+            stored_events = storage.get_logs_for_run(run_id)
+            assert [event.message for event in stored_events] == [event.message for event in events]
+
+            materializations = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION, asset_key=AssetKey("a"))
+            )
+            assert len(materializations) == 2
+            assert storage.has_asset_key(AssetKey("a"))
+            assert storage.has_asset_key(AssetKey("b"))
+
+            latest = storage.get_latest_materialization_events([AssetKey("a")])[AssetKey("a")]
+            assert latest.dagster_event.step_materialization_data.materialization.tags == {
+                "dagster/foo": "baz"
+            }
+
+            if storage.supports_add_asset_event_tags():
+                asset_event_tags = storage.get_event_tags_for_asset(AssetKey("a"))
+                assert sorted(tags["dagster/foo"] for tags in asset_event_tags) == ["bar", "baz"]
+
+            # a second batch updates the existing asset keys
+            more_events, _ = _synthesize_events(lambda: my_op())
+            storage.store_events(more_events)
+            latest = storage.get_latest_materialization_events([AssetKey("a")])[AssetKey("a")]
+            assert latest.run_id == more_events[0].run_id
+
+    def test_event_records_without_event(self, storage, instance):
+        @op
+        def my_op():
+            yield AssetMaterialization(asset_key=AssetKey("a"), partition="x")
+            yield AssetMaterialization(asset_key=AssetKey("a"), partition="y")
+            yield Output(5)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: my_op(), run_id)
+            storage.store_events(events)
+
+            records = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION, asset_key=AssetKey("a")),
+                ascending=True,
+            )
+            projected_records = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION, asset_key=AssetKey("a")),
+                ascending=True,
+                include_event=False,
+            )
+            assert len(records) == len(projected_records) == 2
+            for record, projected_record in zip(records, projected_records):
+                assert isinstance(projected_record, EventLogRecordProjection)
+                assert projected_record.storage_id == record.storage_id
+                assert projected_record.run_id == run_id
+                assert projected_record.asset_key == AssetKey("a")
+                assert projected_record.timestamp == pytest.approx(
+                    record.event_log_entry.timestamp, abs=1e-3
+                )
+
+            assert [record.partition_key for record in projected_records] == ["x", "y"]
+            assert records[0].event_log_entry.dagster_event.partition == "x"
+            assert records[0] == records[0]
+
+            # records fetched with their events are plain, serializable records
+            assert all(type(record) is EventLogRecord for record in records)
+            assert deserialize_as(serialize_value(records[0]), EventLogRecord) == records[0]
+            assert (
+                deserialize_as(serialize_value(projected_records[0]), EventLogRecordProjection)
+                == projected_records[0]
+            )
+
+            # the pooled connections of single writer storages are read-only
+            if isinstance(storage, SqlEventLogStorage) and not getattr(
+                storage, "is_single_writer", False
+            ):
+                # rows written before the asset key column was added read the asset key and
+                # partition from the event
+                with storage.index_connection() as conn:
+                    conn.execute(
+                        SqlEventLogStorageTable.update()  # pylint: disable=no-value-for-parameter
+                        .where(SqlEventLogStorageTable.c.id == records[0].storage_id)
+                        .values(asset_key=None, partition=None)
+                    )
+                legacy_records = storage.get_event_records(
+                    EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION),
+                    ascending=True,
+                    include_event=False,
+                )
+                assert [record.asset_key for record in legacy_records] == [AssetKey("a")] * 2
+                assert [record.partition_key for record in legacy_records] == ["x", "y"]
+
+            run_records = storage.get_records_for_run(
+                run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION, include_event=False
+            ).records
+            assert all(isinstance(record, EventLogRecordProjection) for record in run_records)
+            assert [record.partition_key for record in run_records] == ["x", "y"]
+            assert all(record.asset_key == AssetKey("a") for record in run_records)
+
+    def test_iterate_event_records(self, storage, instance):
+        @op
+        def materialize():
+            for i in range(5):
+                yield AssetMaterialization(AssetKey("a"), partition=str(i))
+            yield AssetMaterialization(AssetKey("b"))
+            yield Output(None)
+
+        def _storage_ids(records):
+            return [record.storage_id for record in records]
+
+        run_id_1, run_id_2 = make_new_run_id(), make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+            for run_id in [run_id_1, run_id_2]:
+                events, _ = _synthesize_events(lambda: materialize(), run_id)
+                storage.store_events(events)
+
+            records_filter = EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=AssetKey("a")
+            )
+            expected = _storage_ids(storage.get_event_records(records_filter, ascending=True))
+            assert len(expected) == 10
+
+            for batch_size in [1, 3, 5, 10, 100]:
+                assert (
+                    _storage_ids(storage.iterate_event_records(records_filter, batch_size))
+                    == expected
+                )
+
+            assert (
+                _storage_ids(
+                    storage.iterate_event_records(
+                        records_filter._replace(after_cursor=expected[3]), batch_size=2
+                    )
+                )
+                == expected[4:]
+            )
+
+            records = list(
+                storage.iterate_event_records(records_filter, batch_size=4, include_event=False)
+            )
+            assert all(isinstance(record, EventLogRecordProjection) for record in records)
+            assert _storage_ids(records) == expected
+            assert [record.partition_key for record in records] == [str(i) for i in range(5)] * 2
+
+            # the iterator can be abandoned before it is exhausted
+            iterator = storage.iterate_event_records(records_filter, batch_size=2)
+            assert next(iterator).storage_id == expected[0]
+            iterator.close()
+
+            if not storage.is_run_sharded:
+                step_output_filter = EventRecordsFilter(event_type=DagsterEventType.STEP_OUTPUT)
+                assert _storage_ids(
+                    storage.iterate_event_records(step_output_filter, batch_size=1)
+                ) == _storage_ids(storage.get_event_records(step_output_filter, ascending=True))
+
+    def test_iterate_event_records_run_sharded(self, storage):
+        if not storage.is_run_sharded:
+            pytest.skip("This test is for run-sharded Event Log behavior")
+
+        @op
+        def return_one():
+            return 1
+
+        def _run_storage_ids(records):
+            return [(record.run_id, record.storage_id) for record in records]
+
+        with instance_for_test() as instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(instance)
+
+            run_id_1, run_id_2 = make_new_run_id(), make_new_run_id()
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+                for run_id in [run_id_1, run_id_2]:
+                    events, _ = _synthesize_events(lambda: return_one(), run_id)
+                    storage.store_events(events)
+
+                # storage ids are only comparable within a run shard, so the records of each run
+                # are paged through in turn
+                records_filter = EventRecordsFilter(event_type=DagsterEventType.ENGINE_EVENT)
+                expected = _run_storage_ids(
+                    storage.get_event_records(records_filter, ascending=True)
+                )
+                assert len(expected) == 4
+                assert {run_id for run_id, _ in expected} == {run_id_1, run_id_2}
+
+                for batch_size in [1, 2, 100]:
+                    assert (
+                        _run_storage_ids(storage.iterate_event_records(records_filter, batch_size))
+                        == expected
+                    )
+
+    def test_get_records_for_runs(self, storage, instance):
+        if not isinstance(storage, SqlEventLogStorage) or storage.is_run_sharded:
+            pytest.skip("This test is for non-run-sharded SQL-backed Event Log behavior")
+
+        @op
+        def my_op():
+            yield Output(5)
+
+        run_id_1, run_id_2, run_id_3 = make_new_run_id(), make_new_run_id(), make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id_1, run_id_2, run_id_3]):
+            for run_id in [run_id_1, run_id_2, run_id_3]:
+                events, _ = _synthesize_events(lambda: my_op(), run_id)
+                storage.store_events(events)
+
+            records_1 = storage.get_records_for_run(run_id_1).records
+            records_2 = storage.get_records_for_run(run_id_2).records
+            expected = sorted(records_1 + records_2, key=lambda record: record.storage_id)
+
+            assert storage.get_records_for_runs({}) == []
+            assert storage.get_records_for_runs({run_id_1: -1, run_id_2: -1}) == expected
+            assert (
+                storage.get_records_for_runs({run_id_1: -1, run_id_2: -1}, limit=3) == expected[:3]
+            )
+
+            # each run is fetched after its own cursor
+            assert (
+                storage.get_records_for_runs(
+                    {run_id_1: records_1[-2].storage_id, run_id_2: records_2[0].storage_id}
+                )
+                == records_1[-1:] + records_2[1:]
+            )
+
+    def test_archive_events(self, storage, instance):
+        if (
+            not isinstance(storage, SqlEventLogStorage)
+            or not storage.has_run_stats_tables()
+            or not storage.has_event_log_archives_table()
+        ):
+            pytest.skip("This test is for SQL-backed Event Log behavior with event log archives")
+
+        @op
+        def my_op():
+            yield AssetMaterialization(asset_key=AssetKey("a"), partition="x")
+            yield Output(5)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: my_op(), run_id)
+            storage.store_events(events)
+
+            records = storage.get_records_for_run(run_id).records
+            run_stats = storage.get_stats_for_run(run_id)
+            step_stats = storage.get_step_stats_for_run(run_id)
+
+            archived = storage.archive_events(run_id)
+            assert archived > 0
+            assert storage.archive_events(run_id) == 0
+
+            assert storage.get_records_for_run(run_id).records == records
+            assert [
+                record.storage_id
+                for record in storage.get_records_for_run(run_id, include_event=False).records
+            ] == [record.storage_id for record in records]
+            assert storage.get_logs_for_run(run_id) == [
+                record.event_log_entry for record in records
+            ]
+            assert storage.get_stats_for_run(run_id) == run_stats
+            assert storage.get_step_stats_for_run(run_id) == step_stats
+
+            # cursors and limits page through the archived and unarchived events in order, without
+            # decompressing the archive again for each page
+            with mock.patch(
+                "dagster._core.storage.event_log.sql_event_log.zlib.decompress",
+                wraps=zlib.decompress,
+            ) as mock_decompress:
+                connection = storage.get_records_for_run(run_id, limit=3)
+                assert connection.records == records[:3]
+                assert connection.has_more
+                next_connection = storage.get_records_for_run(run_id, cursor=connection.cursor)
+                assert next_connection.records == records[3:]
+                assert mock_decompress.call_count == 0
+
+            step_events = storage.get_records_for_run(
+                run_id,
+                of_type={DagsterEventType.STEP_START, DagsterEventType.STEP_SUCCESS},
+            ).records
+            assert [record.event_log_entry.dagster_event_type for record in step_events] == [
+                DagsterEventType.STEP_START,
+                DagsterEventType.STEP_SUCCESS,
+            ]
+
+            # asset events are not archived
+            materializations = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION, asset_key=AssetKey("a"))
+            )
+            assert len(materializations) == 1
+            assert materializations[0].partition_key == "x"
+
+            # events stored after archiving are merged with the archived events
+            more_events, _ = _synthesize_events(lambda: my_op(), run_id)
+            storage.store_events(more_events)
+            assert len(storage.get_logs_for_run(run_id)) == len(records) + len(more_events)
+
+            # archiving them again replaces the cached archive
+            assert storage.archive_events(run_id) > 0
+            assert len(storage.get_logs_for_run(run_id)) == len(records) + len(more_events)
+
+            storage.delete_events(run_id)
+            assert storage.get_logs_for_run(run_id) == []
+
     def test_add_asset_event_tags(self, storage, instance):
         if not storage.supports_add_asset_event_tags():
             pytest.skip("storage does not support adding asset event tags")
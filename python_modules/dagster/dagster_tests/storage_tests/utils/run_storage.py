@@ -1,5 +1,6 @@
 import sys
 import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
 
@@ -29,15 +30,19 @@
     DagsterRunStatus,
     JobBucket,
     RunsFilter,
+    RunStatusRecord,
     TagBucket,
 )
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
+from dagster._core.storage.runs.snapshot_cache import SnapshotCache
 from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+from dagster._core.storage.runs.wakeup import RunWakeupChannel
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
 )
@@ -45,7 +50,7 @@
 from dagster._core.utils import make_new_run_id
 from dagster._daemon.daemon import SensorDaemon
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import serialize_pp
+from dagster._serdes import serialize_dagster_namedtuple, serialize_pp
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
 win_py36 = _seven.IS_WINDOWS and sys.version_info[0] == 3 and sys.version_info[1] == 6
@@ -153,6 +158,29 @@ def test_basic_storage(self, storage):
         assert fetched_run.run_id == run_id
         assert fetched_run.pipeline_name == "some_pipeline"
 
+    def test_add_runs(self, storage):
+        assert storage
+        run_ids = [make_new_run_id() for _ in range(3)]
+        added = storage.add_runs(
+            [
+                TestRunStorage.build_run(
+                    run_id=run_id, pipeline_name="some_pipeline", tags={"foo": str(i)}
+                )
+                for i, run_id in enumerate(run_ids)
+            ]
+        )
+        assert [run.run_id for run in added] == run_ids
+        assert storage.add_runs([]) == []
+
+        runs = storage.get_runs()
+        assert len(runs) == 3
+        assert {run.run_id for run in runs} == set(run_ids)
+        assert {run.tags.get("foo") for run in runs} == {"0", "1", "2"}
+        assert len(storage.get_runs(RunsFilter(tags={"foo": "1"}))) == 1
+
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs([_get_run_by_id(storage, run_ids[0])])
+
     def test_clear(self, storage):
         if not self.can_delete_runs():
             pytest.skip("storage cannot delete")
@@ -171,6 +199,58 @@ def test_storage_telemetry(self, storage):
         storage_id_again = storage.get_run_storage_id()
         assert storage_id == storage_id_again
 
+    def test_get_run_status_records(self, storage):
+        assert storage
+        job_origin = self.fake_job_origin("some_pipeline")
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                pipeline_name="some_pipeline",
+                status=DagsterRunStatus.QUEUED,
+                tags={"foo": "bar", PRIORITY_TAG: "3"},
+                external_pipeline_origin=job_origin,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two, pipeline_name="some_pipeline", status=DagsterRunStatus.NOT_STARTED
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three, pipeline_name="some_pipeline", status=DagsterRunStatus.STARTED
+            )
+        )
+        storage.add_run_tags(two, {PRIORITY_TAG: "not_a_number"})
+
+        not_started_filter = RunsFilter(
+            statuses=[DagsterRunStatus.QUEUED, DagsterRunStatus.NOT_STARTED]
+        )
+        records = storage.get_run_status_records(not_started_filter, ascending=True)
+        assert records == [
+            RunStatusRecord.from_run_record(run_record)
+            for run_record in storage.get_run_records(not_started_filter, ascending=True)
+        ]
+        assert [record.run_id for record in records] == [one, two]
+
+        record_one, record_two = records
+        assert record_one.status == DagsterRunStatus.QUEUED
+        assert record_one.tags == {"foo": "bar", PRIORITY_TAG: "3"}
+        assert record_one.priority == 3
+        assert record_one.location_name == job_origin.location_name
+        assert record_two.tags == {PRIORITY_TAG: "not_a_number"}
+        assert record_two.priority == 0
+        assert record_two.location_name is None
+
+        assert [record.run_id for record in storage.get_run_status_records(limit=2)] == [
+            three,
+            two,
+        ]
+        assert storage.get_run_status_records(RunsFilter(statuses=[DagsterRunStatus.SUCCESS])) == []
+
     def test_fetch_by_pipeline(self, storage):
         assert storage
         one = make_new_run_id()
@@ -912,6 +992,58 @@ def test_add_get_snapshot(self, storage):
 
             assert not storage.has_pipeline_snapshot(pipeline_snapshot_id)
 
+    def test_snapshot_cache(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("storage does not cache snapshots")
+
+        pipeline_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
+        pipeline_snapshot = pipeline_def.get_pipeline_snapshot()
+        pipeline_snapshot_id = storage.add_pipeline_snapshot(pipeline_snapshot)
+
+        stats = storage.get_snapshot_cache_stats()
+        assert stats.num_entries == 1
+
+        # snapshots written by this storage are served from the cache
+        assert storage.get_pipeline_snapshot(pipeline_snapshot_id) is pipeline_snapshot
+        assert storage.get_snapshot_cache_stats().hits == stats.hits + 1
+
+        # a cleared cache is refilled from the stored snapshot
+        storage.snapshot_cache.clear()
+        fetched = storage.get_pipeline_snapshot(pipeline_snapshot_id)
+        assert serialize_pp(fetched) == serialize_pp(pipeline_snapshot)
+        assert storage.get_snapshot_cache_stats().misses == stats.misses + 1
+        assert storage.get_pipeline_snapshot(pipeline_snapshot_id) is fetched
+
+        if self.can_delete_runs():
+            storage.wipe()
+            assert storage.get_pipeline_snapshot(pipeline_snapshot_id) is None
+
+    def test_snapshot_cache_size(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("storage does not cache snapshots")
+
+        snapshots = [
+            GraphDefinition(name=name, node_defs=[]).to_job().get_pipeline_snapshot()
+            for name in ["first_pipeline", "second_pipeline"]
+        ]
+        json_sizes = [len(serialize_dagster_namedtuple(snapshot)) for snapshot in snapshots]
+
+        # room for one snapshot by its json size, though the compressed bodies of both would fit
+        storage._snapshot_cache = SnapshotCache(  # pylint: disable=protected-access
+            max_bytes=max(json_sizes) + min(json_sizes) // 2
+        )
+        snapshot_ids = [storage.add_pipeline_snapshot(snapshot) for snapshot in snapshots]
+
+        stats = storage.get_snapshot_cache_stats()
+        assert stats.num_entries == 1
+        assert stats.evictions == 1
+        assert stats.size_bytes == json_sizes[1]
+
+        # snapshots read back from storage are charged the same size
+        storage.snapshot_cache.clear()
+        storage.get_pipeline_snapshot(snapshot_ids[0])
+        assert storage.get_snapshot_cache_stats().size_bytes == json_sizes[0]
+
     def test_single_write_read_with_snapshot(self, storage):
         run_with_snapshot_id = "lkasjdflkjasdf"
         pipeline_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
@@ -1309,6 +1441,58 @@ def test_backfill(self, storage):
         assert len(storage.get_backfills()) == 1
         assert len(storage.get_backfills(status=BulkActionStatus.REQUESTED)) == 0
 
+    def test_wakeup_notifications(self, storage):
+        if not storage.supports_wakeup_notifications:
+            pytest.skip("storage does not support wakeup notifications")
+
+        queued_event = threading.Event()
+        backfill_event = threading.Event()
+        storage.add_wakeup_listener([RunWakeupChannel.RUN_QUEUED], queued_event)
+        storage.add_wakeup_listener([RunWakeupChannel.BACKFILL_CREATED], backfill_event)
+        try:
+            run_id = make_new_run_id()
+            storage.add_run(TestRunStorage.build_run(run_id=run_id, pipeline_name="some_pipeline"))
+            assert not queued_event.wait(1)
+
+            storage.handle_run_event(
+                run_id,
+                DagsterEvent(
+                    message="a message",
+                    event_type_value=DagsterEventType.PIPELINE_ENQUEUED.value,
+                    pipeline_name="some_pipeline",
+                ),
+            )
+            assert queued_event.wait(5)
+            assert not backfill_event.is_set()
+
+            storage.add_backfill(
+                PartitionBackfill(
+                    "one",
+                    partition_set_origin=self.fake_partition_set_origin("fake_partition_set"),
+                    status=BulkActionStatus.REQUESTED,
+                    partition_names=["a"],
+                    from_failure=False,
+                    tags={},
+                    backfill_timestamp=pendulum.now().timestamp(),
+                )
+            )
+            assert backfill_event.wait(5)
+
+            storage.remove_wakeup_listener(queued_event)
+            queued_event.clear()
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=make_new_run_id(),
+                    pipeline_name="some_pipeline",
+                    status=DagsterRunStatus.QUEUED,
+                )
+            )
+            assert not queued_event.wait(1)
+        finally:
+            storage.remove_wakeup_listener(queued_event)
+            storage.remove_wakeup_listener(backfill_event)
+            storage.dispose()
+
     def test_secondary_index(self, storage):
         if not isinstance(storage, SqlRunStorage):
             return
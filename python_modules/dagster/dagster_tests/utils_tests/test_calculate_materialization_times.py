@@ -22,7 +22,7 @@
 from dagster._core.definitions.time_window_partitions import DailyPartitionsDefinition
 from dagster._core.event_api import EventRecordsFilter
 from dagster._seven.compat.pendulum import create_pendulum_time
-from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+from dagster._utils.caching_instance_queryer import USED_DATA_TAG, CachingInstanceQueryer
 
 
 @pytest.mark.parametrize("ignore_asset_tags", [True, False])
@@ -276,3 +276,56 @@ def test_partitioned_data_time(scenario):
         assert data_time_queryer.get_used_data_times_for_record(
             asset_graph=partition_repo.asset_graph, record=record
         ) == {AssetKey("partitioned_asset"): scenario.expected_time}
+
+
+def test_stored_used_data():
+    @asset
+    def root():
+        pass
+
+    @asset(non_argument_deps={AssetKey("root")})
+    def middle():
+        pass
+
+    @asset(non_argument_deps={AssetKey("middle")})
+    def leaf():
+        pass
+
+    asset_graph = AssetGraph.from_assets([root, middle, leaf])
+
+    with DagsterInstance.ephemeral() as instance:
+        assert materialize_to_memory([root, middle, leaf], instance=instance).success
+
+        records = {
+            key: CachingInstanceQueryer(instance).get_latest_materialization_record(AssetKey(key))
+            for key in ["root", "middle", "leaf"]
+        }
+        used_data_times = CachingInstanceQueryer(instance).get_used_data_times_for_record(
+            asset_graph=asset_graph, record=records["leaf"]
+        )
+        assert used_data_times == {
+            AssetKey("root"): datetime.datetime.fromtimestamp(
+                records["root"].event_log_entry.timestamp, tz=datetime.timezone.utc
+            )
+        }
+
+        # the used data of every record upstream of the leaf was stored along the way
+        for key in ["middle", "leaf"]:
+            tags = instance.event_log_storage.get_event_tags_for_asset(
+                AssetKey(key), filter_event_id=records[key].storage_id
+            )
+            assert USED_DATA_TAG in tags[0]
+
+        # so the used data of the leaf can be looked up without walking upstream of it
+        data_time_queryer = CachingInstanceQueryer(instance)
+        with mock.patch.object(
+            data_time_queryer,
+            "get_latest_materialization_record",
+            side_effect=Exception("should not walk upstream"),
+        ):
+            assert (
+                data_time_queryer.get_used_data_times_for_record(
+                    asset_graph=asset_graph, record=records["leaf"]
+                )
+                == used_data_times
+            )
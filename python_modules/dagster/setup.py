@@ -101,6 +101,7 @@ def get_version() -> str:
     ],
     extras_require={
         "docker": ["docker"],
+        "binary-serdes": ["msgpack>=1.0", "zstandard"],
         "test": [
             "buildkite-test-collector ; python_version>='3.8'",
             "docker",
@@ -1,4 +1,6 @@
-from typing import ContextManager, Optional
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import ContextManager, Iterable, Iterator, Optional, Sequence, Tuple
 
 import dagster._check as check
 import sqlalchemy as db
@@ -8,7 +10,7 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.event_api import EventHandlerFn
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig, mysql_config
 from dagster._core.storage.event_log import (
     AssetKeyTable,
     SqlEventLogStorage,
@@ -19,6 +21,8 @@
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.sql import (
     AlembicVersion,
+    SqlAlchemyQuery,
+    SqlAlchemyRow,
     check_alembic_revision,
     create_engine,
     run_alembic_upgrade,
@@ -29,6 +33,7 @@
 
 from ..utils import (
     create_mysql_connection,
+    create_mysql_engine,
     mysql_alembic_config,
     mysql_url_from_config,
     parse_mysql_version,
@@ -57,19 +62,20 @@ class MySQLEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     """
 
-    def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        mysql_url: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = check.str_param(mysql_url, "mysql_url")
         self._disposed = False
 
         self._event_watcher = SqlPollingEventWatcher(self)
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.mysql_url,
-            isolation_level="AUTOCOMMIT",
-            poolclass=db_pool.NullPool,
-        )
+        self._pool_config = pool_config
+        self._engine = create_mysql_engine(self.mysql_url, self._pool_config)
         self._secondary_index_cache = {}
 
         table_names = retry_mysql_connection_fn(db.inspect(self._engine).get_table_names)
@@ -94,6 +100,9 @@ def _init_db(self) -> None:
     def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
         # When running in dagit, hold an open connection
         # https://github.com/dagster-io/dagster/issues/3719
+        if self._pool_config is not None:
+            # keep drawing from the shared pool
+            return
         self._engine = create_engine(
             self.mysql_url,
             isolation_level="AUTOCOMMIT",
@@ -119,7 +128,9 @@ def from_config_value(
         inst_data: Optional[ConfigurableClassData], config_value: MySqlStorageConfig
     ) -> "MySQLEventLogStorage":
         return MySQLEventLogStorage(
-            inst_data=inst_data, mysql_url=mysql_url_from_config(config_value)
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -175,6 +186,34 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 except db_exc.IntegrityError:
                     pass
 
+        self._store_asset_partition_latest([(event, event_id)])
+
+    def _store_asset_entries(self, asset_events: Sequence[Tuple[EventLogEntry, int]]) -> None:
+        values_by_key = self._get_asset_entry_values_by_key(
+            asset_events, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
+        )
+        if not values_by_key:
+            return
+
+        # rows setting different columns need separate upsert statements
+        rows_by_columns = defaultdict(list)
+        for asset_key, values in values_by_key.items():
+            rows_by_columns[tuple(sorted(values.keys()))].append(
+                dict(asset_key=asset_key, **values)
+            )
+
+        with self.index_connection() as conn:
+            for columns, rows in rows_by_columns.items():
+                query = db_dialects.mysql.insert(AssetKeyTable).values(rows)
+                if columns:
+                    query = query.on_duplicate_key_update(
+                        **{column: query.inserted[column] for column in columns}
+                    )
+                else:
+                    # no-op update, so that existing asset keys are left untouched
+                    query = query.on_duplicate_key_update(asset_key=query.inserted.asset_key)
+                conn.execute(query)
+
     def _connect(self) -> ContextManager[Connection]:
         return create_mysql_connection(self._engine, __file__, "event log")
 
@@ -187,11 +226,23 @@ def index_connection(self) -> ContextManager[Connection]:
     def has_table(self, table_name: str) -> bool:
         return bool(self._engine.dialect.has_table(self._engine.connect(), table_name))
 
+    @contextmanager
+    def _stream_query(
+        self, conn: Connection, query: SqlAlchemyQuery
+    ) -> Iterator[Iterable[SqlAlchemyRow]]:
+        # the rows are streamed through an unbuffered cursor, which must be closed before the
+        # connection can issue another query
+        result = conn.execution_options(stream_results=True).execute(query)
+        try:
+            yield result
+        finally:
+            result.close()
+
     def has_secondary_index(self, name: str) -> bool:
         if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                MySQLEventLogStorage, self
-            ).has_secondary_index(name)
+            if not super(MySQLEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
         return self._secondary_index_cache[name]
 
     def enable_secondary_index(self, name: str) -> None:
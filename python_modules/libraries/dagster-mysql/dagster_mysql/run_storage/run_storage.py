@@ -5,7 +5,7 @@
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig, mysql_config
 from dagster._core.storage.runs import (
     DaemonHeartbeatsTable,
     InstanceInfo,
@@ -27,6 +27,7 @@
 
 from ..utils import (
     create_mysql_connection,
+    create_mysql_engine,
     mysql_alembic_config,
     mysql_url_from_config,
     parse_mysql_version,
@@ -56,16 +57,17 @@ class MySQLRunStorage(SqlRunStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        mysql_url: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = mysql_url
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.mysql_url,
-            isolation_level="AUTOCOMMIT",
-            poolclass=db_pool.NullPool,
-        )
+        self._pool_config = pool_config
+        self._engine = create_mysql_engine(self.mysql_url, self._pool_config)
 
         self._index_migration_cache = {}
         table_names = retry_mysql_connection_fn(db.inspect(self._engine).get_table_names)
@@ -93,6 +95,9 @@ def _init_db(self) -> None:
     def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
         # When running in dagit, hold 1 open connection
         # https://github.com/dagster-io/dagster/issues/3719
+        if self._pool_config is not None:
+            # keep drawing from the shared pool
+            return
         self._engine = create_engine(
             self.mysql_url,
             isolation_level="AUTOCOMMIT",
@@ -119,7 +124,11 @@ def get_server_version(self) -> Optional[str]:
     def from_config_value(
         inst_data: Optional[ConfigurableClassData], config_value: MySqlStorageConfig
     ) -> "MySQLRunStorage":
-        return MySQLRunStorage(inst_data=inst_data, mysql_url=mysql_url_from_config(config_value))
+        return MySQLRunStorage(
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
+        )
 
     @staticmethod
     def wipe_storage(mysql_url: str) -> None:
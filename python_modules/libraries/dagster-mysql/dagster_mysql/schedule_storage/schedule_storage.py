@@ -6,7 +6,7 @@
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig, mysql_config
 from dagster._core.storage.schedules import ScheduleStorageSqlMetadata, SqlScheduleStorage
 from dagster._core.storage.schedules.schema import InstigatorsTable
 from dagster._core.storage.sql import (
@@ -16,11 +16,12 @@
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster._serdes import ConfigurableClass, ConfigurableClassData, serialize_dagster_namedtuple
+from dagster._serdes import ConfigurableClass, ConfigurableClassData, serialize_value
 from sqlalchemy.engine import Connection
 
 from ..utils import (
     create_mysql_connection,
+    create_mysql_engine,
     mysql_alembic_config,
     mysql_url_from_config,
     parse_mysql_version,
@@ -48,16 +49,17 @@ class MySQLScheduleStorage(SqlScheduleStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        mysql_url: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = mysql_url
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.mysql_url,
-            isolation_level="AUTOCOMMIT",
-            poolclass=db_pool.NullPool,
-        )
+        self._pool_config = pool_config
+        self._engine = create_mysql_engine(self.mysql_url, self._pool_config)
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
@@ -82,6 +84,9 @@ def _init_db(self) -> None:
     def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
         # When running in dagit, hold an open connection
         # https://github.com/dagster-io/dagster/issues/3719
+        if self._pool_config is not None:
+            # keep drawing from the shared pool
+            return
         self._engine = create_engine(
             self.mysql_url,
             isolation_level="AUTOCOMMIT",
@@ -102,7 +107,9 @@ def from_config_value(
         inst_data: Optional[ConfigurableClassData], config_value: MySqlStorageConfig
     ) -> "MySQLScheduleStorage":
         return MySQLScheduleStorage(
-            inst_data=inst_data, mysql_url=mysql_url_from_config(config_value)
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -150,12 +157,12 @@ def _add_or_update_instigators_table(self, conn: Connection, state) -> None:
                 repository_selector_id=state.repository_selector_id,
                 status=state.status.value,
                 instigator_type=state.instigator_type.value,
-                instigator_body=serialize_dagster_namedtuple(state),
+                instigator_body=serialize_value(state, serdes_format=self.serdes_format),
             )
             .on_duplicate_key_update(
                 status=state.status.value,
                 instigator_type=state.instigator_type.value,
-                instigator_body=serialize_dagster_namedtuple(state),
+                instigator_body=serialize_value(state, serdes_format=self.serdes_format),
                 update_timestamp=pendulum.now("UTC"),
             )
         )
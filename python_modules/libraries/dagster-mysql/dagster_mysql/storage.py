@@ -3,10 +3,11 @@
 from dagster import _check as check
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.storage.base_storage import DagsterStorage
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig, mysql_config
 from dagster._core.storage.event_log import EventLogStorage
 from dagster._core.storage.runs import RunStorage
 from dagster._core.storage.schedules import ScheduleStorage
+from dagster._core.storage.sql import SqlPoolStats, get_engine_pool_stats
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 
 from .event_log import MySQLEventLogStorage
@@ -31,14 +32,17 @@ class DagsterMySQLStorage(DagsterStorage, ConfigurableClass):
 
     Note that the fields in this config are :py:class:`~dagster.StringSource` and
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
+
+    If ``pool`` is set, the run, event log and schedule storages share a single pooled engine, so
+    that each process holds at most ``pool_size + max_overflow`` connections to the database.
     """
 
-    def __init__(self, mysql_url, inst_data=None):
+    def __init__(self, mysql_url, inst_data=None, pool_config: Optional[SqlPoolConfig] = None):
         self.mysql_url = mysql_url
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
-        self._run_storage = MySQLRunStorage(mysql_url)
-        self._event_log_storage = MySQLEventLogStorage(mysql_url)
-        self._schedule_storage = MySQLScheduleStorage(mysql_url)
+        self._run_storage = MySQLRunStorage(mysql_url, pool_config=pool_config)
+        self._event_log_storage = MySQLEventLogStorage(mysql_url, pool_config=pool_config)
+        self._schedule_storage = MySQLScheduleStorage(mysql_url, pool_config=pool_config)
         super().__init__()
 
     @property
@@ -56,8 +60,15 @@ def from_config_value(
         return DagsterMySQLStorage(
             inst_data=inst_data,
             mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
+    def get_pool_stats(self) -> Optional[SqlPoolStats]:
+        """Returns the usage of the connection pool shared by the storages, or None if the storages
+        do not share a pool.
+        """
+        return get_engine_pool_stats(self._run_storage._engine)  # pylint: disable=protected-access
+
     @property
     def event_log_storage(self) -> EventLogStorage:
         return self._event_log_storage
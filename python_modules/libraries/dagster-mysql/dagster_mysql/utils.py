@@ -2,7 +2,7 @@
 import re
 import time
 from contextlib import contextmanager
-from typing import Callable, Iterator, Optional, Tuple, TypeVar, Union, cast
+from typing import Any, Callable, Iterator, Optional, Tuple, TypeVar, Union, cast
 from urllib.parse import (
     quote_plus as urlquote,
     urlparse,
@@ -12,10 +12,11 @@
 import mysql.connector.errorcode as mysql_errorcode
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
+import sqlalchemy.pool as db_pool
 from alembic.config import Config
 from dagster import _check as check
-from dagster._core.storage.config import MySqlStorageConfig
-from dagster._core.storage.sql import get_alembic_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig
+from dagster._core.storage.sql import create_engine, get_alembic_config, get_shared_engine
 from mysql.connector.pooling import PooledMySQLConnection
 from sqlalchemy.engine import Connection
 from typing_extensions import TypeAlias
@@ -50,8 +51,16 @@ def get_conn(conn_string: str) -> MySQLConnectionUnion:
 
 def mysql_url_from_config(config_value: MySqlStorageConfig) -> str:
     if config_value.get("mysql_url"):
+        check.invariant(
+            "mysql_db" not in config_value,
+            "mysql storage config must have exactly one of `mysql_url` or `mysql_db`",
+        )
         return config_value["mysql_url"]
 
+    check.invariant(
+        "mysql_db" in config_value,
+        "mysql storage config must have exactly one of `mysql_url` or `mysql_db`",
+    )
     return get_conn_string(**config_value["mysql_db"])
 
 
@@ -178,6 +187,23 @@ def mysql_alembic_config(dunder_file: str) -> Config:
     return get_alembic_config(dunder_file, config_path="../alembic/alembic.ini")
 
 
+def create_mysql_engine(
+    mysql_url: str, pool_config: Optional[SqlPoolConfig] = None, **kwargs: Any
+) -> db.engine.Engine:
+    """Creates the engine of a MySQL storage. Without a pool config, connections are not held open
+    between uses. With one, the storage uses the pooled engine shared by every storage of the
+    process for the same database.
+    """
+    if pool_config is None:
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance
+        return create_engine(
+            mysql_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool, **kwargs
+        )
+
+    return get_shared_engine(mysql_url, isolation_level="AUTOCOMMIT", **pool_config, **kwargs)
+
+
 @contextmanager
 def create_mysql_connection(
     engine: db.engine.Engine, dunder_file: str, storage_type_desc: Optional[str] = None
@@ -6,7 +6,12 @@
 import yaml
 from dagster._core.instance import DagsterInstance
 from dagster._core.instance.ref import InstanceRef
-from dagster._core.storage.sql import create_engine, get_alembic_config, stamp_alembic_rev
+from dagster._core.storage.sql import (
+    create_engine,
+    get_alembic_config,
+    get_engine_pool_stats,
+    stamp_alembic_rev,
+)
 from dagster._core.test_utils import instance_for_test
 from dagster._utils import file_relative_path
 from dagster_mysql import MySQLEventLogStorage, MySQLRunStorage, MySQLScheduleStorage
@@ -125,6 +130,31 @@ def test_load_instance(conn_string):
         pass
 
 
+def test_shared_pool(conn_string):
+    # pylint: disable=protected-access
+    parse_result = urlparse(conn_string)
+    hostname = parse_result.hostname
+    port = parse_result.port
+
+    overrides = yaml.safe_load(unified_mysql_config(hostname, port))
+    overrides["storage"]["mysql"]["pool"] = {"pool_size": 2, "max_overflow": 1}
+    with instance_for_test(overrides=overrides) as instance:
+        engine = instance._run_storage._engine
+        assert instance._event_storage._engine is engine
+        assert instance._schedule_storage._engine is engine
+
+        instance.get_runs()
+        instance.all_asset_keys()
+        instance.all_instigator_state()
+
+        stats = get_engine_pool_stats(engine)
+        assert stats
+        assert stats.pool_size == 2
+        assert stats.max_overflow == 1
+        assert stats.checked_out == 0
+        assert stats.total_checkouts >= 3
+
+
 @pytest.mark.skip("https://github.com/dagster-io/dagster/issues/3719")
 def test_statement_timeouts(conn_string):
     parse_result = urlparse(conn_string)
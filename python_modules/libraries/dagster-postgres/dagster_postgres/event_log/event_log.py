@@ -1,15 +1,33 @@
-from typing import Any, ContextManager, Mapping, Optional
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import dagster._check as check
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
+import sqlalchemy.exc as db_exc
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
 from dagster._core.events import ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.config import pg_config
+from dagster._core.storage.config import SqlPoolConfig, pg_config
 from dagster._core.storage.event_log import (
     AssetKeyTable,
     SqlEventLogStorage,
@@ -20,6 +38,8 @@
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.sql import (
     AlembicVersion,
+    SqlAlchemyQuery,
+    SqlAlchemyRow,
     check_alembic_revision,
     create_engine,
     run_alembic_upgrade,
@@ -30,13 +50,29 @@
 
 from ..utils import (
     create_pg_connection,
+    create_pg_engine,
     pg_alembic_config,
+    pg_copy_rows,
     pg_statement_timeout,
     pg_url_from_config,
     retry_pg_connection_fn,
     retry_pg_creation_fn,
 )
 from .event_watcher import PostgresEventWatcher
+from .partitioning import (
+    PARTITION_CACHE_TTL,
+    PARTITION_TIMESTAMP_SLACK,
+    EventLogPartitioning,
+    create_partition,
+    create_partitioned_event_logs_table,
+    drop_partition,
+    get_default_partition_storage_id_bounds,
+    get_max_storage_id,
+    get_partition_indices,
+    get_partition_timestamp,
+    is_partitioned_event_logs_table,
+    partitioning_config,
+)
 
 CHANNEL_NAME = "run_events"
 
@@ -68,6 +104,13 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     Note that the fields in this config are :py:class:`~dagster.StringSource` and
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
 
+    The event log table can optionally be created with declarative range partitioning on the
+    storage id, by setting ``partitioning`` in the storage config. Partitions are created ahead of
+    the events on a background thread as the events move into new partitions, or by calling
+    ``ensure_event_log_partitions``. Queries with cursor or time bounds only read the partitions
+    within those bounds, and if ``retention_days`` is set, partitions holding only older events
+    are dropped.
+
     """
 
     def __init__(
@@ -75,25 +118,44 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        partitioning: Optional[EventLogPartitioning] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
+        self._partitioning = check.opt_inst_param(
+            partitioning, "partitioning", EventLogPartitioning
+        )
 
         self._disposed = False
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
-        )
+        self._pool_config = pool_config
+        self._engine = create_pg_engine(self.postgres_url, self._pool_config)
 
         # lazy init
         self._event_watcher: Optional[PostgresEventWatcher] = None
 
         self._secondary_index_cache = {}
 
+        # partition bookkeeping, only used if the event log table is partitioned
+        self._is_partitioned: Optional[bool] = None
+        self._partitions_lock = threading.Lock()
+        self._partitions_high_water: Optional[int] = None
+        self._partitions_check_lock = threading.Lock()
+        self._partitions_checked_index: Optional[int] = None
+        self._partitions_thread: Optional[threading.Thread] = None
+        self._max_inserted_storage_id: Optional[int] = None
+        # the time the partitions were listed at, along with their indices and the storage id
+        # bounds of the default partition
+        self._partitions_listing: Optional[
+            Tuple[float, Sequence[int], Optional[Tuple[int, int]]]
+        ] = None
+        self._partition_first_timestamps: Dict[int, datetime] = {}
+        self._partition_last_timestamps: Dict[int, datetime] = {}
+
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
         if self.should_autocreate_tables:
@@ -105,10 +167,24 @@ def __init__(
 
         super().__init__()
 
+        if self.is_partitioned:
+            self.ensure_event_log_partitions()
+
     def _init_db(self) -> None:
         with self._connect() as conn:
             with conn.begin():
-                SqlEventLogStorageMetadata.create_all(conn)
+                if self._partitioning:
+                    SqlEventLogStorageMetadata.create_all(
+                        conn,
+                        tables=[
+                            table
+                            for table in SqlEventLogStorageMetadata.sorted_tables
+                            if table is not SqlEventLogStorageTable
+                        ],
+                    )
+                    create_partitioned_event_logs_table(conn)
+                else:
+                    SqlEventLogStorageMetadata.create_all(conn)
                 stamp_alembic_rev(pg_alembic_config(__file__), conn)
 
     def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
@@ -119,6 +195,12 @@ def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
             options = f"{timeout_option} {existing_options}"
         else:
             options = timeout_option
+        if self._pool_config is not None:
+            # keep drawing from the shared pool, with the statement timeout set on its connections
+            self._engine = create_pg_engine(
+                self.postgres_url, self._pool_config, connect_args={"options": options}
+            )
+            return
         self._engine = create_engine(
             self.postgres_url,
             isolation_level="AUTOCOMMIT",
@@ -138,7 +220,7 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return pg_config()
+        return {**pg_config(), "partitioning": partitioning_config()}
 
     @staticmethod
     def from_config_value(
@@ -148,11 +230,15 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
+            partitioning=EventLogPartitioning.from_config_value(config_value.get("partitioning")),
         )
 
     @staticmethod
     def create_clean_storage(
-        conn_string: str, should_autocreate_tables: bool = True
+        conn_string: str,
+        should_autocreate_tables: bool = True,
+        partitioning: Optional[EventLogPartitioning] = None,
     ) -> "PostgresEventLogStorage":
         engine = create_engine(
             conn_string, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
@@ -162,7 +248,9 @@ def create_clean_storage(
         finally:
             engine.dispose()
 
-        return PostgresEventLogStorage(conn_string, should_autocreate_tables)
+        return PostgresEventLogStorage(
+            conn_string, should_autocreate_tables, partitioning=partitioning
+        )
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a pipeline run.
@@ -172,6 +260,7 @@ def store_event(self, event: EventLogEntry) -> None:
         """
         check.inst_param(event, "event", EventLogEntry)
         insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
+        should_update_run_stats = self.should_update_run_stats()
         with self._connect() as conn:
             result = conn.execute(
                 insert_event_statement.returning(
@@ -186,6 +275,11 @@ def store_event(self, event: EventLogEntry) -> None:
             )
             event_id = res[1]  # type: ignore
 
+            if should_update_run_stats:
+                self._update_stats_for_events(conn, [(event, event_id)])
+
+        self._maybe_add_event_log_partitions(event_id)
+
         if (
             event.is_dagster_event
             and event.dagster_event_type in ASSET_EVENTS
@@ -200,6 +294,76 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        super().store_events(events)
+        if self._max_inserted_storage_id is not None:
+            self._maybe_add_event_log_partitions(self._max_inserted_storage_id)
+
+    def _bulk_insert_rows(
+        self, conn: Connection, table: db.Table, rows: Sequence[Mapping[str, Any]]
+    ) -> None:
+        pg_copy_rows(conn, table, rows)
+
+    def import_event_log_rows(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        count = super().import_event_log_rows(rows)
+        # the copied rows don't return their storage ids, so the partitions are checked against the
+        # latest storage id instead
+        if rows and self.is_partitioned:
+            self._maybe_add_event_log_partitions(self.get_maximum_record_id())
+        return count
+
+    def _insert_events(
+        self, conn: Connection, events: Sequence[EventLogEntry], fetch_step_order_ids: bool = False
+    ) -> Sequence[Tuple[EventLogEntry, Optional[int]]]:
+        """Insert all of the events with a single multi-row insert, and publish their notifications
+        with a single statement. The storage ids of all of the events are returned.
+        """
+        if not events:
+            return []
+
+        result = conn.execute(
+            SqlEventLogStorageTable.insert()  # pylint: disable=no-value-for-parameter
+            .values([self._get_insert_event_values(event) for event in events])
+            .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+        )
+        # ids are drawn from the sequence in VALUES order, so sorting them restores event order
+        rows = sorted(result.fetchall(), key=lambda row: row[1])
+        result.close()
+        conn.execute(
+            """SELECT pg_notify(%s, payload) FROM unnest(%s) AS payload;""",
+            (CHANNEL_NAME, [row[0] + "_" + str(row[1]) for row in rows]),
+        )
+        # partitions can't be created within the transaction inserting the events, so they are
+        # added once the events are stored
+        self._max_inserted_storage_id = max(self._max_inserted_storage_id or 0, rows[-1][1])
+        return [(event, row[1]) for event, row in zip(events, rows)]
+
+    def _store_asset_entries(self, asset_events: Sequence[Tuple[EventLogEntry, int]]) -> None:
+        values_by_key = self._get_asset_entry_values_by_key(
+            asset_events, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
+        )
+        if not values_by_key:
+            return
+
+        # rows setting different columns need separate upsert statements
+        rows_by_columns = defaultdict(list)
+        for asset_key, values in values_by_key.items():
+            rows_by_columns[tuple(sorted(values.keys()))].append(
+                dict(asset_key=asset_key, **values)
+            )
+
+        with self.index_connection() as conn:
+            for columns, rows in rows_by_columns.items():
+                query = db_dialects.postgresql.insert(AssetKeyTable).values(rows)
+                if columns:
+                    query = query.on_conflict_do_update(
+                        index_elements=[AssetKeyTable.c.asset_key],
+                        set_={column: query.excluded[column] for column in columns},
+                    )
+                else:
+                    query = query.on_conflict_do_nothing()
+                conn.execute(query)
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
@@ -252,6 +416,259 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 query = query.on_conflict_do_nothing()
             conn.execute(query)
 
+        self._store_asset_partition_latest([(event, event_id)])
+
+    @property
+    def is_partitioned(self) -> bool:
+        """Whether the event log table is partitioned by storage id, which is only the case if the
+        table was created by a storage configured with a partitioning.
+        """
+        if self._partitioning is None:
+            return False
+
+        if self._is_partitioned is None:
+            with self._connect() as conn:
+                self._is_partitioned = is_partitioned_event_logs_table(conn)
+        return self._is_partitioned
+
+    def ensure_event_log_partitions(self, max_storage_id: Optional[int] = None) -> None:
+        """Creates the partition holding the latest events, if missing, along with the configured
+        number of partitions ahead of it, and then applies the retention policy.
+
+        Args:
+            max_storage_id (Optional[int]): The latest storage id written. Defaults to the latest
+                storage id in the event log table.
+        """
+        if not self.is_partitioned:
+            return
+
+        partitioning = check.not_none(self._partitioning)
+        with self._partitions_lock:
+            with self._connect() as conn:
+                if max_storage_id is None:
+                    max_storage_id = get_max_storage_id(conn)
+
+                current_index = partitioning.partition_index(max_storage_id)
+                last_index = current_index + partitioning.partitions_ahead
+                existing = set(get_partition_indices(conn))
+                for index in range(current_index, last_index + 1):
+                    if index in existing:
+                        continue
+                    try:
+                        create_partition(conn, partitioning, index)
+                    except db_exc.DatabaseError:
+                        # either another process created the partition concurrently, or events in
+                        # its range were already written to the default partition, where they stay
+                        if index not in get_partition_indices(conn):
+                            logging.warning(
+                                (
+                                    "Could not create event log partition %s, its events are stored"
+                                    " in the default partition."
+                                ),
+                                index,
+                                exc_info=True,
+                            )
+
+            self._partitions_high_water = partitioning.partition_bounds(last_index)[1]
+            self._partitions_listing = None
+
+        if partitioning.retention_days is not None:
+            self.drop_event_log_partitions(
+                before_timestamp=time.time() - partitioning.retention_days * 24 * 60 * 60
+            )
+
+    def _maybe_add_event_log_partitions(self, storage_id: Optional[int]) -> None:
+        if storage_id is None or not self.is_partitioned:
+            return
+
+        partitioning = check.not_none(self._partitioning)
+        index = partitioning.partition_index(storage_id)
+        high_water = self._partitions_high_water
+        # only check the partitions once the events have moved into a new partition
+        if high_water is not None and index + partitioning.partitions_ahead < (
+            partitioning.partition_index(high_water)
+        ):
+            return
+
+        # the partitions are checked at most once per partition that the events move into, on a
+        # background thread so that storing events never waits on partition DDL
+        with self._partitions_check_lock:
+            if (
+                self._partitions_checked_index is not None
+                and index <= self._partitions_checked_index
+            ):
+                return
+            self._partitions_checked_index = index
+            self._partitions_thread = threading.Thread(
+                target=self._add_event_log_partitions,
+                args=(storage_id,),
+                name="postgres-event-log-partitions",
+                daemon=True,
+            )
+            self._partitions_thread.start()
+
+    def _add_event_log_partitions(self, storage_id: int) -> None:
+        try:
+            self.ensure_event_log_partitions(storage_id)
+        except Exception:
+            logging.exception(
+                "Could not add event log partitions, events past the existing partitions are stored"
+                " in the default partition."
+            )
+
+    def drop_event_log_partitions(self, before_timestamp: float) -> Sequence[int]:
+        """Drops the oldest partitions of the event log table, as long as they only hold events
+        older than the given timestamp. The partition holding the latest events is never dropped.
+
+        Dropping a partition does not update the asset index, so assets only materialized in dropped
+        partitions keep their latest materialization.
+
+        Args:
+            before_timestamp (float): Drop the partitions holding only events older than this.
+
+        Returns:
+            Sequence[int]: The indices of the dropped partitions.
+        """
+        check.numeric_param(before_timestamp, "before_timestamp")
+        if not self.is_partitioned:
+            return []
+
+        partitioning = check.not_none(self._partitioning)
+        before = datetime.utcfromtimestamp(before_timestamp)
+        dropped: List[int] = []
+        with self._partitions_lock:
+            with self._connect() as conn:
+                current_index = partitioning.partition_index(get_max_storage_id(conn))
+                for index in get_partition_indices(conn):
+                    if index >= current_index:
+                        break
+
+                    last_timestamp = get_partition_timestamp(conn, index, latest=True)
+                    if (
+                        last_timestamp is not None
+                        and last_timestamp + PARTITION_TIMESTAMP_SLACK >= before
+                    ):
+                        break
+
+                    drop_partition(conn, index)
+                    self._partition_first_timestamps.pop(index, None)
+                    self._partition_last_timestamps.pop(index, None)
+                    dropped.append(index)
+
+            if dropped:
+                self._partitions_listing = None
+
+        return dropped
+
+    def _get_partitions_listing(self) -> Tuple[Sequence[int], Optional[Tuple[int, int]]]:
+        """Returns the indices of the range partitions, in ascending order, along with the storage id
+        bounds of the events in the default partition. The listing is cached for the partition cache
+        TTL, along with the timestamps of the first event of each partition.
+        """
+        listing = self._partitions_listing
+        if listing is None or time.monotonic() - listing[0] > PARTITION_CACHE_TTL.total_seconds():
+            with self._connect() as conn:
+                indices = get_partition_indices(conn)
+                default_bounds = get_default_partition_storage_id_bounds(conn)
+                for index in indices:
+                    if index not in self._partition_first_timestamps:
+                        first_timestamp = get_partition_timestamp(conn, index, latest=False)
+                        if first_timestamp is not None:
+                            self._partition_first_timestamps[index] = first_timestamp
+            listing = (time.monotonic(), indices, default_bounds)
+            self._partitions_listing = listing
+
+        return listing[1], listing[2]
+
+    def _get_partition_timestamp_ranges(
+        self, indices: Sequence[int]
+    ) -> Sequence[Tuple[int, datetime, Optional[datetime]]]:
+        """Returns the range of event timestamps of each of the given range partitions, widened by
+        the timestamp slack. Partitions that can still be written to have no upper end, and
+        partitions that were empty when listed can only hold events written since.
+
+        The timestamps are read from the first and last events of each partition by storage id, and
+        cached once they can no longer change.
+        """
+        # partitions older than the latest partition with events are no longer written to
+        latest_written_index = max(
+            (index for index in indices if index in self._partition_first_timestamps),
+            default=None,
+        )
+        finished_indices = [
+            index
+            for index in indices
+            if latest_written_index is not None and index < latest_written_index
+        ]
+        if any(index not in self._partition_last_timestamps for index in finished_indices):
+            with self._connect() as conn:
+                for index in finished_indices:
+                    if index not in self._partition_last_timestamps:
+                        timestamp = get_partition_timestamp(conn, index, latest=True)
+                        if timestamp is not None:
+                            self._partition_last_timestamps[index] = timestamp
+
+        now = datetime.utcnow()
+        ranges = []
+        for index in indices:
+            last_timestamp = (
+                self._partition_last_timestamps.get(index) if index in finished_indices else None
+            )
+            ranges.append(
+                (
+                    index,
+                    self._partition_first_timestamps.get(index, now) - PARTITION_TIMESTAMP_SLACK,
+                    last_timestamp + PARTITION_TIMESTAMP_SLACK if last_timestamp else None,
+                )
+            )
+        return ranges
+
+    def _get_storage_id_bounds_for_timestamps(
+        self, before_timestamp: Optional[float], after_timestamp: Optional[float]
+    ) -> Tuple[Optional[int], Optional[int]]:
+        if not self.is_partitioned:
+            return None, None
+
+        partitioning = check.not_none(self._partitioning)
+        indices, default_bounds = self._get_partitions_listing()
+        if not indices:
+            return None, None
+        ranges = self._get_partition_timestamp_ranges(indices)
+
+        min_storage_id = None
+        if after_timestamp:
+            after = datetime.utcfromtimestamp(after_timestamp)
+            # every partition before the first one that may hold later events is pruned
+            min_storage_id = partitioning.partition_bounds(ranges[-1][0])[1]
+            for index, _, last_timestamp in ranges:
+                if last_timestamp is None or last_timestamp > after:
+                    min_storage_id = partitioning.partition_bounds(index)[0]
+                    break
+
+        max_storage_id = None
+        if before_timestamp:
+            before = datetime.utcfromtimestamp(before_timestamp)
+            # every partition after the last one that may hold earlier events is pruned, unless
+            # that is the last listed partition, since partitions may have been added since
+            max_storage_id = partitioning.partition_bounds(ranges[0][0])[0]
+            for index, first_timestamp, _ in reversed(ranges):
+                if first_timestamp < before:
+                    max_storage_id = (
+                        partitioning.partition_bounds(index)[1] if index != indices[-1] else None
+                    )
+                    break
+
+        # the timestamps of the events in the default partition are not tracked, so the bounds are
+        # widened to cover all of them
+        if default_bounds:
+            default_min_storage_id, default_max_storage_id = default_bounds
+            if min_storage_id is not None:
+                min_storage_id = min(min_storage_id, default_min_storage_id)
+            if max_storage_id is not None:
+                max_storage_id = max(max_storage_id, default_max_storage_id + 1)
+
+        return min_storage_id, max_storage_id
+
     def _connect(self) -> ContextManager[Connection]:
         return create_pg_connection(self._engine)
 
@@ -264,11 +681,27 @@ def index_connection(self) -> ContextManager[Connection]:
     def has_table(self, table_name: str) -> bool:
         return bool(self._engine.dialect.has_table(self._engine.connect(), table_name))
 
+    @contextmanager
+    def _stream_query(
+        self, conn: Connection, query: SqlAlchemyQuery
+    ) -> Iterator[Iterable[SqlAlchemyRow]]:
+        # psycopg2 only opens server-side cursors within a transaction, so the rows are streamed in
+        # a read committed transaction instead of the autocommit mode of the engine
+        streaming_conn = conn.execution_options(
+            isolation_level="READ COMMITTED", stream_results=True
+        )
+        with streaming_conn.begin():
+            result = streaming_conn.execute(query)
+            try:
+                yield result
+            finally:
+                result.close()
+
     def has_secondary_index(self, name: str) -> bool:
         if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                PostgresEventLogStorage, self
-            ).has_secondary_index(name)
+            if not super(PostgresEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
         return self._secondary_index_cache[name]
 
     def enable_secondary_index(self, name: str) -> None:
@@ -0,0 +1,173 @@
+from datetime import datetime, timedelta
+from typing import Any, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import dagster._check as check
+import sqlalchemy as db
+from dagster import Field, IntSource
+from dagster._core.storage.event_log import SqlEventLogStorageTable
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateTable
+
+PARTITION_NAME_PREFIX = "event_logs_p"
+DEFAULT_PARTITION_NAME = "event_logs_default"
+
+DEFAULT_PARTITION_SIZE = 1000000
+DEFAULT_PARTITIONS_AHEAD = 2
+
+# Events are not written in exact timestamp order (e.g. buffered writes, clock skew between
+# processes), so the timestamp range of a partition is widened by this margin before it is used to
+# prune partitions from time-bounded queries
+PARTITION_TIMESTAMP_SLACK = timedelta(hours=1)
+
+# The partitions of the event log table are listed at most this often by each storage, which must
+# stay well within the timestamp slack for pruning to remain correct with a stale listing
+PARTITION_CACHE_TTL = timedelta(minutes=1)
+
+
+def partitioning_config() -> Field:
+    return Field(
+        {
+            "partition_size": Field(
+                IntSource,
+                is_required=False,
+                default_value=DEFAULT_PARTITION_SIZE,
+                description="Number of storage ids covered by each partition of the event log.",
+            ),
+            "partitions_ahead": Field(
+                IntSource,
+                is_required=False,
+                default_value=DEFAULT_PARTITIONS_AHEAD,
+                description=(
+                    "Number of empty partitions kept ahead of the partition currently written to."
+                ),
+            ),
+            "retention_days": Field(
+                IntSource,
+                is_required=False,
+                description=(
+                    "If set, partitions holding only events older than this are dropped as new "
+                    "partitions are created."
+                ),
+            ),
+        },
+        is_required=False,
+        description=(
+            "Creates the event log table with declarative range partitioning on the storage id. "
+            "Only applies when the event log table is created."
+        ),
+    )
+
+
+class EventLogPartitioning(
+    NamedTuple(
+        "_EventLogPartitioning",
+        [
+            ("partition_size", int),
+            ("partitions_ahead", int),
+            ("retention_days", Optional[int]),
+        ],
+    )
+):
+    """Layout of an event log table partitioned by ranges of storage ids."""
+
+    def __new__(
+        cls,
+        partition_size: int = DEFAULT_PARTITION_SIZE,
+        partitions_ahead: int = DEFAULT_PARTITIONS_AHEAD,
+        retention_days: Optional[int] = None,
+    ):
+        check.invariant(partition_size > 0, "partition_size must be positive")
+        check.invariant(partitions_ahead > 0, "partitions_ahead must be positive")
+        return super(EventLogPartitioning, cls).__new__(
+            cls,
+            partition_size=check.int_param(partition_size, "partition_size"),
+            partitions_ahead=check.int_param(partitions_ahead, "partitions_ahead"),
+            retention_days=check.opt_int_param(retention_days, "retention_days"),
+        )
+
+    @staticmethod
+    def from_config_value(
+        config_value: Optional[Mapping[str, Any]]
+    ) -> Optional["EventLogPartitioning"]:
+        if config_value is None:
+            return None
+        return EventLogPartitioning(**config_value)
+
+    def partition_index(self, storage_id: int) -> int:
+        return storage_id // self.partition_size
+
+    def partition_bounds(self, index: int) -> Tuple[int, int]:
+        return index * self.partition_size, (index + 1) * self.partition_size
+
+
+def partition_name(index: int) -> str:
+    return f"{PARTITION_NAME_PREFIX}{index}"
+
+
+def create_partitioned_event_logs_table(conn: Connection) -> None:
+    """Creates the event log table partitioned by range of storage id, along with a default
+    partition that catches any event written before its range partition is created.
+    """
+    create_table = str(CreateTable(SqlEventLogStorageTable).compile(dialect=conn.dialect)).strip()
+    conn.execute(f"{create_table} PARTITION BY RANGE (id)")
+    conn.execute(f"CREATE TABLE {DEFAULT_PARTITION_NAME} PARTITION OF event_logs DEFAULT")
+    # indexes created on the partitioned table are created on each of its partitions
+    for index in SqlEventLogStorageTable.indexes:
+        index.create(conn)
+
+
+def is_partitioned_event_logs_table(conn: Connection) -> bool:
+    relkind = conn.execute(
+        "SELECT relkind FROM pg_class WHERE oid = to_regclass('event_logs')"
+    ).scalar()
+    return relkind == "p"
+
+
+def get_partition_indices(conn: Connection) -> Sequence[int]:
+    """Returns the indices of the range partitions of the event log table, in ascending order."""
+    rows = conn.execute(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'event_logs'::regclass"
+    ).fetchall()
+    return sorted(
+        int(row[0][len(PARTITION_NAME_PREFIX) :])
+        for row in rows
+        if row[0].startswith(PARTITION_NAME_PREFIX)
+    )
+
+
+def create_partition(conn: Connection, partitioning: EventLogPartitioning, index: int) -> None:
+    lower, upper = partitioning.partition_bounds(index)
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {partition_name(index)} PARTITION OF event_logs "
+        f"FOR VALUES FROM ({lower}) TO ({upper})"
+    )
+
+
+def drop_partition(conn: Connection, index: int) -> None:
+    conn.execute(f"DROP TABLE IF EXISTS {partition_name(index)}")
+
+
+def get_max_storage_id(conn: Connection) -> int:
+    return conn.execute(db.select([db.func.max(SqlEventLogStorageTable.c.id)])).scalar() or 0
+
+
+def get_default_partition_storage_id_bounds(conn: Connection) -> Optional[Tuple[int, int]]:
+    """Returns the lowest and the highest storage ids of the events stored in the default partition,
+    if it holds any. Events in the default partition can have any storage id, since they were
+    written before the range partition covering them was created.
+    """
+    row = conn.execute(f"SELECT min(id), max(id) FROM {DEFAULT_PARTITION_NAME}").fetchone()
+    if row is None or row[0] is None:
+        return None
+    return row[0], row[1]
+
+
+def get_partition_timestamp(conn: Connection, index: int, latest: bool) -> Optional[datetime]:
+    """Returns the timestamp of the first or the last event stored in the given partition, found by
+    its storage id rather than by scanning the partition.
+    """
+    order = "DESC" if latest else "ASC"
+    return conn.execute(
+        f"SELECT timestamp FROM {partition_name(index)} ORDER BY id {order} LIMIT 1"
+    ).scalar()
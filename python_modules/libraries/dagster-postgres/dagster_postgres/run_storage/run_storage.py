@@ -1,11 +1,12 @@
-from typing import ContextManager, Mapping, Optional
+import threading
+from typing import Any, ContextManager, Mapping, Optional, Sequence
 
 import dagster._check as check
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.storage.config import PostgresStorageConfig, pg_config
+from dagster._core.storage.config import PostgresStorageConfig, SqlPoolConfig, pg_config
 from dagster._core.storage.runs import (
     DaemonHeartbeatsTable,
     InstanceInfo,
@@ -13,6 +14,7 @@
     SqlRunStorage,
 )
 from dagster._core.storage.runs.schema import KeyValueStoreTable
+from dagster._core.storage.runs.wakeup import RunWakeupChannel
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -27,12 +29,15 @@
 
 from ..utils import (
     create_pg_connection,
+    create_pg_engine,
     pg_alembic_config,
+    pg_copy_rows,
     pg_statement_timeout,
     pg_url_from_config,
     retry_pg_connection_fn,
     retry_pg_creation_fn,
 )
+from .wakeup_watcher import PostgresWakeupWatcher
 
 
 class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
@@ -68,6 +73,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
@@ -75,15 +81,14 @@ def __init__(
             should_autocreate_tables, "should_autocreate_tables"
         )
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url,
-            isolation_level="AUTOCOMMIT",
-            poolclass=db_pool.NullPool,
-        )
+        self._pool_config = pool_config
+        self._engine = create_pg_engine(self.postgres_url, self._pool_config)
 
         self._index_migration_cache = {}
 
+        # lazy init
+        self._wakeup_watcher: Optional[PostgresWakeupWatcher] = None
+
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
         if self.should_autocreate_tables:
@@ -112,6 +117,12 @@ def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
             options = f"{timeout_option} {existing_options}"
         else:
             options = timeout_option
+        if self._pool_config is not None:
+            # keep drawing from the shared pool, with the statement timeout set on its connections
+            self._engine = create_pg_engine(
+                self.postgres_url, self._pool_config, connect_args={"options": options}
+            )
+            return
         self._engine = create_engine(
             self.postgres_url,
             isolation_level="AUTOCOMMIT",
@@ -136,6 +147,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -170,6 +182,35 @@ def mark_index_built(self, migration_name: str) -> None:
         if migration_name in self._index_migration_cache:
             del self._index_migration_cache[migration_name]
 
+    @property
+    def supports_wakeup_notifications(self) -> bool:
+        return True
+
+    def add_wakeup_listener(
+        self, channels: Sequence[RunWakeupChannel], wakeup_event: threading.Event
+    ) -> None:
+        if self._wakeup_watcher is None:
+            self._wakeup_watcher = PostgresWakeupWatcher(self.postgres_url)
+        self._wakeup_watcher.add_listener(channels, wakeup_event)
+
+    def remove_wakeup_listener(self, wakeup_event: threading.Event) -> None:
+        if self._wakeup_watcher is None:
+            return
+        self._wakeup_watcher.remove_listener(wakeup_event)
+
+    def _publish_wakeup(self, conn: Connection, channel: RunWakeupChannel) -> None:
+        conn.execute(db.text("SELECT pg_notify(:channel, '')"), channel=channel.value)
+
+    def _bulk_insert_rows(
+        self, conn: Connection, table: db.Table, rows: Sequence[Mapping[str, Any]]
+    ) -> None:
+        pg_copy_rows(conn, table, rows)
+
+    def dispose(self) -> None:
+        if self._wakeup_watcher:
+            self._wakeup_watcher.close()
+            self._wakeup_watcher = None
+
     def add_daemon_heartbeat(self, daemon_heartbeat: DaemonHeartbeat) -> None:
         with self.connect() as conn:
             # insert or update if already present, using postgres specific on_conflict
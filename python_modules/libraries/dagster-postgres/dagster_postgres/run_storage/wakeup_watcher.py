@@ -0,0 +1,105 @@
+import logging
+import threading
+from collections import defaultdict
+from typing import List, MutableMapping, Optional, Sequence
+
+import dagster._check as check
+from dagster._core.storage.runs.wakeup import RunWakeupChannel
+
+from ..pynotify import await_pg_notifications
+
+POLLING_CADENCE = 0.25
+
+
+def wakeup_watcher_thread(
+    conn_string: str,
+    events_by_channel: MutableMapping[str, List[threading.Event]],
+    dict_lock: threading.Lock,
+    watcher_thread_exit: threading.Event,
+    watcher_thread_started: threading.Event,
+) -> None:
+    for notif in await_pg_notifications(
+        conn_string,
+        channels=[channel.value for channel in RunWakeupChannel],
+        timeout=POLLING_CADENCE,
+        yield_on_timeout=True,
+        exit_event=watcher_thread_exit,
+        started_event=watcher_thread_started,
+    ):
+        if notif is None:
+            if watcher_thread_exit.is_set():
+                break
+        else:
+            with dict_lock:
+                wakeup_events = list(events_by_channel.get(notif.channel, []))
+
+            for wakeup_event in wakeup_events:
+                wakeup_event.set()
+
+
+class PostgresWakeupWatcher:
+    """Listens for run wakeup notifications on a background thread, and sets the events of the
+    listeners of the channel each notification arrives on.
+    """
+
+    def __init__(self, conn_string: str):
+        self._conn_string: str = check.str_param(conn_string, "conn_string")
+        self._events_by_channel: MutableMapping[str, List[threading.Event]] = defaultdict(list)
+        self._dict_lock: threading.Lock = threading.Lock()
+        self._watcher_thread_exit: Optional[threading.Event] = None
+        self._watcher_thread_started: Optional[threading.Event] = None
+        self._watcher_thread: Optional[threading.Thread] = None
+
+    def add_listener(
+        self,
+        channels: Sequence[RunWakeupChannel],
+        wakeup_event: threading.Event,
+        start_timeout: int = 15,
+    ) -> None:
+        check.sequence_param(channels, "channels", of_type=RunWakeupChannel)
+        check.inst_param(wakeup_event, "wakeup_event", threading.Event)
+        if not self._watcher_thread:
+            self._watcher_thread_exit = threading.Event()
+            self._watcher_thread_started = threading.Event()
+
+            self._watcher_thread = threading.Thread(
+                target=wakeup_watcher_thread,
+                args=(
+                    self._conn_string,
+                    self._events_by_channel,
+                    self._dict_lock,
+                    self._watcher_thread_exit,
+                    self._watcher_thread_started,
+                ),
+                name="postgres-wakeup-watch",
+            )
+            self._watcher_thread.daemon = True
+            self._watcher_thread.start()
+
+            # Wait until the watcher thread is actually listening before returning
+            self._watcher_thread_started.wait(start_timeout)
+            if not self._watcher_thread_started.is_set():
+                # daemons still run on their polling interval without wakeups
+                logging.warning("Postgres wakeup watcher thread did not start listening in time.")
+
+        with self._dict_lock:
+            for channel in channels:
+                self._events_by_channel[channel.value].append(wakeup_event)
+
+    def remove_listener(self, wakeup_event: threading.Event) -> None:
+        check.inst_param(wakeup_event, "wakeup_event", threading.Event)
+        with self._dict_lock:
+            for channel in list(self._events_by_channel.keys()):
+                self._events_by_channel[channel] = [
+                    event for event in self._events_by_channel[channel] if event is not wakeup_event
+                ]
+                if not self._events_by_channel[channel]:
+                    del self._events_by_channel[channel]
+
+    def close(self) -> None:
+        if self._watcher_thread:
+            self._watcher_thread_exit.set()  # type: ignore
+            if self._watcher_thread.is_alive():
+                self._watcher_thread.join()
+            self._watcher_thread_exit = None
+            self._watcher_thread = None
@@ -1,4 +1,4 @@
-from typing import ContextManager, Optional
+from typing import Any, ContextManager, Mapping, Optional, Sequence
 
 import dagster._check as check
 import pendulum
@@ -7,9 +7,9 @@
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.scheduler.instigation import InstigatorState
-from dagster._core.storage.config import PostgresStorageConfig, pg_config
+from dagster._core.storage.config import PostgresStorageConfig, SqlPoolConfig, pg_config
 from dagster._core.storage.schedules import ScheduleStorageSqlMetadata, SqlScheduleStorage
-from dagster._core.storage.schedules.schema import InstigatorsTable
+from dagster._core.storage.schedules.schema import InstigatorsTable, JobTickTable
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -17,11 +17,12 @@
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster._serdes import ConfigurableClass, ConfigurableClassData, serialize_dagster_namedtuple
+from dagster._serdes import ConfigurableClass, ConfigurableClassData, serialize_value
 from sqlalchemy.engine import Connection
 
 from ..utils import (
     create_pg_connection,
+    create_pg_engine,
     pg_alembic_config,
     pg_statement_timeout,
     pg_url_from_config,
@@ -63,6 +64,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
@@ -70,10 +72,8 @@ def __init__(
             should_autocreate_tables, "should_autocreate_tables"
         )
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
-        )
+        self._pool_config = pool_config
+        self._engine = create_pg_engine(self.postgres_url, self._pool_config)
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
@@ -103,6 +103,12 @@ def optimize_for_dagit(self, statement_timeout: int, pool_recycle: int) -> None:
             options = f"{timeout_option} {existing_options}"
         else:
             options = timeout_option
+        if self._pool_config is not None:
+            # keep drawing from the shared pool, with the statement timeout set on its connections
+            self._engine = create_pg_engine(
+                self.postgres_url, self._pool_config, connect_args={"options": options}
+            )
+            return
         self._engine = create_engine(
             self.postgres_url,
             isolation_level="AUTOCOMMIT",
@@ -127,6 +133,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -159,19 +166,61 @@ def _add_or_update_instigators_table(self, conn: Connection, state: InstigatorSt
                 repository_selector_id=state.repository_selector_id,
                 status=state.status.value,
                 instigator_type=state.instigator_type.value,
-                instigator_body=serialize_dagster_namedtuple(state),
+                instigator_body=serialize_value(state, serdes_format=self.serdes_format),
             )
             .on_conflict_do_update(
                 index_elements=[InstigatorsTable.c.selector_id],
                 set_={
                     "status": state.status.value,
                     "instigator_type": state.instigator_type.value,
-                    "instigator_body": serialize_dagster_namedtuple(state),
+                    "instigator_body": serialize_value(state, serdes_format=self.serdes_format),
                     "update_timestamp": pendulum.now("UTC"),
                 },
             )
         )
 
+    def _add_or_update_instigators_table_batch(
+        self,
+        conn: Connection,
+        states: Sequence[InstigatorState],
+        bodies_by_origin_id: Mapping[str, str],
+    ) -> None:
+        # a single statement may not upsert the same row twice
+        states_by_selector_id = {state.selector_id: state for state in states}
+        insert_stmt = db_dialects.postgresql.insert(InstigatorsTable).values(
+            [
+                dict(
+                    selector_id=selector_id,
+                    repository_selector_id=state.repository_selector_id,
+                    status=state.status.value,
+                    instigator_type=state.instigator_type.value,
+                    instigator_body=bodies_by_origin_id[state.instigator_origin_id],
+                )
+                for selector_id, state in states_by_selector_id.items()
+            ]
+        )
+        conn.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[InstigatorsTable.c.selector_id],
+                set_={
+                    "status": insert_stmt.excluded.status,
+                    "instigator_type": insert_stmt.excluded.instigator_type,
+                    "instigator_body": insert_stmt.excluded.instigator_body,
+                    "update_timestamp": pendulum.now("UTC"),
+                },
+            )
+        )
+
+    def _insert_ticks(self, conn: Connection, rows: Sequence[Mapping[str, Any]]) -> Sequence[int]:
+        # ids are drawn from the sequence in the order of the inserted rows, so sorting the returned
+        # ids restores the order of the rows
+        result = conn.execute(
+            JobTickTable.insert()  # pylint: disable=no-value-for-parameter
+            .values(list(rows))
+            .returning(JobTickTable.c.id)
+        )
+        return sorted(row[0] for row in result.fetchall())
+
     def alembic_version(self) -> AlembicVersion:
         alembic_config = pg_alembic_config(__file__)
         with self.connect() as conn:
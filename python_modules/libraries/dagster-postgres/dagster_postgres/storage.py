@@ -3,10 +3,11 @@
 from dagster import _check as check
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.storage.base_storage import DagsterStorage
-from dagster._core.storage.config import PostgresStorageConfig, pg_config
+from dagster._core.storage.config import PostgresStorageConfig, SqlPoolConfig, pg_config
 from dagster._core.storage.event_log import EventLogStorage
 from dagster._core.storage.runs import RunStorage
 from dagster._core.storage.schedules import ScheduleStorage
+from dagster._core.storage.sql import SqlPoolStats, get_engine_pool_stats
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 
 from .event_log import PostgresEventLogStorage
@@ -32,17 +33,32 @@ class DagsterPostgresStorage(DagsterStorage, ConfigurableClass):
 
     Note that the fields in this config are :py:class:`~dagster.StringSource` and
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
+
+    If ``pool`` is set, the run, event log and schedule storages share a single pooled engine, so
+    that each process holds at most ``pool_size + max_overflow`` connections to the database.
     """
 
-    def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
+    def __init__(
+        self,
+        postgres_url,
+        should_autocreate_tables=True,
+        inst_data=None,
+        pool_config: Optional[SqlPoolConfig] = None,
+    ):
         self.postgres_url = postgres_url
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
-        self._run_storage = PostgresRunStorage(postgres_url, should_autocreate_tables)
-        self._event_log_storage = PostgresEventLogStorage(postgres_url, should_autocreate_tables)
-        self._schedule_storage = PostgresScheduleStorage(postgres_url, should_autocreate_tables)
+        self._run_storage = PostgresRunStorage(
+            postgres_url, should_autocreate_tables, pool_config=pool_config
+        )
+        self._event_log_storage = PostgresEventLogStorage(
+            postgres_url, should_autocreate_tables, pool_config=pool_config
+        )
+        self._schedule_storage = PostgresScheduleStorage(
+            postgres_url, should_autocreate_tables, pool_config=pool_config
+        )
         super().__init__()
 
     @property
@@ -61,8 +77,15 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
+    def get_pool_stats(self) -> Optional[SqlPoolStats]:
+        """Returns the usage of the connection pool shared by the storages, or None if the storages
+        do not share a pool.
+        """
+        return get_engine_pool_stats(self._run_storage._engine)  # pylint: disable=protected-access
+
     @property
     def event_log_storage(self) -> EventLogStorage:
         return self._event_log_storage
@@ -1,7 +1,9 @@
+import io
 import logging
 import time
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, Mapping, Optional, TypeVar
+from datetime import datetime
+from typing import Any, Callable, Iterator, Mapping, Optional, Sequence, TypeVar
 from urllib.parse import quote, urlencode
 
 import alembic.config
@@ -10,13 +12,17 @@
 import psycopg2.extensions
 import sqlalchemy
 import sqlalchemy.exc
+import sqlalchemy.pool
 from dagster import _check as check
 from dagster._core.definitions.policy import Backoff, Jitter, calculate_delay
 
 # re-export
-from dagster._core.storage.config import pg_config as pg_config
+from dagster._core.storage.config import (
+    SqlPoolConfig,
+    pg_config as pg_config,
+)
 from dagster._core.storage.event_log.sql_event_log import SqlDbConnection
-from dagster._core.storage.sql import get_alembic_config
+from dagster._core.storage.sql import create_engine, get_alembic_config, get_shared_engine
 from sqlalchemy.engine import Connection
 
 T = TypeVar("T")
@@ -155,6 +161,26 @@ def pg_alembic_config(
     )
 
 
+def create_pg_engine(
+    postgres_url: str, pool_config: Optional[SqlPoolConfig] = None, **kwargs: Any
+) -> sqlalchemy.engine.Engine:
+    """Creates the engine of a Postgres storage. Without a pool config, connections are not held
+    open between uses. With one, the storage uses the pooled engine shared by every storage of the
+    process for the same database.
+    """
+    if pool_config is None:
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance
+        return create_engine(
+            postgres_url,
+            isolation_level="AUTOCOMMIT",
+            poolclass=sqlalchemy.pool.NullPool,
+            **kwargs,
+        )
+
+    return get_shared_engine(postgres_url, isolation_level="AUTOCOMMIT", **pool_config, **kwargs)
+
+
 @contextmanager
 def create_pg_connection(
     engine: sqlalchemy.engine.Engine,
@@ -173,3 +199,45 @@ def create_pg_connection(
 def pg_statement_timeout(millis: int) -> str:
     check.int_param(millis, "millis")
     return "-c statement_timeout={}".format(millis)
+
+
+def _pg_copy_text_value(value: Any) -> str:
+    # escaping of the text format of COPY, in which \N is null
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, bytes):
+        return "\\\\x" + value.hex()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\t", "\\t")
+    )
+
+
+def pg_copy_rows(
+    conn: Connection, table: sqlalchemy.Table, rows: Sequence[Mapping[str, Any]]
+) -> None:
+    """Insert rows into a table with a single ``COPY ... FROM STDIN``, which loads rows much faster
+    than inserts do. All rows must have the same keys. Should be called inside a transaction on the
+    connection, which commits the copied rows.
+    """
+    if not rows:
+        return
+
+    columns = list(rows[0].keys())
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_pg_copy_text_value(row[column]) for column in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(f'COPY "{table.name}" ({column_list}) FROM STDIN', buffer)
+    finally:
+        cursor.close()
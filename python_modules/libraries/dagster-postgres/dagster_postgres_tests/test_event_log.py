@@ -1,10 +1,20 @@
+import threading
 import time
+from unittest import mock
 
 import pytest
 import yaml
+from dagster._core.event_api import EventRecordsFilter
+from dagster._core.events import DagsterEventType
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.test_utils import instance_for_test
 from dagster_postgres.event_log import PostgresEventLogStorage
+from dagster_postgres.event_log.partitioning import (
+    DEFAULT_PARTITION_NAME,
+    EventLogPartitioning,
+    create_partition,
+    get_partition_indices,
+)
 from dagster_tests.storage_tests.utils.event_log_storage import (
     TestEventLogStorage,
     create_test_event_log_record,
@@ -114,3 +124,136 @@ def test_load_from_config(self, hostname):
                 from_explicit = explicit_instance._event_storage
 
                 assert from_url.postgres_url == from_explicit.postgres_url
+
+
+def _store_events(storage, count):
+    # pylint: disable=protected-access
+    for i in range(count):
+        storage.store_event(create_test_event_log_record(str(i), run_id="foo"))
+        # partitions are added on a background thread
+        if storage._partitions_thread:
+            storage._partitions_thread.join()
+
+
+class TestPartitionedPostgresEventLogStorage(TestPostgresEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(scope="function", name="storage")
+    def event_log_storage(self, conn_string):  # pylint: disable=arguments-renamed
+        storage = PostgresEventLogStorage.create_clean_storage(
+            conn_string, partitioning=EventLogPartitioning(partition_size=5, partitions_ahead=1)
+        )
+        assert storage
+        try:
+            yield storage
+        finally:
+            storage.dispose()
+
+    def test_partitions_created_ahead(self, storage):
+        assert storage.is_partitioned
+        with storage.index_connection() as conn:
+            assert get_partition_indices(conn) == [0, 1]
+
+        _store_events(storage, 12)
+
+        with storage.index_connection() as conn:
+            assert get_partition_indices(conn) == [0, 1, 2, 3]
+            # every event is stored in a range partition
+            assert not conn.execute(f"SELECT count(*) FROM {DEFAULT_PARTITION_NAME}").scalar()
+
+        assert len(storage.get_logs_for_run("foo")) == 12
+
+    def test_partitions_added_off_write_path(self, storage):
+        created_on_threads = []
+
+        def _record_create_partition(conn, partitioning, index):
+            created_on_threads.append(threading.current_thread())
+            create_partition(conn, partitioning, index)
+
+        with mock.patch(
+            "dagster_postgres.event_log.event_log.create_partition", _record_create_partition
+        ):
+            _store_events(storage, 12)
+
+        # every partition is added once, and never by the thread storing the events
+        assert len(created_on_threads) == 2
+        assert threading.current_thread() not in created_on_threads
+
+    def test_partitions_listing_cached(self, storage):
+        # pylint: disable=protected-access
+        _store_events(storage, 12)
+
+        with mock.patch(
+            "dagster_postgres.event_log.event_log.get_partition_indices",
+            wraps=get_partition_indices,
+        ) as mock_get_partition_indices:
+            for _ in range(3):
+                storage._get_storage_id_bounds_for_timestamps(
+                    before_timestamp=time.time(), after_timestamp=time.time() - 60
+                )
+            assert mock_get_partition_indices.call_count == 1
+
+            # adding partitions lists them again
+            storage.ensure_event_log_partitions(20)
+            assert storage._get_storage_id_bounds_for_timestamps(
+                before_timestamp=None, after_timestamp=time.time() + 2 * 60 * 60
+            ) == (10, None)
+            assert mock_get_partition_indices.call_count == 3
+
+    def test_prune_partitions_by_timestamp(self, storage):
+        # pylint: disable=protected-access
+        _store_events(storage, 12)
+
+        # the slack keeps recent partitions from being pruned
+        assert storage._get_storage_id_bounds_for_timestamps(
+            before_timestamp=None, after_timestamp=time.time() - 60
+        ) == (0, None)
+
+        # partitions written before the time bound are pruned
+        assert storage._get_storage_id_bounds_for_timestamps(
+            before_timestamp=None, after_timestamp=time.time() + 2 * 60 * 60
+        ) == (10, None)
+
+        records = storage.get_event_records(
+            EventRecordsFilter(
+                event_type=DagsterEventType.ENGINE_EVENT, after_timestamp=time.time() - 60
+            )
+        )
+        assert len(records) == 12
+
+    def test_prune_partitions_with_default_partition_rows(self, storage):
+        # pylint: disable=protected-access
+        _store_events(storage, 12)
+
+        # an event written before the range partition covering its storage id was created
+        old_event = create_test_event_log_record("old", run_id="foo")._replace(
+            timestamp=time.time() - 4 * 60 * 60
+        )
+        with storage.index_connection() as conn:
+            conn.execute(storage.prepare_insert_event(old_event).values(id=1000))
+            assert conn.execute(f"SELECT count(*) FROM {DEFAULT_PARTITION_NAME}").scalar() == 1
+
+        # every range partition is pruned, but the events of the default partition are kept
+        before_timestamp = time.time() - 2 * 60 * 60
+        assert storage._get_storage_id_bounds_for_timestamps(
+            before_timestamp=before_timestamp, after_timestamp=None
+        ) == (None, 1001)
+
+        records = storage.get_event_records(
+            EventRecordsFilter(
+                event_type=DagsterEventType.ENGINE_EVENT, before_timestamp=before_timestamp
+            )
+        )
+        assert [record.event_log_entry.user_message for record in records] == ["old"]
+
+    def test_drop_partitions(self, storage):
+        _store_events(storage, 12)
+
+        assert storage.drop_event_log_partitions(before_timestamp=time.time()) == []
+
+        # the partition holding the latest events is kept
+        assert storage.drop_event_log_partitions(before_timestamp=time.time() + 2 * 60 * 60) == [
+            0,
+            1,
+        ]
+        assert [int(event.message) for event in storage.get_logs_for_run("foo")] == [9, 10, 11]
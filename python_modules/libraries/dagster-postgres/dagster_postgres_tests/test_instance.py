@@ -6,6 +6,7 @@
 import yaml
 from dagster._core.instance import DagsterInstance
 from dagster._core.instance.ref import InstanceRef
+from dagster._core.storage.sql import get_engine_pool_stats
 from dagster._core.test_utils import instance_for_test
 from dagster._utils.test.postgres_instance import TestPostgresInstance
 from dagster_postgres.utils import get_conn, get_conn_string
@@ -60,6 +61,21 @@ def unified_pg_config(hostname):
     """
 
 
+def shared_pool_pg_config(hostname):
+    return f"""
+      storage:
+        postgres:
+          postgres_db:
+            username: test
+            password: test
+            hostname: {hostname}
+            db_name: test
+          pool:
+            pool_size: 2
+            max_overflow: 1
+    """
+
+
 def skip_autocreate_pg_config(hostname):
     return """
       run_storage:
@@ -201,6 +217,34 @@ def test_connection_leak(hostname, conn_string):
     tempdir.cleanup()
 
 
+def test_shared_pool(hostname):
+    # pylint: disable=protected-access
+    with instance_for_test(overrides=yaml.safe_load(shared_pool_pg_config(hostname))) as instance:
+        engine = instance._run_storage._engine
+        assert instance._event_storage._engine is engine
+        assert instance._schedule_storage._engine is engine
+
+        instance.get_runs()
+        instance.all_asset_keys()
+        instance.all_instigator_state()
+
+        stats = get_engine_pool_stats(engine)
+        assert stats
+        assert stats.pool_size == 2
+        assert stats.max_overflow == 1
+        assert stats.checked_out == 0
+        assert stats.total_checkouts >= 3
+
+        with instance_for_test(
+            overrides=yaml.safe_load(shared_pool_pg_config(hostname))
+        ) as other_instance:
+            # instances in the same process share the pool as well
+            assert other_instance._run_storage._engine is engine
+
+    with instance_for_test(overrides=yaml.safe_load(unified_pg_config(hostname))) as instance:
+        assert get_engine_pool_stats(instance._run_storage._engine) is None
+
+
 def test_statement_timeouts(hostname):
     with instance_for_test(overrides=yaml.safe_load(full_pg_config(hostname))) as instance:
         instance.optimize_for_dagit(statement_timeout=500, pool_recycle=-1)  # 500ms